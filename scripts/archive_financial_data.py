@@ -0,0 +1,74 @@
+"""
+Arquiva (ou desarquiva) lançamentos e parcelas de períodos fechados
+
+Lançamentos mais antigos que --months meses, sem parcela em aberto, vão
+para coleções por ano (financial_entries_archive_<ano>) junto com as
+parcelas; as consultas por período continuam encontrando esses dados.
+
+Para executar:
+    python scripts/archive_financial_data.py archive --months 24
+    python scripts/archive_financial_data.py archive --months 12 --company-id <id> --batch-size 500
+    python scripts/archive_financial_data.py unarchive --company-id <id> --year 2023
+    python scripts/archive_financial_data.py unarchive --company-id <id>
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.database import MongoConnection, get_shared_db, get_tenant_db
+from src.infra.repositories import MongoCompanyRepository
+from src.infra.database.transaction_runner import MongoTransactionRunner
+from src.infra.cache import get_tenant_write_version
+from src.application.services.financial_archiver import FinancialArchiver
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arquiva dados financeiros de períodos fechados")
+    parser.add_argument("command", choices=["archive", "unarchive"])
+    parser.add_argument("--company-id", help="Apenas esta empresa (padrão: todas)")
+    parser.add_argument("--months", type=int, default=24, help="archive: idade mínima em meses (padrão: 24)")
+    parser.add_argument("--year", type=int, help="unarchive: apenas este ano (padrão: todos)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Lançamentos movidos por lote")
+    args = parser.parse_args()
+
+    MongoConnection()
+    if args.company_id:
+        company_ids = [args.company_id]
+    else:
+        company_repo = MongoCompanyRepository(get_shared_db()["companies"])
+        company_ids = [c.id for c in company_repo.find_all(only_active=False)]
+
+    print(f"🗄️  {args.command} em {len(company_ids)} empresa(s)\n")
+
+    for company_id in company_ids:
+        tenant_db = get_tenant_db(company_id)
+        runner = MongoTransactionRunner(tenant_db.client)
+        if not runner.supported():
+            # Sem transação, um lote interrompido ficaria nas duas coleções e seria somado duas vezes
+            print("❌ O servidor não suporta transações (use replica set ou mongos)")
+            sys.exit(1)
+        archiver = FinancialArchiver(tenant_db, runner, args.batch_size)
+
+        if args.command == "archive":
+            stats = archiver.archive(args.months)
+            print(f"🏢 {company_id}: {stats['entries_archived']} lançamentos e "
+                  f"{stats['installments_archived']} parcelas arquivados antes de {stats['cutoff']} "
+                  f"({stats['entries_kept_open']} com parcelas em aberto mantidos), anos {stats['years']}")
+        else:
+            stats = archiver.unarchive(args.year)
+            print(f"🏢 {company_id}: {stats['entries_restored']} lançamentos e "
+                  f"{stats['installments_restored']} parcelas restaurados, anos {stats['years']}")
+
+        # Caches em memória (análises, totais, snapshot) descartam o que leram antes
+        get_tenant_write_version().bump(company_id)
+
+    print("\n✅ Concluído")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Microbenchmark do custo de autenticação por requisição (require_auth)
+
+Compara a verificação completa do JWT a cada requisição (JWTHandler novo +
+jwt.decode) com o handler singleton e o cache de tokens verificados.
+Não acessa o banco.
+
+Para executar:
+    python scripts/benchmark_auth.py
+    python scripts/benchmark_auth.py --requests 50000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask import Flask, jsonify
+
+from src.application.middleware import auth_middleware
+from src.infra.security import JWTHandler, VerifiedTokenCache
+
+
+class UncachedHandler(JWTHandler):
+    """Comportamento anterior: verificação completa em toda requisição"""
+
+    def verify_access_token(self, token):
+        return JWTHandler().verify_token(token)
+
+
+def measure(app, headers, requests: int) -> float:
+    """Tempo médio (µs) de uma chamada à rota protegida dentro do contexto de requisição"""
+    view = app.view_functions["protected"]
+    with app.test_request_context("/protected", headers=headers):
+        view()  # aquecimento
+        started = time.perf_counter()
+        for _ in range(requests):
+            view()
+        return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark do require_auth")
+    parser.add_argument("--requests", type=int, default=20000, help="Requisições por cenário")
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+
+    @app.route("/protected")
+    @auth_middleware.require_auth
+    def protected():
+        return jsonify({"ok": True})
+
+    token = JWTHandler().generate_token({
+        "user_id": "benchmark-user",
+        "email": "bench@example.com",
+        "company_id": "benchmark-company",
+        "roles": ["Admin"],
+        "features": [f"feature_{i}.view" for i in range(40)],
+    })
+    headers = {"Authorization": f"Bearer {token}"}
+
+    scenarios = [
+        ("jwt.decode a cada requisição", UncachedHandler()),
+        ("singleton + cache de tokens", JWTHandler(token_cache=VerifiedTokenCache())),
+    ]
+
+    print(f"🚀 {args.requests} requisições por cenário\n")
+    results = []
+    for name, handler in scenarios:
+        auth_middleware.get_jwt_handler = lambda handler=handler: handler
+        results.append(measure(app, headers, args.requests))
+        print(f"  {name:<32} {results[-1]:8.1f} µs/requisição")
+
+    print(f"\n⚡ Ganho: {results[0] / results[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Confere em qual membro do replica set cada política de leitura executa
+
+Roda uma consulta em financial_entries com as políticas dos endpoints e
+mostra o servidor que respondeu (via monitoramento de comandos do driver).
+
+Replica set local para teste:
+    docker run -d --name rs -p 27017:27017 mongo:7 --replSet rs0
+    docker exec rs mongosh --eval "rs.initiate()"
+    (adicione um secundário, ou use três containers, para ver a leitura sair do primário)
+
+Para executar:
+    MONGO_URI="mongodb://localhost:27017/?replicaSet=rs0" python scripts/check_read_policy.py
+    python scripts/check_read_policy.py --endpoint dashboard.snapshot --db company_teste
+"""
+
+import argparse
+import os
+import sys
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pymongo import MongoClient, monitoring
+
+from src.config import Environment
+from src.database import ANALYTICS, PRIMARY, get_read_policy
+
+ENDPOINTS = {
+    "financial_entries.list": PRIMARY,
+    "installments.daily_summary": ANALYTICS,
+    "financial_entries.totals": ANALYTICS,
+    "dashboard.snapshot": ANALYTICS,
+    "admin.dashboard": ANALYTICS,
+}
+
+
+class ServerRecorder(monitoring.CommandListener):
+    def __init__(self):
+        self.last_address = None
+
+    def started(self, event):
+        if event.command_name in ("find", "aggregate"):
+            self.last_address = event.connection_id
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Confere a preferência de leitura por endpoint")
+    parser.add_argument("--db", default="shared_db", help="Banco a consultar (padrão: shared_db)")
+    parser.add_argument("--endpoint", action="append", help="Endpoint(s) a conferir (padrão: todos)")
+    args = parser.parse_args()
+
+    recorder = ServerRecorder()
+    client = MongoClient(Environment().mongo_uri, event_listeners=[recorder])
+    client.admin.command("ping")
+
+    print(f"Primário: {client.primary}  Secundários: {sorted(client.secondaries)}")
+
+    policy = get_read_policy()
+    for endpoint in args.endpoint or ENDPOINTS:
+        default = ENDPOINTS.get(endpoint, PRIMARY)
+        db = policy.apply(client[args.db], endpoint, default)
+        list(db["financial_entries"].find({}, {"_id": 1}).limit(1))
+
+        where = "primário" if recorder.last_address == client.primary else "secundário"
+        print(f"{endpoint:<30} {db.read_preference.mongos_mode:<20} -> {recorder.last_address} ({where})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Importa as planilhas financeiras (CSV) para o banco de uma empresa
+
+Usa o importador de src/application/importers: leitura em streaming,
+chaves naturais determinísticas e upserts em lote. O parse dos arquivos
+roda em paralelo (pool de processos) e uma única thread grava no banco.
+Pode ser executado várias vezes com os mesmos arquivos sem duplicar dados.
+
+Para executar:
+    python scripts/import_spreadsheets.py --company-id <id> arquivo.csv [pasta/ ...]
+    python scripts/import_spreadsheets.py --company-id <id> --year 2025 "Despesas.csv"
+    python scripts/import_spreadsheets.py --company-id <id> --workers 8 pasta/
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Adicionar o diretório raiz ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.database.mongo_connection import MongoConnection
+from src.application.importers import SHEET_TYPES, ImportPipeline
+
+
+def collect_files(paths):
+    """Expande pastas para os arquivos .csv que elas contêm"""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.csv")))
+        else:
+            files.append(path)
+    return files
+
+
+def print_stats(stats: dict):
+    print(f"\n📄 {stats['file']} ({stats['sheet_type']})")
+    print(f"  ➕ Inseridos: {stats['inserted']}  ✏️  Atualizados: {stats['updated']}  "
+          f"= Sem mudança: {stats['unchanged']}  🗑️  Removidos: {stats['removed']}")
+    print(f"  💰 Valor total: R$ {stats['total_value']:,.2f}  ⏱️  {stats['elapsed_ms']:.0f} ms")
+    if stats['skipped']:
+        print(f"  ⚠️  Células ignoradas: {stats['skipped']}")
+    for error in stats['errors']:
+        print(f"  ❌ {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importa planilhas financeiras (CSV) de uma empresa")
+    parser.add_argument("paths", nargs="+", help="Arquivos .csv ou pastas com arquivos .csv")
+    parser.add_argument("--company-id", required=True, help="ID da empresa")
+    parser.add_argument("--year", type=int, help="Ano dos dados, quando não está no nome do arquivo")
+    parser.add_argument("--type", choices=SHEET_TYPES, help="Tipo da planilha (padrão: pelo nome do arquivo)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Operações por bulk_write")
+    parser.add_argument("--workers", type=int, help="Processos de parse (padrão: IMPORT_MAX_WORKERS ou até 4; 0 = sem paralelismo)")
+    args = parser.parse_args()
+
+    files = collect_files(args.paths)
+    if not files:
+        print("❌ Nenhum arquivo .csv encontrado")
+        sys.exit(1)
+
+    if args.workers is not None:
+        os.environ["IMPORT_MAX_WORKERS"] = str(args.workers)
+
+    mongo_conn = MongoConnection()
+    pipeline = ImportPipeline(mongo_conn.get_tenant_db(args.company_id), batch_size=args.batch_size)
+
+    print(f"🚀 Importando {len(files)} arquivo(s) para a empresa {args.company_id}")
+    started = time.perf_counter()
+
+    results = pipeline.run([(path, None) for path in files], sheet_type=args.type, year=args.year)
+
+    failures = 0
+    for stats in results:
+        if "error" in stats:
+            failures += 1
+            print(f"\n❌ {stats['file']}: {stats['error']}")
+        else:
+            print_stats(stats)
+
+    print(f"\n✅ Importação finalizada em {time.perf_counter() - started:.1f}s")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Remove parcelas órfãs (cujo lançamento financeiro foi apagado)
+
+Lançamentos apagados antes da exclusão em cascata deixaram as parcelas
+no banco, e elas continuam entrando no resumo diário do crediário.
+
+Para executar:
+    python scripts/purge_orphan_installments.py --dry-run
+    python scripts/purge_orphan_installments.py
+    python scripts/purge_orphan_installments.py --company-id <id> --batch-size 500
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from src.database import MongoConnection, get_shared_db, get_tenant_db
+from src.infra.repositories import (
+    MongoCompanyRepository,
+    MongoFinancialEntryRepository,
+    MongoInstallmentRepository,
+)
+from src.application.use_cases import PurgeOrphanInstallments
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove parcelas cujo lançamento não existe mais")
+    parser.add_argument("--company-id", help="Apenas esta empresa (padrão: todas)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Lançamentos verificados por lote")
+    parser.add_argument("--dry-run", action="store_true", help="Apenas conta, sem remover")
+    args = parser.parse_args()
+
+    MongoConnection()
+    if args.company_id:
+        company_ids = [args.company_id]
+    else:
+        company_repo = MongoCompanyRepository(get_shared_db()["companies"])
+        company_ids = [c.id for c in company_repo.find_all(only_active=False)]
+
+    print(f"🔧 Verificando parcelas órfãs em {len(company_ids)} empresa(s)"
+          f"{' (dry-run)' if args.dry_run else ''}\n")
+
+    total = 0
+    for company_id in company_ids:
+        tenant_db = get_tenant_db(company_id)
+        use_case = PurgeOrphanInstallments(
+            MongoFinancialEntryRepository(tenant_db["financial_entries"]),
+            MongoInstallmentRepository(tenant_db["installments"]),
+        )
+        stats = use_case.execute(batch_size=args.batch_size, dry_run=args.dry_run)
+        total += stats["installments_deleted"]
+
+        print(f"🏢 {company_id}: {stats['entries_checked']} lançamentos verificados, "
+              f"{stats['orphan_entries']} apagados com parcelas, "
+              f"{stats['installments_deleted']} parcelas removidas")
+
+    print(f"\n✅ Concluído: {total} parcelas órfãs removidas")
+
+
+if __name__ == "__main__":
+    main()
@@ -198,6 +198,45 @@ def seed_features(feature_repo):
             is_system=True
         ),
 
+        # Loans
+        Feature(
+            code="loans.create",
+            name="Criar Empréstimos",
+            description="Permite cadastrar empréstimos",
+            module="loans",
+            is_system=True
+        ),
+        Feature(
+            code="loans.read",
+            name="Visualizar Empréstimos",
+            description="Permite visualizar empréstimos e cronogramas",
+            module="loans",
+            is_system=True
+        ),
+        Feature(
+            code="loans.update",
+            name="Atualizar Empréstimos",
+            description="Permite atualizar e renegociar empréstimos",
+            module="loans",
+            is_system=True
+        ),
+        Feature(
+            code="loans.delete",
+            name="Deletar Empréstimos",
+            description="Permite deletar empréstimos",
+            module="loans",
+            is_system=True
+        ),
+
+        # Imports
+        Feature(
+            code="imports.create",
+            name="Importar Planilhas",
+            description="Permite importar planilhas financeiras (CSV)",
+            module="imports",
+            is_system=True
+        ),
+
         # Platform Settings
         Feature(
             code="platform_settings.read",
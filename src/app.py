@@ -8,12 +8,20 @@ from src.presentation.routes import (
     installment_bp,
     account_bp,
     bank_limit_bp,
-    migration_bp
+    migration_bp,
+    dashboard_bp,
+    loan_bp,
+    import_bp,
+    analytics_bp,
+    forecast_bp,
+    search_bp
 )
 from src.presentation.routes.auth_routes import auth_bp
 from src.presentation.routes.admin_routes import admin_bp
 from src.presentation.routes.audit_routes import audit_bp
 from src.database import MongoConnection
+from src.presentation.middlewares.tenant_versioning import bump_tenant_version_after_write
+from src.presentation.middlewares.compression import get_response_compressor
 
 env = Environment()
 
@@ -39,6 +47,12 @@ def create_app():
     app.register_blueprint(account_bp, url_prefix="/api")
     app.register_blueprint(bank_limit_bp, url_prefix="/api")
     app.register_blueprint(migration_bp, url_prefix="/api")
+    app.register_blueprint(dashboard_bp, url_prefix="/api")
+    app.register_blueprint(loan_bp, url_prefix="/api")
+    app.register_blueprint(import_bp, url_prefix="/api")
+    app.register_blueprint(analytics_bp, url_prefix="/api")
+    app.register_blueprint(forecast_bp, url_prefix="/api")
+    app.register_blueprint(search_bp, url_prefix="/api")
 
     @app.route("/", methods=["GET"])
     def home():
@@ -58,6 +72,8 @@ def create_app():
                         },
                         "admin": {
                             "dashboard": "GET /api/admin/dashboard (super admin only)",
+                            "compression_metrics": "GET /api/admin/metrics/compression (super admin only)",
+                            "revenue_report": "GET /api/admin/reports/revenue?from=&to= (super admin only, NDJSON stream)",
                             "companies": "GET /api/admin/companies (super admin only)",
                             "create_company": "POST /api/admin/companies (super admin only)",
                             "company_details": "GET /api/admin/companies/<id> (super admin only)",
@@ -73,14 +89,49 @@ def create_app():
                             "update": "PUT /api/payment-modalities/<id> (requires auth)",
                             "delete": "DELETE /api/payment-modalities/<id> (requires auth)",
                             "toggle": "PATCH /api/payment-modalities/<id>/toggle (requires auth)",
+                            "propagation": "GET /api/payment-modalities/<id>/propagation (requires auth)",
+                            "restart_propagation": "POST /api/payment-modalities/<id>/propagation/restart (requires auth)",
                         },
                         "financial_entries": {
                             "list": "GET /api/financial-entries (requires auth)",
                             "create": "POST /api/financial-entries (requires auth)",
+                            "bulk_create": "POST /api/financial-entries/bulk (body: entries[]) (requires auth)",
+                            "totals": "GET /api/financial-entries/totals?periods=today,week,month,year&from=&to= (requires auth)",
                             "update": "PUT /api/financial-entries/<id> (requires auth)",
                             "delete": "DELETE /api/financial-entries/<id> (requires auth)",
+                            "bulk_delete": "DELETE /api/financial-entries (body: ids | start_date, end_date, modality_id?) (requires auth)",
                         },
                     },
+                    "accounts": {
+                        "upcoming": "GET /api/accounts/upcoming?days=30 (requires auth)",
+                    },
+                    "dashboard": {
+                        "snapshot": "GET /api/dashboard/snapshot?from=&to= (requires auth)",
+                    },
+                    "loans": {
+                        "list": "GET /api/loans (requires auth)",
+                        "create": "POST /api/loans (requires auth)",
+                        "schedule": "GET /api/loans/<id>/schedule (requires auth)",
+                        "renegotiate": "POST /api/loans/<id>/renegotiate (requires auth)",
+                        "debt_service": "GET /api/loans/debt-service?start_date=&end_date= (requires auth)",
+                    },
+                    "imports": {
+                        "upload": "POST /api/imports (multipart: files, sheet_type?, year?) (requires auth)",
+                        "start_job": "POST /api/imports/jobs (multipart: files, sheet_type?, year?) (requires auth)",
+                        "job_status": "GET /api/imports/jobs/<job_id> (requires auth)",
+                    },
+                    "analytics": {
+                        "groupby": "GET /api/analytics/groupby?dims=&measure=&from=&to= (requires auth)",
+                    },
+                    "forecast": {
+                        "sales": "GET /api/forecast/sales?horizon=30 (requires auth)",
+                    },
+                    "pricing": {
+                        "calculate": "POST /api/pricing/calculate?stream= (JSON costs or CSV file) (requires auth)",
+                    },
+                    "search": {
+                        "search": "GET /api/search?q=&page=&page_size=&types= (requires auth)",
+                    },
                     "database_architecture": {
                         "shared_db": ["companies", "users", "features", "audit_logs"],
                         "per_company_db": [
@@ -102,6 +153,12 @@ def create_app():
     def connect_db():
         MongoConnection()
 
+    # Compressão gzip/brotli das respostas (registrada antes: roda por último)
+    get_response_compressor().init_app(app)
+
+    # Escritas invalidam os caches de leitura da empresa
+    app.after_request(bump_tenant_version_after_write)
+
     return app
 
 
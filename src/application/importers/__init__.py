@@ -0,0 +1,19 @@
+from .spreadsheet_importer import ParsedSheet, SpreadsheetImporter, parse_sheet
+from .sheets import SHEET_PARSERS, SHEET_TYPES, ImportRecord, SheetContext, detect_sheet_type
+from .bulk_writer import BulkImportWriter
+from .pipeline import ImportJobTracker, ImportPipeline, get_parse_executor
+
+__all__ = [
+    "SpreadsheetImporter",
+    "ParsedSheet",
+    "parse_sheet",
+    "SHEET_PARSERS",
+    "SHEET_TYPES",
+    "ImportRecord",
+    "SheetContext",
+    "detect_sheet_type",
+    "BulkImportWriter",
+    "ImportPipeline",
+    "ImportJobTracker",
+    "get_parse_executor",
+]
@@ -0,0 +1,82 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+from pymongo import UpdateOne
+from pymongo.database import Database
+
+from .sheets import ImportRecord
+
+
+class BulkImportWriter:
+    """
+    Grava registros importados com upserts em lote (bulk_write)
+
+    Cada documento recebe import_scope; depois de gravar a planilha inteira,
+    prune() remove os documentos do mesmo escopo que não vieram nesta
+    importação (linha apagada ou corrigida na planilha), então reimportar
+    nunca duplica nem deixa valores antigos somando no dashboard.
+    """
+
+    # Coleção -> (coleção dependente, campo que aponta para o _id), removidos junto no prune
+    DEPENDENTS = {"loans": ("loan_schedules", "loan_id")}
+
+    def __init__(self, db: Database, batch_size: int = 1000):
+        self._db = db
+        self._batch_size = batch_size
+        self._pending: Dict[str, List[UpdateOne]] = defaultdict(list)
+        self._seen: Dict[str, Set[str]] = defaultdict(set)
+        self.stats = {"inserted": 0, "updated": 0, "unchanged": 0, "removed": 0, "total_value": 0.0}
+
+    def add(self, records: Iterable[ImportRecord], scope: Optional[str]) -> None:
+        for record in records:
+            fields = dict(record.fields)
+            if scope:
+                fields["import_scope"] = scope
+
+            update = {"$set": fields}
+            if record.insert_fields:
+                update["$setOnInsert"] = record.insert_fields
+
+            operations = self._pending[record.collection]
+            operations.append(UpdateOne(record.filter or {"_id": record.key}, update, upsert=True))
+            self._seen[record.collection].add(record.key)
+            self.stats["total_value"] += record.value
+
+            if len(operations) >= self._batch_size:
+                self._flush_collection(record.collection)
+
+    def flush(self) -> None:
+        for collection in list(self._pending):
+            self._flush_collection(collection)
+
+    def prune(self, scope: Optional[str]) -> int:
+        """Remove documentos do escopo que não foram gravados nesta importação"""
+        if not scope:
+            return 0
+
+        removed = 0
+        for collection, keys in self._seen.items():
+            stale = {"import_scope": scope, "_id": {"$nin": list(keys)}}
+            dependent = self.DEPENDENTS.get(collection)
+            if dependent:
+                # Dependentes primeiro: uma falha no meio não deixa filhos sem o pai
+                child_collection, parent_field = dependent
+                ids = [doc["_id"] for doc in self._db[collection].find(stale, {"_id": 1})]
+                if ids:
+                    self._db[child_collection].delete_many({parent_field: {"$in": ids}})
+            result = self._db[collection].delete_many(stale)
+            removed += result.deleted_count
+        self.stats["removed"] += removed
+        return removed
+
+    def keys(self, collection: str) -> Set[str]:
+        return self._seen.get(collection, set())
+
+    def _flush_collection(self, collection: str) -> None:
+        operations = self._pending.pop(collection, [])
+        if not operations:
+            return
+
+        result = self._db[collection].bulk_write(operations, ordered=False)
+        self.stats["inserted"] += result.upserted_count
+        self.stats["updated"] += result.modified_count
+        self.stats["unchanged"] += result.matched_count - result.modified_count
@@ -0,0 +1,125 @@
+import re
+import unicodedata
+import uuid
+from datetime import datetime
+from typing import Iterable, Optional, Sequence
+import numpy as np
+
+# Namespace fixo: a mesma linha da planilha sempre gera o mesmo _id
+IMPORT_NAMESPACE = uuid.UUID("6f1d3c1e-8a4b-5c2d-9e7f-0a1b2c3d4e5f")
+
+MONTHS = {
+    "janeiro": 1, "fevereiro": 2, "marco": 3, "abril": 4, "maio": 5, "junho": 6,
+    "julho": 7, "agosto": 8, "setembro": 9, "outubro": 10, "novembro": 11, "dezembro": 12,
+}
+
+_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?")
+_YEAR_RE = re.compile(r"(20\d{2})")
+
+
+def fix_encoding(text: str) -> str:
+    """Corrige texto UTF-8 lido como latin-1 (ex: "CrÃ©dito" -> "Crédito")"""
+    if "Ã" not in text:
+        return text
+    try:
+        return text.encode("latin-1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return text
+
+
+def normalize_name(text: str) -> str:
+    """Chave de comparação: sem acento, minúscula e com espaços simples"""
+    text = unicodedata.normalize("NFKD", fix_encoding(text or ""))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(text.lower().split())
+
+
+def natural_key(*parts) -> str:
+    """_id determinístico a partir dos campos que identificam a linha"""
+    return str(uuid.uuid5(IMPORT_NAMESPACE, "|".join(str(p) for p in parts)))
+
+
+def _as_str_array(values: Iterable[str]) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values.astype(str)
+    return np.asarray(list(values), dtype=str)
+
+
+def parse_brl(values: Iterable[str]) -> np.ndarray:
+    """
+    Converte valores em reais para float de uma vez (ex: "R$ 1.234,56", "-R$ 4.037,61")
+
+    Células vazias ou inválidas viram NaN.
+    """
+    arr = np.char.strip(_as_str_array(values))
+    if arr.size == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    negative = np.char.startswith(arr, "-")
+    cleaned = np.char.replace(arr, "R$", "")
+    cleaned = np.char.replace(cleaned, "-", "")
+    cleaned = np.char.replace(cleaned, " ", "")
+    cleaned = np.char.replace(cleaned, "\u00a0", "")
+    cleaned = np.char.replace(cleaned, ".", "")
+    cleaned = np.char.replace(cleaned, ",", ".")
+
+    valid = np.char.isdigit(np.char.replace(cleaned, ".", "", 1)) & (np.char.str_len(cleaned) > 0)
+    result = np.full(arr.shape, np.nan, dtype=np.float64)
+    if valid.any():
+        result[valid] = cleaned[valid].astype(np.float64)
+    return np.where(negative, -result, result)
+
+
+def parse_percent(values: Iterable[str]) -> np.ndarray:
+    """Converte percentuais (ex: "1,94%") para float em %; "-" e vazio viram 0"""
+    result = parse_brl(np.char.replace(_as_str_array(values), "%", ""))
+    return np.nan_to_num(result, nan=0.0)
+
+
+def compose_dates(year: int, months: Sequence[int], days: Sequence[int]) -> np.ndarray:
+    """
+    Monta datas (datetime64[D]) a partir de ano, mês e dia
+
+    Dias inexistentes no mês (ex: 31/02) viram NaT.
+    """
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+
+    month_starts = np.datetime64(f"{year:04d}-01", "M") + (months - 1)
+    month_lengths = ((month_starts + 1).astype("datetime64[D]") - month_starts.astype("datetime64[D]")).astype(np.int64)
+
+    dates = month_starts.astype("datetime64[D]") + (days - 1)
+    valid = (days >= 1) & (days <= month_lengths)
+    return np.where(valid, dates, np.datetime64("NaT"))
+
+
+def to_datetime(value: np.datetime64) -> datetime:
+    return datetime.combine(value.astype("datetime64[D]").astype(object), datetime.min.time())
+
+
+def parse_br_date(text: str, default_year: Optional[int] = None) -> Optional[datetime]:
+    """Converte "DD/MM/YYYY" ou "DD/MM" (usa default_year) para datetime"""
+    match = _DATE_RE.search(text or "")
+    if not match:
+        return None
+    day, month, year = match.groups()
+    if year is None:
+        if default_year is None:
+            return None
+        year = default_year
+    year = int(year)
+    if year < 100:
+        year += 2000
+    try:
+        return datetime(year, int(month), int(day))
+    except ValueError:
+        return None
+
+
+def year_from_filename(filename: str) -> Optional[int]:
+    match = _YEAR_RE.search(filename or "")
+    if match:
+        return int(match.group(1))
+    # "Vendas Dezembro_25" -> 2025
+    match = re.search(r"_(\d{2})(?:\D|$)", filename or "")
+    return 2000 + int(match.group(1)) if match else None
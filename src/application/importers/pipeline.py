@@ -0,0 +1,250 @@
+import logging
+import multiprocessing
+import os
+import threading
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from .spreadsheet_importer import ParsedSheet, SpreadsheetImporter, parse_sheet, resolve_filename
+
+logger = logging.getLogger(__name__)
+
+# (caminho ou conteúdo em bytes, nome do arquivo)
+ImportSource = Tuple[Union[str, Path, bytes], Optional[str]]
+
+
+class ImportJobTracker:
+    """
+    Guarda o andamento das importações na coleção import_jobs da empresa
+
+    Cada arquivo tem seu status (queued, parsing, writing, done, error)
+    e as estatísticas da gravação, consultados pelo endpoint de status.
+    """
+
+    def __init__(self, collection: Collection):
+        self._collection = collection
+
+    def create(self, job_id: str, filenames: Sequence[str]) -> dict:
+        job = {
+            "_id": job_id,
+            "status": "running",
+            "created_at": datetime.now().isoformat(),
+            "finished_at": None,
+            "total_files": len(filenames),
+            "processed_files": 0,
+            "files": [
+                {"file": name, "status": "queued", "stats": None, "error": None}
+                for name in filenames
+            ],
+        }
+        self._collection.insert_one(job)
+        return job
+
+    def update_file(self, job_id: str, index: int, status: str, stats: dict = None, error: str = None) -> None:
+        update = {"$set": {
+            f"files.{index}.status": status,
+            f"files.{index}.stats": stats,
+            f"files.{index}.error": error,
+        }}
+        if status in ("done", "error"):
+            update["$inc"] = {"processed_files": 1}
+        self._collection.update_one({"_id": job_id}, update)
+
+    def finish(self, job_id: str, status: str) -> None:
+        self._collection.update_one(
+            {"_id": job_id},
+            {"$set": {"status": status, "finished_at": datetime.now().isoformat()}}
+        )
+
+    def find_by_id(self, job_id: str) -> Optional[dict]:
+        job = self._collection.find_one({"_id": job_id})
+        if job:
+            job["id"] = job.pop("_id")
+        return job
+
+
+class ImportPipeline:
+    """
+    Importa vários arquivos em paralelo
+
+    O parse (CPU) roda em um pool de processos, um arquivo por tarefa; os
+    registros voltam para uma única thread de gravação, que grava cada arquivo
+    com upserts em lote assim que o parse dele termina. Com um só escritor não
+    há disputa de escrita no banco da empresa e a remoção de linhas antigas
+    (prune) de um escopo não concorre com a gravação de outro arquivo.
+
+    Uso:
+        pipeline = ImportPipeline(get_tenant_db(company_id))
+        results = pipeline.run([(path, None) for path in paths])
+    """
+
+    def __init__(
+        self,
+        tenant_db: Database,
+        executor: Optional[Executor] = None,
+        batch_size: int = 1000,
+        tracker: Optional[ImportJobTracker] = None,
+        on_written: Optional[Callable[[], None]] = None,
+    ):
+        self._importer = SpreadsheetImporter(tenant_db, batch_size=batch_size)
+        self._executor = executor
+        self._tracker = tracker or ImportJobTracker(tenant_db["import_jobs"])
+        self._on_written = on_written
+
+    def start(
+        self,
+        sources: Sequence[ImportSource],
+        sheet_type: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> str:
+        """
+        Inicia a importação em segundo plano
+
+        Returns:
+            ID do job (acompanhe com ImportJobTracker.find_by_id)
+        """
+        job_id = self._create_job(sources)
+        thread = threading.Thread(
+            target=self._run_job, args=(sources, sheet_type, year, job_id),
+            name=f"import-job-{job_id[:8]}", daemon=True
+        )
+        thread.start()
+        return job_id
+
+    def run(
+        self,
+        sources: Sequence[ImportSource],
+        sheet_type: Optional[str] = None,
+        year: Optional[int] = None,
+        job_id: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Importa os arquivos e aguarda o fim
+
+        Args:
+            sources: Pares (caminho ou bytes, nome do arquivo)
+            sheet_type: Força o tipo da planilha (padrão: pelo nome do arquivo)
+            year: Ano dos dados quando não está no nome do arquivo
+            job_id: Job já criado (padrão: cria um novo)
+
+        Returns:
+            Estatísticas por arquivo, na ordem de sources
+        """
+        if job_id is None:
+            job_id = self._create_job(sources)
+        return self._run_job(sources, sheet_type, year, job_id)
+
+    def _create_job(self, sources: Sequence[ImportSource]) -> str:
+        if not sources:
+            raise ValueError("Nenhum arquivo enviado")
+        filenames = [resolve_filename(source, filename) for source, filename in sources]
+        job_id = str(uuid.uuid4())
+        self._tracker.create(job_id, filenames)
+        return job_id
+
+    def _run_job(self, sources, sheet_type, year, job_id: str) -> List[dict]:
+        results: List[Optional[dict]] = [None] * len(sources)
+        try:
+            modalities = self._importer.modalities()
+            for index, parsed, error in self._parse_all(sources, sheet_type, year, modalities, job_id):
+                if error is not None:
+                    results[index] = self._file_error(job_id, index, sources[index], error)
+                    continue
+                self._tracker.update_file(job_id, index, "writing")
+                try:
+                    stats = self._importer.write(parsed)
+                except Exception as e:
+                    logger.exception("Falha ao gravar %s", parsed.filename)
+                    results[index] = self._file_error(job_id, index, sources[index], e)
+                    continue
+                results[index] = stats
+                self._tracker.update_file(job_id, index, "done", stats=stats)
+        except Exception:
+            logger.exception("Falha no job de importação %s", job_id)
+            self._tracker.finish(job_id, "failed")
+            raise
+        finally:
+            if self._on_written is not None:
+                self._on_written()
+
+        failed = any("error" in result for result in results)
+        self._tracker.finish(job_id, "completed_with_errors" if failed else "completed")
+        return results
+
+    def _parse_all(self, sources, sheet_type, year, modalities, job_id: str):
+        """Gera (índice, ParsedSheet, erro) conforme cada arquivo termina o parse"""
+        for index in range(len(sources)):
+            self._tracker.update_file(job_id, index, "parsing")
+
+        executor = self._executor if self._executor is not None else get_parse_executor()
+        pending = set(range(len(sources)))
+
+        if executor is not None:
+            try:
+                futures = {
+                    executor.submit(parse_sheet, source, filename, sheet_type, year, modalities): index
+                    for index, (source, filename) in enumerate(sources)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    error = future.exception()
+                    if isinstance(error, BrokenProcessPool):
+                        raise error
+                    pending.discard(index)
+                    yield index, (None if error else future.result()), error
+            except BrokenProcessPool:
+                logger.warning("Pool de parse indisponível; processando %d arquivo(s) na thread atual", len(pending))
+                _reset_parse_executor(executor)
+
+        for index in sorted(pending):
+            source, filename = sources[index]
+            try:
+                yield index, parse_sheet(source, filename, sheet_type, year, modalities), None
+            except Exception as e:
+                yield index, None, e
+
+    def _file_error(self, job_id: str, index: int, source: ImportSource, error: BaseException) -> dict:
+        message = str(error) if isinstance(error, ValueError) else "Erro ao processar o arquivo"
+        self._tracker.update_file(job_id, index, "error", error=message)
+        return {"file": resolve_filename(*source), "error": message}
+
+
+# Pool de processos compartilhado (criado sob demanda)
+_parse_executor = None
+_parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """
+    Retorna o pool de processos de parse (IMPORT_MAX_WORKERS, padrão até 4)
+
+    Usa o contexto "spawn": os processos filhos não herdam o estado do
+    processo web (conexões do MongoClient, locks e threads do gunicorn).
+    Com IMPORT_MAX_WORKERS=0 o parse roda na thread de gravação.
+    """
+    global _parse_executor
+    workers = int(os.getenv("IMPORT_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+    if workers <= 0:
+        return None
+
+    with _parse_executor_lock:
+        if _parse_executor is None:
+            _parse_executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_executor
+
+
+def _reset_parse_executor(executor: Executor) -> None:
+    global _parse_executor
+    with _parse_executor_lock:
+        if _parse_executor is not executor:
+            return
+        _parse_executor = None
+    executor.shutdown(wait=False)
@@ -0,0 +1,551 @@
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+import numpy as np
+
+from src.domain.entities import Account, FinancialEntry
+from .parsing import (
+    MONTHS,
+    compose_dates,
+    fix_encoding,
+    natural_key,
+    normalize_name,
+    parse_br_date,
+    parse_brl,
+    parse_percent,
+    to_datetime,
+)
+
+CHUNK_ROWS = 200
+
+# Coluna de dia: "5" ou "27/11"
+_DAY_RE = re.compile(r"^(\d{1,2})(?:/\d{1,2})?$")
+
+SHEET_TYPES = ("vendas", "despesas", "crediario", "boletos", "emprestimos", "investimentos", "saldos")
+
+
+@dataclass
+class ImportRecord:
+    """
+    Um documento a gravar com upsert
+
+    fields vão em $set (a planilha é a fonte da verdade) e insert_fields em
+    $setOnInsert (só na primeira importação, ex: created_at, status de pagamento
+    alterado pelo usuário). Sem filter, o documento é identificado por _id = key.
+    """
+    collection: str
+    key: str
+    fields: dict
+    insert_fields: dict = field(default_factory=dict)
+    filter: Optional[dict] = None
+    value: float = 0.0
+
+
+@dataclass
+class SheetContext:
+    """Parâmetros e resultado do parse de uma planilha"""
+    sheet_type: str
+    year: Optional[int] = None
+    modalities: Dict[str, dict] = field(default_factory=dict)
+    # Escopo da importação: documentos do mesmo escopo que sumiram da planilha são removidos
+    scope: Optional[str] = None
+    skipped: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def error(self, message: str) -> None:
+        if message not in self.errors:
+            self.errors.append(message)
+
+    def require_year(self) -> int:
+        if not self.year:
+            raise ValueError("Não foi possível identificar o ano da planilha; informe o ano")
+        return self.year
+
+
+def detect_sheet_type(filename: str) -> str:
+    """Identifica o tipo da planilha pelo nome do arquivo"""
+    name = normalize_name(filename)
+    for sheet_type in SHEET_TYPES:
+        if sheet_type in name:
+            return sheet_type
+    raise ValueError(f"Tipo de planilha não reconhecido: {filename}")
+
+
+def _chunks(rows: Iterator[List[str]], size: int = CHUNK_ROWS) -> Iterator[List[List[str]]]:
+    chunk = []
+    for row in rows:
+        chunk.append([fix_encoding(cell) for cell in row])
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _grid(chunk: List[List[str]], width: int) -> np.ndarray:
+    """Linhas do CSV como matriz de strings (linhas curtas completadas com vazio)"""
+    return np.array([(row + [""] * width)[:width] for row in chunk], dtype=object).astype(str)
+
+
+def _entity_fields(entity_dict: dict, now: str, insert_only=()) -> tuple:
+    """Separa o to_dict() da entidade em campos de $set e de $setOnInsert"""
+    entity_dict.pop("id", None)
+    entity_dict.pop("created_at", None)
+    entity_dict.pop("updated_at", None)
+    # Reimportar uma linha sem mudanças não reescreve o documento
+    insert_fields = {"created_at": now, "updated_at": now}
+    for name in insert_only:
+        insert_fields[name] = entity_dict.pop(name)
+    return entity_dict, insert_fields
+
+
+def _find_row(rows: Iterator[List[str]], predicate: Callable[[List[str]], bool]) -> Optional[List[str]]:
+    for row in rows:
+        row = [fix_encoding(cell) for cell in row]
+        if predicate(row):
+            return row
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Vendas: uma coluna de valor + uma de modalidade por dia
+# ---------------------------------------------------------------------------
+
+def parse_vendas(rows: Iterator[List[str]], ctx: SheetContext) -> Iterator[List[ImportRecord]]:
+    rows = iter(rows)
+    header = _find_row(rows, lambda row: any(normalize_name(c) == "modalidade" for c in row))
+    if header is None:
+        raise ValueError("Cabeçalho de datas não encontrado na planilha de vendas")
+
+    explicit_years = [d.year for d in (parse_br_date(c) for c in header) if d]
+    default_year = Counter(explicit_years).most_common(1)[0][0] if explicit_years else ctx.year
+
+    value_cols, dates = [], []
+    for i in range(0, len(header) - 1):
+        if normalize_name(header[i + 1]) != "modalidade":
+            continue
+        date = parse_br_date(header[i], default_year)
+        if date:
+            value_cols.append(i)
+            dates.append(date)
+
+    if not dates:
+        raise ValueError("Nenhuma data encontrada no cabeçalho da planilha de vendas")
+
+    period = Counter(d.strftime("%Y-%m") for d in dates).most_common(1)[0][0]
+    ctx.scope = f"vendas:{period}"
+
+    value_cols = np.array(value_cols)
+    width = int(value_cols.max()) + 2
+    occurrences = Counter()
+    now = datetime.now().isoformat()
+
+    for chunk in _chunks(rows):
+        grid = _grid(chunk, width)
+        amounts = parse_brl(grid[:, value_cols].ravel()).reshape(len(chunk), len(value_cols))
+        modality_names = np.char.strip(grid[:, value_cols + 1])
+
+        # Linha de totais do dia não tem modalidade
+        mask = (amounts > 0) & (modality_names != "")
+        records = []
+        for r, c in zip(*np.nonzero(mask)):
+            name = modality_names[r, c]
+            modality = ctx.modalities.get(normalize_name(name))
+            if modality is None:
+                ctx.error(f"Modalidade não encontrada: {name}")
+                ctx.skipped += 1
+                continue
+
+            date = dates[c]
+            value = round(float(amounts[r, c]), 2)
+            identity = (date.date().isoformat(), modality["id"], int(round(value * 100)))
+            # Vendas iguais no mesmo dia são diferenciadas pela ordem na planilha
+            occurrence = occurrences[identity]
+            occurrences[identity] += 1
+
+            entry = FinancialEntry(
+                value=value,
+                date=date,
+                modality_id=modality["id"],
+                modality_name=modality["name"],
+                modality_color=modality["color"],
+                type="received",
+                entry_type="normal",
+                is_credit_plan=modality["is_credit_plan"],
+                credit_payment=normalize_name(modality["name"]).startswith("recebimento crediario"),
+            )
+            fields, insert_fields = _entity_fields(entry.to_dict(), now)
+            records.append(ImportRecord(
+                "financial_entries", natural_key("vendas", *identity, occurrence),
+                fields, insert_fields, value=value,
+            ))
+
+        if records:
+            yield records
+
+
+# ---------------------------------------------------------------------------
+# Planilhas por mês (Boletos, Crediário, Despesas): bloco de colunas por mês
+# ---------------------------------------------------------------------------
+
+def _month_columns(rows: Iterator[List[str]]) -> List[tuple]:
+    header = _find_row(
+        rows, lambda row: sum(normalize_name(c) in MONTHS for c in row) >= 2
+    )
+    if header is None:
+        raise ValueError("Cabeçalho de meses não encontrado na planilha")
+    return [(i, MONTHS[normalize_name(c)]) for i, c in enumerate(header) if normalize_name(c) in MONTHS]
+
+
+def _month_cells(rows, block: int, carry_day: bool = False):
+    """
+    Percorre as células por mês em blocos de linhas
+
+    Yields:
+        Tuplas de arrays (meses, dias, células do bloco[0..block-1]) por chunk
+    """
+    rows = iter(rows)
+    month_cols = _month_columns(rows)
+    width = max(col for col, _ in month_cols) + block
+    last_day = {}
+
+    for chunk in _chunks(rows):
+        grid = _grid(chunk, width)
+        months, days, cells = [], [], []
+        for r in range(len(chunk)):
+            for col, month in month_cols:
+                day_str = grid[r, col].strip()
+                day_match = _DAY_RE.match(day_str)
+                if day_match:
+                    last_day[col] = int(day_match.group(1))
+                elif day_str:
+                    # Linha de totais/cabeçalho
+                    continue
+                elif not carry_day or col not in last_day:
+                    continue
+                months.append(month)
+                days.append(last_day[col])
+                cells.append(grid[r, col + 1:col + block])
+        if cells:
+            yield np.array(months), np.array(days), np.array(cells)
+
+
+def _dated(ctx: SheetContext, months, days, values) -> tuple:
+    """Datas das células; células com valor em data inexistente (ex: 31/04) são puladas"""
+    dates = compose_dates(ctx.require_year(), months, days)
+    valid = ~np.isnat(dates)
+    ctx.skipped += int((~valid & (values > 0)).sum())
+    return dates, valid
+
+
+def parse_boletos(rows: Iterator[List[str]], ctx: SheetContext) -> Iterator[List[ImportRecord]]:
+    year = ctx.require_year()
+    ctx.scope = f"boletos:{year}"
+    now = datetime.now().isoformat()
+
+    for months, days, cells in _month_cells(rows, block=2):
+        values = parse_brl(cells[:, 0])
+        dates, valid = _dated(ctx, months, days, values)
+
+        records = []
+        for i in np.nonzero(valid & (values > 0))[0]:
+            date = to_datetime(dates[i])
+            value = round(float(values[i]), 2)
+            account = Account(
+                value=value,
+                date=date,
+                description=f"Boleto {date.strftime('%d/%m/%Y')}",
+                type="boleto",
+                paid=False,
+            )
+            # Status de pagamento é controlado pelo sistema depois da importação
+            fields, insert_fields = _entity_fields(account.to_dict(), now, ("paid",))
+            records.append(ImportRecord(
+                "accounts", natural_key("boletos", date.date().isoformat()),
+                fields, insert_fields, value=value,
+            ))
+        if records:
+            yield records
+
+
+def parse_crediario(rows: Iterator[List[str]], ctx: SheetContext) -> Iterator[List[ImportRecord]]:
+    year = ctx.require_year()
+    ctx.scope = f"crediario:{year}"
+    modality = ctx.modalities.get("crediario")
+    if modality is None:
+        raise ValueError("Modalidade 'Crediário' não encontrada")
+    now = datetime.now().isoformat()
+
+    # Colunas por mês: Data, venda, recebido, em aberto
+    for months, days, cells in _month_cells(rows, block=4):
+        sales = parse_brl(cells[:, 0])
+        dates, valid = _dated(ctx, months, days, sales)
+
+        records = []
+        for i in np.nonzero(valid & (sales > 0))[0]:
+            date = to_datetime(dates[i])
+            value = round(float(sales[i]), 2)
+            entry = FinancialEntry(
+                value=value,
+                date=date,
+                modality_id=modality["id"],
+                modality_name=modality["name"],
+                modality_color=modality["color"],
+                type="receivable",
+                entry_type="normal",
+                is_credit_plan=True,
+            )
+            fields, insert_fields = _entity_fields(entry.to_dict(), now)
+            records.append(ImportRecord(
+                "financial_entries", natural_key("crediario", date.date().isoformat()),
+                fields, insert_fields, value=value,
+            ))
+        if records:
+            yield records
+
+
+def parse_despesas(rows: Iterator[List[str]], ctx: SheetContext) -> Iterator[List[ImportRecord]]:
+    year = ctx.require_year()
+    ctx.scope = f"despesas:{year}"
+    occurrences = Counter()
+    now = datetime.now().isoformat()
+
+    # Colunas por mês: Dia, Descrição, Valor, Status (dia em branco = mesmo dia da linha anterior)
+    for months, days, cells in _month_cells(rows, block=4, carry_day=True):
+        values = parse_brl(cells[:, 1])
+        dates, valid = _dated(ctx, months, days, values)
+
+        records = []
+        for i in np.nonzero(valid & (values > 0))[0]:
+            date = to_datetime(dates[i])
+            value = round(float(values[i]), 2)
+            description = " ".join(cells[i, 0].split()) or "Despesa"
+            identity = (date.date().isoformat(), normalize_name(description))
+            occurrence = occurrences[identity]
+            occurrences[identity] += 1
+
+            account = Account(
+                value=value,
+                date=date,
+                description=description,
+                type="payment",
+                paid=normalize_name(cells[i, 2]) == "pago",
+            )
+            fields, insert_fields = _entity_fields(account.to_dict(), now)
+            records.append(ImportRecord(
+                "accounts", natural_key("despesas", *identity, occurrence),
+                fields, insert_fields, value=value,
+            ))
+        if records:
+            yield records
+
+
+# ---------------------------------------------------------------------------
+# Tabelas com cabeçalho "Banco" (Empréstimos, Investimentos, Saldos e Taxas)
+# ---------------------------------------------------------------------------
+
+def _table(rows: Iterator[List[str]], columns: Dict[str, str]):
+    """
+    Lê uma tabela a partir da linha de cabeçalho que contém "Banco"
+
+    Args:
+        columns: nome do campo -> prefixo normalizado do cabeçalho
+
+    Yields:
+        Dict campo -> array de strings, por chunk
+    """
+    rows = iter(rows)
+    header = _find_row(rows, lambda row: any(normalize_name(c) == "banco" for c in row))
+    if header is None:
+        raise ValueError("Cabeçalho com a coluna 'Banco' não encontrado")
+
+    normalized = [normalize_name(c) for c in header]
+    indexes = {}
+    for name, prefix in columns.items():
+        # Coincidência exata tem prioridade (ex: "iof" x "iof diário")
+        matches = [i for i, c in enumerate(normalized) if c == prefix]
+        matches = matches or [i for i, c in enumerate(normalized) if c.startswith(prefix)]
+        if matches:
+            indexes[name] = matches[0]
+
+    if "bank" not in indexes:
+        raise ValueError("Coluna 'Banco' não encontrada")
+
+    width = len(header)
+    for chunk in _chunks(rows):
+        grid = _grid(chunk, width)
+        table = {name: np.char.strip(grid[:, i]) for name, i in indexes.items()}
+        for name in columns:
+            table.setdefault(name, np.full(len(chunk), "", dtype=str))
+        yield table
+
+
+def _bank_rows(table: Dict[str, np.ndarray]) -> np.ndarray:
+    """Linhas com banco preenchido, sem a linha de total"""
+    banks = np.char.lower(table["bank"])
+    return (banks != "") & (banks != "total")
+
+
+def parse_investimentos(rows: Iterator[List[str]], ctx: SheetContext) -> Iterator[List[ImportRecord]]:
+    ctx.scope = "investimentos"
+    occurrences = Counter()
+    now = datetime.now().isoformat()
+
+    columns = {"bank": "banco", "value": "valor", "kind": "tipo", "purpose": "objetivo"}
+    for table in _table(rows, columns):
+        values = parse_brl(table["value"])
+
+        records = []
+        for i in np.nonzero((values > 0) & _bank_rows(table))[0]:
+            bank, kind, purpose = str(table["bank"][i]), str(table["kind"][i]), str(table["purpose"][i])
+            value = round(float(values[i]), 2)
+            identity = (normalize_name(bank), normalize_name(kind), normalize_name(purpose))
+            occurrence = occurrences[identity]
+            occurrences[identity] += 1
+
+            account = Account(
+                value=value,
+                date=datetime.now(),
+                description=" - ".join(p for p in (bank, kind, purpose) if p),
+                type="investment",
+                paid=False,
+            )
+            fields, insert_fields = _entity_fields(account.to_dict(), now, ("date", "paid"))
+            records.append(ImportRecord(
+                "accounts", natural_key("investimentos", *identity, occurrence),
+                fields, insert_fields, value=value,
+            ))
+        if records:
+            yield records
+
+
+def parse_emprestimos(rows: Iterator[List[str]], ctx: SheetContext) -> Iterator[List[ImportRecord]]:
+    """
+    Empréstimos com prazo viram Loan (o cronograma é gerado depois da gravação,
+    só para os novos; reimportar não altera as condições de um já cadastrado);
+    sem prazo, só o saldo devedor é registrado como lançamento "emprestimo"
+    """
+    ctx.scope = "emprestimos"
+    occurrences = Counter()
+    now = datetime.now()
+
+    columns = {
+        "bank": "banco", "contracted": "valor contratado", "balance": "saldo devedor",
+        "kind": "modalidade", "term": "prazo", "rate": "cet", "purpose": "objetivo",
+    }
+    for table in _table(rows, columns):
+        contracted = np.nan_to_num(parse_brl(table["contracted"]))
+        balance = np.nan_to_num(parse_brl(table["balance"]))
+        terms = np.nan_to_num(parse_brl(table["term"])).astype(np.int64)
+        rates = parse_percent(table["rate"])
+
+        records = []
+        for i in np.nonzero(((contracted > 0) | (balance > 0)) & _bank_rows(table))[0]:
+            bank, kind = str(table["bank"][i]), str(table["kind"][i])
+            identity = (normalize_name(bank), normalize_name(kind))
+            occurrence = occurrences[identity]
+            occurrences[identity] += 1
+            key = natural_key("emprestimos", *identity, occurrence)
+
+            if terms[i] > 0:
+                principal = round(float(contracted[i] or balance[i]), 2)
+                next_month = np.datetime64(now.date(), "M") + 1
+                records.append(ImportRecord(
+                    "loans", key,
+                    {
+                        "bank_name": bank,
+                        "purpose": str(table["purpose"][i]) or kind,
+                    },
+                    {
+                        # Condições só na criação: depois valem as edições e renegociações do sistema
+                        "principal": principal,
+                        "monthly_rate": float(rates[i]),
+                        "term_months": int(terms[i]),
+                        "amortization_system": "price",
+                        "first_due_date": to_datetime(next_month.astype("datetime64[D]")).isoformat(),
+                        "created_at": now.isoformat(),
+                        "updated_at": now.isoformat(),
+                    },
+                    value=principal,
+                ))
+                continue
+
+            value = round(float(balance[i] or contracted[i]), 2)
+            entry = FinancialEntry(
+                value=value,
+                date=now,
+                modality_id="emprestimo",
+                modality_name=f"Empréstimo {bank}",
+                modality_color="#EF4444",
+                type="received",
+                entry_type="emprestimo",
+            )
+            fields, insert_fields = _entity_fields(entry.to_dict(), now.isoformat(), ("date",))
+            records.append(ImportRecord("financial_entries", key, fields, insert_fields, value=value))
+        if records:
+            yield records
+
+
+def parse_saldos(rows: Iterator[List[str]], ctx: SheetContext) -> Iterator[List[ImportRecord]]:
+    """Saldos e Taxas: uma linha por banco e modalidade, gravadas como um limite por banco"""
+    # Limites cadastrados à mão não são removidos
+    ctx.scope = None
+    now = datetime.now().isoformat()
+
+    columns = {
+        "bank": "banco", "available": "valor disp", "used": "valor em uso", "kind": "modalidade",
+        "rate": "taxa juros", "cdi": "cdi", "iof": "iof", "iof_daily": "iof diario",
+    }
+    banks: Dict[str, dict] = {}
+    for table in _table(rows, columns):
+        available = np.nan_to_num(parse_brl(table["available"]))
+        used = np.nan_to_num(parse_brl(table["used"]))
+        rates = parse_percent(table["rate"])
+        cdi = parse_percent(table["cdi"])
+        iof = parse_percent(table["iof"])
+        iof_daily = parse_percent(table["iof_daily"])
+
+        for i in np.nonzero(_bank_rows(table))[0]:
+            kind = normalize_name(table["kind"][i])
+            if kind.startswith("rotativo"):
+                prefix = "rotativo"
+            elif kind.startswith("cheque"):
+                prefix = "cheque"
+            else:
+                # Linhas sem modalidade são do quadro de saldos, abaixo dos limites
+                ctx.skipped += 1 if kind else 0
+                continue
+
+            bank = str(table["bank"][i])
+            fields = banks.setdefault(bank, {"bank_name": bank})
+            fields[f"{prefix}_available"] = float(available[i])
+            fields[f"{prefix}_used"] = float(used[i])
+            fields[f"{prefix}_rate"] = float(rates[i])
+            fields["iof_rate"] = float(iof[i])
+            fields["iof_daily_rate"] = float(iof_daily[i])
+            if cdi[i] > 0:
+                fields["cdi_rate"] = float(cdi[i])
+
+    records = []
+    for bank, fields in banks.items():
+        records.append(ImportRecord(
+            "bank_limits", natural_key("bank_limits", normalize_name(bank)),
+            fields,
+            {"id": natural_key("bank_limits", normalize_name(bank)), "created_at": now, "updated_at": now},
+            filter={"bank_name": bank},
+        ))
+    if records:
+        yield records
+
+
+SHEET_PARSERS: Dict[str, Callable[[Iterator[List[str]], SheetContext], Iterator[List[ImportRecord]]]] = {
+    "vendas": parse_vendas,
+    "despesas": parse_despesas,
+    "crediario": parse_crediario,
+    "boletos": parse_boletos,
+    "emprestimos": parse_emprestimos,
+    "investimentos": parse_investimentos,
+    "saldos": parse_saldos,
+}
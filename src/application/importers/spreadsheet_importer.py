@@ -0,0 +1,193 @@
+import csv
+import io
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, IO, Iterable, List, Optional, Union
+from pymongo.database import Database
+
+from src.application.services.amortization_engine import AmortizationEngine
+from src.infra.repositories import MongoLoanRepository
+from .bulk_writer import BulkImportWriter
+from .parsing import normalize_name, year_from_filename
+from .sheets import SHEET_PARSERS, ImportRecord, SheetContext, detect_sheet_type
+
+Source = Union[str, Path, bytes, IO]
+
+
+@dataclass
+class ParsedSheet:
+    """Resultado do parse de um arquivo, pronto para ser gravado"""
+    filename: str
+    sheet_type: str
+    scope: Optional[str]
+    chunks: List[List[ImportRecord]] = field(default_factory=list)
+    skipped: int = 0
+    errors: List[str] = field(default_factory=list)
+    parse_ms: float = 0.0
+
+    @property
+    def record_count(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks)
+
+
+def resolve_filename(source: Source, filename: Optional[str] = None) -> str:
+    if filename:
+        return filename
+    if not isinstance(source, (str, Path)):
+        raise ValueError("Nome do arquivo é obrigatório")
+    return Path(source).name
+
+
+def parse_sheet(
+    source: Source,
+    filename: Optional[str] = None,
+    sheet_type: Optional[str] = None,
+    year: Optional[int] = None,
+    modalities: Optional[Dict[str, dict]] = None,
+) -> ParsedSheet:
+    """
+    Faz o parse de um arquivo CSV sem acessar o banco
+
+    Função de módulo (serializável) para poder rodar em um pool de processos.
+
+    Args:
+        source: Caminho, conteúdo (bytes) ou stream do arquivo
+        filename: Nome do arquivo (obrigatório se source não é caminho; define tipo e ano)
+        sheet_type: Tipo da planilha (padrão: detectado pelo nome do arquivo)
+        year: Ano dos dados quando não está no nome do arquivo
+        modalities: Modalidades ativas por nome normalizado
+    """
+    filename = resolve_filename(source, filename)
+    sheet_type = sheet_type or detect_sheet_type(filename)
+    if sheet_type not in SHEET_PARSERS:
+        raise ValueError(f"Tipo de planilha inválido: {sheet_type}")
+
+    started = time.perf_counter()
+    ctx = SheetContext(
+        sheet_type=sheet_type,
+        year=year_from_filename(filename) or year,
+        modalities=modalities or {},
+    )
+
+    with _open(source) as stream:
+        chunks = list(SHEET_PARSERS[sheet_type](csv.reader(stream), ctx))
+
+    return ParsedSheet(
+        filename=filename,
+        sheet_type=sheet_type,
+        scope=ctx.scope,
+        chunks=chunks,
+        skipped=ctx.skipped,
+        errors=ctx.errors,
+        parse_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+
+
+def _open(source: Source):
+    if isinstance(source, (str, Path)):
+        return open(source, "r", encoding="utf-8-sig", newline="")
+    if isinstance(source, (bytes, bytearray)):
+        return io.TextIOWrapper(io.BytesIO(source), encoding="utf-8-sig", newline="")
+    if isinstance(source, io.TextIOBase):
+        return source
+    # Upload (stream binário): decodifica em streaming, sem ler o arquivo todo
+    return io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+
+
+class SpreadsheetImporter:
+    """
+    Importa as planilhas financeiras (CSV exportado do Google Sheets) de uma empresa
+
+    Cada arquivo é lido em streaming com o módulo csv e convertido em blocos
+    de registros; os registros têm _id determinístico (chave natural da linha)
+    e são gravados com upserts em lote. Reimportar a mesma planilha atualiza os
+    documentos existentes em vez de duplicar.
+
+    Uso:
+        importer = SpreadsheetImporter(get_tenant_db(company_id))
+        stats = importer.import_file("Vendas Dezembro_25.csv")
+
+    Para vários arquivos em paralelo, veja ImportPipeline.
+    """
+
+    def __init__(self, tenant_db: Database, batch_size: int = 1000):
+        self._db = tenant_db
+        self._batch_size = batch_size
+        self._modalities: Optional[Dict[str, dict]] = None
+
+    def import_files(self, paths: Iterable[Union[str, Path]], year: Optional[int] = None) -> List[dict]:
+        return [self.import_file(path, year=year) for path in paths]
+
+    def import_file(
+        self,
+        source: Source,
+        filename: Optional[str] = None,
+        sheet_type: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> dict:
+        """
+        Importa um arquivo CSV (parse + gravação)
+
+        Args:
+            source: Caminho do arquivo, conteúdo (bytes) ou stream (texto ou binário)
+            filename: Nome do arquivo (obrigatório para streams; define tipo e ano)
+            sheet_type: Tipo da planilha (padrão: detectado pelo nome do arquivo)
+            year: Ano dos dados quando não está no nome do arquivo
+
+        Returns:
+            Estatísticas da importação
+        """
+        parsed = parse_sheet(source, filename, sheet_type, year, self.modalities())
+        return self.write(parsed)
+
+    def write(self, parsed: ParsedSheet) -> dict:
+        """Grava um arquivo já processado e remove as linhas que saíram da planilha"""
+        started = time.perf_counter()
+        writer = BulkImportWriter(self._db, self._batch_size)
+
+        for records in parsed.chunks:
+            writer.add(records, parsed.scope)
+        writer.flush()
+        writer.prune(parsed.scope)
+
+        if writer.keys("loans"):
+            self._generate_loan_schedules(writer.keys("loans"))
+
+        write_ms = (time.perf_counter() - started) * 1000
+        return {
+            "file": parsed.filename,
+            "sheet_type": parsed.sheet_type,
+            "scope": parsed.scope,
+            **writer.stats,
+            "total_value": round(writer.stats["total_value"], 2),
+            "skipped": parsed.skipped,
+            "errors": parsed.errors,
+            "elapsed_ms": round(parsed.parse_ms + write_ms, 1),
+        }
+
+    def modalities(self) -> Dict[str, dict]:
+        """Modalidades ativas por nome normalizado (sem acento, minúsculo)"""
+        if self._modalities is None:
+            self._modalities = {}
+            for doc in self._db["payment_modalities"].find({"is_active": True}):
+                self._modalities[normalize_name(doc["name"])] = {
+                    "id": str(doc["_id"]),
+                    "name": doc["name"],
+                    "color": doc.get("color", "#9333EA"),
+                    "is_credit_plan": doc.get("is_credit_plan", False),
+                }
+        return self._modalities
+
+    def _generate_loan_schedules(self, loan_ids) -> None:
+        # Só empréstimos sem cronograma (novos): os existentes podem ter sido renegociados
+        scheduled = set(self._db["loan_schedules"].distinct("loan_id", {"loan_id": {"$in": list(loan_ids)}}))
+        repository = MongoLoanRepository(self._db["loans"], self._db["loan_schedules"])
+        engine = AmortizationEngine()
+        for loan_id in set(loan_ids) - scheduled:
+            loan = repository.find_by_id(loan_id)
+            rows = engine.schedule(
+                loan.principal, loan.monthly_rate, loan.term_months,
+                loan.amortization_system, loan.first_due_date
+            )
+            repository.replace_schedule(loan, rows)
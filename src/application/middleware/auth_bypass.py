@@ -5,6 +5,7 @@ Importar este módulo sobrescreverá os decoradores de autenticação.
 
 from flask import g
 from functools import wraps
+from .tenant_quota import call_with_tenant_quota
 
 # Company ID fixo para modo sem autenticação
 COMPANY_ID = "03a24d1f-52fa-429f-9a1c-1b4fc4a9f268"
@@ -20,13 +21,22 @@ def no_auth_decorator(f):
         g.email = "teste@teste.com"
         g.is_super_admin = True
         g.roles = ["Admin"]
-        g.features = []
+        g.features = frozenset()
         return f(*args, **kwargs)
     return wrapper
 
 
+def no_auth_with_quota(f):
+    """Como no_auth_decorator, aplicando a cota da empresa (igual ao require_auth real)"""
+    @no_auth_decorator
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        return call_with_tenant_quota(f, *args, **kwargs)
+    return wrapper
+
+
 # Sobrescrever decoradores
-require_auth = no_auth_decorator
+require_auth = no_auth_with_quota
 require_feature = lambda feature: no_auth_decorator
 require_role = lambda role: no_auth_decorator
 require_super_admin = no_auth_decorator
@@ -1,6 +1,15 @@
 from functools import wraps
 from flask import request, jsonify, g
-from src.infra.security import JWTHandler
+from src.application.services.feature_registry import get_feature_registry
+from src.infra.security import get_jwt_handler
+from .tenant_quota import call_with_tenant_quota
+
+
+def _token_features(payload: dict) -> frozenset:
+    """Features do token: bitset do registro (ou lista de códigos, tokens antigos)"""
+    if "feature_bits" in payload:
+        return get_feature_registry().decode(payload["feature_bits"], payload.get("feature_version", 0))
+    return frozenset(payload.get("features", []))
 
 
 def require_auth(f):
@@ -16,6 +25,8 @@ def require_auth(f):
 
     O token deve ser enviado no header:
         Authorization: Bearer <token>
+
+    Aplica a cota da empresa (429 + Retry-After acima do limite do plano).
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -26,8 +37,7 @@ def require_auth(f):
 
         try:
             token = token.replace('Bearer ', '')
-            jwt_handler = JWTHandler()
-            payload = jwt_handler.verify_token(token)
+            payload = get_jwt_handler().verify_access_token(token)
 
             # Armazena dados do usuário no contexto da requisição
             g.user_id = payload.get('user_id')
@@ -35,13 +45,14 @@ def require_auth(f):
             g.name = payload.get('name')
             g.company_id = payload.get('company_id')
             g.roles = payload.get('roles', [])
-            g.features = payload.get('features', [])
+            g.features = _token_features(payload)
             g.is_super_admin = payload.get('is_super_admin', False)
 
             if not g.user_id:
                 return jsonify({"error": "Token inválido"}), 401
 
-            return f(*args, **kwargs)
+            # Limite de taxa e concorrência do plano da empresa
+            return call_with_tenant_quota(f, *args, **kwargs)
 
         except ValueError as e:
             return jsonify({"error": str(e)}), 401
@@ -0,0 +1,39 @@
+from flask import current_app, g, jsonify
+from src.infra.rate_limit import QuotaExceeded, get_tenant_quota
+
+
+def call_with_tenant_quota(f, *args, **kwargs):
+    """
+    Executa a view dentro da cota da empresa (g.company_id)
+
+    Chamado pelo require_auth depois de preencher o contexto. Acima do limite
+    do plano responde 429 com Retry-After. Uma requisição só reserva uma vez,
+    mesmo com decoradores aninhados. Respostas em streaming ocupam a vaga
+    de concorrência até o fim do envio.
+    """
+    company_id = g.get("company_id")
+    quota = get_tenant_quota()
+    if not company_id or quota is None or g.get("tenant_quota_reserved"):
+        return f(*args, **kwargs)
+
+    try:
+        lease = quota.acquire(company_id)
+    except QuotaExceeded as e:
+        response = jsonify({"error": str(e), "reason": e.reason})
+        response.headers["Retry-After"] = str(e.retry_after)
+        return response, 429
+
+    g.tenant_quota_reserved = True
+    try:
+        response = current_app.make_response(f(*args, **kwargs))
+    except Exception:
+        quota.release(company_id, lease)
+        raise
+
+    if response.is_streamed:
+        # O corpo (NDJSON, ?stream=true) é gerado depois que a view retorna:
+        # a vaga só é liberada quando o servidor termina de enviar
+        response.call_on_close(lambda: quota.release(company_id, lease))
+    else:
+        quota.release(company_id, lease)
+    return response
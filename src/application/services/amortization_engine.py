@@ -0,0 +1,120 @@
+from datetime import date, datetime
+from typing import Dict, List
+import numpy as np
+
+
+class AmortizationEngine:
+    """
+    Gera o cronograma de amortização de empréstimos (Tabela Price e SAC)
+
+    Todas as parcelas são calculadas de uma vez com arrays NumPy:
+    - Price: parcela fixa PMT = P * r / (1 - (1 + r)^-n), saldo em forma fechada
+    - SAC: amortização constante P / n, juros sobre o saldo anterior
+
+    Convenções:
+    - Taxa em percentual ao mês (ex: 1.5 = 1,5% a.m.)
+    - Vencimentos mensais a partir do primeiro vencimento, no mesmo dia do mês
+      (limitado ao último dia nos meses mais curtos)
+    - Valores arredondados em centavos; a última parcela absorve o arredondamento
+    """
+
+    SYSTEMS = ("price", "sac")
+
+    def schedule(
+        self,
+        principal: float,
+        monthly_rate: float,
+        term_months: int,
+        system: str,
+        first_due_date: date,
+        start_number: int = 1
+    ) -> List[Dict]:
+        """
+        Gera as parcelas do empréstimo
+
+        Args:
+            principal: Valor financiado
+            monthly_rate: Taxa de juros em % ao mês
+            term_months: Prazo em meses
+            system: "price" ou "sac"
+            first_due_date: Vencimento da primeira parcela
+            start_number: Número da primeira parcela (renegociação continua a numeração)
+
+        Returns:
+            Lista de parcelas com number, due_date, payment, interest,
+            amortization e balance (saldo após o pagamento)
+        """
+        if system not in self.SYSTEMS:
+            raise ValueError("Sistema de amortização deve ser 'price' ou 'sac'")
+        if principal <= 0:
+            raise ValueError("Valor do empréstimo deve ser maior que zero")
+        if term_months < 1:
+            raise ValueError("Prazo deve ser de pelo menos 1 mês")
+        if monthly_rate < 0:
+            raise ValueError("Taxa de juros não pode ser negativa")
+
+        r = monthly_rate / 100.0
+        k = np.arange(1, term_months + 1, dtype=np.float64)
+
+        if system == "price":
+            interest, amortization = self._price(principal, r, term_months, k)
+        else:
+            interest, amortization = self._sac(principal, r, term_months, k)
+
+        if system == "price":
+            # Parcela fixa em centavos; a amortização absorve o arredondamento dos juros
+            fixed_payment = round(float(interest[0] + amortization[0]), 2)
+            interest = np.round(interest, 2)
+            amortization = np.round(fixed_payment - interest, 2)
+        else:
+            interest = np.round(interest, 2)
+            amortization = np.round(amortization, 2)
+        # Ajusta a última amortização para zerar o saldo após o arredondamento
+        amortization[-1] = round(principal - float(amortization[:-1].sum()), 2)
+        payment = np.round(interest + amortization, 2)
+        balance = np.round(principal - np.cumsum(amortization), 2)
+        balance[-1] = 0.0
+
+        due_dates = self._due_dates(first_due_date, term_months)
+
+        return [
+            {
+                "number": start_number + i,
+                "due_date": due_dates[i],
+                "payment": float(payment[i]),
+                "interest": float(interest[i]),
+                "amortization": float(amortization[i]),
+                "balance": float(balance[i]),
+            }
+            for i in range(term_months)
+        ]
+
+    @staticmethod
+    def _price(principal: float, r: float, n: int, k):
+        if r == 0:
+            return np.zeros(n), np.full(n, principal / n)
+
+        growth = np.power(1.0 + r, k - 1)
+        pmt = principal * r / (1.0 - (1.0 + r) ** -n)
+        # Saldo antes do pagamento k: P(1+r)^(k-1) - PMT * ((1+r)^(k-1) - 1) / r
+        opening_balance = principal * growth - pmt * (growth - 1.0) / r
+        interest = opening_balance * r
+        return interest, pmt - interest
+
+    @staticmethod
+    def _sac(principal: float, r: float, n: int, k):
+        amortization = np.full(n, principal / n)
+        opening_balance = principal - amortization * (k - 1)
+        return opening_balance * r, amortization
+
+    @staticmethod
+    def _due_dates(first_due_date: date, n: int) -> List[datetime]:
+        if isinstance(first_due_date, datetime):
+            first_due_date = first_due_date.date()
+
+        months = np.datetime64(first_due_date, "M") + np.arange(n)
+        month_ends = (months + 1).astype("datetime64[D]") - 1
+        days = np.minimum(
+            months.astype("datetime64[D]") + (first_due_date.day - 1), month_ends
+        )
+        return [datetime.combine(d, datetime.min.time()) for d in days.astype(date)]
@@ -0,0 +1,338 @@
+import os
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.infra.cache import SingleFlight, TenantWriteVersion, get_tenant_write_version
+
+WEEKDAYS = ["segunda", "terça", "quarta", "quinta", "sexta", "sábado", "domingo"]
+DIMENSIONS = ("day", "weekday", "month", "year", "modality", "type", "entry_type")
+MEASURES = ("sum", "count", "avg")
+
+# Acima disso a chave composta não cabe em um bincount denso
+_DENSE_KEY_LIMIT = 1 << 22
+
+
+def _month_index(value: date) -> int:
+    """Meses desde 1970-01"""
+    return (value.year - 1970) * 12 + value.month - 1
+
+
+class _Categories:
+    """Dicionário de códigos: valor -> código inteiro, com o rótulo de cada código"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.labels: List[str] = []
+
+    def code(self, key: str, label: str) -> int:
+        code = self.codes.get(key)
+        if code is None:
+            code = self.codes[key] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+
+class TenantColumns:
+    """
+    Lançamentos de uma empresa em colunas NumPy
+
+    Colunas: days (ordinal da data), months (meses desde 1970-01), values,
+    modality/type/entry_type (códigos de categoria). Os arrays têm folga de
+    capacidade para o append de lançamentos novos não realocar a cada escrita.
+    """
+
+    def __init__(self, version: int):
+        self.version = version
+        self._lock = threading.Lock()
+        self._size = 0
+        self._days = np.empty(0, dtype=np.int32)
+        self._months = np.empty(0, dtype=np.int32)
+        self._values = np.empty(0, dtype=np.float64)
+        self._modality = np.empty(0, dtype=np.int32)
+        self._type = np.empty(0, dtype=np.int16)
+        self._entry_type = np.empty(0, dtype=np.int16)
+        self.modalities = _Categories()
+        self.types = _Categories()
+        self.entry_types = _Categories()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (
+            self._days, self._months, self._values, self._modality, self._type, self._entry_type
+        ))
+
+    def append(self, docs: Iterable[dict]) -> int:
+        """Acrescenta lançamentos (documentos do Mongo ou FinancialEntry.to_dict())"""
+        days, months, values, modality, types, entry_types = [], [], [], [], [], []
+        for doc in docs:
+            day = date.fromisoformat(str(doc["date"])[:10])
+            days.append(day.toordinal())
+            months.append(_month_index(day))
+            values.append(float(doc["value"]))
+            modality.append(self.modalities.code(
+                doc.get("modality_id") or "", doc.get("modality_name") or "Sem modalidade"
+            ))
+            entry_type = doc.get("type") or "received"
+            types.append(self.types.code(entry_type, entry_type))
+            kind = doc.get("entry_type") or "normal"
+            entry_types.append(self.entry_types.code(kind, kind))
+
+        if not days:
+            return 0
+
+        with self._lock:
+            start = self._size
+            self._reserve(start + len(days))
+            end = start + len(days)
+            self._days[start:end] = days
+            self._months[start:end] = months
+            self._values[start:end] = values
+            self._modality[start:end] = modality
+            self._type[start:end] = types
+            self._entry_type[start:end] = entry_types
+            self._size = end
+        return len(days)
+
+    def groupby(
+        self,
+        dims: Sequence[str],
+        measure: str = "sum",
+        start_day: Optional[int] = None,
+        end_day: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Agrupa os lançamentos por dims (vetorizado)
+
+        Args:
+            dims: Dimensões (DIMENSIONS), na ordem das chaves do resultado
+            measure: sum, count ou avg sobre value
+            start_day/end_day: Ordinais das datas (inclusive)
+
+        Returns:
+            Linhas {dim: rótulo, ..., "value": medida, "count": qtd}, na ordem das chaves
+        """
+        if measure not in MEASURES:
+            raise ValueError(f"Medida inválida: {measure}. Use: {', '.join(MEASURES)}")
+        for dim in dims:
+            if dim not in DIMENSIONS:
+                raise ValueError(f"Dimensão inválida: {dim}. Use: {', '.join(DIMENSIONS)}")
+
+        with self._lock:
+            size = self._size
+            columns = {
+                "days": self._days[:size], "months": self._months[:size], "values": self._values[:size],
+                "modality": self._modality[:size], "type": self._type[:size],
+                "entry_type": self._entry_type[:size],
+            }
+            labels = {
+                "modality": list(self.modalities.labels), "type": list(self.types.labels),
+                "entry_type": list(self.entry_types.labels),
+            }
+
+        if start_day is not None or end_day is not None:
+            mask = np.ones(size, dtype=bool)
+            if start_day is not None:
+                mask &= columns["days"] >= start_day
+            if end_day is not None:
+                mask &= columns["days"] <= end_day
+            columns = {name: column[mask] for name, column in columns.items()}
+
+        values = columns["values"]
+        if values.size == 0:
+            return []
+
+        # Chave composta em base mista: um inteiro por combinação de dimensões
+        key = np.zeros(values.size, dtype=np.int64)
+        decoders = []
+        radix = 1
+        for dim in dims:
+            codes, cardinality, label = self._dimension(dim, columns, labels)
+            key = key * cardinality + codes
+            radix *= cardinality
+            decoders.append((dim, cardinality, label))
+
+        if radix <= _DENSE_KEY_LIMIT:
+            counts = np.bincount(key, minlength=radix)
+            sums = np.bincount(key, weights=values, minlength=radix)
+            keys = np.flatnonzero(counts)
+            counts, sums = counts[keys], sums[keys]
+        else:
+            keys, inverse = np.unique(key, return_inverse=True)
+            counts = np.bincount(inverse)
+            sums = np.bincount(inverse, weights=values)
+
+        if measure == "sum":
+            measured = sums
+        elif measure == "count":
+            measured = counts
+        else:
+            measured = sums / counts
+
+        rows = []
+        for composite, value, count in zip(keys.tolist(), measured.tolist(), counts.tolist()):
+            row = {}
+            for dim, cardinality, label in reversed(decoders):
+                composite, code = divmod(composite, cardinality)
+                row[dim] = label(code)
+            rows.append({
+                **{dim: row[dim] for dim in dims},
+                "value": round(value, 2) if measure != "count" else int(value),
+                "count": int(count),
+            })
+        return rows
+
+    @staticmethod
+    def _dimension(dim: str, columns: Dict[str, np.ndarray], labels: Dict[str, List[str]]):
+        """(códigos 0..n-1, n, código -> rótulo) de uma dimensão"""
+        if dim == "weekday":
+            # Ordinal 1 (0001-01-01) é segunda-feira
+            return (columns["days"] - 1) % 7, 7, lambda c: WEEKDAYS[c]
+        if dim == "day":
+            first = int(columns["days"].min())
+            return (columns["days"] - first, int(columns["days"].max()) - first + 1,
+                    lambda c: date.fromordinal(first + c).isoformat())
+        if dim == "month":
+            first = int(columns["months"].min())
+            return (columns["months"] - first, int(columns["months"].max()) - first + 1,
+                    lambda c: f"{1970 + (first + c) // 12}-{(first + c) % 12 + 1:02d}")
+        if dim == "year":
+            years = columns["months"] // 12
+            first = int(years.min())
+            return years - first, int(years.max()) - first + 1, lambda c: str(1970 + first + c)
+
+        names = labels[dim]
+        return columns[dim].astype(np.int64), max(1, len(names)), lambda c: names[c]
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._days.shape[0]
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 1024)
+        for name in ("_days", "_months", "_values", "_modality", "_type", "_entry_type"):
+            old = getattr(self, name)
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[:self._size] = old[:self._size]
+            setattr(self, name, grown)
+
+
+class ColumnarStore:
+    """
+    Cache de TenantColumns por empresa, com orçamento global de memória
+
+    A primeira consulta de análise da empresa carrega os lançamentos (uma
+    única vez, mesmo com requisições simultâneas). As colunas valem para a
+    versão de escrita da empresa em que foram carregadas: a criação de
+    lançamentos acrescenta as linhas e avança a versão (append); qualquer
+    outra escrita muda a versão e as colunas são recarregadas na próxima
+    consulta. Acima de max_bytes as empresas menos usadas saem (LRU).
+    Colunas lidas enquanto a versão mudava servem só a consulta que as
+    carregou.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Iterable[dict]],
+        max_bytes: int = 256 * 1024 * 1024,
+        version_source: Optional[TenantWriteVersion] = None,
+    ):
+        self._loader = loader
+        self._max_bytes = max_bytes
+        self._version_source = version_source
+        self._lock = threading.Lock()
+        self._tenants: "OrderedDict[str, TenantColumns]" = OrderedDict()
+        self._flight = SingleFlight()
+
+    def get(self, company_id: str) -> TenantColumns:
+        version = self._versions().current(company_id)
+        with self._lock:
+            columns = self._tenants.get(company_id)
+            if columns is not None and columns.version == version:
+                self._tenants.move_to_end(company_id)
+                return columns
+
+        return self._flight.do((company_id, version), lambda: self._load(company_id, version))
+
+    def append(self, company_id: str, docs: Iterable[dict], versions: Tuple[int, int]) -> bool:
+        """
+        Acrescenta lançamentos recém-criados às colunas carregadas
+
+        Args:
+            versions: (versão anterior, nova versão), de mark_tenant_write
+
+        Returns:
+            False se as colunas não estavam carregadas ou já estavam
+            desatualizadas (serão recarregadas na próxima consulta)
+        """
+        previous, current = versions
+        with self._lock:
+            columns = self._tenants.get(company_id)
+            if columns is None or columns.version != previous:
+                return False
+            columns.append(docs)
+            columns.version = current
+            self._evict()
+        return True
+
+    def memory_usage(self) -> Dict[str, int]:
+        with self._lock:
+            return {company_id: columns.nbytes for company_id, columns in self._tenants.items()}
+
+    def _load(self, company_id: str, version: int) -> TenantColumns:
+        columns = TenantColumns(version)
+        columns.append(self._loader(company_id))
+        if self._versions().current(company_id) != version:
+            # Escrita durante a leitura: as linhas podem já conter lançamentos
+            # que o append da mesma escrita acrescentaria de novo
+            return columns
+        with self._lock:
+            self._tenants[company_id] = columns
+            self._tenants.move_to_end(company_id)
+            self._evict(keep=company_id)
+        return columns
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        total = sum(columns.nbytes for columns in self._tenants.values())
+        for company_id in list(self._tenants):
+            if total <= self._max_bytes:
+                break
+            if company_id == keep:
+                continue
+            total -= self._tenants.pop(company_id).nbytes
+
+    def _versions(self) -> TenantWriteVersion:
+        if self._version_source is None:
+            self._version_source = get_tenant_write_version()
+        return self._version_source
+
+
+def _load_entries(company_id: str) -> Iterable[dict]:
+    from src.database import get_tenant_db
+    from src.infra.database.archive_catalog import ArchiveCatalog
+
+    projection = {"date": 1, "value": 1, "modality_id": 1, "modality_name": 1, "type": 1, "entry_type": 1}
+    collection = get_tenant_db(company_id)["financial_entries"]
+    # Análises cobrem todo o histórico, inclusive os anos arquivados
+    for source in [collection] + ArchiveCatalog(collection).all_collections():
+        yield from source.find({}, projection, batch_size=5000)
+
+
+# Singleton global
+_columnar_store = None
+
+
+def get_columnar_store() -> ColumnarStore:
+    """Retorna a instância singleton do ColumnarStore (ANALYTICS_MEMORY_MB, padrão 256)"""
+    global _columnar_store
+    if _columnar_store is None:
+        _columnar_store = ColumnarStore(
+            _load_entries, max_bytes=int(float(os.getenv("ANALYTICS_MEMORY_MB", "256")) * 1024 * 1024)
+        )
+    return _columnar_store
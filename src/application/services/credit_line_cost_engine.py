@@ -0,0 +1,176 @@
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+from src.domain.entities.bank_limit import BankLimit
+
+
+class CreditLineCostEngine:
+    """
+    Motor de custo das linhas de crédito bancárias (rotativo e cheque especial)
+
+    Para cada linha calcula, dia a dia, os juros compostos e o IOF
+    (fixo + diário) acumulados sobre o saldo, e o CET equivalente.
+    Todas as linhas e todos os dias são calculados de uma vez com arrays
+    NumPy (linhas x dias), sem laços por dia.
+
+    Convenções:
+    - Taxas em percentual ao mês (ex: 1.94 = 1,94% a.m.), mês comercial de 30 dias
+    - IOF fixo em percentual sobre o valor utilizado (ex: 0.38)
+    - IOF diário em percentual ao dia (ex: 0.0082), limitado a 365 dias
+    - "available" é o limite contratado; a folga para saque é available - used
+    """
+
+    DAYS_PER_MONTH = 30
+    IOF_MAX_DAYS = 365
+    MAX_HORIZON_DAYS = 3650
+
+    LINES = (
+        ("rotativo", "rotativo_available", "rotativo_used", "rotativo_rate"),
+        ("cheque_especial", "cheque_available", "cheque_used", "cheque_rate"),
+    )
+
+    def project(
+        self,
+        bank_limits: List[BankLimit],
+        days: int,
+        amount: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Projeta o custo das linhas de crédito em um horizonte de dias
+
+        Args:
+            bank_limits: Limites bancários da empresa
+            days: Horizonte em dias
+            amount: Valor a sacar (opcional) - gera o ranking da linha mais barata
+
+        Returns:
+            Dict com "lines" (custo do saldo atual de cada linha),
+            "totals" e "ranking" (None quando amount não é informado)
+        """
+        if days < 1 or days > self.MAX_HORIZON_DAYS:
+            raise ValueError(f"Horizonte deve estar entre 1 e {self.MAX_HORIZON_DAYS} dias")
+        if amount is not None and amount <= 0:
+            raise ValueError("Valor a sacar deve ser maior que zero")
+
+        lines = self._flatten(bank_limits)
+        if not lines:
+            return {
+                "days": days,
+                "lines": [],
+                "totals": self._empty_totals(),
+                "ranking": [] if amount is not None else None,
+            }
+
+        rates = np.array([line["rate"] for line in lines], dtype=np.float64) / 100.0
+        iof_rates = np.array([line["iof_rate"] for line in lines], dtype=np.float64) / 100.0
+        iof_daily = np.array([line["iof_daily_rate"] for line in lines], dtype=np.float64) / 100.0
+        used = np.array([line["used"] for line in lines], dtype=np.float64)
+        headroom = np.maximum(
+            np.array([line["available"] for line in lines], dtype=np.float64) - used, 0.0
+        )
+
+        # Fator de custo por real utilizado: matriz (linhas x dias)
+        cost_factor, interest_factor, iof_factor = self._cost_factors(rates, iof_rates, iof_daily, days)
+
+        interest = used[:, None] * interest_factor
+        iof = used[:, None] * iof_factor
+        cost = interest + iof
+
+        cet_month, cet_year = self._cet(cost_factor[:, -1], days)
+
+        result_lines = []
+        for i, line in enumerate(lines):
+            result_lines.append({
+                "bank_name": line["bank_name"],
+                "line": line["line"],
+                "limit_id": line["limit_id"],
+                "monthly_rate": line["rate"],
+                "available": line["available"],
+                "used": line["used"],
+                "headroom": round(float(headroom[i]), 2),
+                "interest": round(float(interest[i, -1]), 2),
+                "iof": round(float(iof[i, -1]), 2),
+                "total_cost": round(float(cost[i, -1]), 2),
+                "cet_month": round(float(cet_month[i]) * 100, 4),
+                "cet_year": round(float(cet_year[i]) * 100, 4),
+                "daily_cost": np.round(cost[i], 2).tolist(),
+            })
+
+        result = {
+            "days": days,
+            "lines": result_lines,
+            "totals": {
+                "used": round(float(used.sum()), 2),
+                "interest": round(float(interest[:, -1].sum()), 2),
+                "iof": round(float(iof[:, -1].sum()), 2),
+                "total_cost": round(float(cost[:, -1].sum()), 2),
+                "daily_cost": np.round(cost.sum(axis=0), 2).tolist(),
+            },
+        }
+
+        result["ranking"] = (
+            self._rank(lines, headroom, cost_factor[:, -1], cet_month, cet_year, amount)
+            if amount is not None else None
+        )
+
+        return result
+
+    def _cost_factors(self, rates, iof_rates, iof_daily, days: int):
+        t = np.arange(1, days + 1, dtype=np.float64)[None, :]
+
+        daily_rates = np.power(1.0 + rates, 1.0 / self.DAYS_PER_MONTH) - 1.0
+        interest_factor = np.power(1.0 + daily_rates[:, None], t) - 1.0
+        iof_factor = iof_rates[:, None] + iof_daily[:, None] * np.minimum(t, self.IOF_MAX_DAYS)
+
+        return interest_factor + iof_factor, interest_factor, iof_factor
+
+    def _cet(self, final_cost_factor, days: int):
+        cet_month = np.power(1.0 + final_cost_factor, self.DAYS_PER_MONTH / days) - 1.0
+        cet_year = np.power(1.0 + cet_month, 12) - 1.0
+        return cet_month, cet_year
+
+    def _rank(self, lines, headroom, final_cost_factor, cet_month, cet_year, amount: float) -> List[Dict]:
+        costs = final_cost_factor * amount
+        order = np.argsort(costs, kind="stable")
+
+        ranking = []
+        for i in order:
+            ranking.append({
+                "bank_name": lines[i]["bank_name"],
+                "line": lines[i]["line"],
+                "limit_id": lines[i]["limit_id"],
+                "amount": amount,
+                "headroom": round(float(headroom[i]), 2),
+                "fits": bool(headroom[i] >= amount),
+                "total_cost": round(float(costs[i]), 2),
+                "cet_month": round(float(cet_month[i]) * 100, 4),
+                "cet_year": round(float(cet_year[i]) * 100, 4),
+            })
+
+        # Linhas com folga suficiente primeiro, cada grupo da mais barata para a mais cara
+        ranking.sort(key=lambda item: not item["fits"])
+        return ranking
+
+    def _flatten(self, bank_limits: List[BankLimit]) -> List[Dict]:
+        lines = []
+        for limit in bank_limits:
+            for line_name, available_attr, used_attr, rate_attr in self.LINES:
+                available = float(getattr(limit, available_attr) or 0.0)
+                used = float(getattr(limit, used_attr) or 0.0)
+                if available <= 0 and used <= 0:
+                    continue
+                lines.append({
+                    "limit_id": limit.id,
+                    "bank_name": limit.bank_name,
+                    "line": line_name,
+                    "available": available,
+                    "used": used,
+                    "rate": float(getattr(limit, rate_attr) or 0.0),
+                    "iof_rate": float(limit.iof_rate or 0.0),
+                    "iof_daily_rate": float(limit.iof_daily_rate or 0.0),
+                })
+        return lines
+
+    @staticmethod
+    def _empty_totals() -> Dict:
+        return {"used": 0.0, "interest": 0.0, "iof": 0.0, "total_cost": 0.0, "daily_cost": []}
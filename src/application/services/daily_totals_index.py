@@ -0,0 +1,221 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from src.infra.cache import TenantWriteVersion, get_tenant_write_version
+
+logger = logging.getLogger(__name__)
+
+SeriesKey = Tuple[str, str]  # (type, entry_type)
+
+
+class TenantDailyTotals:
+    """
+    Somas acumuladas dos totais diários de uma empresa, por (type, entry_type)
+
+    Para cada série, prefix[i] é a soma dos dias first_day .. first_day + i - 1.
+    O total de qualquer intervalo é a diferença de duas posições: O(1),
+    independente do tamanho do intervalo.
+    """
+
+    def __init__(self, version: int):
+        self.version = version
+        self._lock = threading.Lock()
+        self._first_day: Optional[int] = None
+        self._series: Dict[SeriesKey, np.ndarray] = {}
+
+    @classmethod
+    def from_rollup(cls, rows: Iterable[dict], version: int) -> "TenantDailyTotals":
+        """Monta as somas a partir dos totais diários ({"day", "type", "entry_type", "total"})"""
+        index = cls(version)
+        by_series: Dict[SeriesKey, Tuple[list, list]] = {}
+        for row in rows:
+            days, totals = by_series.setdefault((row["type"], row["entry_type"]), ([], []))
+            days.append(date.fromisoformat(row["day"]).toordinal())
+            totals.append(row["total"])
+
+        if not by_series:
+            return index
+
+        first = min(min(days) for days, _ in by_series.values())
+        last = max(max(days) for days, _ in by_series.values())
+        for key, (days, totals) in by_series.items():
+            daily = np.zeros(last - first + 1, dtype=np.float64)
+            np.add.at(daily, np.asarray(days) - first, totals)
+            index._series[key] = np.concatenate(([0.0], np.cumsum(daily)))
+        index._first_day = first
+        return index
+
+    def total(
+        self,
+        start: date,
+        end: date,
+        type: Optional[str] = None,
+        entry_type: Optional[str] = None
+    ) -> float:
+        """Total de start a end (inclusive), opcionalmente filtrado por type/entry_type"""
+        with self._lock:
+            if self._first_day is None:
+                return 0.0
+            days = next(iter(self._series.values())).shape[0] - 1
+            lo = max(start.toordinal(), self._first_day) - self._first_day
+            hi = min(end.toordinal(), self._first_day + days - 1) - self._first_day
+            if lo > hi:
+                return 0.0
+
+            total = 0.0
+            for (series_type, series_entry_type), prefix in self._series.items():
+                if type and series_type != type:
+                    continue
+                if entry_type and series_entry_type != entry_type:
+                    continue
+                total += prefix[hi + 1] - prefix[lo]
+        return round(float(total), 2)
+
+    def add(self, day: date, value: float, type: str = "received", entry_type: str = "normal") -> None:
+        """Soma um lançamento novo (estende o intervalo de dias se preciso)"""
+        ordinal = day.toordinal()
+        key = (type or "received", entry_type or "normal")
+        with self._lock:
+            if self._first_day is None:
+                self._first_day = ordinal
+                self._series[key] = np.zeros(2, dtype=np.float64)
+            self._extend(ordinal)
+            if key not in self._series:
+                length = next(iter(self._series.values())).shape[0]
+                self._series[key] = np.zeros(length, dtype=np.float64)
+            self._series[key][ordinal - self._first_day + 1:] += value
+
+    def _extend(self, ordinal: int) -> None:
+        length = next(iter(self._series.values())).shape[0]
+        last = self._first_day + length - 2
+        if ordinal > last:
+            extra = ordinal - last
+            for key, prefix in self._series.items():
+                self._series[key] = np.concatenate((prefix, np.full(extra, prefix[-1])))
+        elif ordinal < self._first_day:
+            extra = self._first_day - ordinal
+            for key, prefix in self._series.items():
+                self._series[key] = np.concatenate((np.zeros(extra), prefix))
+            self._first_day = ordinal
+
+
+class DailyTotalsIndex:
+    """
+    Índice de somas acumuladas por empresa, para totais de intervalos em O(1)
+
+    lookup() devolve o índice só se ele corresponde à versão de escrita
+    atual da empresa; senão agenda a reconstrução (a partir dos totais
+    diários agregados no banco) em segundo plano e devolve None, para quem
+    chamou responder com a agregação. A criação de lançamentos soma os
+    valores no índice (patch) e avança a versão; as demais escritas o
+    invalidam.
+
+    Uma reconstrução durante a qual a versão mudou é descartada: os totais
+    lidos podem já incluir um lançamento que o patch da mesma escrita
+    somaria de novo.
+    """
+
+    def __init__(
+        self,
+        rollup_loader: Callable[[str], Iterable[dict]],
+        version_source: Optional[TenantWriteVersion] = None,
+        max_tenants: int = 512,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        self._rollup_loader = rollup_loader
+        self._version_source = version_source
+        self._max_tenants = max_tenants
+        self._executor = executor or ThreadPoolExecutor(max_workers=2, thread_name_prefix="daily-totals")
+        self._lock = threading.Lock()
+        self._tenants: "OrderedDict[str, TenantDailyTotals]" = OrderedDict()
+        self._building: set = set()
+
+    def lookup(self, company_id: str) -> Optional[TenantDailyTotals]:
+        version = self._versions().current(company_id)
+        with self._lock:
+            index = self._tenants.get(company_id)
+            if index is not None and index.version == version:
+                self._tenants.move_to_end(company_id)
+                return index
+
+            if (company_id, version) in self._building:
+                return None
+            self._building.add((company_id, version))
+
+        self._executor.submit(self._rebuild, company_id, version)
+        return None
+
+    def build(self, company_id: str) -> TenantDailyTotals:
+        """Reconstrói o índice da empresa agora (síncrono)"""
+        return self._rebuild(company_id, self._versions().current(company_id))
+
+    def patch(self, company_id: str, entries: Iterable[dict], versions: Tuple[int, int]) -> bool:
+        """
+        Soma lançamentos recém-criados (FinancialEntry.to_dict()) ao índice
+
+        Args:
+            versions: (versão anterior, nova versão), de mark_tenant_write
+
+        Returns:
+            False se o índice não estava carregado ou já estava desatualizado
+        """
+        previous, current = versions
+        with self._lock:
+            index = self._tenants.get(company_id)
+            if index is None or index.version != previous:
+                return False
+            for entry in entries:
+                index.add(
+                    date.fromisoformat(str(entry["date"])[:10]), float(entry["value"]),
+                    entry.get("type"), entry.get("entry_type"),
+                )
+            index.version = current
+        return True
+
+    def _rebuild(self, company_id: str, version: int) -> TenantDailyTotals:
+        try:
+            index = TenantDailyTotals.from_rollup(self._rollup_loader(company_id), version)
+            if self._versions().current(company_id) != version:
+                return index
+            with self._lock:
+                self._tenants[company_id] = index
+                self._tenants.move_to_end(company_id)
+                while len(self._tenants) > self._max_tenants:
+                    self._tenants.popitem(last=False)
+            return index
+        except Exception:
+            logger.exception("Falha ao montar o índice de totais da empresa %s", company_id)
+            raise
+        finally:
+            with self._lock:
+                self._building.discard((company_id, version))
+
+    def _versions(self) -> TenantWriteVersion:
+        if self._version_source is None:
+            self._version_source = get_tenant_write_version()
+        return self._version_source
+
+
+def _load_rollup(company_id: str):
+    from src.database import get_tenant_db
+    from src.infra.repositories import MongoFinancialEntryRepository
+
+    return MongoFinancialEntryRepository(get_tenant_db(company_id)["financial_entries"]).get_daily_totals()
+
+
+# Singleton global
+_daily_totals_index = None
+
+
+def get_daily_totals_index() -> DailyTotalsIndex:
+    """Retorna a instância singleton do DailyTotalsIndex"""
+    global _daily_totals_index
+    if _daily_totals_index is None:
+        _daily_totals_index = DailyTotalsIndex(_load_rollup)
+    return _daily_totals_index
@@ -0,0 +1,134 @@
+import base64
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from src.domain.repositories import FeatureRepository
+
+
+class FeatureRegistry:
+    """
+    Registro versionado de features: cada feature tem um bit fixo
+
+    O token de acesso carrega as features do usuário como um bitset em base64
+    (feature_bits) e a versão do registro que o gerou (feature_version), em vez
+    da lista de códigos. Os bits só são acrescentados, nunca reutilizados, então
+    um token antigo continua válido com um registro mais novo; a versão é o
+    total de bits atribuídos.
+
+    O decode de cada bitset fica em cache (LRU): o mesmo token, enviado em
+    dezenas de requisições, vira um frozenset uma única vez e require_feature
+    testa a permissão em O(1).
+    """
+
+    MAX_DECODED = 2048
+
+    def __init__(self, feature_repository: FeatureRepository):
+        self._feature_repository = feature_repository
+        self._lock = threading.Lock()
+        self._bits: Dict[str, int] = {}
+        self._codes: Dict[int, str] = {}
+        self._codes_by_id: Dict[str, str] = {}
+        self._version: Optional[int] = None
+        self._decoded: "OrderedDict[Tuple[str, int], FrozenSet[str]]" = OrderedDict()
+
+    @property
+    def version(self) -> int:
+        if self._version is None:
+            self.refresh()
+        return self._version
+
+    def refresh(self) -> None:
+        """Recarrega as features e atribui bit às que ainda não têm"""
+        features = self._feature_repository.find_all()
+        for feature in features:
+            if feature.bit is None:
+                feature.bit = self._feature_repository.assign_bit(feature.id)
+
+        with self._lock:
+            self._bits = {f.code: f.bit for f in features if f.bit is not None}
+            self._codes = {bit: code for code, bit in self._bits.items()}
+            self._codes_by_id = {f.id: f.code for f in features}
+            self._version = max(self._codes) + 1 if self._codes else 0
+
+    def codes_for_ids(self, feature_ids: Iterable[str]) -> List[str]:
+        """Converte IDs de features (das roles) em códigos"""
+        feature_ids = list(feature_ids)
+        if self._version is None or any(fid not in self._codes_by_id for fid in feature_ids):
+            self.refresh()
+        return [self._codes_by_id[fid] for fid in feature_ids if fid in self._codes_by_id]
+
+    def encode(self, codes: Iterable[str]) -> Tuple[str, int]:
+        """
+        Codifica códigos de features no bitset do token
+
+        Returns:
+            Tupla (bitset em base64 url-safe sem padding, versão do registro)
+        """
+        codes = list(codes)
+        if self._version is None or any(code not in self._bits for code in codes):
+            self.refresh()
+
+        mask = 0
+        for code in codes:
+            bit = self._bits.get(code)
+            if bit is not None:
+                mask |= 1 << bit
+
+        raw = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii"), self._version
+
+    def decode(self, bitset: str, version: int) -> FrozenSet[str]:
+        """
+        Decodifica o bitset do token nos códigos das features
+
+        Raises:
+            ValueError: Se o bitset for inválido
+        """
+        key = (bitset, version)
+        with self._lock:
+            decoded = self._decoded.get(key)
+            if decoded is not None:
+                self._decoded.move_to_end(key)
+                return decoded
+
+        # Token gerado por um registro mais novo (feature criada em outro processo)
+        if self._version is None or version > self._version:
+            self.refresh()
+
+        try:
+            raw = base64.urlsafe_b64decode(bitset + "=" * (-len(bitset) % 4))
+        except (ValueError, TypeError):
+            raise ValueError("Token inválido")
+
+        mask = int.from_bytes(raw, "little")
+        codes = []
+        while mask:
+            low = mask & -mask
+            code = self._codes.get(low.bit_length() - 1)
+            if code is not None:
+                codes.append(code)
+            mask ^= low
+        decoded = frozenset(codes)
+
+        with self._lock:
+            self._decoded[key] = decoded
+            while len(self._decoded) > self.MAX_DECODED:
+                self._decoded.popitem(last=False)
+
+        return decoded
+
+
+# Singleton global
+_feature_registry = None
+
+
+def get_feature_registry() -> FeatureRegistry:
+    """Retorna a instância singleton do FeatureRegistry (features do banco compartilhado)"""
+    global _feature_registry
+    if _feature_registry is None:
+        from src.database import get_shared_db
+        from src.infra.repositories import MongoFeatureRepository
+
+        _feature_registry = FeatureRegistry(MongoFeatureRepository(get_shared_db()["features"]))
+    return _feature_registry
@@ -0,0 +1,223 @@
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from pymongo import ASCENDING, ReplaceOne
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+from src.infra.database.archive_catalog import ArchiveCatalog
+
+
+class _NoTransaction:
+    def run(self, fn: Callable[[Optional[Any]], Any]) -> Any:
+        return fn(None)
+
+
+class FinancialArchiver:
+    """
+    Move períodos fechados para coleções de arquivo por ano, e de volta
+
+    Um lançamento é arquivado quando a data dele é anterior ao corte (primeiro
+    dia do mês, older_than_months atrás) e nenhuma parcela dele está em
+    aberto; as parcelas vão junto (arquivo do ano de vencimento). Assim a
+    coleção principal de parcelas nunca fica com parcela sem lançamento.
+
+    Cada lote é copiado (upsert), registrado no catálogo e apagado da
+    coleção de origem em uma transação. Sem transação um lote interrompido
+    deixaria o documento nas duas coleções, e as somas que juntam a coleção
+    principal e o arquivo (totais, análises, faturamento) o contariam duas
+    vezes; por isso, com um runner que informa supported() == False (mongod
+    standalone), mover documentos é recusado.
+    """
+
+    ENTRIES = "financial_entries"
+    INSTALLMENTS = "installments"
+
+    def __init__(self, tenant_db: Database, transaction_runner=None, batch_size: int = 500):
+        self._db = tenant_db
+        self._transactions = transaction_runner or _NoTransaction()
+        self._batch_size = batch_size
+        self._catalogs = {
+            kind: ArchiveCatalog(tenant_db[kind]) for kind in (self.ENTRIES, self.INSTALLMENTS)
+        }
+
+    def archive(self, older_than_months: int, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Returns:
+            {"cutoff", "entries_archived", "installments_archived", "entries_kept_open", "years"}
+        """
+        if older_than_months < 1:
+            raise ValueError("older_than_months deve ser pelo menos 1")
+        self._require_transactions()
+
+        cutoff = self._cutoff(today or date.today(), older_than_months)
+        entries = self._db[self.ENTRIES]
+        installments = self._db[self.INSTALLMENTS]
+        stats = {"cutoff": cutoff.isoformat(), "entries_archived": 0, "installments_archived": 0,
+                 "entries_kept_open": 0, "years": set()}
+
+        last_id = None
+        while True:
+            query = {"date": {"$lt": cutoff.isoformat()}}
+            if last_id is not None:
+                query["_id"] = {"$gt": last_id}
+            ids = [doc["_id"] for doc in entries.find(query, {"_id": 1}).sort("_id", ASCENDING).limit(self._batch_size)]
+            if not ids:
+                break
+            last_id = ids[-1]
+
+            open_ids = set(installments.distinct("financial_entry_id", {
+                "financial_entry_id": {"$in": ids},
+                "is_paid": False,
+                "is_anticipated": {"$ne": True},
+            }))
+            movable = [entry_id for entry_id in ids if entry_id not in open_ids]
+            stats["entries_kept_open"] += len(open_ids)
+            if not movable:
+                continue
+
+            entry_docs = list(entries.find({"_id": {"$in": movable}}))
+            installment_docs = list(installments.find({"financial_entry_id": {"$in": movable}}))
+            entry_years = self._by_year(entry_docs, "date")
+            installment_years = self._by_year(installment_docs, "due_date")
+            self._ensure_indexes(entry_years, installment_years)
+
+            def move(session):
+                self._copy(self.ENTRIES, entry_years, session)
+                self._copy(self.INSTALLMENTS, installment_years, session)
+                entries.delete_many({"_id": {"$in": movable}}, session=session)
+                installments.delete_many({"financial_entry_id": {"$in": movable}}, session=session)
+
+            self._transactions.run(move)
+            stats["entries_archived"] += len(entry_docs)
+            stats["installments_archived"] += len(installment_docs)
+            stats["years"].update(entry_years)
+
+        stats["years"] = sorted(stats["years"])
+        return stats
+
+    def unarchive(self, year: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Devolve à coleção principal os lançamentos de um ano arquivado (ou de todos)
+
+        Cada lançamento volta com todas as parcelas dele (de qualquer ano de
+        vencimento), gravado antes delas, para que nenhuma parcela fique na
+        coleção principal sem o lançamento (PurgeOrphanInstallments a removeria).
+
+        Returns:
+            {"entries_restored", "installments_restored", "years"}
+        """
+        self._require_transactions()
+        stats = {"entries_restored": 0, "installments_restored": 0, "years": []}
+        entries_catalog = self._catalogs[self.ENTRIES]
+        installments_catalog = self._catalogs[self.INSTALLMENTS]
+
+        for archived_year in [y for y in entries_catalog.years() if year is None or y == year]:
+            archive = entries_catalog.collection(archived_year)
+            while True:
+                docs = list(archive.find().sort("_id", ASCENDING).limit(self._batch_size))
+                if not docs:
+                    break
+                stats["installments_restored"] += self._restore(archive, docs)
+                stats["entries_restored"] += len(docs)
+
+            entries_catalog.remove_year(archived_year)
+            archive.drop()
+            stats["years"].append(archived_year)
+
+        # Anos de parcelas que ficaram vazios saem do catálogo
+        for archived_year in installments_catalog.years():
+            collection = installments_catalog.collection(archived_year)
+            if collection.count_documents({}, limit=1) == 0:
+                installments_catalog.remove_year(archived_year)
+                collection.drop()
+
+        return stats
+
+    def restore_installment(self, installment_id: str) -> bool:
+        """
+        Devolve à coleção principal o lançamento de uma parcela arquivada, com todas as parcelas dele
+
+        Chamado antes de alterar a parcela: o arquivo só guarda lançamentos
+        sem parcela em aberto, e as consultas de parcelas em aberto leem só
+        a coleção principal.
+
+        Returns:
+            True se a parcela estava arquivada
+        """
+        if self._db[self.INSTALLMENTS].find_one({"_id": installment_id}) is not None:
+            return False
+
+        installment = next(
+            (doc for collection in self._catalogs[self.INSTALLMENTS].all_collections()
+             for doc in [collection.find_one({"_id": installment_id})] if doc),
+            None,
+        )
+        if installment is None:
+            return False
+
+        self._require_transactions()
+        entry_id = installment["financial_entry_id"]
+        for archive in self._catalogs[self.ENTRIES].all_collections():
+            docs = list(archive.find({"_id": entry_id}))
+            if docs:
+                self._restore(archive, docs)
+                return True
+        return False
+
+    def _restore(self, archive: Collection, docs: List[dict]) -> int:
+        """Move lançamentos do arquivo (e todas as parcelas deles) para as coleções principais"""
+        ids = [doc["_id"] for doc in docs]
+        query = {"financial_entry_id": {"$in": ids}}
+        installment_archives = self._catalogs[self.INSTALLMENTS].all_collections()
+        installment_docs = [doc for collection in installment_archives for doc in collection.find(query)]
+
+        # Lançamento antes das parcelas: nenhuma parcela fica na coleção principal sem ele
+        def move(session):
+            self._upsert(self._db[self.ENTRIES], docs, session)
+            self._upsert(self._db[self.INSTALLMENTS], installment_docs, session)
+            archive.delete_many({"_id": {"$in": ids}}, session=session)
+            for collection in installment_archives:
+                collection.delete_many(query, session=session)
+
+        self._transactions.run(move)
+        return len(installment_docs)
+
+    def _require_transactions(self) -> None:
+        supported = getattr(self._transactions, "supported", None)
+        if supported is not None and not supported():
+            raise ValueError("Mover dados do arquivo exige transações (replica set ou mongos)")
+
+    @staticmethod
+    def _upsert(collection: Collection, docs: List[dict], session) -> None:
+        if docs:
+            collection.bulk_write(
+                [ReplaceOne({"_id": d["_id"]}, d, upsert=True) for d in docs], ordered=False, session=session
+            )
+
+    def _copy(self, kind: str, by_year: Dict[int, List[dict]], session) -> None:
+        catalog = self._catalogs[kind]
+        for year, docs in by_year.items():
+            self._upsert(catalog.collection(year), docs, session)
+        catalog.add_years(by_year, session=session)
+
+    def _ensure_indexes(self, entry_years: Iterable[int], installment_years: Iterable[int]) -> None:
+        # Fora da transação: criar índice dentro dela não é permitido em todas as versões
+        for year in entry_years:
+            self._catalogs[self.ENTRIES].collection(year).create_index("date")
+        for year in installment_years:
+            collection: Collection = self._catalogs[self.INSTALLMENTS].collection(year)
+            collection.create_index("financial_entry_id")
+            collection.create_index("due_date")
+
+    @staticmethod
+    def _by_year(docs: List[dict], field: str) -> Dict[int, List[dict]]:
+        by_year: Dict[int, List[dict]] = {}
+        for doc in docs:
+            by_year.setdefault(int(str(doc[field])[:4]), []).append(doc)
+        return by_year
+
+    @staticmethod
+    def _cutoff(today: date, months: int) -> date:
+        month_index = today.year * 12 + today.month - 1 - months
+        return date(month_index // 12, month_index % 12 + 1, 1)
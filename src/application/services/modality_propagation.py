@@ -0,0 +1,317 @@
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+from pymongo import ReturnDocument
+from pymongo.database import Database
+
+from src.domain.entities import PaymentModality
+from src.infra.database.archive_catalog import ArchiveCatalog
+
+logger = logging.getLogger(__name__)
+
+
+class ModalityPropagation:
+    """
+    Propaga nome e cor de uma modalidade para os lançamentos dela
+
+    Os lançamentos guardam modality_name e modality_color (desnormalizados).
+    Ao renomear uma modalidade, um job em segundo plano atualiza os lançamentos
+    em lotes (update_many por faixa de _id), primeiro na coleção principal e
+    depois nas de arquivo de cada ano. O andamento fica na coleção
+    modality_propagation_jobs (um documento por modalidade):
+
+        {_id: modality_id, status: running|completed|failed, name, color,
+         run_id, collection, last_id, updated, attempts, retry_at, started_at,
+         heartbeat_at, finished_at}
+
+    collection e last_id permitem retomar de onde parou; um job "running"
+    sem heartbeat recente (processo reiniciado) é retomado por
+    resume_stale(), chamado nas leituras com sobreposição (no máximo a cada
+    RESUME_INTERVAL segundos, resume_stale_throttled) e na consulta do
+    andamento. Um job que falhou é retomado da mesma forma depois de
+    retry_at (espera dobrando a cada falha, até MAX_ATTEMPTS tentativas);
+    depois disso fica "failed" até restart(). Enquanto o job não termina,
+    pending() informa os nomes atuais para as leituras sobreporem nos
+    lançamentos.
+    """
+
+    COLLECTION = "modality_propagation_jobs"
+    BATCH_SIZE = 500
+    STALE_AFTER = timedelta(minutes=2)
+    RETRY_BASE = timedelta(minutes=1)
+    MAX_ATTEMPTS = 5
+
+    def __init__(
+        self,
+        tenant_db: Database,
+        on_finished: Optional[Callable[[], None]] = None,
+        batch_size: Optional[int] = None,
+    ):
+        self._jobs = tenant_db[self.COLLECTION]
+        self._entries = tenant_db["financial_entries"]
+        self._archive = ArchiveCatalog(self._entries)
+        self._on_finished = on_finished
+        self._batch_size = batch_size or self.BATCH_SIZE
+
+    def start(self, modality: PaymentModality, background: bool = True) -> dict:
+        """
+        Inicia (ou reinicia, se já houver um em andamento) a propagação da modalidade
+
+        Um novo run_id faz o job anterior da mesma modalidade parar no próximo lote.
+        """
+        now = datetime.now().isoformat()
+        job = self._jobs.find_one_and_update(
+            {"_id": modality.id},
+            {"$set": {
+                "status": "running",
+                "name": modality.name,
+                "color": modality.color,
+                "run_id": str(uuid.uuid4()),
+                "collection": None,
+                "last_id": None,
+                "updated": 0,
+                "started_at": now,
+                "heartbeat_at": now,
+                "finished_at": None,
+                "error": None,
+                "attempts": 0,
+                "retry_at": None,
+            }},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        self._launch(job, background)
+        return job
+
+    def run(self, job: dict) -> None:
+        """Executa o job a partir de last_id até o fim (ou até ser substituído)"""
+        modality_id, run_id = job["_id"], job["run_id"]
+        fields = {"modality_name": job["name"], "modality_color": job["color"]}
+
+        try:
+            collections = [self._entries] + self._archive.all_collections()
+            names = [collection.name for collection in collections]
+            current = job.get("collection") or self._entries.name
+            # Ano desarquivado depois que o job começou: recomeça da coleção principal
+            position = names.index(current) if current in names else 0
+            last_id = job.get("last_id") if current in names else None
+
+            for index, collection in enumerate(collections[position:], position):
+                if index > position:
+                    last_id = None
+                    moved = self._jobs.update_one(
+                        {"_id": modality_id, "run_id": run_id},
+                        {"$set": {"collection": collection.name, "last_id": None,
+                                  "heartbeat_at": datetime.now().isoformat()}},
+                    )
+                    if moved.matched_count == 0:
+                        return
+                if not self._propagate(collection, modality_id, run_id, last_id, fields):
+                    # Outra renomeação reiniciou o job; ele segue com o nome novo
+                    return
+
+            self._jobs.update_one(
+                {"_id": modality_id, "run_id": run_id},
+                {"$set": {"status": "completed", "finished_at": datetime.now().isoformat()}},
+            )
+        except Exception as e:
+            logger.exception("Falha ao propagar a modalidade %s", modality_id)
+            now = datetime.now()
+            attempts = job.get("attempts", 0) + 1
+            retry_at = (
+                (now + self.RETRY_BASE * 2 ** (attempts - 1)).isoformat()
+                if attempts < self.MAX_ATTEMPTS else None
+            )
+            self._jobs.update_one(
+                {"_id": modality_id, "run_id": run_id},
+                {"$set": {"status": "failed", "error": str(e), "finished_at": now.isoformat(),
+                          "attempts": attempts, "retry_at": retry_at}},
+            )
+        finally:
+            if self._on_finished is not None:
+                self._on_finished()
+
+    def _propagate(self, collection, modality_id: str, run_id: str, last_id: Optional[str], fields: dict) -> bool:
+        """Atualiza os lançamentos de uma coleção em lotes; False se o job foi substituído"""
+        while True:
+            query = {"modality_id": modality_id}
+            if last_id is not None:
+                query["_id"] = {"$gt": last_id}
+            ids = [
+                doc["_id"] for doc in
+                collection.find(query, {"_id": 1}).sort("_id", 1).limit(self._batch_size)
+            ]
+            if not ids:
+                return True
+
+            result = collection.update_many(
+                {"_id": {"$in": ids}, "$or": [
+                    {"modality_name": {"$ne": fields["modality_name"]}},
+                    {"modality_color": {"$ne": fields["modality_color"]}},
+                ]},
+                {"$set": fields},
+            )
+            last_id = ids[-1]
+
+            progress = self._jobs.update_one(
+                {"_id": modality_id, "run_id": run_id},
+                {"$set": {"last_id": last_id, "heartbeat_at": datetime.now().isoformat()},
+                 "$inc": {"updated": result.modified_count}},
+            )
+            if progress.matched_count == 0:
+                return False
+
+    def pending(self) -> Dict[str, dict]:
+        """
+        Nome e cor atuais das modalidades com propagação em andamento (modality_id -> dados)
+
+        Jobs que falharam continuam aqui: os lançamentos deles ainda têm o nome antigo.
+        """
+        return {
+            job["_id"]: {"name": job["name"], "color": job["color"]}
+            for job in self._jobs.find({"status": {"$in": ["running", "failed"]}})
+        }
+
+    def resume_stale(self) -> int:
+        """
+        Retoma jobs "running" sem heartbeat recente (processo que os executava
+        caiu) e jobs "failed" cujo retry_at já passou
+        """
+        now = datetime.now()
+        cutoff = (now - self.STALE_AFTER).isoformat()
+        resumed = 0
+        for job in self._jobs.find({"status": "running", "heartbeat_at": {"$lt": cutoff}}):
+            # Reivindica o job: só um processo vence a atualização do heartbeat
+            claimed = self._jobs.find_one_and_update(
+                {"_id": job["_id"], "run_id": job["run_id"], "heartbeat_at": job["heartbeat_at"]},
+                {"$set": {"heartbeat_at": datetime.now().isoformat()}},
+                return_document=ReturnDocument.AFTER,
+            )
+            if claimed:
+                self._launch(claimed, background=True)
+                resumed += 1
+
+        for job in self._jobs.find({"status": "failed", "retry_at": {"$ne": None, "$lte": now.isoformat()}}):
+            claimed = self._jobs.find_one_and_update(
+                {"_id": job["_id"], "run_id": job["run_id"], "status": "failed", "retry_at": job["retry_at"]},
+                {"$set": {"status": "running", "heartbeat_at": datetime.now().isoformat(),
+                          "retry_at": None, "finished_at": None}},
+                return_document=ReturnDocument.AFTER,
+            )
+            if claimed:
+                self._launch(claimed, background=True)
+                resumed += 1
+        return resumed
+
+    def restart(self, modality_id: str, background: bool = True) -> dict:
+        """
+        Reinicia manualmente a propagação da modalidade
+
+        Um job que falhou continua de last_id, com as tentativas zeradas; um
+        job concluído roda de novo desde o início.
+
+        Raises:
+            ValueError: Nenhuma propagação registrada ou job em andamento
+        """
+        job = self._jobs.find_one({"_id": modality_id})
+        if not job:
+            raise ValueError("Nenhuma propagação encontrada para a modalidade")
+
+        cutoff = (datetime.now() - self.STALE_AFTER).isoformat()
+        if job["status"] == "running" and job["heartbeat_at"] >= cutoff:
+            raise ValueError("Propagação já está em andamento")
+
+        now = datetime.now().isoformat()
+        reset = {
+            "status": "running", "run_id": str(uuid.uuid4()), "attempts": 0, "retry_at": None,
+            "heartbeat_at": now, "finished_at": None, "error": None,
+        }
+        if job["status"] == "completed":
+            reset.update({"collection": None, "last_id": None, "updated": 0, "started_at": now})
+
+        claimed = self._jobs.find_one_and_update(
+            {"_id": modality_id, "run_id": job["run_id"]},
+            {"$set": reset},
+            return_document=ReturnDocument.AFTER,
+        )
+        if not claimed:
+            raise ValueError("Propagação alterada por outra requisição, tente novamente")
+
+        self._launch(claimed, background)
+        return claimed
+
+    def find_job(self, modality_id: str) -> Optional[dict]:
+        job = self._jobs.find_one({"_id": modality_id})
+        if job:
+            job["modality_id"] = job.pop("_id")
+            job.pop("run_id", None)
+        return job
+
+    def _launch(self, job: dict, background: bool) -> None:
+        if not background:
+            self.run(job)
+            return
+        threading.Thread(
+            target=self.run, args=(job,), name=f"modality-propagation-{job['_id'][:8]}", daemon=True
+        ).start()
+
+
+def modality_overlay(company_id: str) -> Callable[[], Dict[str, dict]]:
+    """
+    Retorna o carregador dos nomes atuais das modalidades em propagação
+
+    O resultado fica no cache da empresa; o fim do job incrementa a versão
+    de escrita, então a sobreposição some assim que os lançamentos estão certos.
+    """
+    def load() -> Dict[str, dict]:
+        from src.database import get_tenant_db
+        from src.infra.cache import get_tenant_cache
+
+        # Fora do cache: a sobreposição pode ficar em cache enquanto um job parado espera ser retomado
+        resume_stale_throttled(company_id)
+        return get_tenant_cache().get_or_load(
+            company_id,
+            ModalityPropagation.COLLECTION,
+            lambda: ModalityPropagation(get_tenant_db(company_id), on_finished=bump_on_finish(company_id)).pending(),
+        )
+    return load
+
+
+# Última verificação de jobs parados por empresa (time.monotonic)
+RESUME_INTERVAL = 30.0
+_resume_lock = threading.Lock()
+_resumed_at: Dict[str, float] = {}
+
+
+def resume_stale_throttled(company_id: str) -> int:
+    """
+    Retoma jobs parados ou com nova tentativa vencida da empresa, no máximo
+    uma vez a cada RESUME_INTERVAL segundos por processo
+
+    Chamado nas leituras que usam a sobreposição; uma falha aqui não pode
+    derrubar a leitura.
+    """
+    now = time.monotonic()
+    with _resume_lock:
+        last = _resumed_at.get(company_id)
+        if last is not None and now - last < RESUME_INTERVAL:
+            return 0
+        _resumed_at[company_id] = now
+
+    try:
+        from src.database import get_tenant_db
+        return ModalityPropagation(get_tenant_db(company_id), on_finished=bump_on_finish(company_id)).resume_stale()
+    except Exception:
+        logger.exception("Falha ao retomar propagações da empresa %s", company_id)
+        return 0
+
+
+def bump_on_finish(company_id: str) -> Callable[[], None]:
+    """Callback de fim de job: invalida os caches de leitura da empresa"""
+    def bump() -> None:
+        from src.infra.cache import get_tenant_write_version
+        get_tenant_write_version().bump(company_id)
+    return bump
@@ -0,0 +1,286 @@
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pymongo.collection import Collection
+
+from src.domain.repositories import FinancialEntryRepository
+
+# z da normal para o intervalo de 95%
+Z_95 = 1.96
+
+
+class SeasonalTrendModel:
+    """
+    Vendas diárias = nível + tendência·t + efeito do dia da semana
+
+    Mínimos quadrados pelas equações normais (XᵀX β = Xᵀy). XᵀX, Xᵀy e yᵀy
+    são acumulados dia a dia, então incluir os dias novos não exige
+    revisitar o histórico. Dias fechados (ex: domingo) não entram no modelo.
+    """
+
+    def __init__(self, open_weekdays: Sequence[int], origin: int):
+        self.open_weekdays = sorted(open_weekdays)
+        self.origin = origin
+        size = 2 + len(self.open_weekdays) - 1
+        self.xtx = np.zeros((size, size))
+        self.xty = np.zeros(size)
+        self.yty = 0.0
+        self.n = 0
+
+    @property
+    def parameters(self) -> int:
+        return self.xty.shape[0]
+
+    def add(self, ordinals: Sequence[int], values: Sequence[float]) -> None:
+        """Acrescenta dias observados (ordinais das datas e vendas do dia)"""
+        if len(ordinals) == 0:
+            return
+        x = self._design(np.asarray(ordinals))
+        y = np.asarray(values, dtype=np.float64)
+        self.xtx += x.T @ x
+        self.xty += x.T @ y
+        self.yty += float(y @ y)
+        self.n += len(y)
+
+    def predict(self, ordinals: Sequence[int]) -> List[Tuple[float, float, float]]:
+        """
+        Previsão pontual e intervalo de 95% para cada dia
+
+        Returns:
+            Lista de (previsão, limite inferior, limite superior), sem valores negativos
+
+        Raises:
+            ValueError: Poucos dias para ajustar o modelo
+        """
+        if self.n <= self.parameters:
+            raise ValueError("Histórico insuficiente para a previsão")
+
+        inverse = np.linalg.pinv(self.xtx)
+        beta = inverse @ self.xty
+        sse = max(self.yty - 2 * beta @ self.xty + beta @ self.xtx @ beta, 0.0)
+        sigma2 = sse / (self.n - self.parameters)
+
+        x = self._design(np.asarray(ordinals))
+        points = x @ beta
+        # Variância da previsão: ruído + incerteza dos coeficientes
+        spread = Z_95 * np.sqrt(sigma2 * (1 + np.einsum("ij,jk,ik->i", x, inverse, x)))
+        return [
+            (round(max(p, 0.0), 2), round(max(p - s, 0.0), 2), round(max(p + s, 0.0), 2))
+            for p, s in zip(points.tolist(), spread.tolist())
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "open_weekdays": self.open_weekdays,
+            "origin": self.origin,
+            "xtx": self.xtx.tolist(),
+            "xty": self.xty.tolist(),
+            "yty": self.yty,
+            "n": self.n,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SeasonalTrendModel":
+        model = cls(data["open_weekdays"], data["origin"])
+        model.xtx = np.asarray(data["xtx"], dtype=np.float64)
+        model.xty = np.asarray(data["xty"], dtype=np.float64)
+        model.yty = float(data["yty"])
+        model.n = int(data["n"])
+        return model
+
+    def _design(self, ordinals: np.ndarray) -> np.ndarray:
+        # Colunas: 1, t (em anos desde a origem), indicador de cada dia aberto
+        # exceto o primeiro (referência)
+        weekdays = (ordinals - 1) % 7
+        columns = [np.ones(len(ordinals)), (ordinals - self.origin) / 365.0]
+        columns += [(weekdays == day).astype(np.float64) for day in self.open_weekdays[1:]]
+        return np.column_stack(columns)
+
+
+class SalesForecaster:
+    """
+    Previsão de vendas por modalidade para os próximos dias
+
+    Os modelos (um por modalidade) ficam na coleção forecast_models da empresa.
+    A cada dia novo, só os dias fechados desde o último ajuste são lidos do
+    banco e somados aos acumuladores; a cada full_refit_days o ajuste é
+    refeito do zero com os últimos history_days dias (pega lançamentos
+    antigos editados ou importados).
+
+    Dias sem nenhuma venda (feriados, loja fechada) ficam fora do ajuste,
+    assim como os dias da semana em closed_weekdays (0 = segunda).
+    """
+
+    STATE_ID = "sales"
+
+    def __init__(
+        self,
+        entry_repository: FinancialEntryRepository,
+        models_collection: Collection,
+        closed_weekdays: Sequence[int] = (6,),
+        history_days: int = 365,
+        full_refit_days: int = 7,
+    ):
+        self._entry_repository = entry_repository
+        self._models = models_collection
+        self._closed_weekdays = sorted(set(closed_weekdays))
+        self._open_weekdays = [d for d in range(7) if d not in self._closed_weekdays]
+        self._history_days = history_days
+        self._full_refit_days = full_refit_days
+
+    def fit(self, today: date) -> dict:
+        """Atualiza os modelos com os dias até ontem e retorna o estado salvo"""
+        state = self._models.find_one({"_id": self.STATE_ID})
+        if self._needs_full_refit(state, today):
+            start = today - timedelta(days=self._history_days)
+            state = {
+                "_id": self.STATE_ID,
+                "closed_weekdays": self._closed_weekdays,
+                "refit_at": today.isoformat(),
+                "last_day": (start - timedelta(days=1)).isoformat(),
+                "origin": start.toordinal(),
+                "modalities": {},
+            }
+
+        yesterday = today - timedelta(days=1)
+        first_new_day = date.fromisoformat(state["last_day"]) + timedelta(days=1)
+        if first_new_day > yesterday:
+            return state
+
+        rows = self._entry_repository.get_daily_sales_by_modality(
+            datetime.combine(first_new_day, datetime.min.time()),
+            datetime.combine(yesterday, datetime.max.time()),
+        )
+        self._accumulate(state, rows)
+        state["last_day"] = yesterday.isoformat()
+        self._models.replace_one({"_id": self.STATE_ID}, state, upsert=True)
+        return state
+
+    def forecast(self, today: date, horizon: int, state: Optional[dict] = None) -> dict:
+        """
+        Previsão de today até today + horizon - 1 (dias fechados não aparecem)
+
+        Returns:
+            {"from", "to", "fitted_until", "modalities": [...], "totals": [{date, forecast}]}
+        """
+        if not 1 <= horizon <= 90:
+            raise ValueError("horizon deve estar entre 1 e 90 dias")
+
+        state = state or self.fit(today)
+        days = [
+            today + timedelta(days=offset) for offset in range(horizon)
+            if (today + timedelta(days=offset)).weekday() not in self._closed_weekdays
+        ]
+        ordinals = [day.toordinal() for day in days]
+
+        modalities = []
+        totals = {day.isoformat(): 0.0 for day in days}
+        for modality_id, data in state["modalities"].items():
+            model = SeasonalTrendModel.from_dict(data["model"])
+            item = {"modality_id": modality_id, "modality_name": data["name"]}
+            try:
+                predictions = model.predict(ordinals)
+            except ValueError as e:
+                modalities.append({**item, "status": "insufficient_data", "message": str(e), "days": []})
+                continue
+
+            item["status"] = "ok"
+            item["days"] = [
+                {"date": day.isoformat(), "forecast": point, "lower": lower, "upper": upper}
+                for day, (point, lower, upper) in zip(days, predictions)
+            ]
+            item["total"] = round(sum(p[0] for p in predictions), 2)
+            for day, (point, _, _) in zip(days, predictions):
+                totals[day.isoformat()] += point
+            modalities.append(item)
+
+        modalities.sort(key=lambda m: -m.get("total", 0))
+        return {
+            "from": today.isoformat(),
+            "to": (today + timedelta(days=horizon - 1)).isoformat(),
+            "fitted_until": state["last_day"],
+            "closed_weekdays": self._closed_weekdays,
+            "modalities": modalities,
+            "totals": [{"date": day, "forecast": round(value, 2)} for day, value in totals.items()],
+        }
+
+    def _needs_full_refit(self, state: Optional[dict], today: date) -> bool:
+        if not state or state.get("closed_weekdays") != self._closed_weekdays:
+            return True
+        refit_at = date.fromisoformat(state["refit_at"])
+        return (today - refit_at).days >= self._full_refit_days
+
+    def _accumulate(self, state: dict, rows: List[dict]) -> None:
+        by_day: Dict[str, Dict[str, float]] = {}
+        names: Dict[str, str] = {}
+        for row in rows:
+            if date.fromisoformat(row["day"]).weekday() in self._closed_weekdays:
+                continue
+            by_day.setdefault(row["day"], {})
+            by_day[row["day"]][row["modality_id"]] = by_day[row["day"]].get(row["modality_id"], 0.0) + row["total"]
+            names[row["modality_id"]] = row["modality_name"]
+
+        open_days = sorted(by_day)
+        ordinals = [date.fromisoformat(day).toordinal() for day in open_days]
+
+        for modality_id in set(state["modalities"]) | set(names):
+            data = state["modalities"].get(modality_id)
+            if data is None:
+                data = {"name": names[modality_id], "model": SeasonalTrendModel(
+                    self._open_weekdays, state["origin"]
+                ).to_dict()}
+                # Modalidade nova: entra a partir do primeiro dia com venda
+                first = next(i for i, day in enumerate(open_days) if modality_id in by_day[day])
+            else:
+                first = 0
+
+            model = SeasonalTrendModel.from_dict(data["model"])
+            model.add(ordinals[first:], [by_day[day].get(modality_id, 0.0) for day in open_days[first:]])
+            data["model"] = model.to_dict()
+            data["name"] = names.get(modality_id, data["name"])
+            state["modalities"][modality_id] = data
+
+
+class ForecastCache:
+    """Previsões por (empresa, dia, horizonte): o ajuste roda uma vez por dia por empresa"""
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str, int], dict]" = OrderedDict()
+
+    def get_or_compute(self, company_id: str, today: date, horizon: int, compute) -> dict:
+        key = (company_id, today.isoformat(), horizon)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        result = compute()
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+
+def closed_weekdays_from_env() -> List[int]:
+    """FORECAST_CLOSED_WEEKDAYS: dias fechados separados por vírgula (0 = segunda, padrão 6 = domingo)"""
+    raw = os.getenv("FORECAST_CLOSED_WEEKDAYS", "6")
+    return [int(day) for day in raw.split(",") if day.strip()]
+
+
+# Singleton global
+_forecast_cache = None
+
+
+def get_forecast_cache() -> ForecastCache:
+    """Retorna a instância singleton do ForecastCache"""
+    global _forecast_cache
+    if _forecast_cache is None:
+        _forecast_cache = ForecastCache()
+    return _forecast_cache
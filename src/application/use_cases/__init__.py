@@ -5,14 +5,21 @@ from .delete_payment_modality import DeletePaymentModality
 from .toggle_payment_modality import TogglePaymentModality
 
 from .create_financial_entry import CreateFinancialEntry
+from .create_financial_entries_bulk import CreateFinancialEntriesBulk
 from .list_financial_entries import ListFinancialEntries
 from .update_financial_entry import UpdateFinancialEntry
 from .delete_financial_entry import DeleteFinancialEntry
+from .bulk_delete_financial_entries import BulkDeleteFinancialEntries
+from .purge_orphan_installments import PurgeOrphanInstallments
 
 from .list_installments import ListInstallments
 from .pay_installment import PayInstallment
 from .unpay_installment import UnpayInstallment
 from .get_daily_credit_summary import GetDailyCreditSummary
+from .installment_anticipation import (
+    SimulateInstallmentAnticipation,
+    ExecuteInstallmentAnticipation,
+)
 
 from .get_platform_settings import GetPlatformSettings
 from .toggle_platform_anticipation import TogglePlatformAnticipation
@@ -21,14 +28,31 @@ from .create_account import CreateAccount
 from .list_accounts import ListAccounts
 from .update_account import UpdateAccount
 from .delete_account import DeleteAccount
+from .list_upcoming_accounts import ListUpcomingAccounts
 
 from .bank_limit_use_cases import (
     CreateBankLimit,
     ListBankLimits,
     UpdateBankLimit,
     DeleteBankLimit,
+    ProjectBankLimitCosts,
+)
+
+from .loan_use_cases import (
+    CreateLoan,
+    ListLoans,
+    GetLoanSchedule,
+    UpdateLoan,
+    RenegotiateLoan,
+    DeleteLoan,
+    GetLoanDebtService,
 )
 
+from .get_dashboard_snapshot import GetDashboardSnapshot
+from .get_entry_totals import GetEntryTotals
+from .calculate_prices import CalculatePrices
+from .search_records import SearchRecords
+
 from .company import CreateCompany, ListCompanies
 from .admin import ImpersonateCompany
 
@@ -39,23 +63,41 @@ __all__ = [
     "DeletePaymentModality",
     "TogglePaymentModality",
     "CreateFinancialEntry",
+    "CreateFinancialEntriesBulk",
     "ListFinancialEntries",
     "UpdateFinancialEntry",
     "DeleteFinancialEntry",
+    "BulkDeleteFinancialEntries",
+    "PurgeOrphanInstallments",
     "ListInstallments",
     "PayInstallment",
     "UnpayInstallment",
     "GetDailyCreditSummary",
+    "SimulateInstallmentAnticipation",
+    "ExecuteInstallmentAnticipation",
     "GetPlatformSettings",
     "TogglePlatformAnticipation",
     "CreateAccount",
     "ListAccounts",
     "UpdateAccount",
     "DeleteAccount",
+    "ListUpcomingAccounts",
     "CreateBankLimit",
     "ListBankLimits",
     "UpdateBankLimit",
     "DeleteBankLimit",
+    "ProjectBankLimitCosts",
+    "CreateLoan",
+    "ListLoans",
+    "GetLoanSchedule",
+    "UpdateLoan",
+    "RenegotiateLoan",
+    "DeleteLoan",
+    "GetLoanDebtService",
+    "GetDashboardSnapshot",
+    "GetEntryTotals",
+    "CalculatePrices",
+    "SearchRecords",
     "CreateCompany",
     "ListCompanies",
     "ImpersonateCompany",
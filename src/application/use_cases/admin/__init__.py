@@ -1,3 +1,4 @@
 from .impersonate_company import ImpersonateCompany
+from .platform_revenue_report import PlatformRevenueReport
 
-__all__ = ["ImpersonateCompany"]
+__all__ = ["ImpersonateCompany", "PlatformRevenueReport"]
@@ -1,5 +1,6 @@
-from typing import Dict
+from typing import Dict, Optional
 from src.domain.repositories import CompanyRepository, UserRepository, RoleRepository, FeatureRepository
+from src.application.services.feature_registry import FeatureRegistry
 from src.infra.security import JWTHandler
 
 
@@ -10,13 +11,15 @@ class ImpersonateCompany:
         user_repository: UserRepository,
         role_repository: RoleRepository,
         feature_repository: FeatureRepository,
-        jwt_handler: JWTHandler
+        jwt_handler: JWTHandler,
+        feature_registry: Optional[FeatureRegistry] = None
     ):
         self._company_repository = company_repository
         self._user_repository = user_repository
         self._role_repository = role_repository
         self._feature_repository = feature_repository
         self._jwt_handler = jwt_handler
+        self._feature_registry = feature_registry or FeatureRegistry(feature_repository)
 
     def execute(self, super_admin_user_id: str, target_company_id: str) -> Dict:
         """
@@ -49,6 +52,7 @@ class ImpersonateCompany:
         # Busca todas as features do sistema para o super admin
         all_features = self._feature_repository.find_all()
         feature_codes = [f.code for f in all_features if f.is_system]
+        feature_bits, feature_version = self._feature_registry.encode(feature_codes)
 
         # Gera payload do JWT com contexto da empresa alvo
         payload = {
@@ -57,7 +61,8 @@ class ImpersonateCompany:
             "name": user.name,
             "company_id": target_company_id,  # Empresa alvo para impersonate
             "roles": ["Super Admin"],
-            "features": feature_codes,  # Todas as features
+            "feature_bits": feature_bits,  # Todas as features
+            "feature_version": feature_version,
             "is_super_admin": True,
             "impersonating": True,  # Flag para indicar impersonate
             "original_company_id": user.company_id  # Empresa original do super admin
@@ -0,0 +1,159 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+from pymongo.database import Database
+from pymongo.errors import ExecutionTimeout
+
+from src.domain.entities import Company
+from src.domain.repositories import CompanyRepository
+from src.infra.database.archive_catalog import ArchiveCatalog
+
+
+# Pool compartilhado por todo o processo: limita quantas empresas são
+# consultadas ao mesmo tempo, independente de quantos relatórios rodarem
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("REVENUE_REPORT_MAX_WORKERS", "8")),
+    thread_name_prefix="revenue-report"
+)
+
+
+class PlatformRevenueReport:
+    """
+    Faturamento de todas as empresas (Super Admin), por mês e por modalidade
+
+    Roda uma agregação no banco de cada empresa (companies.db_name) em um
+    pool limitado. O relatório é um gerador: cada empresa é emitida assim
+    que termina, e uma empresa lenta só atrasa a si mesma.
+
+    Eventos gerados, na ordem em que ficam prontos:
+        {"type": "tenant", "company_id", "company_name", "status": "ok",
+         "elapsed_ms", "total", "count", "by_month", "by_modality"}
+        {"type": "tenant", ..., "status": "timeout" | "error"}
+        {"type": "summary", "platform": {...}, "tenants": {status: qtd}, "elapsed_ms"}
+
+    Faturamento = lançamentos normais (sem despesas e empréstimos).
+    """
+
+    DEFAULT_TENANT_TIMEOUT = float(os.getenv("REVENUE_REPORT_TENANT_TIMEOUT", "10"))
+    DEFAULT_TOTAL_TIMEOUT = float(os.getenv("REVENUE_REPORT_TIMEOUT", "60"))
+
+    def __init__(
+        self,
+        company_repository: CompanyRepository,
+        db_resolver: Callable[[Company], Database],
+        tenant_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        self._company_repository = company_repository
+        self._db_resolver = db_resolver
+        self._tenant_timeout = tenant_timeout or self.DEFAULT_TENANT_TIMEOUT
+        self._total_timeout = total_timeout or self.DEFAULT_TOTAL_TIMEOUT
+        self._executor = executor or _executor
+
+    def stream(self, start_date: datetime, end_date: datetime) -> Iterator[Dict]:
+        if start_date > end_date:
+            raise ValueError("Data inicial deve ser anterior à data final")
+
+        started = time.perf_counter()
+        companies = self._company_repository.find_all(only_active=False)
+        platform = _empty_totals()
+        statuses: Dict[str, int] = {}
+
+        futures = {
+            self._executor.submit(self._tenant_revenue, company, start_date, end_date): company
+            for company in companies
+        }
+        remaining = set(futures)
+
+        try:
+            for future in as_completed(futures, timeout=self._total_timeout):
+                remaining.discard(future)
+                company = futures[future]
+                event = self._tenant_event(company, future)
+                if event["status"] == "ok":
+                    _merge(platform, event)
+                statuses[event["status"]] = statuses.get(event["status"], 0) + 1
+                yield event
+        except FutureTimeoutError:
+            # Tempo total esgotado: as empresas que faltam saem como timeout
+            for future in remaining:
+                future.cancel()
+                statuses["timeout"] = statuses.get("timeout", 0) + 1
+                yield _tenant_header(futures[future], "timeout")
+
+        yield {
+            "type": "summary",
+            "from": start_date.isoformat(),
+            "to": end_date.isoformat(),
+            "platform": _rounded(platform),
+            "tenants": statuses,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+        }
+
+    def _tenant_event(self, company: Company, future) -> Dict:
+        try:
+            totals, elapsed_ms = future.result()
+        except ExecutionTimeout:
+            return _tenant_header(company, "timeout")
+        except Exception as e:
+            return {**_tenant_header(company, "error"), "error": str(e)}
+
+        return {**_tenant_header(company, "ok"), "elapsed_ms": elapsed_ms, **_rounded(totals)}
+
+    def _tenant_revenue(self, company: Company, start_date: datetime, end_date: datetime):
+        started = time.perf_counter()
+        pipeline = [
+            {"$match": {
+                "date": {"$gte": start_date.isoformat(), "$lte": end_date.isoformat()},
+                "entry_type": {"$nin": ["despesa", "emprestimo"]},
+            }},
+            {"$group": {
+                "_id": {"month": {"$substrBytes": ["$date", 0, 7]}, "modality": "$modality_name"},
+                "total": {"$sum": "$value"},
+                "count": {"$sum": 1},
+            }},
+        ]
+        collection = self._db_resolver(company)["financial_entries"]
+
+        totals = _empty_totals()
+        # Anos arquivados do período entram como coleções extras
+        for source in [collection] + ArchiveCatalog(collection).collections_for(start_date, end_date):
+            rows = source.aggregate(pipeline, maxTimeMS=int(self._tenant_timeout * 1000))
+            for row in rows:
+                _add(totals, row["_id"]["month"], row["_id"]["modality"] or "Sem modalidade", row["total"], row["count"])
+        return totals, round((time.perf_counter() - started) * 1000, 2)
+
+
+def _empty_totals() -> Dict:
+    return {"total": 0.0, "count": 0, "by_month": {}, "by_modality": {}}
+
+
+def _add(totals: Dict, month: str, modality: str, value: float, count: int) -> None:
+    totals["total"] += value
+    totals["count"] += count
+    totals["by_month"][month] = totals["by_month"].get(month, 0.0) + value
+    totals["by_modality"][modality] = totals["by_modality"].get(modality, 0.0) + value
+
+
+def _merge(platform: Dict, tenant: Dict) -> None:
+    platform["total"] += tenant["total"]
+    platform["count"] += tenant["count"]
+    for key in ("by_month", "by_modality"):
+        for name, value in tenant[key].items():
+            platform[key][name] = platform[key].get(name, 0.0) + value
+
+
+def _rounded(totals: Dict) -> Dict:
+    return {
+        "total": round(totals["total"], 2),
+        "count": totals["count"],
+        "by_month": {k: round(v, 2) for k, v in sorted(totals["by_month"].items())},
+        "by_modality": {k: round(v, 2) for k, v in sorted(totals["by_modality"].items(), key=lambda i: -i[1])},
+    }
+
+
+def _tenant_header(company: Company, status: str) -> Dict:
+    return {"type": "tenant", "company_id": company.id, "company_name": company.name, "status": status}
@@ -1,10 +1,12 @@
+from typing import Optional
 from src.domain.repositories import UserRepository
-from src.infra.security import PasswordHash
+from src.infra.security import BcryptPool, get_bcrypt_pool
 
 
 class ChangePassword:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, password_hasher: Optional[BcryptPool] = None):
         self._user_repository = user_repository
+        self._password_hasher = password_hasher or get_bcrypt_pool()
 
     def execute(self, user_id: str, current_password: str, new_password: str) -> bool:
         """
@@ -20,6 +22,7 @@ class ChangePassword:
 
         Raises:
             ValueError: Se a senha atual estiver incorreta ou se os dados forem inválidos
+            PasswordHasherBusy: Se a fila do bcrypt estiver cheia
         """
         if not current_password or not new_password:
             raise ValueError("Senha atual e nova senha são obrigatórias")
@@ -32,11 +35,11 @@ class ChangePassword:
             raise ValueError("Usuário não encontrado")
 
         # Verifica se a senha atual está correta
-        if not PasswordHash.verify(current_password, user.password_hash):
+        if not self._password_hasher.verify(current_password, user.password_hash):
             raise ValueError("Senha atual incorreta")
 
         # Gera hash da nova senha
-        new_password_hash = PasswordHash.hash(new_password)
+        new_password_hash = self._password_hasher.hash(new_password)
 
         # Atualiza a senha do usuário
         user.password_hash = new_password_hash
@@ -1,6 +1,7 @@
-from typing import Dict
+from typing import Dict, Optional
 from src.domain.repositories import UserRepository, RoleRepository, FeatureRepository
-from src.infra.security import PasswordHash, JWTHandler
+from src.application.services.feature_registry import FeatureRegistry
+from src.infra.security import BcryptPool, JWTHandler, PasswordHash, PasswordHasherBusy, get_bcrypt_pool
 
 
 class Login:
@@ -9,12 +10,16 @@ class Login:
         user_repository: UserRepository,
         role_repository: RoleRepository,
         feature_repository: FeatureRepository,
-        jwt_handler: JWTHandler
+        jwt_handler: JWTHandler,
+        feature_registry: Optional[FeatureRegistry] = None,
+        password_hasher: Optional[BcryptPool] = None
     ):
         self._user_repository = user_repository
         self._role_repository = role_repository
         self._feature_repository = feature_repository
         self._jwt_handler = jwt_handler
+        self._feature_registry = feature_registry or FeatureRegistry(feature_repository)
+        self._password_hasher = password_hasher or get_bcrypt_pool()
 
     def execute(self, email: str, password: str) -> Dict:
         """
@@ -29,6 +34,7 @@ class Login:
 
         Raises:
             ValueError: Se credenciais forem inválidas
+            PasswordHasherBusy: Se a fila do bcrypt estiver cheia
         """
         if not email or not password:
             raise ValueError("Email e senha são obrigatórios")
@@ -40,9 +46,12 @@ class Login:
         if not user.is_active:
             raise ValueError("Usuário inativo")
 
-        if not PasswordHash.verify(password, user.password_hash):
+        if not self._password_hasher.verify(password, user.password_hash):
             raise ValueError("Credenciais inválidas")
 
+        if PasswordHash.needs_rehash(user.password_hash):
+            self._rehash(user, password)
+
         # Busca features do usuário baseado em suas roles
         feature_codes = set()
         roles = []
@@ -54,11 +63,8 @@ class Login:
                 feature_codes.update(role.feature_ids)
 
         # Busca os códigos das features
-        features = []
-        for feature_id in feature_codes:
-            feature = self._feature_repository.find_by_id(feature_id)
-            if feature:
-                features.append(feature.code)
+        features = self._feature_registry.codes_for_ids(feature_codes)
+        feature_bits, feature_version = self._feature_registry.encode(features)
 
         # Gera payload do JWT
         payload = {
@@ -67,7 +73,8 @@ class Login:
             "name": user.name,
             "company_id": user.company_id,
             "roles": roles,
-            "features": features,
+            "feature_bits": feature_bits,
+            "feature_version": feature_version,
             "is_super_admin": user.is_super_admin
         }
 
@@ -93,3 +100,12 @@ class Login:
                 "is_super_admin": user.is_super_admin
             }
         }
+
+    def _rehash(self, user, password: str) -> None:
+        """Regrava o hash da senha com o custo configurado (BCRYPT_ROUNDS)"""
+        try:
+            user.password_hash = self._password_hasher.hash(password)
+            self._user_repository.update(user.id, user)
+        except PasswordHasherBusy:
+            # Fica para o próximo login; o login atual não deve falhar por isso
+            pass
@@ -1,5 +1,6 @@
-from typing import Dict
+from typing import Dict, Optional
 from src.domain.repositories import UserRepository, RoleRepository, FeatureRepository
+from src.application.services.feature_registry import FeatureRegistry
 from src.infra.security import JWTHandler
 
 
@@ -9,12 +10,14 @@ class RefreshToken:
         user_repository: UserRepository,
         role_repository: RoleRepository,
         feature_repository: FeatureRepository,
-        jwt_handler: JWTHandler
+        jwt_handler: JWTHandler,
+        feature_registry: Optional[FeatureRegistry] = None
     ):
         self._user_repository = user_repository
         self._role_repository = role_repository
         self._feature_repository = feature_repository
         self._jwt_handler = jwt_handler
+        self._feature_registry = feature_registry or FeatureRegistry(feature_repository)
 
     def execute(self, refresh_token: str) -> Dict:
         """
@@ -55,11 +58,9 @@ class RefreshToken:
                 roles.append(role.name)
                 feature_codes.update(role.feature_ids)
 
-        features = []
-        for feature_id in feature_codes:
-            feature = self._feature_repository.find_by_id(feature_id)
-            if feature:
-                features.append(feature.code)
+        # Busca os códigos das features
+        features = self._feature_registry.codes_for_ids(feature_codes)
+        feature_bits, feature_version = self._feature_registry.encode(features)
 
         # Gera novo payload
         new_payload = {
@@ -68,7 +69,8 @@ class RefreshToken:
             "name": user.name,
             "company_id": user.company_id,
             "roles": roles,
-            "features": features
+            "feature_bits": feature_bits,
+            "feature_version": feature_version
         }
 
         # Gera novos tokens
@@ -1,9 +1,11 @@
 """
 Bank Limit Use Cases
 """
-from typing import List
+from typing import Any, Dict, List, Optional
 from src.domain.entities.bank_limit import BankLimit
 from src.domain.repositories.bank_limit_repository import BankLimitRepository
+from src.application.services.credit_line_cost_engine import CreditLineCostEngine
+from src.infra.cache import VersionedTenantCache
 
 
 class CreateBankLimit:
@@ -20,6 +22,9 @@ class CreateBankLimit:
         rotativo_rate: float = 0.0,
         cheque_rate: float = 0.0,
         interest_rate: float = 0.0,
+        cdi_rate: float = 0.0,
+        iof_rate: float = 0.0,
+        iof_daily_rate: float = 0.0,
     ) -> BankLimit:
         if not bank_name or not bank_name.strip():
             raise ValueError("Bank name is required")
@@ -33,6 +38,9 @@ class CreateBankLimit:
             rotativo_rate=rotativo_rate,
             cheque_rate=cheque_rate,
             interest_rate=interest_rate,
+            cdi_rate=cdi_rate,
+            iof_rate=iof_rate,
+            iof_daily_rate=iof_daily_rate,
         )
 
 
@@ -59,6 +67,9 @@ class UpdateBankLimit:
         rotativo_rate: float = 0.0,
         cheque_rate: float = 0.0,
         interest_rate: float = 0.0,
+        cdi_rate: float = 0.0,
+        iof_rate: float = 0.0,
+        iof_daily_rate: float = 0.0,
     ) -> BankLimit:
         if not bank_name or not bank_name.strip():
             raise ValueError("Bank name is required")
@@ -73,6 +84,9 @@ class UpdateBankLimit:
             rotativo_rate=rotativo_rate,
             cheque_rate=cheque_rate,
             interest_rate=interest_rate,
+            cdi_rate=cdi_rate,
+            iof_rate=iof_rate,
+            iof_daily_rate=iof_daily_rate,
         )
 
 
@@ -85,3 +99,34 @@ class DeleteBankLimit:
         if not success:
             raise ValueError(f"Bank limit with id {limit_id} not found")
         return success
+
+
+class ProjectBankLimitCosts:
+    """
+    Projeta juros, IOF e CET das linhas de crédito da empresa
+
+    Os limites são lidos do cache da empresa (invalidado a cada escrita),
+    então simulações repetidas com valores diferentes não vão ao banco.
+    """
+
+    CACHE_KEY = "bank_limits"
+
+    def __init__(
+        self,
+        repository: BankLimitRepository,
+        tenant_cache: Optional[VersionedTenantCache] = None,
+        company_id: Optional[str] = None,
+        engine: Optional[CreditLineCostEngine] = None,
+    ):
+        self.repository = repository
+        self.tenant_cache = tenant_cache
+        self.company_id = company_id
+        self.engine = engine or CreditLineCostEngine()
+
+    def execute(self, days: int = 30, amount: Optional[float] = None) -> Dict[str, Any]:
+        return self.engine.project(self._load_limits(), days, amount)
+
+    def _load_limits(self) -> List[BankLimit]:
+        if self.tenant_cache is None or not self.company_id:
+            return self.repository.find_all()
+        return self.tenant_cache.get_or_load(self.company_id, self.CACHE_KEY, self.repository.find_all)
@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Any, Callable, List, Optional
+from src.domain.repositories import FinancialEntryRepository, InstallmentRepository
+
+
+class _NoTransaction:
+    def run(self, fn: Callable[[Optional[Any]], Any]) -> Any:
+        return fn(None)
+
+
+class BulkDeleteFinancialEntries:
+    """
+    Remove vários lançamentos e as parcelas deles
+
+    Seleção por IDs ou por período (opcionalmente de uma modalidade). Com
+    transação, lançamentos e parcelas são removidos juntos. Sem transação os
+    passos são ordenados: primeiro os lançamentos, depois as parcelas; se o
+    segundo passo falhar, as parcelas que sobraram ficam órfãs e são
+    removidas por PurgeOrphanInstallments.
+    """
+
+    MAX_IDS = 1000
+    BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        entry_repository: FinancialEntryRepository,
+        installment_repository: InstallmentRepository,
+        transaction_runner=None
+    ):
+        self._entry_repository = entry_repository
+        self._installment_repository = installment_repository
+        self._transactions = transaction_runner or _NoTransaction()
+
+    def execute(
+        self,
+        entry_ids: Optional[List[str]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        modality_id: Optional[str] = None
+    ) -> dict:
+        """
+        Args:
+            entry_ids: IDs dos lançamentos
+            start_date: Início do período (alternativa aos IDs)
+            end_date: Fim do período
+            modality_id: Restringe o período a uma modalidade
+
+        Returns:
+            Dict com entries_deleted e installments_deleted
+
+        Raises:
+            ValueError: Se nenhum critério for informado
+        """
+        if entry_ids:
+            if len(entry_ids) > self.MAX_IDS:
+                raise ValueError(f"Máximo de {self.MAX_IDS} lançamentos por requisição")
+            ids = list(dict.fromkeys(entry_ids))
+        elif start_date and end_date:
+            if start_date > end_date:
+                raise ValueError("Data inicial deve ser anterior à data final")
+            ids = self._entry_repository.find_ids(start_date, end_date, modality_id)
+        else:
+            raise ValueError("Informe os IDs ou o período (start_date e end_date)")
+
+        if not ids:
+            return {"entries_deleted": 0, "installments_deleted": 0}
+
+        return self._transactions.run(lambda session: self._delete(ids, session))
+
+    def _delete(self, ids: List[str], session) -> dict:
+        entries_deleted = 0
+        installments_deleted = 0
+
+        for start in range(0, len(ids), self.BATCH_SIZE):
+            batch = ids[start:start + self.BATCH_SIZE]
+            entries_deleted += self._entry_repository.delete_many(batch, session=session)
+            installments_deleted += self._installment_repository.delete_by_financial_entry_ids(
+                batch, session=session
+            )
+
+        return {"entries_deleted": entries_deleted, "installments_deleted": installments_deleted}
@@ -0,0 +1,154 @@
+import csv
+import io
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.entities import PaymentModality, PlatformSettings
+from src.domain.repositories import PaymentModalityRepository, PlatformSettingsRepository
+from src.application.importers.parsing import normalize_name, parse_brl
+from src.infra.cache import VersionedTenantCache
+
+MAX_ITEMS = 100_000
+
+_COST_HEADERS = {"custo", "cost", "valor", "preco de custo", "valor de custo", "custo unitario"}
+_SKU_HEADERS = {"sku", "codigo", "referencia", "ref", "produto", "descricao"}
+
+
+def read_costs_csv(stream) -> Tuple[List[Optional[str]], np.ndarray]:
+    """
+    Lê custos de um CSV (upload ou texto), com ou sem cabeçalho
+
+    Com cabeçalho, usa as colunas de custo (custo, valor, ...) e de SKU
+    (sku, codigo, referencia, ...). Sem cabeçalho, o custo é a última
+    coluna e o SKU a primeira. Valores no formato brasileiro ("R$ 1.234,56").
+
+    Returns:
+        (skus, custos)
+    """
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+    sample = stream.read(4096)
+    delimiter = ";" if sample.count(";") > sample.count(",") else ","
+    rows = [row for row in csv.reader(io.StringIO(sample + stream.read()), delimiter=delimiter) if any(row)]
+    if not rows:
+        raise ValueError("Arquivo sem custos")
+
+    headers = [normalize_name(cell) for cell in rows[0]]
+    cost_col = next((i for i, h in enumerate(headers) if h in _COST_HEADERS), None)
+    sku_col = next((i for i, h in enumerate(headers) if h in _SKU_HEADERS), None)
+    if cost_col is not None:
+        rows = rows[1:]
+    else:
+        cost_col = len(rows[0]) - 1
+        sku_col = 0 if cost_col > 0 else None
+
+    costs = parse_brl([row[cost_col] if cost_col < len(row) else "" for row in rows])
+    skus = [row[sku_col].strip() if sku_col is not None and sku_col < len(row) else None for row in rows]
+    return skus, costs
+
+
+class CalculatePrices:
+    """
+    Preço de venda em lote a partir do custo, por forma de pagamento
+
+    À vista: (custo + C) × M, com C = markup_cost e M = markup_default.
+    Cartão/crediário: à vista × (1 + markup_percentage) / (1 - taxa da
+    modalidade), repassando a taxa da maquininha para o preço.
+
+    As configurações e as modalidades ativas são lidas uma vez por
+    requisição, do cache da empresa (invalidado a cada escrita); os preços
+    de todos os itens saem de uma única multiplicação de matrizes.
+    """
+
+    SETTINGS_KEY = "platform_settings"
+    MODALITIES_KEY = "active_modalities"
+
+    def __init__(
+        self,
+        settings_repository: PlatformSettingsRepository,
+        modality_repository: PaymentModalityRepository,
+        tenant_cache: Optional[VersionedTenantCache] = None,
+        company_id: Optional[str] = None,
+    ):
+        self._settings_repository = settings_repository
+        self._modality_repository = modality_repository
+        self._tenant_cache = tenant_cache
+        self._company_id = company_id
+
+    def execute(self, costs: Sequence[float], skus: Optional[Sequence[Optional[str]]] = None) -> Dict[str, Any]:
+        """
+        Returns:
+            {"settings", "methods": [{"key", "name", "fee_percentage"}],
+             "items": [{"sku", "cost", "prices": {key: preço}}], "count"}
+        """
+        header, items = self._calculate(costs, skus)
+        items = list(items)
+        return {**header, "items": items, "count": len(items)}
+
+    def stream(self, costs: Sequence[float], skus: Optional[Sequence[Optional[str]]] = None) -> Iterator[Dict[str, Any]]:
+        """Mesmo resultado de execute, como eventos: {"type": "header", ...} e um {"type": "item", ...} por custo"""
+        header, items = self._calculate(costs, skus)
+        yield {"type": "header", **header}
+        for item in items:
+            yield {"type": "item", **item}
+
+    def _calculate(self, costs: Sequence[float], skus: Optional[Sequence[Optional[str]]]):
+        costs = np.asarray(costs, dtype=np.float64)
+        if costs.size == 0:
+            raise ValueError("Informe ao menos um custo")
+        if costs.size > MAX_ITEMS:
+            raise ValueError(f"Máximo de {MAX_ITEMS} itens por cálculo")
+        if np.isnan(costs).any() or (costs < 0).any():
+            raise ValueError("Custos devem ser números maiores ou iguais a zero")
+        skus = list(skus) if skus is not None else [None] * costs.size
+
+        settings = self._load(self.SETTINGS_KEY, self._settings_repository.get_settings)
+        if not settings.markup_default or settings.markup_default <= 0:
+            raise ValueError("Markup padrão (markup_default) não configurado")
+
+        methods, factors = self._methods(settings)
+        cash = (costs + settings.markup_cost) * settings.markup_default
+        prices = np.round(np.outer(cash, factors), 2)
+
+        header = {
+            "settings": {
+                "markup_default": settings.markup_default,
+                "markup_cost": settings.markup_cost,
+                "markup_percentage": settings.markup_percentage,
+            },
+            "methods": methods,
+        }
+        keys = [method["key"] for method in methods]
+        items = (
+            {"sku": sku, "cost": cost, "prices": dict(zip(keys, row))}
+            for sku, cost, row in zip(skus, costs.tolist(), prices.tolist())
+        )
+        return header, items
+
+    def _methods(self, settings: PlatformSettings) -> Tuple[List[dict], np.ndarray]:
+        methods = [{"key": "cash", "name": "À vista", "fee_percentage": 0.0}]
+        factors = [1.0]
+
+        modalities: Iterable[PaymentModality] = self._load(self.MODALITIES_KEY, self._modality_repository.find_active)
+        for modality in modalities:
+            # Sem taxa e fora do crediário = dinheiro/pix, já coberto pelo preço à vista
+            if modality.fee_percentage <= 0 and not modality.is_credit_plan:
+                continue
+            if modality.fee_percentage >= 100:
+                continue
+            methods.append({
+                "key": modality.id,
+                "name": modality.name,
+                "bank_name": modality.bank_name,
+                "fee_percentage": modality.fee_percentage,
+            })
+            factors.append((1 + settings.markup_percentage) / (1 - modality.fee_percentage / 100))
+
+        return methods, np.asarray(factors, dtype=np.float64)
+
+    def _load(self, key: str, loader):
+        if self._tenant_cache is None or not self._company_id:
+            return loader()
+        return self._tenant_cache.get_or_load(self._company_id, key, loader)
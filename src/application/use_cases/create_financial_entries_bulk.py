@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Dict, List
+from src.domain.entities import FinancialEntry, Installment
+from src.domain.repositories import FinancialEntryRepository, InstallmentRepository
+from src.domain.repositories import PaymentModalityRepository
+from .create_financial_entry import build_financial_entry, build_installments
+
+
+class CreateFinancialEntriesBulk:
+    """
+    Cria os lançamentos do fechamento do dia em uma única requisição
+
+    Todas as modalidades são buscadas em uma consulta ($in) e lançamentos e
+    parcelas são gravados com insert_many. Cada item é validado com as mesmas
+    regras de CreateFinancialEntry; itens inválidos são reportados e não
+    impedem a gravação dos demais.
+    """
+
+    MAX_ITEMS = 500
+
+    def __init__(
+        self,
+        entry_repository: FinancialEntryRepository,
+        modality_repository: PaymentModalityRepository,
+        installment_repository: InstallmentRepository
+    ):
+        self._entry_repository = entry_repository
+        self._modality_repository = modality_repository
+        self._installment_repository = installment_repository
+
+    def execute(self, items: List[dict]) -> dict:
+        """
+        Args:
+            items: Lançamentos no formato do POST /financial-entries
+                (value, date, modality_id, installments_count?, start_date?, is_credit_payment?)
+
+        Returns:
+            Dict com created, failed e results (um por item, na ordem recebida)
+
+        Raises:
+            ValueError: Se a lista estiver vazia ou passar do limite
+        """
+        if not isinstance(items, list) or not items:
+            raise ValueError("Informe a lista de lançamentos")
+        if len(items) > self.MAX_ITEMS:
+            raise ValueError(f"Máximo de {self.MAX_ITEMS} lançamentos por requisição")
+
+        modality_ids = list({item.get("modality_id") for item in items if isinstance(item, dict)} - {None})
+        modalities = {m.id: m for m in self._modality_repository.find_by_ids(modality_ids)}
+
+        results: List[dict] = [None] * len(items)
+        valid: List[tuple] = []
+
+        for index, item in enumerate(items):
+            try:
+                valid.append((index, *self._build(item, modalities)))
+            except (ValueError, TypeError) as e:
+                message = str(e) if isinstance(e, ValueError) else "Dados inválidos"
+                results[index] = {"index": index, "status": "error", "error": message}
+
+        entries = self._entry_repository.create_many([entry for _, entry, _ in valid])
+
+        installments: List[Installment] = []
+        by_entry: Dict[int, List[Installment]] = {}
+        for (index, _, plan), entry in zip(valid, entries):
+            if plan:
+                by_entry[index] = build_installments(entry.id, entry.value, *plan)
+                installments.extend(by_entry[index])
+        self._installment_repository.create_many(installments)
+
+        for (index, _, _), entry in zip(valid, entries):
+            results[index] = {
+                "index": index,
+                "status": "created",
+                "entry": entry.to_dict(),
+                "installments": [i.to_dict() for i in by_entry.get(index, [])],
+            }
+
+        return {
+            "created": len(entries),
+            "failed": len(items) - len(entries),
+            "results": results,
+        }
+
+    @staticmethod
+    def _build(item: dict, modalities: dict) -> tuple:
+        if not isinstance(item, dict):
+            raise ValueError("Lançamento inválido")
+
+        value = float(item.get("value"))
+        date_str = item.get("date")
+        if not date_str:
+            raise ValueError("Data é obrigatória")
+        date = datetime.fromisoformat(date_str)
+
+        installments_count = item.get("installments_count")
+        installments_count = int(installments_count) if installments_count else None
+        start_date_str = item.get("start_date")
+        start_date = datetime.fromisoformat(start_date_str) if start_date_str else None
+
+        modality = modalities.get(item.get("modality_id"))
+        entry: FinancialEntry = build_financial_entry(
+            modality, value, date, installments_count, start_date, bool(item.get("is_credit_payment", False))
+        )
+
+        plan = (installments_count, start_date) if modality.is_credit_plan and installments_count else None
+        return entry, plan
@@ -1,13 +1,25 @@
-from src.domain.repositories import FinancialEntryRepository
+from typing import Optional
+from src.domain.repositories import FinancialEntryRepository, InstallmentRepository
 
 
 class DeleteFinancialEntry:
-    def __init__(self, repository: FinancialEntryRepository):
+    def __init__(
+        self,
+        repository: FinancialEntryRepository,
+        installment_repository: Optional[InstallmentRepository] = None
+    ):
         self._repository = repository
+        self._installment_repository = installment_repository
 
     def execute(self, entry_id: str) -> bool:
         entry = self._repository.find_by_id(entry_id)
         if not entry:
             raise ValueError("Lançamento não encontrado")
-        
-        return self._repository.delete(entry_id)
+
+        deleted = self._repository.delete(entry_id)
+
+        # Remove as parcelas do lançamento (crediário)
+        if deleted and self._installment_repository is not None:
+            self._installment_repository.delete_by_financial_entry_id(entry_id)
+
+        return deleted
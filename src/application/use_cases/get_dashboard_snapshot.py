@@ -0,0 +1,169 @@
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from src.domain.repositories import (
+    FinancialEntryRepository,
+    InstallmentRepository,
+    AccountRepository,
+    PaymentModalityRepository,
+    PlatformSettingsRepository,
+)
+from src.domain.repositories.bank_limit_repository import BankLimitRepository
+from .list_financial_entries import ListFinancialEntries
+from .get_daily_credit_summary import GetDailyCreditSummary
+from .list_accounts import ListAccounts
+from .list_payment_modalities import ListPaymentModalities
+from .get_platform_settings import GetPlatformSettings
+from .bank_limit_use_cases import ListBankLimits
+
+
+logger = logging.getLogger(__name__)
+
+# Pool compartilhado por todo o processo: limita quantas consultas do dashboard
+# rodam ao mesmo tempo, independente de quantas requisições chegarem. O padrão
+# comporta 4 snapshots simultâneos (6 seções cada) sem fila.
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DASHBOARD_MAX_WORKERS", "24")),
+    thread_name_prefix="dashboard"
+)
+
+
+class GetDashboardSnapshot:
+    """
+    Monta o snapshot da tela inicial do dashboard executando as consultas
+    independentes em paralelo.
+
+    Cada seção tem seu próprio timeout, contado a partir de quando ela
+    começa a rodar; com o pool cheio, uma seção pode esperar na fila pelo
+    mesmo tempo antes de ser cancelada. Uma seção que já está rodando não
+    pode ser interrompida: a resposta sai sem ela e a consulta termina em
+    segundo plano. Seções que falham ou estouram o tempo não derrubam as
+    demais: o resultado traz o status de cada uma.
+    """
+
+    ERROR_MESSAGE = "Erro ao carregar a seção"
+
+    DEFAULT_SECTION_TIMEOUT = float(os.getenv("DASHBOARD_SECTION_TIMEOUT", "5"))
+
+    def __init__(
+        self,
+        entry_repository: FinancialEntryRepository,
+        installment_repository: InstallmentRepository,
+        account_repository: AccountRepository,
+        bank_limit_repository: BankLimitRepository,
+        modality_repository: PaymentModalityRepository,
+        settings_repository: PlatformSettingsRepository,
+        section_timeout: Optional[float] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        modality_overlay: Optional[Callable[[], Dict[str, dict]]] = None
+    ):
+        self._entry_repository = entry_repository
+        self._installment_repository = installment_repository
+        self._account_repository = account_repository
+        self._bank_limit_repository = bank_limit_repository
+        self._modality_repository = modality_repository
+        self._settings_repository = settings_repository
+        self._section_timeout = section_timeout or self.DEFAULT_SECTION_TIMEOUT
+        self._executor = executor or _executor
+        self._modality_overlay = modality_overlay
+
+    def execute(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Executa todas as seções em paralelo
+
+        Args:
+            start_date: Data inicial do período (opcional)
+            end_date: Data final do período (opcional)
+
+        Returns:
+            Dict com "sections" (status, dados e tempo de cada seção)
+            e "elapsed_ms" total
+        """
+        sections = self._build_sections(start_date, end_date)
+
+        started = time.perf_counter()
+        section_starts: Dict[str, float] = {}
+        pending = {
+            self._executor.submit(self._timed, loader, section_starts, name): name
+            for name, loader in sections.items()
+        }
+
+        result = {}
+        while pending:
+            now = time.perf_counter()
+            deadlines = {
+                future: section_starts.get(name, started) + self._section_timeout
+                for future, name in pending.items()
+            }
+            done, _ = wait(
+                list(pending), timeout=max(0.0, min(deadlines.values()) - now), return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    data, elapsed_ms = future.result()
+                    result[name] = {"status": "ok", "elapsed_ms": elapsed_ms, "data": data}
+                except Exception:
+                    logger.exception("Falha na seção %s do snapshot do dashboard", name)
+                    result[name] = {
+                        "status": "error", "error": self.ERROR_MESSAGE, "elapsed_ms": None, "data": None
+                    }
+
+            now = time.perf_counter()
+            for future, name in list(pending.items()):
+                if name not in section_starts:
+                    # Na fila: cancel() a retira; se falhar, a seção acabou de começar
+                    if now < started + self._section_timeout or not future.cancel():
+                        continue
+                elif now < section_starts[name] + self._section_timeout:
+                    continue
+                pending.pop(future)
+                result[name] = {"status": "timeout", "elapsed_ms": None, "data": None}
+
+        result = {name: result[name] for name in sections}
+        return {
+            "sections": result,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+        }
+
+    def _build_sections(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Dict[str, Callable[[], Any]]:
+        return {
+            "financial_entries": lambda: [
+                e.to_dict() for e in ListFinancialEntries(
+                    self._entry_repository, self._modality_overlay
+                ).execute(start_date=start_date, end_date=end_date)
+            ],
+            "daily_credit_summary": lambda: GetDailyCreditSummary(
+                self._installment_repository, self._entry_repository
+            ).execute(start_date, end_date),
+            "accounts": lambda: [
+                a.to_dict() for a in ListAccounts(self._account_repository).execute(start_date, end_date)
+            ],
+            "bank_limits": lambda: [
+                b.to_dict() for b in ListBankLimits(self._bank_limit_repository).execute()
+            ],
+            "payment_modalities": lambda: [
+                m.to_dict() for m in ListPaymentModalities(self._modality_repository).execute()
+            ],
+            "platform_settings": lambda: GetPlatformSettings(self._settings_repository).execute().to_dict(),
+        }
+
+    @staticmethod
+    def _timed(loader: Callable[[], Any], section_starts: Dict[str, float], name: str):
+        started = time.perf_counter()
+        section_starts[name] = started
+        data = loader()
+        return data, round((time.perf_counter() - started) * 1000, 2)
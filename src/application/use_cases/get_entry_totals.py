@@ -0,0 +1,75 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+from src.domain.repositories import FinancialEntryRepository
+from src.application.services.daily_totals_index import TenantDailyTotals
+
+
+class GetEntryTotals:
+    """
+    Totais de lançamentos para vários intervalos de datas
+
+    Com o índice de somas acumuladas carregado, cada intervalo custa duas
+    consultas a um array; sem ele (índice sendo montado ou desatualizado),
+    cada intervalo é uma agregação no banco.
+    """
+
+    PERIODS = ("today", "week", "month", "year")
+
+    def __init__(
+        self,
+        repository: FinancialEntryRepository,
+        index: Optional[TenantDailyTotals] = None
+    ):
+        self._repository = repository
+        self._index = index
+
+    @classmethod
+    def period_range(cls, period: str, today: Optional[date] = None) -> Tuple[date, date]:
+        """Intervalo de um período relativo a hoje (semana começa na segunda)"""
+        today = today or date.today()
+        if period == "today":
+            return today, today
+        if period == "week":
+            return today - timedelta(days=today.weekday()), today
+        if period == "month":
+            return today.replace(day=1), today
+        if period == "year":
+            return today.replace(month=1, day=1), today
+        raise ValueError(f"Período inválido: {period}. Use: {', '.join(cls.PERIODS)}")
+
+    def execute(
+        self,
+        ranges: Dict[str, Tuple[date, date]],
+        type: Optional[str] = None,
+        entry_type: Optional[str] = None
+    ) -> Dict:
+        """
+        Args:
+            ranges: Nome -> (data inicial, data final), inclusive
+            type: Filtra por type ("received" / "receivable")
+            entry_type: Filtra por entry_type ("normal", "despesa", "emprestimo")
+
+        Returns:
+            {"totals": {nome: total}, "source": "index" | "aggregation"}
+        """
+        for name, (start, end) in ranges.items():
+            if start > end:
+                raise ValueError(f"Intervalo '{name}': data inicial deve ser anterior à data final")
+
+        if self._index is not None:
+            totals = {
+                name: self._index.total(start, end, type, entry_type)
+                for name, (start, end) in ranges.items()
+            }
+            return {"totals": totals, "source": "index"}
+
+        totals = {}
+        for name, (start, end) in ranges.items():
+            total = self._repository.get_total_by_date_range(
+                datetime.combine(start, datetime.min.time()),
+                datetime.combine(end, datetime.max.time()),
+                type,
+                entry_type
+            )
+            totals[name] = round(total, 2)
+        return {"totals": totals, "source": "aggregation"}
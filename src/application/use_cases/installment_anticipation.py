@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import Optional
+
+from src.domain.repositories import InstallmentRepository
+from src.application.services.anticipation_calculator import AnticipationCalculator
+
+
+class SimulateInstallmentAnticipation:
+    """Simula a antecipação das parcelas em aberto com vencimento até a data de corte"""
+
+    def __init__(
+        self,
+        repository: InstallmentRepository,
+        calculator: Optional[AnticipationCalculator] = None
+    ):
+        self._repository = repository
+        self._calculator = calculator or AnticipationCalculator()
+
+    def execute(
+        self,
+        discount_rate: float,
+        cut_off_date: datetime,
+        anticipation_date: Optional[datetime] = None
+    ) -> dict:
+        anticipation_date = anticipation_date or datetime.now()
+        if cut_off_date.date() < anticipation_date.date():
+            raise ValueError("Data de corte não pode ser anterior à data da antecipação")
+
+        installments = self._repository.find_open_due_until(cut_off_date)
+        simulation = self._calculator.simulate(installments, discount_rate, anticipation_date)
+        simulation["cut_off_date"] = cut_off_date.date().isoformat()
+        return simulation
+
+
+class ExecuteInstallmentAnticipation:
+    """Antecipa as parcelas em aberto com vencimento até a data de corte"""
+
+    def __init__(
+        self,
+        repository: InstallmentRepository,
+        calculator: Optional[AnticipationCalculator] = None
+    ):
+        self._repository = repository
+        self._simulate = SimulateInstallmentAnticipation(repository, calculator)
+
+    def execute(
+        self,
+        discount_rate: float,
+        cut_off_date: datetime,
+        anticipation_date: Optional[datetime] = None
+    ) -> dict:
+        anticipation_date = anticipation_date or datetime.now()
+        simulation = self._simulate.execute(discount_rate, cut_off_date, anticipation_date)
+
+        if not simulation["installments"]:
+            raise ValueError("Nenhuma parcela em aberto até a data de corte")
+
+        present_values = {
+            item["id"]: item["present_value"] for item in simulation["installments"]
+        }
+        simulation["anticipated_count"] = self._repository.mark_as_anticipated(
+            present_values, anticipation_date
+        )
+        return simulation
@@ -1,12 +1,24 @@
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 from datetime import datetime
 from src.domain.entities import FinancialEntry
 from src.domain.repositories import FinancialEntryRepository
 
 
 class ListFinancialEntries:
-    def __init__(self, repository: FinancialEntryRepository):
+    def __init__(
+        self,
+        repository: FinancialEntryRepository,
+        modality_overlay: Optional[Callable[[], Dict[str, dict]]] = None
+    ):
+        """
+        Args:
+            repository: Repositório de lançamentos
+            modality_overlay: Retorna {modality_id: {"name", "color"}} das modalidades
+                renomeadas cuja propagação ainda não terminou; esses valores
+                substituem modality_name/modality_color dos lançamentos
+        """
         self._repository = repository
+        self._modality_overlay = modality_overlay
 
     def execute(
         self,
@@ -15,9 +27,24 @@ class ListFinancialEntries:
         end_date: Optional[datetime] = None
     ) -> List[FinancialEntry]:
         if modality_id:
-            return self._repository.find_by_modality(modality_id)
-        
-        if start_date and end_date:
-            return self._repository.find_by_date_range(start_date, end_date)
-        
-        return self._repository.find_all()
+            entries = self._repository.find_by_modality(modality_id)
+        elif start_date and end_date:
+            entries = self._repository.find_by_date_range(start_date, end_date)
+        else:
+            entries = self._repository.find_all()
+
+        return self._apply_overlay(entries)
+
+    def _apply_overlay(self, entries: List[FinancialEntry]) -> List[FinancialEntry]:
+        if self._modality_overlay is None:
+            return entries
+
+        pending = self._modality_overlay()
+        if pending:
+            for entry in entries:
+                current = pending.get(entry.modality_id)
+                if current:
+                    entry.modality_name = current["name"]
+                    entry.modality_color = current["color"]
+
+        return entries
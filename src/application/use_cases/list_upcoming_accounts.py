@@ -0,0 +1,61 @@
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+from src.domain.repositories import AccountRepository
+
+
+class ListUpcomingAccounts:
+    """
+    Calendário de contas a pagar: contas em aberto dos próximos dias, por dia
+
+    Lê só as contas não pagas do intervalo (índice parcial de contas em
+    aberto), com os campos que o calendário mostra; as vencidas antes de
+    hoje vêm apenas como resumo.
+    """
+
+    MAX_DAYS = 365
+
+    def __init__(self, account_repository: AccountRepository):
+        self._account_repository = account_repository
+
+    def execute(self, days: int = 30, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Args:
+            days: Tamanho da janela, a partir de hoje (inclusive)
+
+        Returns:
+            {"from", "to", "count", "total", "overdue": {"count", "total"},
+             "days": [{"date", "count", "total", "accounts": [...]}]}
+        """
+        if not 1 <= days <= self.MAX_DAYS:
+            raise ValueError(f"days deve estar entre 1 e {self.MAX_DAYS}")
+
+        today = today or date.today()
+        start = datetime.combine(today, datetime.min.time())
+        end = datetime.combine(today + timedelta(days=days - 1), datetime.max.time())
+
+        calendar: Dict[str, Dict[str, Any]] = {}
+        for account in self._account_repository.find_unpaid_due_between(start, end):
+            day = account.date.date().isoformat()
+            group = calendar.setdefault(day, {"date": day, "count": 0, "total": 0.0, "accounts": []})
+            group["count"] += 1
+            group["total"] += account.value
+            group["accounts"].append({
+                "id": account.id,
+                "description": account.description,
+                "type": account.type,
+                "value": account.value,
+            })
+
+        groups = list(calendar.values())
+        for group in groups:
+            group["total"] = round(group["total"], 2)
+
+        overdue = self._account_repository.get_unpaid_summary_before(start)
+        return {
+            "from": start.date().isoformat(),
+            "to": end.date().isoformat(),
+            "count": sum(g["count"] for g in groups),
+            "total": round(sum(g["total"] for g in groups), 2),
+            "overdue": {"count": overdue["count"], "total": round(overdue["total"], 2)},
+            "days": groups,
+        }
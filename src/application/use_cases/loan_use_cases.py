@@ -0,0 +1,256 @@
+"""
+Loan Use Cases
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from src.domain.entities import Loan
+from src.domain.repositories import LoanRepository
+from src.application.services.amortization_engine import AmortizationEngine
+
+
+class CreateLoan:
+    def __init__(self, repository: LoanRepository, engine: Optional[AmortizationEngine] = None):
+        self.repository = repository
+        self.engine = engine or AmortizationEngine()
+
+    def execute(
+        self,
+        bank_name: str,
+        principal: float,
+        monthly_rate: float,
+        term_months: int,
+        first_due_date: datetime,
+        amortization_system: str = "price",
+        purpose: str = "",
+    ) -> Loan:
+        if not bank_name or not bank_name.strip():
+            raise ValueError("Nome do banco é obrigatório")
+
+        # Gera o cronograma antes de gravar: valida os parâmetros do empréstimo
+        rows = self.engine.schedule(principal, monthly_rate, term_months, amortization_system, first_due_date)
+
+        loan = self.repository.create(Loan(
+            bank_name=bank_name.strip(),
+            principal=principal,
+            monthly_rate=monthly_rate,
+            term_months=term_months,
+            first_due_date=first_due_date,
+            amortization_system=amortization_system,
+            purpose=(purpose or "").strip(),
+        ))
+        self.repository.replace_schedule(loan, rows)
+
+        return loan
+
+
+class ListLoans:
+    def __init__(self, repository: LoanRepository):
+        self.repository = repository
+
+    def execute(self) -> List[Loan]:
+        return self.repository.find_all()
+
+
+class GetLoanSchedule:
+    def __init__(self, repository: LoanRepository):
+        self.repository = repository
+
+    def execute(self, loan_id: str, as_of: Optional[datetime] = None) -> Dict[str, Any]:
+        loan = self.repository.find_by_id(loan_id)
+        if not loan:
+            raise ValueError("Empréstimo não encontrado")
+
+        schedule = self.repository.find_schedule(loan_id)
+        as_of_str = (as_of or datetime.now()).isoformat()
+        open_rows = [row for row in schedule if row["due_date"] >= as_of_str]
+
+        return {
+            "loan": loan.to_dict(),
+            "schedule": schedule,
+            "totals": {
+                "payment": round(sum(row["payment"] for row in schedule), 2),
+                "interest": round(sum(row["interest"] for row in schedule), 2),
+                "amortization": round(sum(row["amortization"] for row in schedule), 2),
+                "open_installments": len(open_rows),
+                "outstanding_balance": round(
+                    sum(row["amortization"] for row in open_rows), 2
+                ),
+            },
+        }
+
+
+class UpdateLoan:
+    """
+    Corrige o cadastro do empréstimo
+
+    O cronograma só é regenerado quando um campo dele muda (principal, taxa,
+    prazo, primeiro vencimento ou sistema). Depois de uma renegociação esses
+    campos descrevem só o saldo reparcelado, então não podem mais ser
+    corrigidos aqui (use uma nova renegociação); banco e finalidade, sim.
+    """
+
+    SCHEDULE_FIELDS = ("principal", "monthly_rate", "term_months", "first_due_date", "amortization_system")
+
+    def __init__(self, repository: LoanRepository, engine: Optional[AmortizationEngine] = None):
+        self.repository = repository
+        self.engine = engine or AmortizationEngine()
+
+    def execute(
+        self,
+        loan_id: str,
+        bank_name: Optional[str] = None,
+        principal: Optional[float] = None,
+        monthly_rate: Optional[float] = None,
+        term_months: Optional[int] = None,
+        first_due_date: Optional[datetime] = None,
+        amortization_system: Optional[str] = None,
+        purpose: Optional[str] = None,
+    ) -> Loan:
+        loan = self.repository.find_by_id(loan_id)
+        if not loan:
+            raise ValueError("Empréstimo não encontrado")
+
+        if bank_name is not None:
+            if not bank_name.strip():
+                raise ValueError("Nome do banco é obrigatório")
+            loan.bank_name = bank_name.strip()
+        if purpose is not None:
+            loan.purpose = purpose.strip()
+
+        requested = {
+            "principal": principal,
+            "monthly_rate": monthly_rate,
+            "term_months": term_months,
+            "first_due_date": first_due_date,
+            "amortization_system": amortization_system,
+        }
+        changed = {
+            field: value for field, value in requested.items()
+            if value is not None and value != getattr(loan, field)
+        }
+        if changed and loan.renegotiated_at:
+            raise ValueError(
+                "Empréstimo renegociado: principal, taxa, prazo, vencimento e sistema "
+                "só podem ser alterados por uma nova renegociação"
+            )
+
+        rows = None
+        if changed:
+            for field, value in changed.items():
+                setattr(loan, field, value)
+            rows = self.engine.schedule(
+                loan.principal, loan.monthly_rate, loan.term_months,
+                loan.amortization_system, loan.first_due_date
+            )
+
+        updated = self.repository.update(loan_id, loan)
+        if not updated:
+            raise ValueError("Erro ao atualizar empréstimo")
+        if rows is not None:
+            self.repository.replace_schedule(updated, rows)
+
+        return updated
+
+
+class RenegotiateLoan:
+    """
+    Renegocia o saldo devedor de um empréstimo
+
+    As parcelas com vencimento anterior à data da renegociação são mantidas;
+    o saldo devedor restante é reparcelado com as novas condições e o
+    cronograma é regenerado em uma única operação em lote.
+    """
+
+    def __init__(self, repository: LoanRepository, engine: Optional[AmortizationEngine] = None):
+        self.repository = repository
+        self.engine = engine or AmortizationEngine()
+
+    def execute(
+        self,
+        loan_id: str,
+        monthly_rate: Optional[float] = None,
+        term_months: Optional[int] = None,
+        amortization_system: Optional[str] = None,
+        first_due_date: Optional[datetime] = None,
+        effective_date: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        loan = self.repository.find_by_id(loan_id)
+        if not loan:
+            raise ValueError("Empréstimo não encontrado")
+
+        effective_date = datetime.combine((effective_date or datetime.now()).date(), datetime.min.time())
+        schedule = self.repository.find_schedule(loan_id)
+        effective_str = effective_date.isoformat()
+        kept = [row for row in schedule if row["due_date"] < effective_str]
+        remaining = [row for row in schedule if row["due_date"] >= effective_str]
+
+        outstanding = kept[-1]["balance"] if kept else loan.principal
+        if outstanding <= 0:
+            raise ValueError("Empréstimo já está quitado")
+
+        if first_due_date is None:
+            first_due_date = (
+                datetime.fromisoformat(remaining[0]["due_date"]) if remaining
+                else effective_date + timedelta(days=30)
+            )
+        if first_due_date < effective_date:
+            raise ValueError("Primeiro vencimento não pode ser anterior à data da renegociação")
+
+        monthly_rate = loan.monthly_rate if monthly_rate is None else monthly_rate
+        term_months = term_months or len(remaining) or 1
+        amortization_system = amortization_system or loan.amortization_system
+
+        rows = self.engine.schedule(
+            outstanding, monthly_rate, term_months, amortization_system,
+            first_due_date, start_number=len(kept) + 1
+        )
+
+        loan.monthly_rate = monthly_rate
+        loan.amortization_system = amortization_system
+        loan.term_months = len(kept) + term_months
+        loan.renegotiated_at = datetime.now()
+
+        updated = self.repository.update(loan_id, loan)
+        if not updated:
+            raise ValueError("Erro ao atualizar empréstimo")
+        self.repository.replace_schedule(updated, rows, from_date=effective_date)
+
+        return {
+            "loan": updated.to_dict(),
+            "renegotiated_balance": round(outstanding, 2),
+            "kept_installments": len(kept),
+            "new_installments": len(rows),
+        }
+
+
+class DeleteLoan:
+    def __init__(self, repository: LoanRepository):
+        self.repository = repository
+
+    def execute(self, loan_id: str) -> bool:
+        success = self.repository.delete(loan_id)
+        if not success:
+            raise ValueError("Empréstimo não encontrado")
+        return success
+
+
+class GetLoanDebtService:
+    """Serviço da dívida (parcelas de todos os empréstimos) agrupado por mês"""
+
+    def __init__(self, repository: LoanRepository):
+        self.repository = repository
+
+    def execute(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        months = self.repository.debt_service_by_month(start_date, end_date)
+        return {
+            "months": months,
+            "totals": {
+                "payment": round(sum(m["payment"] for m in months), 2),
+                "interest": round(sum(m["interest"] for m in months), 2),
+                "amortization": round(sum(m["amortization"] for m in months), 2),
+            },
+        }
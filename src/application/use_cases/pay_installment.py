@@ -1,11 +1,14 @@
 from datetime import datetime
+from typing import Optional
 from src.domain.entities import Installment
 from src.domain.repositories import InstallmentRepository
+from src.application.services.financial_archiver import FinancialArchiver
 
 
 class PayInstallment:
-    def __init__(self, repository: InstallmentRepository):
+    def __init__(self, repository: InstallmentRepository, archiver: Optional[FinancialArchiver] = None):
         self._repository = repository
+        self._archiver = archiver
 
     def execute(self, installment_id: str, payment_date: datetime = None) -> Installment:
         installment = self._repository.find_by_id(installment_id)
@@ -17,6 +20,10 @@ class PayInstallment:
 
         installment.mark_as_paid(payment_date)
 
+        # Parcela arquivada volta antes, com o lançamento e as demais parcelas
+        if self._archiver is not None:
+            self._archiver.restore_installment(installment_id)
+
         updated = self._repository.update(installment_id, installment)
         if not updated:
             raise ValueError("Erro ao atualizar parcela")
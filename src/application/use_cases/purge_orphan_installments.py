@@ -0,0 +1,50 @@
+from src.domain.repositories import FinancialEntryRepository, InstallmentRepository
+
+
+class PurgeOrphanInstallments:
+    """
+    Remove parcelas cujo lançamento não existe mais
+
+    Lançamentos apagados antes da exclusão em cascata deixaram parcelas
+    órfãs, que continuam entrando no resumo do crediário. Percorre os IDs
+    de lançamento referenciados pelas parcelas em lotes e remove as parcelas
+    dos que não existem.
+    """
+
+    def __init__(
+        self,
+        entry_repository: FinancialEntryRepository,
+        installment_repository: InstallmentRepository
+    ):
+        self._entry_repository = entry_repository
+        self._installment_repository = installment_repository
+
+    def execute(self, batch_size: int = 1000, dry_run: bool = False) -> dict:
+        """
+        Args:
+            batch_size: IDs de lançamento verificados por lote
+            dry_run: Apenas conta, sem remover
+
+        Returns:
+            Dict com entries_checked, orphan_entries e installments_deleted
+        """
+        stats = {"entries_checked": 0, "orphan_entries": 0, "installments_deleted": 0}
+
+        # Os lotes são coletados antes de remover: apagar durante a varredura
+        # do cursor de agregação não é seguro
+        orphans = []
+        for entry_ids in self._installment_repository.iter_financial_entry_ids(batch_size):
+            existing = self._entry_repository.find_existing_ids(entry_ids)
+            orphans.extend(entry_id for entry_id in entry_ids if entry_id not in existing)
+            stats["entries_checked"] += len(entry_ids)
+
+        stats["orphan_entries"] = len(orphans)
+        if dry_run:
+            return stats
+
+        for start in range(0, len(orphans), batch_size):
+            stats["installments_deleted"] += self._installment_repository.delete_by_financial_entry_ids(
+                orphans[start:start + batch_size]
+            )
+
+        return stats
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List, Optional
+
+from src.domain.repositories import SearchRepository
+
+KINDS = ("account", "financial_entry", "payment_modality", "bank_limit")
+
+
+class SearchRecords:
+    """
+    Busca textual em contas, lançamentos, modalidades e bancos
+
+    Cada tipo devolve no máximo os page × page_size mais relevantes
+    (até MAX_RESULTS); os tipos são intercalados pela relevância e a página
+    é recortada desse conjunto. Páginas além de MAX_RESULTS não existem:
+    o usuário deve refinar o termo.
+    """
+
+    MAX_RESULTS = 200
+    MAX_PAGE_SIZE = 50
+    MIN_QUERY_LENGTH = 2
+    MAX_QUERY_LENGTH = 100
+
+    def __init__(self, repository: SearchRepository):
+        self._repository = repository
+
+    def execute(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 20,
+        kinds: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Returns:
+            {"query", "page", "page_size", "results": [...], "has_more", "capped"}
+
+        Raises:
+            ValueError: Termo, página ou tipo inválido
+        """
+        query = " ".join((query or "").split())
+        if not self.MIN_QUERY_LENGTH <= len(query) <= self.MAX_QUERY_LENGTH:
+            raise ValueError(
+                f"O termo de busca deve ter entre {self.MIN_QUERY_LENGTH} e {self.MAX_QUERY_LENGTH} caracteres"
+            )
+        if page < 1:
+            raise ValueError("page deve ser maior ou igual a 1")
+        if not 1 <= page_size <= self.MAX_PAGE_SIZE:
+            raise ValueError(f"page_size deve estar entre 1 e {self.MAX_PAGE_SIZE}")
+
+        kinds = kinds or list(KINDS)
+        for kind in kinds:
+            if kind not in KINDS:
+                raise ValueError(f"Tipo inválido: {kind}. Use: {', '.join(KINDS)}")
+
+        offset = (page - 1) * page_size
+        if offset >= self.MAX_RESULTS:
+            raise ValueError(f"A busca retorna no máximo {self.MAX_RESULTS} resultados; refine o termo")
+
+        # Um a mais que o fim da página, para saber se existe a próxima
+        limit = min(offset + page_size + 1, self.MAX_RESULTS)
+        results = self._repository.search(query, kinds, limit)
+        # Mesma relevância: mais recentes primeiro (ordenação estável em duas passadas)
+        results.sort(key=lambda r: str(r.get("date") or ""), reverse=True)
+        results.sort(key=lambda r: r["score"], reverse=True)
+        results = results[:self.MAX_RESULTS]
+
+        return {
+            "query": query,
+            "page": page,
+            "page_size": page_size,
+            "results": results[offset:offset + page_size],
+            "has_more": len(results) > offset + page_size,
+            "capped": len(results) >= self.MAX_RESULTS,
+        }
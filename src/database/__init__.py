@@ -7,6 +7,7 @@ from .mongo_connection import (
     create_tenant_db,
     close_connection
 )
+from .read_policy import ANALYTICS, PRIMARY, ReadPolicy, get_read_policy, with_read_policy
 
 __all__ = [
     "MongoConnection",
@@ -15,5 +16,10 @@ __all__ = [
     "get_tenant_db",
     "get_collection",
     "create_tenant_db",
-    "close_connection"
+    "close_connection",
+    "ANALYTICS",
+    "PRIMARY",
+    "ReadPolicy",
+    "get_read_policy",
+    "with_read_policy",
 ]
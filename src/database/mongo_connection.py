@@ -122,8 +122,18 @@ class MongoConnection:
         # Cria índices para financial_entries
         tenant_db["financial_entries"].create_index("date")
         tenant_db["financial_entries"].create_index("modality_id")
+        # Propagação de nome/cor da modalidade percorre os lançamentos em ordem de _id
+        tenant_db["financial_entries"].create_index([("modality_id", 1), ("_id", 1)])
         tenant_db["financial_entries"].create_index([("date", -1)])
 
+        # Índice para parcelas em aberto por vencimento (antecipação, resumo do crediário)
+        tenant_db["installments"].create_index([("is_paid", 1), ("due_date", 1)])
+        tenant_db["installments"].create_index("financial_entry_id")
+
+        # Índices para o cronograma de empréstimos
+        tenant_db["loan_schedules"].create_index([("loan_id", 1), ("number", 1)])
+        tenant_db["loan_schedules"].create_index("due_date")
+
         # Cria índices para payment_modalities
         tenant_db["payment_modalities"].create_index("name", unique=True)
         tenant_db["payment_modalities"].create_index("is_active")
@@ -131,6 +141,14 @@ class MongoConnection:
         # Cria índices para roles
         tenant_db["roles"].create_index("name", unique=True)
 
+        # Contas em aberto por vencimento (calendário de contas a pagar)
+        from src.infra.repositories.mongo_account_repository import ensure_unpaid_index
+        ensure_unpaid_index(tenant_db["accounts"])
+
+        # Índices de texto da busca (contas, lançamentos, modalidades, bancos)
+        from src.infra.repositories.mongo_search_repository import ensure_text_indexes
+        ensure_text_indexes(tenant_db)
+
         print(f"Banco de dados criado para empresa: {company_id}")
 
         return tenant_db
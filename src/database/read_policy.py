@@ -0,0 +1,104 @@
+import json
+import os
+from typing import Dict, Optional, TypeVar, Union
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+
+# Políticas de leitura
+PRIMARY = "primary"      # Fluxos que validam/escrevem: leem o próprio dado recém-gravado
+ANALYTICS = "analytics"  # Relatórios: aceitam dado alguns segundos atrasado (secundário)
+
+# Mínimo aceito pelo MongoDB para maxStalenessSeconds
+MIN_MAX_STALENESS = 90
+
+_MODES = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+Target = TypeVar("Target", Database, Collection)
+
+
+class ReadPolicy:
+    """
+    Escolhe a preferência de leitura (read preference) de cada endpoint
+
+    Cada endpoint declara sua política padrão (PRIMARY ou ANALYTICS). ANALYTICS
+    lê de um secundário (secondaryPreferred) com atraso máximo de
+    max_staleness segundos; sem replica set o driver usa o primário.
+
+    Configuração (variáveis de ambiente):
+        READ_FROM_SECONDARIES: false força tudo no primário (padrão true)
+        READ_MAX_STALENESS_SECONDS: atraso máximo do secundário (padrão 90, mínimo 90)
+        READ_POLICIES: sobrescreve por endpoint, em JSON. Aceita primary,
+            analytics ou um modo do MongoDB (primaryPreferred, secondary,
+            secondaryPreferred, nearest). Ex: '{"dashboard.snapshot": "primary"}'
+    """
+
+    def __init__(
+        self,
+        overrides: Optional[Dict[str, str]] = None,
+        max_staleness: int = MIN_MAX_STALENESS,
+        enabled: bool = True,
+    ):
+        self._overrides = overrides or {}
+        self._max_staleness = max_staleness if max_staleness < 0 else max(max_staleness, MIN_MAX_STALENESS)
+        self._enabled = enabled
+
+    def policy_for(self, endpoint: str, default: str = PRIMARY) -> str:
+        if not self._enabled:
+            return PRIMARY
+        return self._overrides.get(endpoint, default)
+
+    def read_preference(self, endpoint: str, default: str = PRIMARY):
+        policy = self.policy_for(endpoint, default)
+        if policy == PRIMARY:
+            return Primary()
+        if policy == ANALYTICS:
+            return SecondaryPreferred(max_staleness=self._max_staleness)
+        if policy not in _MODES:
+            raise ValueError(f"Política de leitura inválida para '{endpoint}': {policy}")
+        return _MODES[policy](max_staleness=self._max_staleness)
+
+    def apply(self, target: Target, endpoint: str, default: str = PRIMARY) -> Target:
+        """
+        Retorna o banco/coleção com a preferência de leitura do endpoint
+
+        Database.with_options propaga para as coleções obtidas dele, então os
+        repositórios não precisam saber da política.
+        """
+        preference = self.read_preference(endpoint, default)
+        if preference == target.read_preference:
+            return target
+        return target.with_options(read_preference=preference)
+
+
+# Singleton global
+_read_policy = None
+
+
+def get_read_policy() -> ReadPolicy:
+    """Retorna a instância singleton do ReadPolicy (configurada pelo ambiente)"""
+    global _read_policy
+    if _read_policy is None:
+        raw = os.getenv("READ_POLICIES", "")
+        _read_policy = ReadPolicy(
+            overrides=json.loads(raw) if raw.strip() else {},
+            max_staleness=int(os.getenv("READ_MAX_STALENESS_SECONDS", str(MIN_MAX_STALENESS))),
+            enabled=os.getenv("READ_FROM_SECONDARIES", "true").lower() not in ("0", "false", "no"),
+        )
+    return _read_policy
+
+
+def with_read_policy(target: Union[Database, Collection], endpoint: str, default: str = PRIMARY):
+    """Atalho para get_read_policy().apply(target, endpoint, default)"""
+    return get_read_policy().apply(target, endpoint, default)
@@ -7,6 +7,7 @@ from .feature import Feature
 from .platform_settings import PlatformSettings
 from .installment import Installment
 from .account import Account
+from .loan import Loan
 
 __all__ = [
     "PaymentModality",
@@ -18,4 +19,5 @@ __all__ = [
     "PlatformSettings",
     "Installment",
     "Account",
+    "Loan",
 ]
@@ -20,6 +20,9 @@ class BankLimit:
         rotativo_rate: Taxa de juros do rotativo (%)
         cheque_rate: Taxa de juros do cheque especial (%)
         interest_rate: Taxa de juros do banco (%) - mantido para compatibilidade
+        cdi_rate: CDI de referência (% ao mês)
+        iof_rate: IOF fixo cobrado sobre o valor utilizado (%)
+        iof_daily_rate: IOF diário sobre o saldo utilizado (% ao dia)
         id: Bank limit UUID (generated by backend)
         created_at: When the limit was created
         updated_at: When the limit was last updated
@@ -32,6 +35,9 @@ class BankLimit:
     rotativo_rate: float = 0.0
     cheque_rate: float = 0.0
     interest_rate: float = 0.0
+    cdi_rate: float = 0.0
+    iof_rate: float = 0.0
+    iof_daily_rate: float = 0.0
     id: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -48,6 +54,9 @@ class BankLimit:
             "rotativo_rate": self.rotativo_rate,
             "cheque_rate": self.cheque_rate,
             "interest_rate": self.interest_rate,
+            "cdi_rate": self.cdi_rate,
+            "iof_rate": self.iof_rate,
+            "iof_daily_rate": self.iof_daily_rate,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -65,6 +74,9 @@ class BankLimit:
             rotativo_rate=float(data.get("rotativo_rate", 0)),
             cheque_rate=float(data.get("cheque_rate", 0)),
             interest_rate=float(data.get("interest_rate", 0)),
+            cdi_rate=float(data.get("cdi_rate", 0)),
+            iof_rate=float(data.get("iof_rate", 0)),
+            iof_daily_rate=float(data.get("iof_daily_rate", 0)),
             created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
             if data.get("created_at")
             else None,
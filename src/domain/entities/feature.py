@@ -10,6 +10,7 @@ class Feature:
     description: str
     module: str
     is_system: bool = True
+    bit: Optional[int] = None
     id: Optional[str] = None
     created_at: Optional[datetime] = None
 
@@ -21,6 +22,7 @@ class Feature:
             "description": self.description,
             "module": self.module,
             "is_system": self.is_system,
+            "bit": self.bit,
             "created_at": self.created_at.isoformat() if self.created_at else None,
         }
 
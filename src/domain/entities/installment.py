@@ -12,6 +12,9 @@ class Installment:
     due_date: datetime
     is_paid: bool = False
     payment_date: Optional[datetime] = None
+    is_anticipated: bool = False
+    anticipation_date: Optional[datetime] = None
+    anticipated_amount: Optional[float] = None
     id: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
@@ -26,6 +29,9 @@ class Installment:
             "due_date": self.due_date.isoformat() if self.due_date else None,
             "is_paid": self.is_paid,
             "payment_date": self.payment_date.isoformat() if self.payment_date else None,
+            "is_anticipated": self.is_anticipated,
+            "anticipation_date": self.anticipation_date.isoformat() if self.anticipation_date else None,
+            "anticipated_amount": self.anticipated_amount,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class Loan:
+    """
+    Empréstimo bancário com cronograma de amortização
+
+    Attributes:
+        bank_name: Nome do banco
+        principal: Valor financiado
+        monthly_rate: Taxa de juros (% ao mês)
+        term_months: Prazo em meses
+        first_due_date: Vencimento da primeira parcela
+        amortization_system: "price" (parcela fixa) ou "sac" (amortização constante)
+        purpose: Objetivo do empréstimo (ex: capital de giro)
+        renegotiated_at: Data da última renegociação
+    """
+    bank_name: str
+    principal: float
+    monthly_rate: float
+    term_months: int
+    first_due_date: datetime
+    amortization_system: str = "price"
+    purpose: str = ""
+    renegotiated_at: Optional[datetime] = None
+    id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "bank_name": self.bank_name,
+            "principal": self.principal,
+            "monthly_rate": self.monthly_rate,
+            "term_months": self.term_months,
+            "first_due_date": self.first_due_date.isoformat() if self.first_due_date else None,
+            "amortization_system": self.amortization_system,
+            "purpose": self.purpose,
+            "renegotiated_at": self.renegotiated_at.isoformat() if self.renegotiated_at else None,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    @staticmethod
+    def _parse_datetime(value) -> Optional[datetime]:
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(value)
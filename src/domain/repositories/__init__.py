@@ -7,6 +7,8 @@ from .feature_repository import FeatureRepository
 from .platform_settings_repository import PlatformSettingsRepository
 from .installment_repository import InstallmentRepository
 from .account_repository import AccountRepository
+from .loan_repository import LoanRepository
+from .search_repository import SearchRepository
 
 __all__ = [
     "PaymentModalityRepository",
@@ -18,4 +20,6 @@ __all__ = [
     "PlatformSettingsRepository",
     "InstallmentRepository",
     "AccountRepository",
+    "LoanRepository",
+    "SearchRepository",
 ]
\ No newline at end of file
@@ -23,6 +23,18 @@ class AccountRepository(ABC):
     ) -> List[Account]:
         pass
 
+    @abstractmethod
+    def find_unpaid_due_between(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[Account]:
+        """Contas não pagas com vencimento no intervalo, por data crescente"""
+        pass
+
+    @abstractmethod
+    def get_unpaid_summary_before(self, date: datetime) -> dict:
+        """Contas não pagas vencidas antes de date: {"count", "total"}"""
+        pass
+
     @abstractmethod
     def update(self, account: Account) -> Account:
         pass
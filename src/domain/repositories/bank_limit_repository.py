@@ -17,7 +17,12 @@ class BankLimitRepository(ABC):
         rotativo_used: float = 0.0,
         cheque_available: float = 0.0,
         cheque_used: float = 0.0,
+        rotativo_rate: float = 0.0,
+        cheque_rate: float = 0.0,
         interest_rate: float = 0.0,
+        cdi_rate: float = 0.0,
+        iof_rate: float = 0.0,
+        iof_daily_rate: float = 0.0,
     ) -> BankLimit:
         """Create a new bank limit"""
         pass
@@ -41,7 +46,12 @@ class BankLimitRepository(ABC):
         rotativo_used: float = 0.0,
         cheque_available: float = 0.0,
         cheque_used: float = 0.0,
+        rotativo_rate: float = 0.0,
+        cheque_rate: float = 0.0,
         interest_rate: float = 0.0,
+        cdi_rate: float = 0.0,
+        iof_rate: float = 0.0,
+        iof_daily_rate: float = 0.0,
     ) -> BankLimit:
         """Update a bank limit"""
         pass
@@ -31,3 +31,7 @@ class FeatureRepository(ABC):
     @abstractmethod
     def delete(self, feature_id: str) -> bool:
         pass
+
+    @abstractmethod
+    def assign_bit(self, feature_id: str) -> Optional[int]:
+        pass
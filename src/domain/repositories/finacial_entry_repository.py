@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional, Set
 from datetime import datetime
 from src.domain.entities import FinancialEntry
 
@@ -9,6 +9,10 @@ class FinancialEntryRepository(ABC):
     def create(self, entry: FinancialEntry) -> FinancialEntry:
         pass
 
+    @abstractmethod
+    def create_many(self, entries: List[FinancialEntry]) -> List[FinancialEntry]:
+        pass
+
     @abstractmethod
     def find_by_id(self, entry_id: str) -> Optional[FinancialEntry]:
         pass
@@ -39,12 +43,43 @@ class FinancialEntryRepository(ABC):
     def delete(self, entry_id: str) -> bool:
         pass
 
+    @abstractmethod
+    def find_ids(
+        self, start_date: datetime, end_date: datetime, modality_id: Optional[str] = None
+    ) -> List[str]:
+        """IDs dos lançamentos no período (opcionalmente de uma modalidade)"""
+        pass
+
+    @abstractmethod
+    def find_existing_ids(self, entry_ids: List[str]) -> Set[str]:
+        """Quais dos IDs informados ainda existem"""
+        pass
+
+    @abstractmethod
+    def delete_many(self, entry_ids: List[str], session: Optional[Any] = None) -> int:
+        """Remove os lançamentos; retorna quantos foram removidos"""
+        pass
+
     @abstractmethod
     def get_total_by_date(self, date: datetime) -> float:
         pass
 
     @abstractmethod
     def get_total_by_date_range(
-        self, start_date: datetime, end_date: datetime
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        type: Optional[str] = None,
+        entry_type: Optional[str] = None
     ) -> float:
         pass
+
+    @abstractmethod
+    def get_daily_totals(self) -> List[dict]:
+        """Totais por dia, type e entry_type: [{"day": "YYYY-MM-DD", "type", "entry_type", "total"}]"""
+        pass
+
+    @abstractmethod
+    def get_daily_sales_by_modality(self, start_date: datetime, end_date: datetime) -> List[dict]:
+        """Vendas por dia e modalidade: [{"day": "YYYY-MM-DD", "modality_id", "modality_name", "total"}]"""
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
 from src.domain.entities import Installment
 
 
@@ -8,6 +9,10 @@ class InstallmentRepository(ABC):
     def create(self, installment: Installment) -> Installment:
         pass
 
+    @abstractmethod
+    def create_many(self, installments: List[Installment]) -> List[Installment]:
+        pass
+
     @abstractmethod
     def find_by_id(self, installment_id: str) -> Optional[Installment]:
         pass
@@ -31,3 +36,23 @@ class InstallmentRepository(ABC):
     @abstractmethod
     def delete_by_financial_entry_id(self, financial_entry_id: str) -> bool:
         pass
+
+    @abstractmethod
+    def delete_by_financial_entry_ids(self, financial_entry_ids: List[str], session: Optional[Any] = None) -> int:
+        """Remove as parcelas dos lançamentos; retorna quantas foram removidas"""
+        pass
+
+    @abstractmethod
+    def iter_financial_entry_ids(self, batch_size: int = 1000) -> Iterator[List[str]]:
+        """Percorre, em lotes, os IDs distintos de lançamentos referenciados pelas parcelas"""
+        pass
+
+    @abstractmethod
+    def find_open_due_until(self, cut_off_date: datetime) -> List[Installment]:
+        """Parcelas não pagas e não antecipadas com vencimento até cut_off_date (inclusive)"""
+        pass
+
+    @abstractmethod
+    def mark_as_anticipated(self, present_values: Dict[str, float], anticipation_date: datetime) -> int:
+        """Marca as parcelas (id -> valor antecipado) como antecipadas; retorna quantas foram marcadas"""
+        pass
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional
+from src.domain.entities import Loan
+
+
+class LoanRepository(ABC):
+    @abstractmethod
+    def create(self, loan: Loan) -> Loan:
+        pass
+
+    @abstractmethod
+    def find_by_id(self, loan_id: str) -> Optional[Loan]:
+        pass
+
+    @abstractmethod
+    def find_all(self) -> List[Loan]:
+        pass
+
+    @abstractmethod
+    def update(self, loan_id: str, loan: Loan) -> Optional[Loan]:
+        pass
+
+    @abstractmethod
+    def delete(self, loan_id: str) -> bool:
+        """Remove o empréstimo e o seu cronograma"""
+        pass
+
+    @abstractmethod
+    def find_schedule(self, loan_id: str) -> List[Dict]:
+        pass
+
+    @abstractmethod
+    def replace_schedule(self, loan: Loan, rows: List[Dict], from_date: Optional[datetime] = None) -> None:
+        """
+        Substitui o cronograma em uma única operação em lote
+
+        Args:
+            loan: Empréstimo
+            rows: Novas parcelas
+            from_date: Se informado, mantém as parcelas com vencimento anterior
+        """
+        pass
+
+    @abstractmethod
+    def debt_service_by_month(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Dict]:
+        """Total de parcelas (juros + amortização) por mês, somando todos os empréstimos"""
+        pass
@@ -16,6 +16,10 @@ class PaymentModalityRepository(ABC):
     def find_all(self) -> List[PaymentModality]:
         pass
 
+    @abstractmethod
+    def find_by_ids(self, modality_ids: List[str]) -> List[PaymentModality]:
+        pass
+
     @abstractmethod
     def find_active(self) -> List[PaymentModality]:
         pass
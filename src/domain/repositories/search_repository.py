@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class SearchRepository(ABC):
+    @abstractmethod
+    def search(self, query: str, kinds: List[str], limit: int) -> List[dict]:
+        """
+        Busca textual por tipo de registro
+
+        Returns:
+            Até limit resultados por tipo: [{"kind", "id", "title", "subtitle", "date", "value", "score"}]
+        """
+        pass
@@ -0,0 +1,12 @@
+from .single_flight import SingleFlight, get_single_flight
+from .tenant_write_version import TenantWriteVersion, get_tenant_write_version
+from .versioned_tenant_cache import VersionedTenantCache, get_tenant_cache
+
+__all__ = [
+    "SingleFlight",
+    "get_single_flight",
+    "TenantWriteVersion",
+    "get_tenant_write_version",
+    "VersionedTenantCache",
+    "get_tenant_cache",
+]
@@ -0,0 +1,115 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """Uma computação em andamento, compartilhada entre as threads que esperam por ela"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesce chamadas concorrentes idênticas em uma única computação
+
+    Enquanto a primeira chamada de uma chave está executando, as demais
+    chamadas com a mesma chave aguardam e recebem o mesmo resultado
+    (ou a mesma exceção). Thread-safe, funciona com workers gthread do gunicorn.
+
+    A versão de escrita do tenant faz parte da chave: uma chamada feita
+    depois de uma escrita não recebe o resultado de uma computação iniciada
+    antes dela. Opcionalmente mantém um micro-cache de curta duração, que
+    pela mesma razão é invalidado por qualquer escrita.
+    """
+
+    MAX_CACHE_ENTRIES = 1024
+
+    def __init__(self, cache_ttl: float = 0.0):
+        self._cache_ttl = cache_ttl
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._cache: Dict[Hashable, Tuple[float, Any]] = {}
+
+    @property
+    def caching_enabled(self) -> bool:
+        return self._cache_ttl > 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any], version: Optional[int] = None) -> Any:
+        """
+        Executa fn uma única vez para chamadas concorrentes com a mesma chave
+
+        Args:
+            key: Chave da computação (ex: company_id, rota, argumentos)
+            fn: Função que calcula o resultado
+            version: Versão de escrita do tenant (invalida o micro-cache)
+
+        Returns:
+            Resultado de fn (compartilhado - não deve ser modificado)
+        """
+        full_key = (key, version)
+
+        with self._lock:
+            cached = self._cache.get(full_key)
+            if cached is not None:
+                expires_at, value = cached
+                if expires_at > time.monotonic():
+                    return value
+                del self._cache[full_key]
+
+            call = self._in_flight.get(full_key)
+            if call is not None:
+                leader = False
+            else:
+                call = _Call()
+                self._in_flight[full_key] = call
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(full_key, None)
+                if call.error is None and self._cache_ttl > 0:
+                    self._store(full_key, call.result)
+            call.done.set()
+
+        return call.result
+
+    def clear(self) -> None:
+        """Limpa o micro-cache (as computações em andamento não são afetadas)"""
+        with self._lock:
+            self._cache.clear()
+
+    def _store(self, full_key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+            if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+                self._cache.clear()
+        self._cache[full_key] = (now + self._cache_ttl, value)
+
+
+# Singleton global
+_single_flight = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Retorna a instância singleton do SingleFlight (TTL via SINGLE_FLIGHT_CACHE_TTL)"""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight(cache_ttl=float(os.getenv("SINGLE_FLIGHT_CACHE_TTL", "0")))
+    return _single_flight
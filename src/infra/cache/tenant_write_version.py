@@ -0,0 +1,85 @@
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from pymongo import ReturnDocument
+from pymongo.database import Database
+
+
+class TenantWriteVersion:
+    """
+    Contador de versão de escrita por empresa
+
+    Toda escrita bem-sucedida em dados da empresa incrementa a versão.
+    Caches em memória usam a versão para saber quando descartar resultados.
+
+    O contador fica no próprio banco da empresa (collection _meta), então é
+    consistente entre os workers do gunicorn. A leitura é memorizada por
+    alguns instantes para não custar uma consulta a cada uso.
+    """
+
+    META_COLLECTION = "_meta"
+    DOC_ID = "write_version"
+
+    def __init__(
+        self,
+        db_resolver: Optional[Callable[[str], Database]] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        self._db_resolver = db_resolver
+        self._ttl = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("TENANT_VERSION_TTL", "1")
+        )
+        self._lock = threading.Lock()
+        self._memo: Dict[str, Tuple[float, int]] = {}
+
+    def current(self, company_id: str) -> int:
+        """Retorna a versão atual de escrita da empresa"""
+        with self._lock:
+            memo = self._memo.get(company_id)
+            if memo and memo[0] > time.monotonic():
+                return memo[1]
+
+        doc = self._collection(company_id).find_one({"_id": self.DOC_ID})
+        version = int(doc["value"]) if doc else 0
+        self._remember(company_id, version)
+        return version
+
+    def bump(self, company_id: str) -> Tuple[int, int]:
+        """
+        Incrementa a versão de escrita da empresa
+
+        Returns:
+            Tupla (versão anterior, nova versão)
+        """
+        doc = self._collection(company_id).find_one_and_update(
+            {"_id": self.DOC_ID},
+            {"$inc": {"value": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        version = int(doc["value"])
+        self._remember(company_id, version)
+        return version - 1, version
+
+    def _remember(self, company_id: str, version: int) -> None:
+        with self._lock:
+            self._memo[company_id] = (time.monotonic() + self._ttl, version)
+
+    def _collection(self, company_id: str):
+        if self._db_resolver is None:
+            from src.database import get_tenant_db
+            self._db_resolver = get_tenant_db
+        return self._db_resolver(company_id)[self.META_COLLECTION]
+
+
+# Singleton global
+_tenant_write_version = None
+
+
+def get_tenant_write_version() -> TenantWriteVersion:
+    """Retorna a instância singleton do TenantWriteVersion"""
+    global _tenant_write_version
+    if _tenant_write_version is None:
+        _tenant_write_version = TenantWriteVersion()
+    return _tenant_write_version
@@ -0,0 +1,82 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from .tenant_write_version import TenantWriteVersion, get_tenant_write_version
+
+
+class VersionedTenantCache:
+    """
+    Cache em memória de dados da empresa, válido enquanto a versão de
+    escrita da empresa não mudar
+
+    Usado para dados pequenos e muito lidos (limites bancários, configurações,
+    modalidades) que não justificam ir ao banco a cada requisição.
+    """
+
+    def __init__(
+        self,
+        version_source: Optional[TenantWriteVersion] = None,
+        max_entries: int = 512
+    ):
+        self._version_source = version_source
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[int, Any]]" = OrderedDict()
+
+    def get_or_load(self, company_id: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Retorna o valor em cache ou carrega com loader
+
+        Args:
+            company_id: ID da empresa
+            key: Identificador do dado dentro da empresa
+            loader: Função que carrega o valor do banco
+
+        Returns:
+            Valor em cache (compartilhado - não deve ser modificado)
+        """
+        version = self._versions().current(company_id)
+        cache_key = (company_id, key)
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(cache_key)
+                return entry[1]
+
+        value = loader()
+
+        with self._lock:
+            self._entries[cache_key] = (version, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def invalidate(self, company_id: str, key: Optional[Hashable] = None) -> None:
+        """Remove uma chave (ou todas as chaves) da empresa"""
+        with self._lock:
+            if key is not None:
+                self._entries.pop((company_id, key), None)
+                return
+            for cache_key in [k for k in self._entries if k[0] == company_id]:
+                del self._entries[cache_key]
+
+    def _versions(self) -> TenantWriteVersion:
+        if self._version_source is None:
+            self._version_source = get_tenant_write_version()
+        return self._version_source
+
+
+# Singleton global
+_tenant_cache = None
+
+
+def get_tenant_cache() -> VersionedTenantCache:
+    """Retorna a instância singleton do VersionedTenantCache"""
+    global _tenant_cache
+    if _tenant_cache is None:
+        _tenant_cache = VersionedTenantCache()
+    return _tenant_cache
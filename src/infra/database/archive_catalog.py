@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Iterable, List, Optional
+from pymongo.collection import Collection
+
+CATALOG_COLLECTION = "archive_catalog"
+
+
+def archive_collection_name(kind: str, year: int) -> str:
+    """Nome da coleção de arquivo de um ano (ex: financial_entries_archive_2023)"""
+    return f"{kind}_archive_{year}"
+
+
+class ArchiveCatalog:
+    """
+    Anos arquivados de uma coleção (financial_entries, installments) da empresa
+
+    Períodos fechados ficam em coleções por ano ({kind}_archive_{ano}); o
+    documento {_id: kind, years: [...]} da coleção archive_catalog diz quais
+    existem. Os repositórios só consultam o arquivo quando o intervalo da
+    consulta cai em um ano arquivado. O catálogo é lido uma vez por
+    instância (os repositórios são criados por requisição).
+    """
+
+    def __init__(self, collection: Collection):
+        """
+        Args:
+            collection: Coleção "quente" (as de arquivo herdam a preferência de leitura dela)
+        """
+        self._hot = collection
+        self._kind = collection.name
+        self._years: Optional[List[int]] = None
+
+    @property
+    def kind(self) -> str:
+        return self._kind
+
+    def years(self) -> List[int]:
+        if self._years is None:
+            doc = self._hot.database[CATALOG_COLLECTION].find_one({"_id": self._kind})
+            self._years = sorted(doc.get("years", [])) if doc else []
+        return self._years
+
+    def collection(self, year: int) -> Collection:
+        return self._hot.database.get_collection(
+            archive_collection_name(self._kind, year), read_preference=self._hot.read_preference
+        )
+
+    def collections_for(self, start_date: datetime, end_date: datetime) -> List[Collection]:
+        """Coleções de arquivo dos anos arquivados entre start_date e end_date"""
+        return [self.collection(y) for y in self.years() if start_date.year <= y <= end_date.year]
+
+    def all_collections(self) -> List[Collection]:
+        return [self.collection(y) for y in self.years()]
+
+    def add_years(self, years: Iterable[int], session=None) -> None:
+        years = sorted(set(years))
+        if not years:
+            return
+        self._hot.database[CATALOG_COLLECTION].update_one(
+            {"_id": self._kind}, {"$addToSet": {"years": {"$each": years}}}, upsert=True, session=session
+        )
+        self._years = None
+
+    def remove_year(self, year: int) -> None:
+        self._hot.database[CATALOG_COLLECTION].update_one({"_id": self._kind}, {"$pull": {"years": year}})
+        self._years = None
@@ -0,0 +1,115 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+from pymongo import MongoClient
+from pymongo.database import Database
+from pymongo.errors import OperationFailure
+
+from src.database.read_policy import ANALYTICS, with_read_policy
+from src.infra.cache import SingleFlight
+
+SYSTEM_DATABASES = {"admin", "local", "config"}
+
+
+class DatabaseInventory:
+    """
+    Inventário dos databases do cluster: coleções, documentos e tamanhos
+
+    Usa os metadados de armazenamento ($collStats.storageStats) em vez de
+    contar documentos, então não varre nenhuma coleção. Cada database é
+    consultado em paralelo (pool limitado) e as leituras seguem a política
+    ANALYTICS (secundário quando houver). Onde $collStats não é permitido,
+    cai para estimated_document_count (só a contagem, a partir dos metadados).
+
+    O resultado fica em cache por ttl segundos; chamadas simultâneas
+    compartilham a mesma coleta.
+    """
+
+    def __init__(self, client: MongoClient, max_workers: int = 8, ttl: float = 30.0):
+        self._client = client
+        self._max_workers = max_workers
+        self._flight = SingleFlight(cache_ttl=ttl)
+
+    def list(self, refresh: bool = False) -> Dict:
+        """
+        Returns:
+            {"databases": [...], "generated_at", "elapsed_ms"}
+        """
+        if refresh:
+            return self._collect()
+        return self._flight.do("databases", self._collect)
+
+    def _collect(self) -> Dict:
+        started = time.perf_counter()
+        names = [name for name in self._client.list_database_names() if name not in SYSTEM_DATABASES]
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self._max_workers, len(names))), thread_name_prefix="db-inventory"
+        ) as executor:
+            databases = list(executor.map(self._database_info, names))
+
+        return {
+            "databases": databases,
+            "generated_at": datetime.now().isoformat(),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def _database_info(self, db_name: str) -> Dict:
+        db = with_read_policy(self._client[db_name], "migration.list_databases", ANALYTICS)
+        collections = sorted(db.list_collection_names(filter={"type": "collection"}))
+
+        stats = {name: self._collection_stats(db, name) for name in collections}
+        return {
+            "name": db_name,
+            "collections": collections,
+            "document_counts": {name: s["count"] for name, s in stats.items()},
+            "stats": stats,
+            "storage_size": sum(s["storage_size"] or 0 for s in stats.values()),
+            "index_size": sum(s["index_size"] or 0 for s in stats.values()),
+        }
+
+    @staticmethod
+    def _collection_stats(db: Database, name: str) -> Dict:
+        try:
+            shards: List[dict] = list(db[name].aggregate([{"$collStats": {"storageStats": {}}}]))
+        except OperationFailure:
+            return {
+                "count": db[name].estimated_document_count(),
+                "size": None,
+                "avg_obj_size": None,
+                "storage_size": None,
+                "index_size": None,
+            }
+
+        # Em cluster shardeado vem um documento por shard
+        storage = [shard.get("storageStats", {}) for shard in shards]
+        count = sum(s.get("count", 0) for s in storage)
+        size = sum(s.get("size", 0) for s in storage)
+        return {
+            "count": count,
+            "size": size,
+            "avg_obj_size": round(size / count, 1) if count else 0,
+            "storage_size": sum(s.get("storageSize", 0) for s in storage),
+            "index_size": sum(s.get("totalIndexSize", 0) for s in storage),
+        }
+
+
+# Singleton global
+_database_inventory = None
+
+
+def get_database_inventory(client: Optional[MongoClient] = None) -> DatabaseInventory:
+    """Retorna a instância singleton do DatabaseInventory (DB_INVENTORY_TTL, DB_INVENTORY_MAX_WORKERS)"""
+    global _database_inventory
+    if _database_inventory is None:
+        if client is None:
+            from src.database import MongoConnection
+            client = MongoConnection().client
+        _database_inventory = DatabaseInventory(
+            client,
+            max_workers=int(os.getenv("DB_INVENTORY_MAX_WORKERS", "8")),
+            ttl=float(os.getenv("DB_INVENTORY_TTL", "30")),
+        )
+    return _database_inventory
@@ -108,8 +108,18 @@ class TenantDatabaseManager:
         # Índices para financial_entries
         tenant_db["financial_entries"].create_index("date")
         tenant_db["financial_entries"].create_index("modality_id")
+        # Propagação de nome/cor da modalidade percorre os lançamentos em ordem de _id
+        tenant_db["financial_entries"].create_index([("modality_id", 1), ("_id", 1)])
         tenant_db["financial_entries"].create_index([("date", -1)])
 
+        # Índice para parcelas em aberto por vencimento (antecipação, resumo do crediário)
+        tenant_db["installments"].create_index([("is_paid", 1), ("due_date", 1)])
+        tenant_db["installments"].create_index("financial_entry_id")
+
+        # Índices para o cronograma de empréstimos
+        tenant_db["loan_schedules"].create_index([("loan_id", 1), ("number", 1)])
+        tenant_db["loan_schedules"].create_index("due_date")
+
         # Índices para payment_modalities
         # Índice único case-insensitive para evitar duplicatas como "PIX" vs "Pix"
         tenant_db["payment_modalities"].create_index(
@@ -122,6 +132,14 @@ class TenantDatabaseManager:
         # Índices para roles
         tenant_db["roles"].create_index("name", unique=True)
 
+        # Contas em aberto por vencimento (calendário de contas a pagar)
+        from src.infra.repositories.mongo_account_repository import ensure_unpaid_index
+        ensure_unpaid_index(tenant_db["accounts"])
+
+        # Índices de texto da busca (contas, lançamentos, modalidades, bancos)
+        from src.infra.repositories.mongo_search_repository import ensure_text_indexes
+        ensure_text_indexes(tenant_db)
+
         return tenant_db
 
     def delete_tenant_db(self, company_id: str) -> bool:
@@ -0,0 +1,64 @@
+from typing import Any, Callable, Optional, TypeVar
+from pymongo import MongoClient
+from pymongo.errors import ConfigurationError, OperationFailure
+
+T = TypeVar("T")
+
+# Códigos do servidor quando não há suporte a transações (mongod standalone)
+_UNSUPPORTED_CODES = {20, 263}
+
+
+class MongoTransactionRunner:
+    """
+    Executa uma função em uma transação do MongoDB quando o servidor suporta
+
+    Transações exigem replica set ou mongos. Em um mongod standalone (ex:
+    desenvolvimento local) a função é executada sem sessão, e deve então ser
+    escrita como passos ordenados: cada passo deixa o banco em um estado que
+    o passo seguinte (ou uma rotina de manutenção) consegue completar.
+    """
+
+    # None = ainda não sabemos; descoberto na primeira execução
+    _supported: Optional[bool] = None
+
+    def __init__(self, client: MongoClient):
+        self._client = client
+
+    def supported(self) -> bool:
+        """
+        Indica se o servidor aceita transações (replica set ou mongos)
+
+        Para quem precisa recusar o trabalho em vez de rodar sem transação.
+        """
+        if MongoTransactionRunner._supported is None:
+            hello = self._client.admin.command("hello")
+            MongoTransactionRunner._supported = bool(hello.get("setName") or hello.get("msg") == "isdbgrid")
+        return MongoTransactionRunner._supported
+
+    def run(self, fn: Callable[[Optional[Any]], T]) -> T:
+        """
+        Args:
+            fn: Função que recebe a sessão (ou None, sem transação)
+
+        Returns:
+            Retorno de fn
+        """
+        if MongoTransactionRunner._supported is False:
+            return fn(None)
+
+        try:
+            with self._client.start_session() as session:
+                result = session.with_transaction(lambda s: fn(s))
+            MongoTransactionRunner._supported = True
+            return result
+        except (OperationFailure, ConfigurationError) as e:
+            if not self._is_unsupported(e):
+                raise
+            MongoTransactionRunner._supported = False
+            return fn(None)
+
+    @staticmethod
+    def _is_unsupported(error: Exception) -> bool:
+        if isinstance(error, ConfigurationError):
+            return True
+        return error.code in _UNSUPPORTED_CODES or "Transaction numbers" in str(error)
@@ -0,0 +1,12 @@
+from .quota_stores import InMemoryQuotaStore, MongoQuotaStore, QuotaExceeded, TenantLimits
+from .tenant_quota import TenantQuota, get_tenant_quota, load_limits
+
+__all__ = [
+    "InMemoryQuotaStore",
+    "MongoQuotaStore",
+    "QuotaExceeded",
+    "TenantLimits",
+    "TenantQuota",
+    "get_tenant_quota",
+    "load_limits",
+]
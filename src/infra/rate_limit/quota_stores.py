@@ -0,0 +1,148 @@
+import math
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+from pymongo import ReturnDocument
+from pymongo.collection import Collection
+
+
+@dataclass(frozen=True)
+class TenantLimits:
+    """Limites de um plano: requisições/s (rate), rajada (burst) e requisições simultâneas"""
+    rate: float
+    burst: int
+    concurrency: int
+
+
+class QuotaExceeded(Exception):
+    """Empresa acima do limite: a requisição deve ser recusada com 429"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(
+            "Muitas requisições simultâneas para esta empresa. Tente novamente em instantes"
+            if reason == "concurrency" else
+            "Limite de requisições da empresa excedido. Tente novamente em instantes"
+        )
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def _retry_after(tokens: float, rate: float) -> int:
+    """Segundos até o balde ter 1 ficha"""
+    return max(1, math.ceil((1 - tokens) / rate)) if rate > 0 else 60
+
+
+class InMemoryQuotaStore:
+    """
+    Balde de fichas + contador de requisições em andamento, por processo
+
+    Cada worker do gunicorn tem o seu estado: o limite efetivo da empresa é
+    o do plano multiplicado pelo número de workers. Use MongoQuotaStore para
+    um limite exato entre workers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._in_flight: Dict[str, int] = {}
+
+    def acquire(self, key: str, limits: TenantLimits) -> str:
+        """
+        Consome uma ficha e ocupa uma vaga de concorrência
+
+        Returns:
+            Identificador da vaga (passe para release)
+
+        Raises:
+            QuotaExceeded: Sem ficha no balde ou sem vaga
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(limits.burst), now))
+            tokens = min(float(limits.burst), tokens + (now - updated_at) * limits.rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                raise QuotaExceeded("rate", _retry_after(tokens, limits.rate))
+
+            in_flight = self._in_flight.get(key, 0)
+            if in_flight >= limits.concurrency:
+                self._buckets[key] = (tokens, now)
+                raise QuotaExceeded("concurrency", 1)
+
+            self._buckets[key] = (tokens - 1, now)
+            self._in_flight[key] = in_flight + 1
+        return key
+
+    def release(self, key: str, lease: str) -> None:
+        with self._lock:
+            in_flight = self._in_flight.get(key, 0) - 1
+            if in_flight > 0:
+                self._in_flight[key] = in_flight
+            else:
+                self._in_flight.pop(key, None)
+
+
+class MongoQuotaStore:
+    """
+    Estado dos limites compartilhado entre workers (coleção tenant_quotas)
+
+    Um documento por empresa: {_id, tokens, ts, leases: [{id, exp}]}. A
+    reserva é um único update com pipeline (atômico no documento): recarrega
+    o balde pelo tempo decorrido, descarta vagas expiradas (worker que caiu
+    no meio da requisição) e só então consome a ficha e registra a vaga.
+    """
+
+    def __init__(self, collection: Collection, lease_ttl: float = 60.0):
+        self._collection = collection
+        self._lease_ttl = lease_ttl
+
+    def acquire(self, key: str, limits: TenantLimits) -> str:
+        now = time.time()
+        lease = str(uuid.uuid4())
+        doc = self._collection.find_one_and_update(
+            {"_id": key},
+            self._acquire_pipeline(now, lease, limits),
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        if doc["allowed"] == "rate":
+            raise QuotaExceeded("rate", _retry_after(doc["tokens"], limits.rate))
+        if doc["allowed"] == "concurrency":
+            raise QuotaExceeded("concurrency", 1)
+        return lease
+
+    def release(self, key: str, lease: str) -> None:
+        self._collection.update_one({"_id": key}, {"$pull": {"leases": {"id": lease}}})
+
+    def _acquire_pipeline(self, now: float, lease: str, limits: TenantLimits) -> List[dict]:
+        elapsed = {"$max": [0, {"$subtract": [now, {"$ifNull": ["$ts", now]}]}]}
+        return [
+            {"$set": {
+                "tokens": {"$min": [
+                    limits.burst,
+                    {"$add": [{"$ifNull": ["$tokens", limits.burst]}, {"$multiply": [elapsed, limits.rate]}]},
+                ]},
+                "ts": now,
+                "leases": {"$filter": {
+                    "input": {"$ifNull": ["$leases", []]},
+                    "cond": {"$gt": ["$$this.exp", now]},
+                }},
+            }},
+            {"$set": {"allowed": {"$switch": {
+                "branches": [
+                    {"case": {"$lt": ["$tokens", 1]}, "then": "rate"},
+                    {"case": {"$gte": [{"$size": "$leases"}, limits.concurrency]}, "then": "concurrency"},
+                ],
+                "default": "ok",
+            }}}},
+            {"$set": {
+                "tokens": {"$cond": [{"$eq": ["$allowed", "ok"]}, {"$subtract": ["$tokens", 1]}, "$tokens"]},
+                "leases": {"$cond": [
+                    {"$eq": ["$allowed", "ok"]},
+                    {"$concatArrays": ["$leases", [{"id": lease, "exp": now + self._lease_ttl}]]},
+                    "$leases",
+                ]},
+            }},
+        ]
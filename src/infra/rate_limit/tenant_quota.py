@@ -0,0 +1,159 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from .quota_stores import InMemoryQuotaStore, MongoQuotaStore, QuotaExceeded, TenantLimits
+
+logger = logging.getLogger(__name__)
+
+QuotaStore = Union[InMemoryQuotaStore, MongoQuotaStore]
+
+DEFAULT_PLAN = "basic"
+
+DEFAULT_LIMITS: Dict[str, TenantLimits] = {
+    "basic": TenantLimits(rate=10, burst=40, concurrency=4),
+    "premium": TenantLimits(rate=25, burst=100, concurrency=8),
+    "enterprise": TenantLimits(rate=50, burst=200, concurrency=16),
+}
+
+
+def load_limits(raw: Optional[str] = None) -> Dict[str, TenantLimits]:
+    """
+    Limites por plano: padrão + TENANT_QUOTA_LIMITS (JSON)
+
+    Exemplo: TENANT_QUOTA_LIMITS='{"basic": {"rate": 5, "burst": 20, "concurrency": 2}}'
+    """
+    raw = raw if raw is not None else os.getenv("TENANT_QUOTA_LIMITS", "")
+    limits = dict(DEFAULT_LIMITS)
+    if raw.strip():
+        for plan, values in json.loads(raw).items():
+            base = limits.get(plan, limits[DEFAULT_PLAN])
+            limits[plan] = TenantLimits(
+                rate=float(values.get("rate", base.rate)),
+                burst=int(values.get("burst", base.burst)),
+                concurrency=int(values.get("concurrency", base.concurrency)),
+            )
+    return limits
+
+
+class TenantQuota:
+    """
+    Limita requisições por empresa: taxa (balde de fichas) e concorrência
+
+    Os limites vêm do plano da empresa (Company.plan), resolvido por
+    plan_resolver e memorizado por plan_ttl segundos. Falhas do backend
+    (ex: Mongo indisponível) liberam a requisição: o limitador protege a
+    latência, não pode virar um ponto de falha.
+    """
+
+    def __init__(
+        self,
+        store: QuotaStore,
+        plan_resolver: Callable[[str], Optional[str]],
+        limits: Optional[Dict[str, TenantLimits]] = None,
+        plan_ttl: float = 60.0,
+    ):
+        self._store = store
+        self._plan_resolver = plan_resolver
+        self._limits = limits or DEFAULT_LIMITS
+        self._plan_ttl = plan_ttl
+        self._lock = threading.Lock()
+        self._plans: Dict[str, Tuple[float, str]] = {}
+
+    def limits_for(self, company_id: str) -> TenantLimits:
+        return self._limits.get(self._plan(company_id), self._limits[DEFAULT_PLAN])
+
+    def acquire(self, company_id: str) -> Optional[str]:
+        """
+        Reserva uma requisição para a empresa
+
+        Returns:
+            Vaga a liberar com release (None se o backend falhou e a requisição foi liberada)
+
+        Raises:
+            QuotaExceeded: Empresa acima do limite do plano
+        """
+        limits = self.limits_for(company_id)
+        try:
+            return self._store.acquire(company_id, limits)
+        except QuotaExceeded:
+            raise
+        except Exception:
+            logger.exception("Falha no limitador da empresa %s; requisição liberada", company_id)
+            return None
+
+    def release(self, company_id: str, lease: Optional[str]) -> None:
+        if lease is None:
+            return
+        try:
+            self._store.release(company_id, lease)
+        except Exception:
+            logger.exception("Falha ao liberar vaga da empresa %s", company_id)
+
+    @contextmanager
+    def guard(self, company_id: str):
+        """Reserva na entrada e libera na saída (levanta QuotaExceeded)"""
+        lease = self.acquire(company_id)
+        try:
+            yield
+        finally:
+            self.release(company_id, lease)
+
+    def _plan(self, company_id: str) -> str:
+        now = time.monotonic()
+        with self._lock:
+            memo = self._plans.get(company_id)
+            if memo and memo[0] > now:
+                return memo[1]
+
+        try:
+            plan = self._plan_resolver(company_id) or DEFAULT_PLAN
+        except Exception:
+            logger.exception("Falha ao buscar o plano da empresa %s", company_id)
+            plan = DEFAULT_PLAN
+
+        with self._lock:
+            self._plans[company_id] = (now + self._plan_ttl, plan)
+        return plan
+
+
+def _company_plan(company_id: str) -> Optional[str]:
+    from src.database import get_shared_db
+    from src.infra.repositories import MongoCompanyRepository
+
+    company = MongoCompanyRepository(get_shared_db()["companies"]).find_by_id(company_id)
+    return company.plan if company else None
+
+
+# Singleton global
+_tenant_quota = None
+_tenant_quota_lock = threading.Lock()
+
+
+def get_tenant_quota() -> Optional[TenantQuota]:
+    """
+    Retorna a instância singleton do TenantQuota (None se TENANT_QUOTA_ENABLED=false)
+
+    TENANT_QUOTA_BACKEND=memory (padrão, por processo) ou mongo (coleção
+    tenant_quotas do banco compartilhado, exato entre workers).
+    """
+    global _tenant_quota
+    if os.getenv("TENANT_QUOTA_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+
+    with _tenant_quota_lock:
+        if _tenant_quota is None:
+            if os.getenv("TENANT_QUOTA_BACKEND", "memory").lower() == "mongo":
+                from src.database import get_shared_db
+                store = MongoQuotaStore(
+                    get_shared_db()["tenant_quotas"],
+                    lease_ttl=float(os.getenv("TENANT_QUOTA_LEASE_TTL", "60")),
+                )
+            else:
+                store = InMemoryQuotaStore()
+            _tenant_quota = TenantQuota(store, _company_plan, limits=load_limits())
+        return _tenant_quota
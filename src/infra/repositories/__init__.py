@@ -7,6 +7,7 @@ from .mongo_feature_repository import MongoFeatureRepository
 from .mongo_audit_log_repository import MongoAuditLogRepository
 from .mongo_platform_settings_repository import MongoPlatformSettingsRepository
 from .mongo_installment_repository import MongoInstallmentRepository
+from .mongo_loan_repository import MongoLoanRepository
 
 __all__ = [
     "MongoFinancialEntryRepository",
@@ -18,4 +19,5 @@ __all__ = [
     "MongoAuditLogRepository",
     "MongoPlatformSettingsRepository",
     "MongoInstallmentRepository",
+    "MongoLoanRepository",
 ]
@@ -8,8 +8,26 @@ from src.domain.repositories import AccountRepository
 
 
 class MongoAccountRepository(AccountRepository):
+    # Bancos de empresas cujos índices já foram garantidos neste processo
+    _indexed_databases = set()
+
+    # Só o que o calendário de contas a pagar mostra
+    UPCOMING_PROJECTION = {"value": 1, "date": 1, "description": 1, "type": 1}
+
     def __init__(self, collection: Collection):
         self._collection = collection
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Garante o índice parcial de contas em aberto (uma vez por banco de empresa por processo)"""
+        key = (self._collection.database.name, self._collection.name)
+        if key in MongoAccountRepository._indexed_databases:
+            return
+        try:
+            ensure_unpaid_index(self._collection)
+            MongoAccountRepository._indexed_databases.add(key)
+        except Exception as e:
+            print(f"Aviso: não foi possível criar índices de contas: {e}")
 
     def create(self, account: Account) -> Account:
         account.id = str(uuid4())
@@ -45,6 +63,32 @@ class MongoAccountRepository(AccountRepository):
         }).sort("date", -1)
         return [self._doc_to_entity(doc) for doc in docs]
 
+    def find_unpaid_due_between(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[Account]:
+        # paid: False no filtro é o que permite usar o índice parcial
+        docs = self._collection.find(
+            {
+                "paid": False,
+                "date": {
+                    "$gte": start_date.isoformat(),
+                    "$lte": end_date.isoformat()
+                }
+            },
+            self.UPCOMING_PROJECTION
+        ).sort("date", 1)
+        return [self._doc_to_entity(doc) for doc in docs]
+
+    def get_unpaid_summary_before(self, date: datetime) -> dict:
+        pipeline = [
+            {"$match": {"paid": False, "date": {"$lt": date.isoformat()}}},
+            {"$group": {"_id": None, "count": {"$sum": 1}, "total": {"$sum": "$value"}}}
+        ]
+        result = list(self._collection.aggregate(pipeline))
+        if not result:
+            return {"count": 0, "total": 0.0}
+        return {"count": result[0]["count"], "total": float(result[0]["total"])}
+
     def update(self, account: Account) -> Account:
         account.updated_at = datetime.now()
 
@@ -74,3 +118,12 @@ class MongoAccountRepository(AccountRepository):
             created_at=Account._parse_datetime(doc.get("created_at")),
             updated_at=Account._parse_datetime(doc.get("updated_at"))
         )
+
+
+def ensure_unpaid_index(collection: Collection) -> None:
+    """Índice parcial por vencimento só das contas em aberto (as pagas não entram nele)"""
+    collection.create_index(
+        [("date", 1)],
+        partialFilterExpression={"paid": False},
+        name="unpaid_by_date"
+    )
@@ -22,6 +22,9 @@ class MongoBankLimitRepository(BankLimitRepository):
         rotativo_rate: float = 0.0,
         cheque_rate: float = 0.0,
         interest_rate: float = 0.0,
+        cdi_rate: float = 0.0,
+        iof_rate: float = 0.0,
+        iof_daily_rate: float = 0.0,
     ) -> BankLimit:
         limit_id = str(uuid.uuid4())
         now = datetime.utcnow()
@@ -36,6 +39,9 @@ class MongoBankLimitRepository(BankLimitRepository):
             "rotativo_rate": rotativo_rate,
             "cheque_rate": cheque_rate,
             "interest_rate": interest_rate,
+            "cdi_rate": cdi_rate,
+            "iof_rate": iof_rate,
+            "iof_daily_rate": iof_daily_rate,
             "created_at": now.isoformat(),
             "updated_at": now.isoformat(),
         }
@@ -64,6 +70,9 @@ class MongoBankLimitRepository(BankLimitRepository):
         rotativo_rate: float = 0.0,
         cheque_rate: float = 0.0,
         interest_rate: float = 0.0,
+        cdi_rate: float = 0.0,
+        iof_rate: float = 0.0,
+        iof_daily_rate: float = 0.0,
     ) -> BankLimit:
         now = datetime.utcnow()
 
@@ -76,6 +85,9 @@ class MongoBankLimitRepository(BankLimitRepository):
             "rotativo_rate": rotativo_rate,
             "cheque_rate": cheque_rate,
             "interest_rate": interest_rate,
+            "cdi_rate": cdi_rate,
+            "iof_rate": iof_rate,
+            "iof_daily_rate": iof_daily_rate,
             "updated_at": now.isoformat(),
         }
 
@@ -2,14 +2,32 @@ from typing import List, Optional
 from datetime import datetime
 from uuid import uuid4
 from pymongo.collection import Collection
+from pymongo.errors import DuplicateKeyError
 
 from src.domain.entities import Feature
 from src.domain.repositories import FeatureRepository
 
 
 class MongoFeatureRepository(FeatureRepository):
+    # Collections cujos índices já foram garantidos neste processo
+    _indexed_databases = set()
+
     def __init__(self, collection: Collection):
         self._collection = collection
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Garante o índice único do bit das features (uma vez por processo)"""
+        key = (self._collection.database.name, self._collection.name)
+        if key in MongoFeatureRepository._indexed_databases:
+            return
+        try:
+            self._collection.create_index(
+                "bit", unique=True, partialFilterExpression={"bit": {"$exists": True}}
+            )
+            MongoFeatureRepository._indexed_databases.add(key)
+        except Exception as e:
+            print(f"Aviso: não foi possível criar índice de bits das features: {e}")
 
     def create(self, feature: Feature) -> Feature:
         feature.id = str(uuid4())
@@ -18,6 +36,9 @@ class MongoFeatureRepository(FeatureRepository):
         feature_dict = feature.to_dict()
         feature_dict["_id"] = feature.id
         feature_dict.pop("id")
+        # O bit é atribuído pelo registro de features (assign_bit)
+        if feature_dict.get("bit") is None:
+            feature_dict.pop("bit")
 
         self._collection.insert_one(feature_dict)
 
@@ -51,6 +72,35 @@ class MongoFeatureRepository(FeatureRepository):
         result = self._collection.delete_one({"_id": feature_id})
         return result.deleted_count > 0
 
+    def assign_bit(self, feature_id: str) -> Optional[int]:
+        """
+        Atribui o próximo bit livre à feature (só acrescenta, nunca reutiliza)
+
+        O índice único em "bit" resolve a corrida entre processos: quem perde
+        tenta o próximo bit.
+
+        Returns:
+            Bit da feature ou None se a feature não existe
+        """
+        while True:
+            doc = self._collection.find_one({"_id": feature_id}, {"bit": 1})
+            if doc is None:
+                return None
+            if doc.get("bit") is not None:
+                return doc["bit"]
+
+            last = self._collection.find_one(
+                {"bit": {"$exists": True}}, {"bit": 1}, sort=[("bit", -1)]
+            )
+            next_bit = last["bit"] + 1 if last else 0
+            try:
+                self._collection.update_one(
+                    {"_id": feature_id, "bit": {"$exists": False}},
+                    {"$set": {"bit": next_bit}}
+                )
+            except DuplicateKeyError:
+                continue
+
     def _doc_to_entity(self, doc: dict) -> Feature:
         return Feature(
             id=doc["_id"],
@@ -59,5 +109,6 @@ class MongoFeatureRepository(FeatureRepository):
             description=doc["description"],
             module=doc["module"],
             is_system=doc.get("is_system", True),
+            bit=doc.get("bit"),
             created_at=Feature._parse_datetime(doc.get("created_at"))
         )
@@ -1,15 +1,25 @@
-from typing import List, Optional
+from typing import Any, List, Optional, Set
 from datetime import datetime
 from uuid import uuid4
 from pymongo.collection import Collection
 
 from src.domain.entities import FinancialEntry
 from src.domain.repositories import FinancialEntryRepository
+from src.infra.database.archive_catalog import ArchiveCatalog
 
 
 class MongoFinancialEntryRepository(FinancialEntryRepository):
-    def __init__(self, collection: Collection):
+    """
+    Lançamentos da empresa
+
+    Períodos arquivados (FinancialArchiver) saem da coleção principal: as
+    consultas por intervalo de datas incluem as coleções de arquivo dos
+    anos do intervalo; find_all e find_by_modality leem só a principal.
+    """
+
+    def __init__(self, collection: Collection, archive: Optional[ArchiveCatalog] = None):
         self._collection = collection
+        self._archive = archive or ArchiveCatalog(collection)
 
     def create(self, entry: FinancialEntry) -> FinancialEntry:
         entry.id = str(uuid4())
@@ -24,8 +34,34 @@ class MongoFinancialEntryRepository(FinancialEntryRepository):
         
         return entry
 
+    def create_many(self, entries: List[FinancialEntry]) -> List[FinancialEntry]:
+        if not entries:
+            return []
+
+        now = datetime.now()
+        docs = []
+        for entry in entries:
+            entry.id = str(uuid4())
+            entry.created_at = now
+            entry.updated_at = now
+
+            entry_dict = entry.to_dict()
+            entry_dict['_id'] = entry.id
+            entry_dict.pop('id')
+            docs.append(entry_dict)
+
+        self._collection.insert_many(docs)
+
+        return entries
+
     def find_by_id(self, entry_id: str) -> Optional[FinancialEntry]:
         doc = self._collection.find_one({"_id": entry_id})
+        if doc is None:
+            # Lançamento arquivado: procura nos anos do arquivo
+            for collection in self._archive.all_collections():
+                doc = collection.find_one({"_id": entry_id})
+                if doc:
+                    break
         if doc:
             return self._doc_to_entity(doc)
         return None
@@ -39,14 +75,7 @@ class MongoFinancialEntryRepository(FinancialEntryRepository):
         """Busca lançamentos de uma data específica"""
         start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        docs = self._collection.find({
-            "date": {
-                "$gte": start_of_day.isoformat(),
-                "$lte": end_of_day.isoformat()
-            }
-        }).sort("created_at", -1)
-        return [self._doc_to_entity(doc) for doc in docs]
+        return self.find_by_date_range(start_of_day, end_of_day)
 
     def update(self, entry_id: str, entry: FinancialEntry) -> Optional[FinancialEntry]:
         entry.updated_at = datetime.now()
@@ -63,11 +92,67 @@ class MongoFinancialEntryRepository(FinancialEntryRepository):
             entry.id = entry_id
             return entry
 
-        return None
+        return self._update_archived(entry_id, entry, entry_dict)
 
     def delete(self, entry_id: str) -> bool:
         result = self._collection.delete_one({"_id": entry_id})
-        return result.deleted_count > 0
+        if result.deleted_count > 0:
+            return True
+
+        for collection in self._archive.all_collections():
+            if collection.delete_one({"_id": entry_id}).deleted_count > 0:
+                return True
+        return False
+
+    def _update_archived(self, entry_id: str, entry: FinancialEntry, entry_dict: dict) -> Optional[FinancialEntry]:
+        """
+        Atualiza um lançamento arquivado
+
+        No mesmo ano, o documento é atualizado no arquivo. Se a data mudou de
+        ano, ele volta para a coleção principal (as consultas por intervalo
+        só olham o arquivo dos anos do intervalo); um novo arquivamento o
+        leva de novo para o ano certo.
+        """
+        new_year = int(str(entry_dict["date"])[:4])
+        for year in self._archive.years():
+            collection = self._archive.collection(year)
+            doc = collection.find_one({"_id": entry_id})
+            if doc is None:
+                continue
+
+            if year == new_year:
+                collection.update_one({"_id": entry_id}, {"$set": entry_dict})
+            else:
+                self._collection.replace_one({"_id": entry_id}, {**doc, **entry_dict}, upsert=True)
+                collection.delete_one({"_id": entry_id})
+
+            entry.id = entry_id
+            return entry
+
+        return None
+
+    def find_ids(
+        self, start_date: datetime, end_date: datetime, modality_id: Optional[str] = None
+    ) -> List[str]:
+        query = {"date": {"$gte": start_date.isoformat(), "$lte": end_date.isoformat()}}
+        if modality_id:
+            query["modality_id"] = modality_id
+
+        ids = []
+        for collection in [self._collection] + self._archive.collections_for(start_date, end_date):
+            ids.extend(doc["_id"] for doc in collection.find(query, {"_id": 1}))
+        return list(dict.fromkeys(ids))
+
+    def find_existing_ids(self, entry_ids: List[str]) -> Set[str]:
+        return {doc["_id"] for doc in self._collection.find({"_id": {"$in": entry_ids}}, {"_id": 1})}
+
+    def delete_many(self, entry_ids: List[str], session: Optional[Any] = None) -> int:
+        deleted = self._collection.delete_many({"_id": {"$in": entry_ids}}, session=session).deleted_count
+        if deleted < len(entry_ids):
+            # O restante pode estar arquivado (find_ids inclui o arquivo)
+            for collection in self._archive.all_collections():
+                deleted += collection.delete_many({"_id": {"$in": entry_ids}}, session=session).deleted_count
+        return deleted
 
     def find_by_modality(self, modality_id: str) -> List[FinancialEntry]:
         docs = self._collection.find({"modality_id": modality_id}).sort("created_at", -1)
@@ -76,13 +161,28 @@ class MongoFinancialEntryRepository(FinancialEntryRepository):
     def find_by_date_range(
         self, start_date: datetime, end_date: datetime
     ) -> List[FinancialEntry]:
-        docs = self._collection.find({
+        query = {
             "date": {
                 "$gte": start_date.isoformat(),
                 "$lte": end_date.isoformat()
             }
-        }).sort("created_at", -1)
-        return [self._doc_to_entity(doc) for doc in docs]
+        }
+        archives = self._archive.collections_for(start_date, end_date)
+        if not archives:
+            docs = self._collection.find(query).sort("created_at", -1)
+            return [self._doc_to_entity(doc) for doc in docs]
+
+        # Durante um lote de arquivamento sem transação o mesmo lançamento
+        # pode estar nas duas coleções por um instante
+        docs = {}
+        for collection in [self._collection] + archives:
+            for doc in collection.find(query):
+                docs.setdefault(doc["_id"], doc)
+        return sorted(
+            (self._doc_to_entity(doc) for doc in docs.values()),
+            key=lambda entry: entry.created_at or datetime.min,
+            reverse=True
+        )
 
     def get_total_by_date(self, date: datetime) -> float:
         """Retorna o total de lançamentos de uma data específica"""
@@ -106,30 +206,121 @@ class MongoFinancialEntryRepository(FinancialEntryRepository):
             }
         ]
 
-        result = list(self._collection.aggregate(pipeline))
-        return float(result[0]["total"]) if result else 0.0
+        return self._sum_total(pipeline, start_of_day, end_of_day)
+
+    def get_total_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        type: Optional[str] = None,
+        entry_type: Optional[str] = None
+    ) -> float:
+        """Retorna o total de lançamentos em um intervalo de datas (opcionalmente por type/entry_type)"""
+        match = {
+            "date": {
+                "$gte": start_date.isoformat(),
+                "$lte": end_date.isoformat()
+            }
+        }
+        if type:
+            match["type"] = type
+        if entry_type:
+            match["entry_type"] = entry_type
+
+        pipeline = [
+            {
+                "$match": match
+            },
+            {
+                "$group": {
+                    "_id": None,
+                    "total": {"$sum": "$value"}
+                }
+            }
+        ]
+
+        return self._sum_total(pipeline, start_date, end_date)
 
-    def get_total_by_date_range(self, start_date: datetime, end_date: datetime) -> float:
-        """Retorna o total de lançamentos em um intervalo de datas"""
+    def get_daily_totals(self) -> List[dict]:
+        """Totais por dia, type e entry_type (base do índice de somas acumuladas)"""
+        pipeline = [
+            {
+                "$group": {
+                    "_id": {
+                        "day": {"$substrBytes": ["$date", 0, 10]},
+                        "type": "$type",
+                        "entry_type": "$entry_type"
+                    },
+                    "total": {"$sum": "$value"}
+                }
+            }
+        ]
+
+        # Sem intervalo: inclui todos os anos arquivados (um dia pode ter
+        # lançamentos nas duas coleções, então os grupos são somados)
+        totals = {}
+        for collection in [self._collection] + self._archive.all_collections():
+            for row in collection.aggregate(pipeline):
+                key = (row["_id"]["day"], row["_id"].get("type") or "received", row["_id"].get("entry_type") or "normal")
+                totals[key] = totals.get(key, 0.0) + float(row["total"])
+
+        return [
+            {"day": day, "type": type, "entry_type": entry_type, "total": total}
+            for (day, type, entry_type), total in totals.items()
+        ]
+
+    def get_daily_sales_by_modality(self, start_date: datetime, end_date: datetime) -> List[dict]:
+        """
+        Vendas por dia e modalidade no intervalo
+
+        Vendas = lançamentos normais (sem despesas, empréstimos e recebimentos de crediário)
+        """
         pipeline = [
             {
                 "$match": {
                     "date": {
                         "$gte": start_date.isoformat(),
                         "$lte": end_date.isoformat()
-                    }
+                    },
+                    "entry_type": {"$nin": ["despesa", "emprestimo"]},
+                    "credit_payment": {"$ne": True}
                 }
             },
             {
                 "$group": {
-                    "_id": None,
+                    "_id": {
+                        "day": {"$substrBytes": ["$date", 0, 10]},
+                        "modality_id": "$modality_id"
+                    },
+                    "modality_name": {"$last": "$modality_name"},
                     "total": {"$sum": "$value"}
                 }
             }
         ]
 
-        result = list(self._collection.aggregate(pipeline))
-        return float(result[0]["total"]) if result else 0.0
+        rows = {}
+        for collection in [self._collection] + self._archive.collections_for(start_date, end_date):
+            for row in collection.aggregate(pipeline):
+                key = (row["_id"]["day"], row["_id"]["modality_id"])
+                if key in rows:
+                    rows[key]["total"] += float(row["total"])
+                else:
+                    rows[key] = {
+                        "day": key[0],
+                        "modality_id": key[1],
+                        "modality_name": row["modality_name"],
+                        "total": float(row["total"])
+                    }
+
+        return list(rows.values())
+
+    def _sum_total(self, pipeline: List[dict], start_date: datetime, end_date: datetime) -> float:
+        """Soma o total do pipeline na coleção principal e nos anos arquivados do intervalo"""
+        total = 0.0
+        for collection in [self._collection] + self._archive.collections_for(start_date, end_date):
+            result = list(collection.aggregate(pipeline))
+            total += float(result[0]["total"]) if result else 0.0
+        return total
 
     def _doc_to_entity(self, doc: dict) -> FinancialEntry:
         return FinancialEntry(
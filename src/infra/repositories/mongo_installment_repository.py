@@ -1,15 +1,35 @@
-from typing import List, Optional
-from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from datetime import datetime, timedelta
 from uuid import uuid4
+from pymongo import ASCENDING, UpdateOne
 from pymongo.collection import Collection
 
 from src.domain.entities import Installment
 from src.domain.repositories import InstallmentRepository
+from src.infra.database.archive_catalog import ArchiveCatalog
 
 
 class MongoInstallmentRepository(InstallmentRepository):
-    def __init__(self, collection: Collection):
+    # Bancos de empresas cujos índices já foram garantidos neste processo
+    _indexed_databases = set()
+
+    def __init__(self, collection: Collection, archive: Optional[ArchiveCatalog] = None):
         self._collection = collection
+        # Parcelas de lançamentos arquivados (todas pagas) ficam no arquivo por ano de vencimento
+        self._archive = archive or ArchiveCatalog(collection)
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Garante os índices de parcelas (uma vez por banco de empresa por processo)"""
+        key = (self._collection.database.name, self._collection.name)
+        if key in MongoInstallmentRepository._indexed_databases:
+            return
+        try:
+            self._collection.create_index([("is_paid", ASCENDING), ("due_date", ASCENDING)])
+            self._collection.create_index("financial_entry_id")
+            MongoInstallmentRepository._indexed_databases.add(key)
+        except Exception as e:
+            print(f"Aviso: não foi possível criar índices de parcelas: {e}")
 
     def create(self, installment: Installment) -> Installment:
         installment.id = str(uuid4())
@@ -24,14 +44,44 @@ class MongoInstallmentRepository(InstallmentRepository):
 
         return installment
 
+    def create_many(self, installments: List[Installment]) -> List[Installment]:
+        if not installments:
+            return []
+
+        now = datetime.now()
+        docs = []
+        for installment in installments:
+            installment.id = str(uuid4())
+            installment.created_at = now
+            installment.updated_at = now
+
+            installment_dict = installment.to_dict()
+            installment_dict['_id'] = installment.id
+            installment_dict.pop('id')
+            docs.append(installment_dict)
+
+        self._collection.insert_many(docs)
+
+        return installments
+
     def find_by_id(self, installment_id: str) -> Optional[Installment]:
         doc = self._collection.find_one({"_id": installment_id})
+        if doc is None:
+            for collection in self._archive.all_collections():
+                doc = collection.find_one({"_id": installment_id})
+                if doc:
+                    break
         if doc:
             return self._doc_to_entity(doc)
         return None
 
     def find_by_financial_entry_id(self, financial_entry_id: str) -> List[Installment]:
-        docs = self._collection.find({"financial_entry_id": financial_entry_id}).sort("installment_number", 1)
+        docs = list(self._collection.find({"financial_entry_id": financial_entry_id}).sort("installment_number", 1))
+        if not docs:
+            # Lançamento arquivado: as parcelas saem junto com ele
+            for collection in self._archive.all_collections():
+                docs.extend(collection.find({"financial_entry_id": financial_entry_id}))
+            docs.sort(key=lambda doc: doc["installment_number"])
         return [self._doc_to_entity(doc) for doc in docs]
 
     def find_all(self) -> List[Installment]:
@@ -60,8 +110,70 @@ class MongoInstallmentRepository(InstallmentRepository):
         return result.deleted_count > 0
 
     def delete_by_financial_entry_id(self, financial_entry_id: str) -> bool:
-        result = self._collection.delete_many({"financial_entry_id": financial_entry_id})
-        return result.deleted_count > 0
+        deleted = self._collection.delete_many({"financial_entry_id": financial_entry_id}).deleted_count
+        if deleted == 0:
+            # Lançamento arquivado: as parcelas saíram junto com ele
+            for collection in self._archive.all_collections():
+                deleted += collection.delete_many({"financial_entry_id": financial_entry_id}).deleted_count
+        return deleted > 0
+
+    def delete_by_financial_entry_ids(self, financial_entry_ids: List[str], session: Optional[Any] = None) -> int:
+        query = {"financial_entry_id": {"$in": financial_entry_ids}}
+        deleted = self._collection.delete_many(query, session=session).deleted_count
+        # Parcelas de lançamentos arquivados estão no arquivo
+        for collection in self._archive.all_collections():
+            deleted += collection.delete_many(query, session=session).deleted_count
+        return deleted
+
+    def iter_financial_entry_ids(self, batch_size: int = 1000) -> Iterator[List[str]]:
+        # Varre o índice de financial_entry_id, sem carregar as parcelas
+        cursor = self._collection.aggregate(
+            [{"$group": {"_id": "$financial_entry_id"}}],
+            batchSize=batch_size,
+            allowDiskUse=True,
+        )
+        batch = []
+        for doc in cursor:
+            batch.append(doc["_id"])
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def find_open_due_until(self, cut_off_date: datetime) -> List[Installment]:
+        # Datas são gravadas em ISO; "< dia seguinte" inclui o dia de corte inteiro
+        next_day = datetime.combine(cut_off_date.date() + timedelta(days=1), datetime.min.time())
+        docs = self._collection.find(
+            {
+                "is_paid": False,
+                "due_date": {"$lt": next_day.isoformat()},
+                "is_anticipated": {"$ne": True},
+            }
+        ).sort("due_date", 1)
+        return [self._doc_to_entity(doc) for doc in docs]
+
+    def mark_as_anticipated(self, present_values: Dict[str, float], anticipation_date: datetime) -> int:
+        if not present_values:
+            return 0
+
+        now = datetime.now().isoformat()
+        operations = [
+            UpdateOne(
+                # Não antecipa parcela paga ou antecipada por outra requisição nesse meio tempo
+                {"_id": installment_id, "is_paid": False, "is_anticipated": {"$ne": True}},
+                {"$set": {
+                    "is_anticipated": True,
+                    "anticipation_date": anticipation_date.isoformat(),
+                    "anticipated_amount": present_value,
+                    "updated_at": now,
+                }},
+            )
+            for installment_id, present_value in present_values.items()
+        ]
+
+        result = self._collection.bulk_write(operations, ordered=False)
+        return result.modified_count
 
     def _doc_to_entity(self, doc: dict) -> Installment:
         return Installment(
@@ -73,6 +185,9 @@ class MongoInstallmentRepository(InstallmentRepository):
             due_date=Installment._parse_datetime(doc["due_date"]),
             is_paid=doc.get("is_paid", False),
             payment_date=Installment._parse_datetime(doc.get("payment_date")),
+            is_anticipated=doc.get("is_anticipated", False),
+            anticipation_date=Installment._parse_datetime(doc.get("anticipation_date")),
+            anticipated_amount=doc.get("anticipated_amount"),
             created_at=Installment._parse_datetime(doc.get("created_at")),
             updated_at=Installment._parse_datetime(doc.get("updated_at"))
         )
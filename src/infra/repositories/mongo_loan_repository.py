@@ -0,0 +1,160 @@
+from typing import Dict, List, Optional
+from datetime import datetime
+from uuid import uuid4
+from pymongo import ASCENDING, DeleteMany, InsertOne
+from pymongo.collection import Collection
+
+from src.domain.entities import Loan
+from src.domain.repositories import LoanRepository
+
+
+class MongoLoanRepository(LoanRepository):
+    """
+    Empréstimos na collection "loans" e parcelas na collection "loan_schedules"
+
+    Cada parcela do cronograma é um documento (saída programada), o que permite
+    agregar o serviço da dívida por mês direto no banco.
+    """
+
+    # Bancos de empresas cujos índices já foram garantidos neste processo
+    _indexed_databases = set()
+
+    def __init__(self, collection: Collection, schedule_collection: Collection):
+        self._collection = collection
+        self._schedules = schedule_collection
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Garante os índices do cronograma (uma vez por banco de empresa por processo)"""
+        key = (self._schedules.database.name, self._schedules.name)
+        if key in MongoLoanRepository._indexed_databases:
+            return
+        try:
+            self._schedules.create_index([("loan_id", ASCENDING), ("number", ASCENDING)])
+            self._schedules.create_index("due_date")
+            MongoLoanRepository._indexed_databases.add(key)
+        except Exception as e:
+            print(f"Aviso: não foi possível criar índices do cronograma de empréstimos: {e}")
+
+    def create(self, loan: Loan) -> Loan:
+        loan.id = str(uuid4())
+        loan.created_at = datetime.now()
+        loan.updated_at = datetime.now()
+
+        loan_dict = loan.to_dict()
+        loan_dict['_id'] = loan.id
+        loan_dict.pop('id')
+
+        self._collection.insert_one(loan_dict)
+
+        return loan
+
+    def find_by_id(self, loan_id: str) -> Optional[Loan]:
+        doc = self._collection.find_one({"_id": loan_id})
+        if doc:
+            return self._doc_to_entity(doc)
+        return None
+
+    def find_all(self) -> List[Loan]:
+        docs = self._collection.find().sort("first_due_date", 1)
+        return [self._doc_to_entity(doc) for doc in docs]
+
+    def update(self, loan_id: str, loan: Loan) -> Optional[Loan]:
+        loan.updated_at = datetime.now()
+
+        loan_dict = loan.to_dict()
+        loan_dict.pop('id', None)
+
+        result = self._collection.update_one({"_id": loan_id}, {"$set": loan_dict})
+
+        if result.matched_count > 0:
+            loan.id = loan_id
+            return loan
+
+        return None
+
+    def delete(self, loan_id: str) -> bool:
+        # Cronograma primeiro: uma falha no meio não deixa parcelas sem empréstimo
+        self._schedules.delete_many({"loan_id": loan_id})
+        result = self._collection.delete_one({"_id": loan_id})
+        return result.deleted_count > 0
+
+    def find_schedule(self, loan_id: str) -> List[Dict]:
+        docs = self._schedules.find({"loan_id": loan_id}, {"_id": 0}).sort("number", 1)
+        return list(docs)
+
+    def replace_schedule(self, loan: Loan, rows: List[Dict], from_date: Optional[datetime] = None) -> None:
+        delete_filter = {"loan_id": loan.id}
+        if from_date is not None:
+            delete_filter["due_date"] = {"$gte": from_date.isoformat()}
+
+        now = datetime.now().isoformat()
+        operations = [DeleteMany(delete_filter)]
+        for row in rows:
+            operations.append(InsertOne({
+                "_id": str(uuid4()),
+                "loan_id": loan.id,
+                "bank_name": loan.bank_name,
+                "number": row["number"],
+                "due_date": row["due_date"].isoformat(),
+                "payment": row["payment"],
+                "interest": row["interest"],
+                "amortization": row["amortization"],
+                "balance": row["balance"],
+                "created_at": now,
+            }))
+
+        # Ordenado: a remoção do cronograma antigo acontece antes das inserções
+        self._schedules.bulk_write(operations, ordered=True)
+
+    def debt_service_by_month(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Dict]:
+        match = {}
+        if start_date or end_date:
+            match["due_date"] = {}
+            if start_date:
+                match["due_date"]["$gte"] = start_date.isoformat()
+            if end_date:
+                match["due_date"]["$lte"] = end_date.isoformat()
+
+        pipeline = [
+            {"$match": match},
+            {"$group": {
+                "_id": {"$substrBytes": ["$due_date", 0, 7]},
+                "payment": {"$sum": "$payment"},
+                "interest": {"$sum": "$interest"},
+                "amortization": {"$sum": "$amortization"},
+                "installments": {"$sum": 1},
+                "loans": {"$addToSet": "$loan_id"},
+            }},
+            {"$sort": {"_id": 1}},
+            {"$project": {
+                "_id": 0,
+                "month": "$_id",
+                "payment": {"$round": ["$payment", 2]},
+                "interest": {"$round": ["$interest", 2]},
+                "amortization": {"$round": ["$amortization", 2]},
+                "installments": 1,
+                "loans": {"$size": "$loans"},
+            }},
+        ]
+
+        return list(self._schedules.aggregate(pipeline))
+
+    def _doc_to_entity(self, doc: dict) -> Loan:
+        return Loan(
+            id=doc["_id"],
+            bank_name=doc["bank_name"],
+            principal=doc["principal"],
+            monthly_rate=doc["monthly_rate"],
+            term_months=doc["term_months"],
+            first_due_date=Loan._parse_datetime(doc["first_due_date"]),
+            amortization_system=doc.get("amortization_system", "price"),
+            purpose=doc.get("purpose", ""),
+            renegotiated_at=Loan._parse_datetime(doc.get("renegotiated_at")),
+            created_at=Loan._parse_datetime(doc.get("created_at")),
+            updated_at=Loan._parse_datetime(doc.get("updated_at")),
+        )
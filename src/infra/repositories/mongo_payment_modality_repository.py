@@ -33,6 +33,10 @@ class MongoPaymentModalityRepository(PaymentModalityRepository):
         docs = self._collection.find()
         return [self._doc_to_entity(doc) for doc in docs]
 
+    def find_by_ids(self, modality_ids: List[str]) -> List[PaymentModality]:
+        docs = self._collection.find({"_id": {"$in": modality_ids}})
+        return [self._doc_to_entity(doc) for doc in docs]
+
     def update(self, modality_id: str, modality: PaymentModality) -> Optional[PaymentModality]:
         modality.updated_at = datetime.now()
 
@@ -0,0 +1,107 @@
+from typing import Callable, Dict, List, NamedTuple
+from pymongo.database import Database
+
+from src.domain.repositories import SearchRepository
+
+
+class _Source(NamedTuple):
+    collection: str
+    fields: Dict[str, int]  # campo -> peso no índice de texto
+    projection: Dict[str, int]
+    to_result: Callable[[dict], dict]
+
+
+def _account(doc: dict) -> dict:
+    return {"title": doc.get("description"), "subtitle": doc.get("type"),
+            "date": doc.get("date"), "value": doc.get("value"), "paid": doc.get("paid", False)}
+
+
+def _entry(doc: dict) -> dict:
+    return {"title": doc.get("modality_name"), "subtitle": doc.get("entry_type") or "normal",
+            "date": doc.get("date"), "value": doc.get("value")}
+
+
+def _modality(doc: dict) -> dict:
+    return {"title": doc.get("name"), "subtitle": doc.get("bank_name"), "date": None, "value": None}
+
+
+def _bank_limit(doc: dict) -> dict:
+    return {"title": doc.get("bank_name"), "subtitle": None, "date": None, "value": None}
+
+
+SOURCES: Dict[str, _Source] = {
+    "account": _Source(
+        "accounts", {"description": 1},
+        {"description": 1, "type": 1, "date": 1, "value": 1, "paid": 1}, _account,
+    ),
+    "financial_entry": _Source(
+        "financial_entries", {"modality_name": 1},
+        {"modality_name": 1, "entry_type": 1, "date": 1, "value": 1}, _entry,
+    ),
+    "payment_modality": _Source(
+        "payment_modalities", {"name": 3, "bank_name": 1},
+        {"name": 1, "bank_name": 1}, _modality,
+    ),
+    "bank_limit": _Source(
+        "bank_limits", {"bank_name": 1},
+        {"id": 1, "bank_name": 1}, _bank_limit,
+    ),
+}
+
+TEXT_INDEX_NAME = "search_text"
+
+
+class MongoSearchRepository(SearchRepository):
+    """
+    Busca com índices de texto do MongoDB (idioma português)
+
+    O índice de texto ignora acentos e maiúsculas e reduz as palavras ao
+    radical ("pagamentos" encontra "Pagamento"); os resultados vêm
+    ordenados pela relevância (textScore) e limitados no banco.
+    """
+
+    # Bancos de empresas cujos índices já foram garantidos neste processo
+    _indexed_databases = set()
+
+    def __init__(self, tenant_db: Database):
+        self._db = tenant_db
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """Garante os índices de texto (uma vez por banco de empresa por processo)"""
+        if self._db.name in MongoSearchRepository._indexed_databases:
+            return
+        try:
+            ensure_text_indexes(self._db)
+            MongoSearchRepository._indexed_databases.add(self._db.name)
+        except Exception as e:
+            print(f"Aviso: não foi possível criar índices de busca: {e}")
+
+    def search(self, query: str, kinds: List[str], limit: int) -> List[dict]:
+        results = []
+        for kind in kinds:
+            source = SOURCES[kind]
+            cursor = self._db[source.collection].find(
+                {"$text": {"$search": query, "$language": "portuguese"}},
+                {**source.projection, "score": {"$meta": "textScore"}},
+            ).sort([("score", {"$meta": "textScore"})]).limit(limit)
+
+            for doc in cursor:
+                results.append({
+                    "kind": kind,
+                    "id": doc.get("id") or doc["_id"],
+                    **source.to_result(doc),
+                    "score": round(doc["score"], 4),
+                })
+        return results
+
+
+def ensure_text_indexes(tenant_db: Database) -> None:
+    """Cria os índices de texto usados pela busca nas coleções da empresa"""
+    for source in SOURCES.values():
+        tenant_db[source.collection].create_index(
+            [(field, "text") for field in source.fields],
+            weights=source.fields,
+            default_language="portuguese",
+            name=TEXT_INDEX_NAME,
+        )
@@ -1,4 +1,14 @@
 from .password_hash import PasswordHash
-from .jwt_handler import JWTHandler
+from .bcrypt_pool import BcryptPool, PasswordHasherBusy, get_bcrypt_pool
+from .jwt_handler import JWTHandler, get_jwt_handler
+from .token_cache import VerifiedTokenCache
 
-__all__ = ["PasswordHash", "JWTHandler"]
+__all__ = [
+    "PasswordHash",
+    "BcryptPool",
+    "PasswordHasherBusy",
+    "get_bcrypt_pool",
+    "JWTHandler",
+    "get_jwt_handler",
+    "VerifiedTokenCache",
+]
@@ -0,0 +1,92 @@
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Callable
+
+from .password_hash import PasswordHash
+
+
+class PasswordHasherBusy(Exception):
+    """Fila do bcrypt cheia: a requisição deve ser recusada com 429"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Muitas tentativas de login. Tente novamente em instantes")
+        self.retry_after = retry_after
+
+
+class BcryptPool:
+    """
+    Executor dedicado e limitado para o bcrypt
+
+    O bcrypt é caro de propósito (~250 ms de CPU no custo 12). Rodá-lo na
+    thread da requisição deixa uma rajada de logins (ou um ataque de
+    credential stuffing) ocupar todos os workers. Aqui no máximo max_workers
+    hashes rodam ao mesmo tempo e até max_queue esperam; acima disso a
+    chamada falha na hora com PasswordHasherBusy (429 + Retry-After), sem
+    ocupar CPU. O bcrypt libera o GIL, então as demais threads do worker
+    continuam atendendo o dashboard.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 8, timeout: float = 10.0):
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._capacity = max_workers + max_queue
+        self._avg_seconds = 0.25
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """PasswordHash.verify no executor (levanta PasswordHasherBusy se a fila está cheia)"""
+        return self._run(PasswordHash.verify, password, hashed_password)
+
+    def hash(self, password: str) -> str:
+        """PasswordHash.hash no executor (levanta PasswordHasherBusy se a fila está cheia)"""
+        return self._run(PasswordHash.hash, password)
+
+    def _run(self, fn: Callable, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy(self._retry_after())
+
+        try:
+            future = self._executor.submit(self._timed, fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=self._timeout)
+        except TimeoutError:
+            raise PasswordHasherBusy(self._retry_after())
+
+    def _timed(self, fn: Callable, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            # Média móvel do tempo de um hash, usada no Retry-After
+            self._avg_seconds = 0.8 * self._avg_seconds + 0.2 * (time.perf_counter() - started)
+
+    def _retry_after(self) -> int:
+        """Segundos até a fila atual esvaziar"""
+        return max(1, math.ceil(self._avg_seconds * self._capacity / self._max_workers))
+
+
+# Singleton global
+_bcrypt_pool = None
+_bcrypt_pool_lock = threading.Lock()
+
+
+def get_bcrypt_pool() -> BcryptPool:
+    """Retorna a instância singleton do BcryptPool (BCRYPT_MAX_CONCURRENCY, BCRYPT_MAX_QUEUE)"""
+    global _bcrypt_pool
+    with _bcrypt_pool_lock:
+        if _bcrypt_pool is None:
+            _bcrypt_pool = BcryptPool(
+                max_workers=int(os.getenv("BCRYPT_MAX_CONCURRENCY", "2")),
+                max_queue=int(os.getenv("BCRYPT_MAX_QUEUE", "8")),
+                timeout=float(os.getenv("BCRYPT_TIMEOUT", "10")),
+            )
+        return _bcrypt_pool
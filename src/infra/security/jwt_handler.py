@@ -3,11 +3,14 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 
+from .token_cache import VerifiedTokenCache
+
 
 class JWTHandler:
-    def __init__(self, secret_key: Optional[str] = None):
+    def __init__(self, secret_key: Optional[str] = None, token_cache: Optional[VerifiedTokenCache] = None):
         self.secret_key = secret_key or os.getenv("JWT_SECRET", "your-secret-key-change-in-production")
         self.algorithm = "HS256"
+        self._token_cache = token_cache
 
     def generate_token(self, payload: Dict, expires_in_hours: int = 24) -> str:
         """
@@ -47,6 +50,33 @@ class JWTHandler:
         except jwt.InvalidTokenError:
             raise ValueError("Token inválido")
 
+    def verify_access_token(self, token: str) -> Dict:
+        """
+        Verifica um token de acesso, reaproveitando verificações anteriores
+
+        O dashboard envia o mesmo token em dezenas de requisições por página;
+        com cache, só a primeira paga o jwt.decode completo.
+
+        Returns:
+            Payload decodificado (compartilhado - não deve ser modificado)
+
+        Raises:
+            ValueError: Se o token for inválido ou expirado
+        """
+        if self._token_cache is None:
+            return self.verify_token(token)
+
+        payload = self._token_cache.get(token)
+        if payload is None:
+            payload = self.verify_token(token)
+            self._token_cache.put(token, payload)
+        return payload
+
+    def revoke_user_tokens(self, user_id: str) -> None:
+        """Invalida os tokens do usuário guardados no cache de verificação"""
+        if self._token_cache is not None:
+            self._token_cache.revoke_user(user_id)
+
     def generate_refresh_token(self, payload: Dict) -> str:
         """
         Gera um refresh token com tempo de expiração maior
@@ -58,3 +88,17 @@ class JWTHandler:
             Refresh token JWT
         """
         return self.generate_token(payload, expires_in_hours=24 * 7)  # 7 dias
+
+
+# Singleton global
+_jwt_handler = None
+
+
+def get_jwt_handler() -> JWTHandler:
+    """Retorna a instância singleton do JWTHandler, com cache de tokens verificados (JWT_CACHE_SIZE)"""
+    global _jwt_handler
+    if _jwt_handler is None:
+        _jwt_handler = JWTHandler(
+            token_cache=VerifiedTokenCache(max_entries=int(os.getenv("JWT_CACHE_SIZE", "4096")))
+        )
+    return _jwt_handler
@@ -1,13 +1,19 @@
+import os
 import bcrypt
 
 
+def configured_rounds() -> int:
+    """Custo (work factor) do bcrypt para novos hashes (BCRYPT_ROUNDS, padrão 12)"""
+    return int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+
 class PasswordHash:
     @staticmethod
     def hash(password: str) -> str:
         """
         Gera um hash seguro da senha usando bcrypt
         """
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=configured_rounds())
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
 
@@ -20,3 +26,15 @@ class PasswordHash:
             password.encode('utf-8'),
             hashed_password.encode('utf-8')
         )
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """
+        Indica se o hash foi gerado com um custo diferente do configurado
+
+        O hash bcrypt tem o formato $2b$<custo>$<salt+hash>.
+        """
+        try:
+            return int(hashed_password.split("$")[2]) != configured_rounds()
+        except (IndexError, ValueError):
+            return False
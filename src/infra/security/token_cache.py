@@ -0,0 +1,87 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+
+class VerifiedTokenCache:
+    """
+    Cache em memória (por processo) de tokens JWT já verificados
+
+    A chave é o SHA-256 do token (o token em si não fica em memória) e cada
+    entrada expira junto com o "exp" do token, então o cache nunca aceita um
+    token que o jwt.decode recusaria por expiração. Limitado a max_entries
+    (LRU). revoke_user remove todas as entradas de um usuário.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict]]" = OrderedDict()
+        self._by_user: Dict[str, Set[bytes]] = {}
+
+    def get(self, token: str) -> Optional[Dict]:
+        """Retorna o payload verificado do token ou None (não está no cache / expirou)"""
+        digest = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                self._remove(digest)
+                return None
+            self._entries.move_to_end(digest)
+            return entry[1]
+
+    def put(self, token: str, payload: Dict) -> None:
+        """Guarda o payload de um token recém-verificado (tokens sem "exp" não são guardados)"""
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+
+        digest = self._digest(token)
+        user_id = payload.get("user_id")
+        with self._lock:
+            self._entries[digest] = (float(expires_at), payload)
+            self._entries.move_to_end(digest)
+            if user_id:
+                self._by_user.setdefault(user_id, set()).add(digest)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def revoke_user(self, user_id: str) -> int:
+        """
+        Remove do cache todos os tokens de um usuário
+
+        Use ao desativar o usuário ou trocar a senha: os próximos requests
+        voltam a passar pela verificação completa.
+
+        Returns:
+            Número de entradas removidas
+        """
+        with self._lock:
+            digests = self._by_user.pop(user_id, set())
+            for digest in digests:
+                self._entries.pop(digest, None)
+            return len(digests)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, digest: bytes) -> None:
+        _, payload = self._entries.pop(digest)
+        user_digests = self._by_user.get(payload.get("user_id"))
+        if user_digests is not None:
+            user_digests.discard(digest)
+            if not user_digests:
+                del self._by_user[payload.get("user_id")]
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
@@ -0,0 +1,219 @@
+import os
+import threading
+import time
+import zlib
+from typing import Iterable, Iterator, Optional
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # está no requirements.txt; sem ele (instalação parcial), só gzip
+    brotli = None
+
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "text/csv",
+    "text/html",
+    "text/plain",
+}
+
+
+class CompressionMetrics:
+    """
+    Contadores de compressão do processo
+
+    Por codificação: respostas, bytes antes/depois e tempo de CPU gasto
+    comprimindo; e quantas respostas deixaram de ser comprimidas por motivo
+    (small, load, encoding).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._encodings = {}
+        self._skipped = {}
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float, responses: int = 1) -> None:
+        with self._lock:
+            stats = self._encodings.setdefault(
+                encoding, {"responses": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0}
+            )
+            stats["responses"] += responses
+            stats["bytes_in"] += bytes_in
+            stats["bytes_out"] += bytes_out
+            stats["cpu_seconds"] += cpu_seconds
+
+    def skip(self, reason: str) -> None:
+        with self._lock:
+            self._skipped[reason] = self._skipped.get(reason, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            encodings = {}
+            for encoding, stats in self._encodings.items():
+                encodings[encoding] = {
+                    **stats,
+                    "cpu_seconds": round(stats["cpu_seconds"], 4),
+                    "ratio": round(stats["bytes_out"] / stats["bytes_in"], 4) if stats["bytes_in"] else None,
+                    "cpu_ms_per_mb": (
+                        round(stats["cpu_seconds"] * 1000 / (stats["bytes_in"] / 1_048_576), 2)
+                        if stats["bytes_in"] else None
+                    ),
+                }
+            return {"encodings": encodings, "skipped": dict(self._skipped)}
+
+
+class ResponseCompressor:
+    """
+    Comprime as respostas (gzip ou brotli) conforme o Accept-Encoding
+
+    - Respostas comuns só são comprimidas a partir de min_size bytes
+    - Respostas em streaming são comprimidas chunk a chunk, com flush a cada
+      chunk para o cliente continuar recebendo os dados aos poucos
+    - Com a CPU saturada (load average por CPU acima de max_load) a resposta
+      sai sem compressão: é melhor gastar banda do que atrasar o worker
+
+    Configuração (variáveis de ambiente):
+        COMPRESSION_MIN_SIZE (padrão 1024), COMPRESSION_GZIP_LEVEL (6),
+        COMPRESSION_BROTLI_LEVEL (4), COMPRESSION_MAX_LOAD (0.9, 0 = não checa)
+    """
+
+    LOAD_CHECK_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        min_size: Optional[int] = None,
+        gzip_level: Optional[int] = None,
+        brotli_level: Optional[int] = None,
+        max_load: Optional[float] = None,
+        metrics: Optional[CompressionMetrics] = None,
+    ):
+        self.min_size = min_size if min_size is not None else int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+        self.gzip_level = gzip_level if gzip_level is not None else int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+        self.brotli_level = (
+            brotli_level if brotli_level is not None else int(os.getenv("COMPRESSION_BROTLI_LEVEL", "4"))
+        )
+        self.max_load = max_load if max_load is not None else float(os.getenv("COMPRESSION_MAX_LOAD", "0.9"))
+        self.metrics = metrics or CompressionMetrics()
+        self._cpu_count = os.cpu_count() or 1
+        self._load = 0.0
+        self._load_checked_at = 0.0
+
+    def init_app(self, app: Flask) -> None:
+        app.after_request(self.compress_response)
+        app.extensions["compression"] = self
+
+    def compress_response(self, response: Response) -> Response:
+        """Hook after_request"""
+        if not self._is_compressible(response):
+            return response
+
+        encoding = self._negotiate()
+        response.vary.add("Accept-Encoding")
+        if encoding is None:
+            self.metrics.skip("encoding")
+            return response
+
+        if not response.is_streamed and response.calculate_content_length() < self.min_size:
+            self.metrics.skip("small")
+            return response
+
+        if self._cpu_saturated():
+            self.metrics.skip("load")
+            return response
+
+        if response.is_streamed:
+            response.response = self._compress_stream(response.iter_encoded(), encoding)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            started = time.thread_time()
+            compressed = self._compress(data, encoding)
+            self.metrics.record(encoding, len(data), len(compressed), time.thread_time() - started)
+            response.set_data(compressed)
+
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    def _is_compressible(self, response: Response) -> bool:
+        if response.status_code < 200 or response.status_code in (204, 206, 304):
+            return False
+        if request.method == "HEAD" or response.direct_passthrough:
+            return False
+        if "Content-Encoding" in response.headers:
+            return False
+        return response.mimetype in COMPRESSIBLE_MIMETYPES
+
+    def _negotiate(self) -> Optional[str]:
+        """Codificação de maior q no Accept-Encoding; no empate, brotli"""
+        accepted = request.accept_encodings
+        options = [("gzip", accepted.quality("gzip"))]
+        if brotli is not None:
+            options.insert(0, ("br", accepted.quality("br")))
+
+        encoding, quality = max(options, key=lambda option: option[1])
+        return encoding if quality > 0 else None
+
+    def _cpu_saturated(self) -> bool:
+        if self.max_load <= 0:
+            return False
+
+        now = time.monotonic()
+        if now - self._load_checked_at >= self.LOAD_CHECK_INTERVAL:
+            try:
+                self._load = os.getloadavg()[0] / self._cpu_count
+            except (AttributeError, OSError):
+                self._load = 0.0  # Plataforma sem load average
+            self._load_checked_at = now
+        return self._load >= self.max_load
+
+    def _compress(self, data: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(data, quality=self.brotli_level)
+        compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
+    def _compress_stream(self, chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=self.brotli_level)
+            process, flush, finish = compressor.process, compressor.flush, compressor.finish
+        else:
+            compressor = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            process = compressor.compress
+            flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)
+            finish = compressor.flush
+
+        bytes_in = bytes_out = 0
+        cpu_seconds = 0.0
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                started = time.thread_time()
+                out = process(chunk) + flush()
+                cpu_seconds += time.thread_time() - started
+                bytes_in += len(chunk)
+                bytes_out += len(out)
+                yield out
+
+            started = time.thread_time()
+            tail = finish()
+            cpu_seconds += time.thread_time() - started
+            bytes_out += len(tail)
+            yield tail
+        finally:
+            self.metrics.record(encoding, bytes_in, bytes_out, cpu_seconds)
+
+
+# Singleton global
+_compressor = None
+
+
+def get_response_compressor() -> ResponseCompressor:
+    """Retorna a instância singleton do ResponseCompressor"""
+    global _compressor
+    if _compressor is None:
+        _compressor = ResponseCompressor()
+    return _compressor
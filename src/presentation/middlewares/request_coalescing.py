@@ -0,0 +1,30 @@
+from typing import Any, Callable
+from flask import g, request
+from src.infra.cache import get_single_flight, get_tenant_write_version
+
+
+def coalesced_tenant_read(route: str, compute: Callable[[], Any]) -> Any:
+    """
+    Executa uma leitura cara da empresa passando pelo single-flight
+
+    Requisições concorrentes com a mesma chave (company_id, rota, query args
+    normalizados, versão de escrita da empresa) compartilham uma única execução de compute. O resultado
+    deve ser serializável e não pode ser modificado por quem o recebe.
+
+    Usage:
+        summary = coalesced_tenant_read(
+            "installments.daily_summary",
+            lambda: use_case.execute(start_date, end_date)
+        )
+    """
+    single_flight = get_single_flight()
+
+    company_id = g.company_id
+    args = tuple(sorted(request.args.items(multi=True)))
+    key = (company_id, route, args)
+
+    # Com a versão na chave, uma leitura depois de uma escrita deste worker
+    # (que já conhece a versão nova) não se junta a uma computação anterior
+    version = get_tenant_write_version().current(company_id)
+
+    return single_flight.do(key, compute, version=version)
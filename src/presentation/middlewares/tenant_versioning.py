@@ -0,0 +1,40 @@
+from flask import Response, g, request
+from src.infra.cache import get_tenant_write_version
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def mark_tenant_write(company_id: str):
+    """
+    Incrementa a versão de escrita da empresa durante a requisição
+
+    Use quando a rota precisa da versão nova (ex: para atualizar um cache
+    em memória). O hook after_request não incrementa de novo.
+
+    Returns:
+        Tupla (versão anterior, nova versão)
+    """
+    versions = get_tenant_write_version().bump(company_id)
+    g.tenant_write_version = versions[1]
+    return versions
+
+
+def bump_tenant_version_after_write(response: Response) -> Response:
+    """
+    Hook after_request: toda escrita bem-sucedida em rota de empresa
+    incrementa a versão de escrita, invalidando caches de leitura
+    """
+    if request.method not in WRITE_METHODS or response.status_code >= 400:
+        return response
+
+    company_id = g.get("company_id")
+    if not company_id or g.get("tenant_write_version") is not None:
+        return response
+
+    try:
+        mark_tenant_write(company_id)
+    except Exception as e:
+        # Falha ao versionar não pode derrubar uma escrita que já aconteceu
+        print(f"Erro ao incrementar versão da empresa {company_id}: {e}")
+
+    return response
@@ -6,6 +6,12 @@ from .installment_routes import installment_bp
 from .account_routes import account_bp
 from .bank_limit_routes import bank_limit_bp
 from .migration_routes import migration_bp
+from .dashboard_routes import dashboard_bp
+from .loan_routes import loan_bp
+from .import_routes import import_bp
+from .analytics_routes import analytics_bp
+from .forecast_routes import forecast_bp
+from .search_routes import search_bp
 
 __all__ = [
     "payment_modality_bp",
@@ -15,5 +21,11 @@ __all__ = [
     "installment_bp",
     "account_bp",
     "bank_limit_bp",
-    "migration_bp"
+    "migration_bp",
+    "dashboard_bp",
+    "loan_bp",
+    "import_bp",
+    "analytics_bp",
+    "forecast_bp",
+    "search_bp"
 ]
@@ -2,7 +2,7 @@ from flask import Blueprint, request, jsonify, g
 from datetime import datetime
 
 from src.application.middleware.auth_bypass import require_auth, require_feature, require_role, require_super_admin
-from src.application.use_cases import CreateAccount, ListAccounts, UpdateAccount, DeleteAccount
+from src.application.use_cases import CreateAccount, ListAccounts, ListUpcomingAccounts, UpdateAccount, DeleteAccount
 from src.infra.repositories.mongo_account_repository import MongoAccountRepository
 from src.database import get_tenant_db
 
@@ -63,6 +63,34 @@ def list_accounts():
         return jsonify({"error": "Erro interno do servidor"}), 500
 
 
+@account_bp.route("/accounts/upcoming", methods=["GET"])
+@require_auth
+@require_feature("accounts.read")
+def list_upcoming_accounts():
+    """
+    Contas em aberto que vencem nos próximos dias, agrupadas por dia
+
+    Query params:
+        days: Janela a partir de hoje (1 a 365, padrão 30)
+
+    Returns:
+        200: {"from", "to", "count", "total", "overdue": {"count", "total"},
+              "days": [{"date", "count", "total", "accounts": [{"id", "description", "type", "value"}]}]}
+        400: days inválido
+    """
+    try:
+        days = int(request.args.get("days", 30))
+
+        repo = get_repository(g.company_id)
+        use_case = ListUpcomingAccounts(repo)
+        return jsonify(use_case.execute(days)), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
 @account_bp.route("/accounts/<account_id>", methods=["PATCH"])
 @require_auth
 @require_feature("accounts.update")
@@ -1,5 +1,8 @@
-from flask import Blueprint, request, jsonify, g
-from src.database import get_shared_db, get_tenant_db
+import json
+from datetime import datetime
+from flask import Blueprint, Response, request, jsonify, g, stream_with_context
+from typing import Optional
+from src.database import ANALYTICS, MongoConnection, get_shared_db, get_tenant_db, with_read_policy
 from src.infra.repositories import (
     MongoCompanyRepository,
     MongoUserRepository,
@@ -8,18 +11,27 @@ from src.infra.repositories import (
     MongoAuditLogRepository
 )
 from src.application.use_cases import CreateCompany, ListCompanies
-from src.application.use_cases.admin import ImpersonateCompany
+from src.application.use_cases.admin import ImpersonateCompany, PlatformRevenueReport
 from src.application.middleware import require_auth, require_super_admin
 from src.application.services.audit_service import AuditService
-from src.infra.security import JWTHandler, PasswordHash
+from src.application.services.feature_registry import get_feature_registry
+from src.infra.security import PasswordHash, get_jwt_handler
+from src.presentation.middlewares.compression import get_response_compressor
 from src.domain.entities import User
 
 admin_bp = Blueprint("admin", __name__)
 
 
-def get_repositories():
-    """Retorna repositórios do shared_db"""
+def get_repositories(analytics_endpoint: Optional[str] = None):
+    """
+    Retorna repositórios do shared_db
+
+    Com analytics_endpoint, as leituras seguem a política desse endpoint
+    (padrão ANALYTICS: secundário com atraso limitado).
+    """
     shared_db = get_shared_db()
+    if analytics_endpoint:
+        shared_db = with_read_policy(shared_db, analytics_endpoint, ANALYTICS)
 
     company_repo = MongoCompanyRepository(shared_db["companies"])
     user_repo = MongoUserRepository(shared_db["users"])
@@ -332,14 +344,15 @@ def impersonate_company(company_id):
         tenant_db = get_tenant_db(company_id)
         role_repo = MongoRoleRepository(tenant_db["roles"])
 
-        jwt_handler = JWTHandler()
+        jwt_handler = get_jwt_handler()
 
         use_case = ImpersonateCompany(
             company_repo,
             user_repo,
             role_repo,
             feature_repo,
-            jwt_handler
+            jwt_handler,
+            get_feature_registry()
         )
 
         result = use_case.execute(g.user_id, company_id)
@@ -618,6 +631,7 @@ def deactivate_user(user_id):
             return jsonify({"error": "Usuário não encontrado"}), 404
 
         user_repo.deactivate(user_id)
+        get_jwt_handler().revoke_user_tokens(user_id)
 
         # Log de auditoria
         audit_service.log(
@@ -678,6 +692,7 @@ def delete_user(user_id):
         success = user_repo.delete(user_id)
         if not success:
             return jsonify({"error": "Erro ao deletar usuário"}), 500
+        get_jwt_handler().revoke_user_tokens(user_id)
 
         return jsonify({"message": "Usuário deletado com sucesso"}), 200
 
@@ -719,6 +734,7 @@ def toggle_user_active(user_id):
             action = "activate_user"
         else:
             user_repo.deactivate(user_id)
+            get_jwt_handler().revoke_user_tokens(user_id)
             message = "Usuário desativado com sucesso"
             action = "deactivate_user"
 
@@ -757,7 +773,7 @@ def admin_dashboard():
         403: Sem permissão (apenas super admin)
     """
     try:
-        company_repo, user_repo, feature_repo, _ = get_repositories()
+        company_repo, user_repo, feature_repo, _ = get_repositories("admin.dashboard")
 
         # Estatísticas de empresas
         all_companies = company_repo.find_all()
@@ -799,3 +815,77 @@ def admin_dashboard():
 
     except Exception:
         return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@admin_bp.route("/admin/reports/revenue", methods=["GET"])
+@require_auth
+@require_super_admin
+def platform_revenue_report():
+    """
+    Faturamento de todas as empresas por mês e modalidade (Super Admin only)
+
+    Query params:
+        from: Data inicial (formato ISO, padrão: início do ano atual)
+        to: Data final (formato ISO, padrão: agora; data sem horário inclui o dia inteiro)
+
+    Returns:
+        200: NDJSON em streaming. Uma linha por empresa, conforme cada uma
+             termina ({"type": "tenant", "status": "ok" | "timeout" | "error", ...}),
+             e por último o total da plataforma ({"type": "summary", ...})
+        400: Datas inválidas
+        403: Sem permissão (apenas super admin)
+    """
+    try:
+        now = datetime.now()
+        start_date_str = request.args.get("from")
+        end_date_str = request.args.get("to")
+
+        start_date = datetime.fromisoformat(start_date_str) if start_date_str else datetime(now.year, 1, 1)
+        end_date = datetime.fromisoformat(end_date_str) if end_date_str else now
+        # Data sem horário inclui o dia inteiro
+        if end_date_str and len(end_date_str) == 10:
+            end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+        if start_date > end_date:
+            raise ValueError("Data inicial deve ser anterior à data final")
+
+        company_repo, _, _, audit_repo = get_repositories()
+        connection = MongoConnection()
+
+        def tenant_db(company):
+            db = connection.get_tenant_db(company.id, db_name=company.db_name)
+            return with_read_policy(db, "admin.reports.revenue", ANALYTICS)
+
+        AuditService(audit_repo).log(
+            action="platform_revenue_report",
+            user_id=g.user_id,
+            user_email=g.email,
+            details={"from": start_date.isoformat(), "to": end_date.isoformat()}
+        )
+
+        events = PlatformRevenueReport(company_repo, tenant_db).stream(start_date, end_date)
+        lines = (json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+
+        return Response(stream_with_context(lines), mimetype="application/x-ndjson"), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@admin_bp.route("/admin/metrics/compression", methods=["GET"])
+@require_auth
+@require_super_admin
+def compression_metrics():
+    """
+    Métricas de compressão das respostas deste processo (Super Admin only)
+
+    Returns:
+        200: Por codificação (responses, bytes_in, bytes_out, ratio, cpu_seconds,
+             cpu_ms_per_mb) e respostas não comprimidas por motivo
+    """
+    try:
+        return jsonify(get_response_compressor().metrics.snapshot()), 200
+
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
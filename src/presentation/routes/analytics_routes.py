@@ -0,0 +1,54 @@
+import time
+from datetime import date
+from flask import Blueprint, request, jsonify, g
+from src.application.services.columnar_store import DIMENSIONS, get_columnar_store
+from src.application.middleware.auth_bypass import require_auth, require_feature, require_role, require_super_admin
+
+analytics_bp = Blueprint("analytics", __name__)
+
+
+@analytics_bp.route("/analytics/groupby", methods=["GET"])
+@require_auth
+@require_feature("financial_entries.read")
+def groupby():
+    """
+    Agrupa os lançamentos da empresa por dimensões (cache colunar em memória)
+
+    Query params:
+        dims: Dimensões separadas por vírgula (day, weekday, month, year,
+              modality, type, entry_type). Vazio = total geral
+        measure: sum (padrão), count ou avg sobre value
+        from: Data inicial (YYYY-MM-DD, opcional)
+        to: Data final (YYYY-MM-DD, opcional)
+
+    Returns:
+        200: {"dims", "measure", "rows": [{dim: rótulo, ..., "value", "count"}], "rows_scanned", "elapsed_ms"}
+        400: Dimensão, medida ou data inválida
+    """
+    try:
+        dims = [d.strip() for d in request.args.get("dims", "").split(",") if d.strip()]
+        measure = request.args.get("measure", "sum")
+        start_str = request.args.get("from")
+        end_str = request.args.get("to")
+
+        if len(set(dims)) != len(dims):
+            raise ValueError("Dimensão repetida")
+        start_day = date.fromisoformat(start_str[:10]).toordinal() if start_str else None
+        end_day = date.fromisoformat(end_str[:10]).toordinal() if end_str else None
+
+        columns = get_columnar_store().get(g.company_id)
+        started = time.perf_counter()
+        rows = columns.groupby(dims, measure, start_day, end_day)
+
+        return jsonify({
+            "dims": dims,
+            "measure": measure,
+            "rows": rows,
+            "rows_scanned": columns.size,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e), "dimensions": list(DIMENSIONS)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
@@ -6,8 +6,9 @@ from src.infra.repositories import (
     MongoRoleRepository,
     MongoFeatureRepository
 )
-from src.infra.security import JWTHandler
+from src.infra.security import PasswordHasherBusy, get_jwt_handler
 from src.application.use_cases.auth import Login, RefreshToken, ChangePassword
+from src.application.services.feature_registry import get_feature_registry
 
 auth_bp = Blueprint("auth", __name__)
 
@@ -24,6 +25,13 @@ def get_auth_repositories():
     return user_repo, company_repo, role_repo, feature_repo
 
 
+def busy_response(error: PasswordHasherBusy):
+    """429 com Retry-After quando a fila do bcrypt está cheia"""
+    response = jsonify({"error": str(error)})
+    response.headers["Retry-After"] = str(error.retry_after)
+    return response, 429
+
+
 @auth_bp.route("/auth/login", methods=["POST"])
 def login():
     """
@@ -38,6 +46,7 @@ def login():
     Returns:
         200: Login bem-sucedido com token
         401: Credenciais inválidas
+        429: Muitos logins simultâneos (ver header Retry-After)
     """
     try:
         data = request.get_json()
@@ -46,13 +55,15 @@ def login():
         password = data.get("password")
 
         user_repo, _, role_repo, feature_repo = get_auth_repositories()
-        jwt_handler = JWTHandler()
+        jwt_handler = get_jwt_handler()
 
-        use_case = Login(user_repo, role_repo, feature_repo, jwt_handler)
+        use_case = Login(user_repo, role_repo, feature_repo, jwt_handler, get_feature_registry())
         result = use_case.execute(email, password)
 
         return jsonify(result), 200
 
+    except PasswordHasherBusy as e:
+        return busy_response(e)
     except ValueError as e:
         return jsonify({"error": str(e)}), 401
     except Exception as e:
@@ -81,9 +92,9 @@ def refresh():
             raise ValueError("Refresh token é obrigatório")
 
         user_repo, _, role_repo, feature_repo = get_auth_repositories()
-        jwt_handler = JWTHandler()
+        jwt_handler = get_jwt_handler()
 
-        use_case = RefreshToken(user_repo, role_repo, feature_repo, jwt_handler)
+        use_case = RefreshToken(user_repo, role_repo, feature_repo, jwt_handler, get_feature_registry())
         result = use_case.execute(refresh_token)
 
         return jsonify(result), 200
@@ -117,7 +128,7 @@ def me():
             "name": g.name,
             "company_id": g.company_id,
             "roles": g.roles,
-            "features": g.features,
+            "features": sorted(g.features),
             "is_super_admin": g.is_super_admin
         }), 200
 
@@ -160,9 +171,12 @@ def change_password():
             user_repo, _, _, _ = get_auth_repositories()
             use_case = ChangePassword(user_repo)
             use_case.execute(g.user_id, current_password, new_password)
+            get_jwt_handler().revoke_user_tokens(g.user_id)
 
             return jsonify({"message": "Senha alterada com sucesso"}), 200
 
+        except PasswordHasherBusy as e:
+            return busy_response(e)
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
         except Exception as e:
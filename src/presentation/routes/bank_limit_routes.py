@@ -6,9 +6,11 @@ from src.application.use_cases import (
     ListBankLimits,
     UpdateBankLimit,
     DeleteBankLimit,
+    ProjectBankLimitCosts,
 )
 from src.infra.repositories.mongo_bank_limit_repository import MongoBankLimitRepository
 from src.database import get_tenant_db
+from src.infra.cache import get_tenant_cache
 
 
 bank_limit_bp = Blueprint("bank_limit", __name__)
@@ -35,12 +37,15 @@ def create_bank_limit():
         rotativo_rate = float(data.get("rotativo_rate", 0))
         cheque_rate = float(data.get("cheque_rate", 0))
         interest_rate = float(data.get("interest_rate", 0))
+        cdi_rate = float(data.get("cdi_rate", 0))
+        iof_rate = float(data.get("iof_rate", 0))
+        iof_daily_rate = float(data.get("iof_daily_rate", 0))
 
         repo = get_repository(g.company_id)
         use_case = CreateBankLimit(repo)
         bank_limit = use_case.execute(
             bank_name, rotativo_available, rotativo_used, cheque_available, cheque_used,
-            rotativo_rate, cheque_rate, interest_rate
+            rotativo_rate, cheque_rate, interest_rate, cdi_rate, iof_rate, iof_daily_rate
         )
 
         return jsonify(bank_limit.to_dict()), 201
@@ -66,6 +71,38 @@ def list_bank_limits():
         return jsonify({"error": "Erro interno do servidor"}), 500
 
 
+@bank_limit_bp.route("/bank-limits/cost-projection", methods=["GET"])
+@require_auth
+@require_feature("bank_limits.read")
+def project_bank_limit_costs():
+    """
+    Projeta juros, IOF e CET de cada linha de crédito
+
+    Query params:
+        days: Horizonte em dias (default: 30)
+        amount: Valor a sacar (opcional) - retorna ranking da linha mais barata
+
+    Returns:
+        200: Custos por linha, totais e ranking
+        400: Parâmetros inválidos
+    """
+    try:
+        days = int(request.args.get("days", 30))
+        amount_str = request.args.get("amount")
+        amount = float(amount_str) if amount_str else None
+
+        repo = get_repository(g.company_id)
+        use_case = ProjectBankLimitCosts(repo, get_tenant_cache(), g.company_id)
+        projection = use_case.execute(days, amount)
+
+        return jsonify(projection), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
 @bank_limit_bp.route("/bank-limits/<limit_id>", methods=["PUT"])
 @require_auth
 @require_feature("bank_limits.update")
@@ -80,12 +117,15 @@ def update_bank_limit(limit_id: str):
         rotativo_rate = float(data.get("rotativo_rate", 0))
         cheque_rate = float(data.get("cheque_rate", 0))
         interest_rate = float(data.get("interest_rate", 0))
+        cdi_rate = float(data.get("cdi_rate", 0))
+        iof_rate = float(data.get("iof_rate", 0))
+        iof_daily_rate = float(data.get("iof_daily_rate", 0))
 
         repo = get_repository(g.company_id)
         use_case = UpdateBankLimit(repo)
         bank_limit = use_case.execute(
             limit_id, bank_name, rotativo_available, rotativo_used, cheque_available, cheque_used,
-            rotativo_rate, cheque_rate, interest_rate
+            rotativo_rate, cheque_rate, interest_rate, cdi_rate, iof_rate, iof_daily_rate
         )
 
         return jsonify(bank_limit.to_dict()), 200
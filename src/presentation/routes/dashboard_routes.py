@@ -0,0 +1,70 @@
+from flask import Blueprint, request, jsonify, g
+from datetime import datetime
+from src.database import ANALYTICS, get_tenant_db, with_read_policy
+from src.infra.repositories import (
+    MongoFinancialEntryRepository,
+    MongoInstallmentRepository,
+    MongoPaymentModalityRepository,
+    MongoPlatformSettingsRepository,
+)
+from src.infra.repositories.mongo_account_repository import MongoAccountRepository
+from src.infra.repositories.mongo_bank_limit_repository import MongoBankLimitRepository
+from src.application.use_cases import GetDashboardSnapshot
+from src.application.services.modality_propagation import modality_overlay
+from src.application.middleware.auth_bypass import require_auth, require_feature, require_role, require_super_admin
+
+dashboard_bp = Blueprint("dashboard", __name__)
+
+
+def get_repositories(company_id: str):
+    """
+    Retorna repositórios do banco de dados da empresa (resolvido uma única vez)
+
+    Só leitura: segue a política "dashboard.snapshot" (padrão ANALYTICS)
+    """
+    tenant_db = with_read_policy(get_tenant_db(company_id), "dashboard.snapshot", ANALYTICS)
+
+    return (
+        MongoFinancialEntryRepository(tenant_db["financial_entries"]),
+        MongoInstallmentRepository(tenant_db["installments"]),
+        MongoAccountRepository(tenant_db["accounts"]),
+        MongoBankLimitRepository(tenant_db["bank_limits"]),
+        MongoPaymentModalityRepository(tenant_db["payment_modalities"]),
+        MongoPlatformSettingsRepository(tenant_db["platform_settings"]),
+    )
+
+
+@dashboard_bp.route("/dashboard/snapshot", methods=["GET"])
+@require_auth
+@require_feature("financial_entries.read")
+def get_snapshot():
+    """
+    Retorna em uma única chamada os dados da tela inicial do dashboard
+
+    Query params:
+        from: Data inicial (formato ISO, opcional)
+        to: Data final (formato ISO, opcional)
+
+    Returns:
+        200: {"sections": {nome: {"status", "elapsed_ms", "data"}}, "elapsed_ms"}
+             status pode ser "ok", "timeout" ou "error" (resultado parcial)
+        400: Datas inválidas
+    """
+    try:
+        start_date_str = request.args.get("from")
+        end_date_str = request.args.get("to")
+
+        start_date = datetime.fromisoformat(start_date_str) if start_date_str else None
+        end_date = datetime.fromisoformat(end_date_str) if end_date_str else None
+
+        use_case = GetDashboardSnapshot(
+            *get_repositories(g.company_id), modality_overlay=modality_overlay(g.company_id)
+        )
+        snapshot = use_case.execute(start_date, end_date)
+
+        return jsonify(snapshot), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
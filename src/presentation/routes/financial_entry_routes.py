@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify, g
 from datetime import datetime
-from src.database import get_tenant_db
+from typing import Optional
+from src.database import ANALYTICS, get_tenant_db, with_read_policy
 from src.infra.repositories import (
     MongoFinancialEntryRepository,
     MongoPaymentModalityRepository,
@@ -8,18 +9,34 @@ from src.infra.repositories import (
 )
 from src.application.use_cases import (
     CreateFinancialEntry,
+    CreateFinancialEntriesBulk,
     ListFinancialEntries,
     UpdateFinancialEntry,
     DeleteFinancialEntry,
+    BulkDeleteFinancialEntries,
+    GetEntryTotals,
 )
+from src.infra.database.transaction_runner import MongoTransactionRunner
+from src.application.services.modality_propagation import modality_overlay
+from src.application.services.columnar_store import get_columnar_store
+from src.application.services.daily_totals_index import get_daily_totals_index
+from src.presentation.middlewares.tenant_versioning import mark_tenant_write
+from src.presentation.middlewares.request_coalescing import coalesced_tenant_read
 from src.application.middleware.auth_bypass import require_auth, require_feature, require_role, require_super_admin
 
 financial_entry_bp = Blueprint("financial_entries", __name__)
 
 
-def get_repositories(company_id: str):
-    """Retorna repositórios do banco de dados da empresa"""
+def get_repositories(company_id: str, analytics_endpoint: Optional[str] = None):
+    """
+    Retorna repositórios do banco de dados da empresa
+
+    Com analytics_endpoint, as leituras seguem a política desse endpoint
+    (padrão ANALYTICS: secundário com atraso limitado).
+    """
     tenant_db = get_tenant_db(company_id)
+    if analytics_endpoint:
+        tenant_db = with_read_policy(tenant_db, analytics_endpoint, ANALYTICS)
 
     entry_collection = tenant_db["financial_entries"]
     modality_collection = tenant_db["payment_modalities"]
@@ -32,6 +49,25 @@ def get_repositories(company_id: str):
     return entry_repo, modality_repo, installment_repo
 
 
+def publish_created_entries(company_id: str, entries: list, before: tuple):
+    """
+    Acrescenta lançamentos recém-criados aos caches em memória da empresa
+    (colunas de análise e índice de totais) e avança a versão de escrita
+
+    Args:
+        before: Versões de mark_tenant_write chamado antes de gravar. Um cache
+            montado durante a gravação fica com a versão intermediária e não
+            recebe o patch (poderia já conter os lançamentos); se outra escrita
+            aconteceu no meio, nenhum cache recebe e todos recarregam.
+    """
+    after = mark_tenant_write(company_id)
+    if after[0] != before[1]:
+        return
+    versions = (before[0], after[1])
+    get_columnar_store().append(company_id, entries, versions)
+    get_daily_totals_index().patch(company_id, entries, versions)
+
+
 @financial_entry_bp.route("/financial-entries", methods=["POST"])
 @require_auth
 @require_feature("financial_entries.create")
@@ -53,6 +89,7 @@ def create_entry():
         # Usa o DB da empresa do usuário autenticado
         entry_repo, modality_repo, installment_repo = get_repositories(g.company_id)
         use_case = CreateFinancialEntry(entry_repo, modality_repo, installment_repo)
+        before = mark_tenant_write(g.company_id)
         result = use_case.execute(
             value,
             date,
@@ -62,9 +99,12 @@ def create_entry():
             is_credit_payment=is_credit_payment
         )
 
+        entry = result["entry"].to_dict()
+        publish_created_entries(g.company_id, [entry], before)
+
         # Return structure: { "entry": {...}, "installments": [...] }
         return jsonify({
-            "entry": result["entry"].to_dict(),
+            "entry": entry,
             "installments": [inst.to_dict() for inst in result["installments"]]
         }), 201
 
@@ -74,6 +114,46 @@ def create_entry():
         return jsonify({"error": "Erro interno do servidor"}), 500
 
 
+@financial_entry_bp.route("/financial-entries/bulk", methods=["POST"])
+@require_auth
+@require_feature("financial_entries.create")
+def create_entries_bulk():
+    """
+    Cria vários lançamentos de uma vez (fechamento do dia)
+
+    Body:
+        {
+            "entries": [
+                {"value": 150.0, "date": "2026-01-10", "modality_id": "..."},
+                {"value": 600.0, "date": "2026-01-10", "modality_id": "...",
+                 "installments_count": 3, "start_date": "2026-02-10"}
+            ]
+        }
+
+    Returns:
+        201: Resultado por item (ao menos um lançamento criado)
+        400: Lista vazia/grande demais ou nenhum item válido
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        entry_repo, modality_repo, installment_repo = get_repositories(g.company_id)
+        use_case = CreateFinancialEntriesBulk(entry_repo, modality_repo, installment_repo)
+        before = mark_tenant_write(g.company_id)
+        result = use_case.execute(data.get("entries"))
+
+        if result["created"]:
+            created = [item["entry"] for item in result["results"] if item["status"] == "created"]
+            publish_created_entries(g.company_id, created, before)
+
+        return jsonify(result), 201 if result["created"] else 400
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
 @financial_entry_bp.route("/financial-entries", methods=["GET"])
 @require_auth
 @require_feature("financial_entries.read")
@@ -88,11 +168,62 @@ def list_entries():
 
         # Usa o DB da empresa do usuário autenticado
         entry_repo, _, _ = get_repositories(g.company_id)
-        use_case = ListFinancialEntries(entry_repo)
-        entries = use_case.execute(modality_id, start_date, end_date)
+        use_case = ListFinancialEntries(entry_repo, modality_overlay(g.company_id))
+        entries = coalesced_tenant_read(
+            "financial_entries.list",
+            lambda: [e.to_dict() for e in use_case.execute(modality_id, start_date, end_date)]
+        )
+
+        return jsonify(entries), 200
+
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@financial_entry_bp.route("/financial-entries/totals", methods=["GET"])
+@require_auth
+@require_feature("financial_entries.read")
+def get_totals():
+    """
+    Totais de lançamentos para vários intervalos de uma vez
+
+    Query params:
+        periods: Períodos relativos a hoje, separados por vírgula (today, week, month, year)
+        from, to: Intervalo livre (YYYY-MM-DD, inclusive), retornado como "range"
+        type: Filtra por type (received, receivable)
+        entry_type: Filtra por entry_type (normal, despesa, emprestimo)
+
+    Returns:
+        200: {"totals": {nome: total}, "source": "index" | "aggregation"}
+        400: Período ou datas inválidos
+    """
+    try:
+        ranges = {}
+        for period in [p.strip() for p in request.args.get("periods", "").split(",") if p.strip()]:
+            ranges[period] = GetEntryTotals.period_range(period)
+
+        start_str = request.args.get("from")
+        end_str = request.args.get("to")
+        if start_str or end_str:
+            if not (start_str and end_str):
+                raise ValueError("Informe from e to")
+            ranges["range"] = (
+                datetime.fromisoformat(start_str).date(), datetime.fromisoformat(end_str).date()
+            )
+
+        if not ranges:
+            ranges["today"] = GetEntryTotals.period_range("today")
+
+        entry_repo, _, _ = get_repositories(g.company_id, "financial_entries.totals")
+        index = get_daily_totals_index().lookup(g.company_id)
+        result = GetEntryTotals(entry_repo, index).execute(
+            ranges, request.args.get("type"), request.args.get("entry_type")
+        )
 
-        return jsonify([e.to_dict() for e in entries]), 200
+        return jsonify(result), 200
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception:
         return jsonify({"error": "Erro interno do servidor"}), 500
 
@@ -116,6 +247,11 @@ def get_entry_by_id(entry_id):
         if not entry:
             return jsonify({"error": "Lançamento não encontrado"}), 404
 
+        current = modality_overlay(g.company_id)().get(entry.modality_id)
+        if current:
+            entry.modality_name = current["name"]
+            entry.modality_color = current["color"]
+
         return jsonify(entry.to_dict()), 200
 
     except Exception:
@@ -153,8 +289,8 @@ def update_entry(entry_id):
 def delete_entry(entry_id):
     try:
         # Usa o DB da empresa do usuário autenticado
-        entry_repo, _, _ = get_repositories(g.company_id)
-        use_case = DeleteFinancialEntry(entry_repo)
+        entry_repo, _, installment_repo = get_repositories(g.company_id)
+        use_case = DeleteFinancialEntry(entry_repo, installment_repo)
         success = use_case.execute(entry_id)
 
         if success:
@@ -165,3 +301,49 @@ def delete_entry(entry_id):
         return jsonify({"error": str(e)}), 404
     except Exception:
         return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@financial_entry_bp.route("/financial-entries", methods=["DELETE"])
+@require_auth
+@require_feature("financial_entries.delete")
+def bulk_delete_entries():
+    """
+    Remove vários lançamentos e as parcelas deles
+
+    Body (um dos critérios):
+        {"ids": ["id1", "id2", ...]}
+        {"start_date": "2026-01-01", "end_date": "2026-01-31", "modality_id": "..."}
+
+    Returns:
+        200: Quantidade de lançamentos e parcelas removidos
+        400: Critério ausente ou inválido
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        entry_ids = data.get("ids")
+        start_date_str = data.get("start_date") or request.args.get("start_date")
+        end_date_str = data.get("end_date") or request.args.get("end_date")
+        modality_id = data.get("modality_id") or request.args.get("modality_id")
+
+        if entry_ids is not None and not isinstance(entry_ids, list):
+            raise ValueError("ids deve ser uma lista")
+
+        start_date = datetime.fromisoformat(start_date_str) if start_date_str else None
+        end_date = datetime.fromisoformat(end_date_str) if end_date_str else None
+        # Data sem horário inclui o dia inteiro
+        if end_date and end_date_str and len(end_date_str) == 10:
+            end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+        tenant_db = get_tenant_db(g.company_id)
+        entry_repo, _, installment_repo = get_repositories(g.company_id)
+        use_case = BulkDeleteFinancialEntries(
+            entry_repo, installment_repo, MongoTransactionRunner(tenant_db.client)
+        )
+        result = use_case.execute(entry_ids, start_date, end_date, modality_id)
+
+        return jsonify(result), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
@@ -0,0 +1,58 @@
+import os
+from datetime import date
+from flask import Blueprint, request, jsonify, g
+from src.application.services.sales_forecast import SalesForecaster, closed_weekdays_from_env, get_forecast_cache
+from src.database import get_tenant_db
+from src.infra.repositories import MongoFinancialEntryRepository
+from src.application.middleware.auth_bypass import require_auth, require_feature
+
+forecast_bp = Blueprint("forecast", __name__)
+
+
+def get_forecaster(company_id: str) -> SalesForecaster:
+    db = get_tenant_db(company_id)
+    return SalesForecaster(
+        MongoFinancialEntryRepository(db["financial_entries"]),
+        db["forecast_models"],
+        closed_weekdays=closed_weekdays_from_env(),
+        history_days=int(os.getenv("FORECAST_HISTORY_DAYS", "365")),
+        full_refit_days=int(os.getenv("FORECAST_FULL_REFIT_DAYS", "7")),
+    )
+
+
+@forecast_bp.route("/forecast/sales", methods=["GET"])
+@require_auth
+@require_feature("financial_entries.read")
+def sales_forecast():
+    """
+    Previsão de vendas por modalidade para os próximos dias
+
+    O modelo (tendência + sazonalidade por dia da semana) é atualizado
+    uma vez por dia por empresa, só com os dias novos; as demais
+    requisições do dia respondem do cache.
+
+    Query params:
+        horizon: Quantidade de dias a prever, a partir de hoje (1 a 90, padrão 30)
+
+    Returns:
+        200: {"from", "to", "fitted_until", "closed_weekdays",
+              "modalities": [{"modality_id", "modality_name", "status", "total",
+                              "days": [{"date", "forecast", "lower", "upper"}]}],
+              "totals": [{"date", "forecast"}]}
+        400: horizon inválido
+    """
+    try:
+        horizon = int(request.args.get("horizon", 30))
+        today = date.today()
+        company_id = g.company_id
+
+        result = get_forecast_cache().get_or_compute(
+            company_id, today, horizon,
+            lambda: get_forecaster(company_id).forecast(today, horizon)
+        )
+        return jsonify(result), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
@@ -0,0 +1,129 @@
+from flask import Blueprint, request, jsonify, g
+
+from src.application.middleware.auth_bypass import require_auth, require_feature, require_role, require_super_admin
+from src.application.importers import ImportJobTracker, ImportPipeline, SpreadsheetImporter
+from src.database import get_tenant_db
+from src.infra.cache import get_tenant_write_version
+
+
+import_bp = Blueprint("imports", __name__)
+
+
+@import_bp.route("/imports", methods=["POST"])
+@require_auth
+@require_feature("imports.create")
+def import_spreadsheets():
+    """
+    Importa planilhas financeiras (CSV) para a empresa
+
+    Multipart form:
+        files: Um ou mais arquivos .csv (o tipo e o ano vêm do nome do arquivo)
+        sheet_type: Força o tipo da planilha (opcional)
+        year: Ano dos dados, quando não está no nome do arquivo (opcional)
+
+    Reimportar os mesmos arquivos atualiza os registros em vez de duplicar.
+
+    Returns:
+        200: Estatísticas por arquivo
+        400: Nenhum arquivo / planilha inválida
+    """
+    try:
+        files = request.files.getlist("files")
+        if not files:
+            return jsonify({"error": "Nenhum arquivo enviado"}), 400
+
+        sheet_type = request.form.get("sheet_type") or None
+        year_str = request.form.get("year")
+        year = int(year_str) if year_str else None
+
+        importer = SpreadsheetImporter(get_tenant_db(g.company_id))
+        results = []
+        for file in files:
+            if not file.filename:
+                raise ValueError("Arquivo sem nome")
+            results.append(
+                importer.import_file(file.stream, filename=file.filename, sheet_type=sheet_type, year=year)
+            )
+
+        return jsonify({"files": results}), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@import_bp.route("/imports/jobs", methods=["POST"])
+@require_auth
+@require_feature("imports.create")
+def start_import_job():
+    """
+    Inicia a importação de várias planilhas em segundo plano
+
+    O parse dos arquivos roda em paralelo e a gravação em uma única thread;
+    o andamento por arquivo é consultado em GET /imports/jobs/<job_id>.
+
+    Multipart form:
+        files: Um ou mais arquivos .csv (o tipo e o ano vêm do nome do arquivo)
+        sheet_type: Força o tipo da planilha (opcional)
+        year: Ano dos dados, quando não está no nome do arquivo (opcional)
+
+    Returns:
+        202: job_id e URL de status
+        400: Nenhum arquivo / parâmetros inválidos
+    """
+    try:
+        files = request.files.getlist("files")
+        if not files:
+            return jsonify({"error": "Nenhum arquivo enviado"}), 400
+
+        sheet_type = request.form.get("sheet_type") or None
+        year_str = request.form.get("year")
+        year = int(year_str) if year_str else None
+
+        sources = []
+        for file in files:
+            if not file.filename:
+                raise ValueError("Arquivo sem nome")
+            # O upload é lido agora: o stream da requisição fecha antes do fim do job
+            sources.append((file.read(), file.filename))
+
+        company_id = g.company_id
+        pipeline = ImportPipeline(
+            get_tenant_db(company_id),
+            # A versão é incrementada de novo ao fim do job, depois da última gravação
+            on_written=lambda: get_tenant_write_version().bump(company_id),
+        )
+        job_id = pipeline.start(sources, sheet_type=sheet_type, year=year)
+
+        return jsonify({
+            "job_id": job_id,
+            "status": "running",
+            "status_url": f"/api/imports/jobs/{job_id}",
+        }), 202
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@import_bp.route("/imports/jobs/<job_id>", methods=["GET"])
+@require_auth
+@require_feature("imports.create")
+def get_import_job(job_id):
+    """
+    Consulta o andamento de uma importação
+
+    Returns:
+        200: Status do job e status/estatísticas de cada arquivo
+        404: Job não encontrado
+    """
+    try:
+        job = ImportJobTracker(get_tenant_db(g.company_id)["import_jobs"]).find_by_id(job_id)
+        if not job:
+            return jsonify({"error": "Importação não encontrada"}), 404
+        return jsonify(job), 200
+
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify, g
 from datetime import datetime
-from src.database import get_tenant_db
+from typing import Optional
+from src.database import ANALYTICS, get_tenant_db, with_read_policy
 from src.infra.repositories import (
     MongoInstallmentRepository,
     MongoFinancialEntryRepository,
@@ -10,15 +11,27 @@ from src.application.use_cases import (
     PayInstallment,
     UnpayInstallment,
     GetDailyCreditSummary,
+    SimulateInstallmentAnticipation,
+    ExecuteInstallmentAnticipation,
 )
+from src.application.services.financial_archiver import FinancialArchiver
+from src.infra.database.transaction_runner import MongoTransactionRunner
+from src.presentation.middlewares.request_coalescing import coalesced_tenant_read
 from src.application.middleware.auth_bypass import require_auth, require_feature, require_role, require_super_admin
 
 installment_bp = Blueprint("installments", __name__)
 
 
-def get_repositories(company_id: str):
-    """Retorna repositórios do banco de dados da empresa"""
+def get_repositories(company_id: str, analytics_endpoint: Optional[str] = None):
+    """
+    Retorna repositórios do banco de dados da empresa
+
+    Com analytics_endpoint, as leituras seguem a política desse endpoint
+    (padrão ANALYTICS: secundário com atraso limitado).
+    """
     tenant_db = get_tenant_db(company_id)
+    if analytics_endpoint:
+        tenant_db = with_read_policy(tenant_db, analytics_endpoint, ANALYTICS)
 
     installment_collection = tenant_db["installments"]
     entry_collection = tenant_db["financial_entries"]
@@ -29,6 +42,12 @@ def get_repositories(company_id: str):
     return installment_repo, entry_repo
 
 
+def get_archiver(company_id: str) -> FinancialArchiver:
+    """Arquivo da empresa: parcelas arquivadas voltam à coleção principal antes de mudar"""
+    tenant_db = get_tenant_db(company_id)
+    return FinancialArchiver(tenant_db, MongoTransactionRunner(tenant_db.client))
+
+
 @installment_bp.route("/installments", methods=["GET"])
 @require_auth
 @require_feature("financial_entries.read")
@@ -66,7 +85,7 @@ def pay_installment(installment_id):
             payment_date = datetime.fromisoformat(payment_date_str)
 
         installment_repo, _ = get_repositories(g.company_id)
-        use_case = PayInstallment(installment_repo)
+        use_case = PayInstallment(installment_repo, get_archiver(g.company_id))
         installment = use_case.execute(installment_id, payment_date)
 
         return jsonify(installment.to_dict()), 200
@@ -84,7 +103,7 @@ def unpay_installment(installment_id):
     """Marca uma parcela como não paga"""
     try:
         installment_repo, _ = get_repositories(g.company_id)
-        use_case = UnpayInstallment(installment_repo)
+        use_case = UnpayInstallment(installment_repo, get_archiver(g.company_id))
         installment = use_case.execute(installment_id)
 
         return jsonify(installment.to_dict()), 200
@@ -120,11 +139,97 @@ def get_daily_credit_summary():
         start_date = datetime.fromisoformat(start_date_str) if start_date_str else None
         end_date = datetime.fromisoformat(end_date_str) if end_date_str else None
 
-        installment_repo, entry_repo = get_repositories(g.company_id)
+        installment_repo, entry_repo = get_repositories(g.company_id, "installments.daily_summary")
         use_case = GetDailyCreditSummary(installment_repo, entry_repo)
-        summary = use_case.execute(start_date, end_date)
+        # Terminais da mesma loja costumam pedir o mesmo resumo ao mesmo tempo
+        summary = coalesced_tenant_read(
+            "installments.daily_summary",
+            lambda: use_case.execute(start_date, end_date)
+        )
 
         return jsonify(summary), 200
 
     except Exception as e:
         return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+def _parse_anticipation_request(data: dict):
+    """Lê taxa de desconto, data de corte e data da antecipação do corpo da requisição"""
+    if data.get("discount_rate") is None:
+        raise ValueError("Taxa de desconto é obrigatória")
+    if not data.get("cut_off_date"):
+        raise ValueError("Data de corte é obrigatória")
+
+    try:
+        discount_rate = float(data["discount_rate"])
+    except (TypeError, ValueError):
+        raise ValueError("Taxa de desconto inválida")
+
+    cut_off_date = datetime.fromisoformat(data["cut_off_date"])
+    anticipation_date_str = data.get("anticipation_date")
+    anticipation_date = datetime.fromisoformat(anticipation_date_str) if anticipation_date_str else None
+
+    return discount_rate, cut_off_date, anticipation_date
+
+
+@installment_bp.route("/installments/anticipation/simulate", methods=["POST"])
+@require_auth
+@require_feature("financial_entries.read")
+def simulate_anticipation():
+    """
+    Simula a antecipação das parcelas em aberto
+
+    Body:
+        discount_rate: Taxa de desconto em % ao mês (ex: 2.5)
+        cut_off_date: Antecipa parcelas com vencimento até esta data (ISO)
+        anticipation_date: Data da antecipação (ISO, opcional - padrão: hoje)
+
+    Returns:
+        - totals: Quantidade, valor bruto, valor líquido (net_cash) e desconto
+        - by_month: Totais agrupados pelo mês de vencimento
+        - installments: Valor presente de cada parcela
+    """
+    try:
+        discount_rate, cut_off_date, anticipation_date = _parse_anticipation_request(
+            request.get_json() or {}
+        )
+
+        installment_repo, _ = get_repositories(g.company_id)
+        use_case = SimulateInstallmentAnticipation(installment_repo)
+        simulation = use_case.execute(discount_rate, cut_off_date, anticipation_date)
+
+        return jsonify(simulation), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@installment_bp.route("/installments/anticipation/execute", methods=["POST"])
+@require_auth
+@require_feature("financial_entries.update")
+def execute_anticipation():
+    """
+    Antecipa as parcelas em aberto com vencimento até a data de corte
+
+    Body: mesmo formato de /installments/anticipation/simulate
+
+    Returns:
+        Simulação usada na antecipação + anticipated_count (parcelas marcadas)
+    """
+    try:
+        discount_rate, cut_off_date, anticipation_date = _parse_anticipation_request(
+            request.get_json() or {}
+        )
+
+        installment_repo, _ = get_repositories(g.company_id)
+        use_case = ExecuteInstallmentAnticipation(installment_repo)
+        result = use_case.execute(discount_rate, cut_off_date, anticipation_date)
+
+        return jsonify(result), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
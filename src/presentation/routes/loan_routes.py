@@ -0,0 +1,220 @@
+from flask import Blueprint, request, jsonify, g
+from datetime import datetime
+
+from src.application.middleware.auth_bypass import require_auth, require_feature, require_role, require_super_admin
+from src.application.use_cases import (
+    CreateLoan,
+    ListLoans,
+    GetLoanSchedule,
+    UpdateLoan,
+    RenegotiateLoan,
+    DeleteLoan,
+    GetLoanDebtService,
+)
+from src.infra.repositories import MongoLoanRepository
+from src.database import get_tenant_db
+
+
+loan_bp = Blueprint("loans", __name__)
+
+
+def get_repository(company_id: str):
+    """Retorna repositório do banco de dados da empresa"""
+    tenant_db = get_tenant_db(company_id)
+    return MongoLoanRepository(tenant_db["loans"], tenant_db["loan_schedules"])
+
+
+def _parse_date(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+def _optional(data: dict, key: str, cast):
+    value = data.get(key)
+    return cast(value) if value is not None else None
+
+
+@loan_bp.route("/loans", methods=["POST"])
+@require_auth
+@require_feature("loans.create")
+def create_loan():
+    """
+    Cadastra um empréstimo e gera o cronograma de amortização
+
+    Body:
+        bank_name: Nome do banco
+        principal: Valor financiado
+        monthly_rate: Taxa de juros em % ao mês
+        term_months: Prazo em meses
+        first_due_date: Vencimento da primeira parcela (ISO)
+        amortization_system: "price" ou "sac" (default: price)
+        purpose: Objetivo (opcional)
+    """
+    try:
+        data = request.get_json() or {}
+        if not data.get("first_due_date"):
+            raise ValueError("Vencimento da primeira parcela é obrigatório")
+
+        repo = get_repository(g.company_id)
+        use_case = CreateLoan(repo)
+        loan = use_case.execute(
+            bank_name=data.get("bank_name"),
+            principal=float(data.get("principal", 0)),
+            monthly_rate=float(data.get("monthly_rate", 0)),
+            term_months=int(data.get("term_months", 0)),
+            first_due_date=_parse_date(data["first_due_date"]),
+            amortization_system=data.get("amortization_system", "price"),
+            purpose=data.get("purpose", ""),
+        )
+
+        return jsonify(loan.to_dict()), 201
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@loan_bp.route("/loans", methods=["GET"])
+@require_auth
+@require_feature("loans.read")
+def list_loans():
+    try:
+        repo = get_repository(g.company_id)
+        use_case = ListLoans(repo)
+        loans = use_case.execute()
+
+        return jsonify([loan.to_dict() for loan in loans]), 200
+
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@loan_bp.route("/loans/debt-service", methods=["GET"])
+@require_auth
+@require_feature("loans.read")
+def get_debt_service():
+    """
+    Total de parcelas de todos os empréstimos por mês
+
+    Query params:
+        start_date: Data inicial (formato ISO, opcional)
+        end_date: Data final (formato ISO, opcional)
+
+    Returns:
+        - months: [{month, payment, interest, amortization, installments, loans}]
+        - totals: Soma do período
+    """
+    try:
+        start_date = _parse_date(request.args.get("start_date"))
+        end_date = _parse_date(request.args.get("end_date"))
+
+        repo = get_repository(g.company_id)
+        use_case = GetLoanDebtService(repo)
+        debt_service = use_case.execute(start_date, end_date)
+
+        return jsonify(debt_service), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@loan_bp.route("/loans/<loan_id>/schedule", methods=["GET"])
+@require_auth
+@require_feature("loans.read")
+def get_loan_schedule(loan_id: str):
+    """Retorna o empréstimo, o cronograma de parcelas e os totais"""
+    try:
+        repo = get_repository(g.company_id)
+        use_case = GetLoanSchedule(repo)
+        schedule = use_case.execute(loan_id)
+
+        return jsonify(schedule), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@loan_bp.route("/loans/<loan_id>", methods=["PUT"])
+@require_auth
+@require_feature("loans.update")
+def update_loan(loan_id: str):
+    """Atualiza o empréstimo (o cronograma é regenerado só se as condições mudarem)"""
+    try:
+        data = request.get_json() or {}
+
+        repo = get_repository(g.company_id)
+        use_case = UpdateLoan(repo)
+        loan = use_case.execute(
+            loan_id,
+            bank_name=data.get("bank_name"),
+            principal=_optional(data, "principal", float),
+            monthly_rate=_optional(data, "monthly_rate", float),
+            term_months=_optional(data, "term_months", int),
+            first_due_date=_parse_date(data.get("first_due_date")),
+            amortization_system=data.get("amortization_system"),
+            purpose=data.get("purpose"),
+        )
+
+        return jsonify(loan.to_dict()), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@loan_bp.route("/loans/<loan_id>/renegotiate", methods=["POST"])
+@require_auth
+@require_feature("loans.update")
+def renegotiate_loan(loan_id: str):
+    """
+    Renegocia o saldo devedor do empréstimo
+
+    Body (todos opcionais):
+        monthly_rate: Nova taxa em % ao mês (default: taxa atual)
+        term_months: Novo prazo do saldo em meses (default: parcelas restantes)
+        amortization_system: "price" ou "sac" (default: sistema atual)
+        first_due_date: Primeiro vencimento do novo cronograma (ISO)
+        effective_date: Data da renegociação (ISO, default: hoje)
+    """
+    try:
+        data = request.get_json() or {}
+
+        repo = get_repository(g.company_id)
+        use_case = RenegotiateLoan(repo)
+        result = use_case.execute(
+            loan_id,
+            monthly_rate=_optional(data, "monthly_rate", float),
+            term_months=_optional(data, "term_months", int),
+            amortization_system=data.get("amortization_system"),
+            first_due_date=_parse_date(data.get("first_due_date")),
+            effective_date=_parse_date(data.get("effective_date")),
+        )
+
+        return jsonify(result), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@loan_bp.route("/loans/<loan_id>", methods=["DELETE"])
+@require_auth
+@require_feature("loans.delete")
+def delete_loan(loan_id: str):
+    try:
+        repo = get_repository(g.company_id)
+        use_case = DeleteLoan(repo)
+        use_case.execute(loan_id)
+
+        return jsonify({"message": "Empréstimo excluído com sucesso"}), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
@@ -1,6 +1,7 @@
 from flask import Blueprint, jsonify, request
 from pymongo import MongoClient
 from src.database import MongoConnection
+from src.infra.database.database_inventory import get_database_inventory
 
 migration_bp = Blueprint("migration", __name__)
 
@@ -100,34 +101,22 @@ def clone_to_dev():
 
 @migration_bp.route("/migration/list-databases", methods=["GET"])
 def list_databases():
-    """Lista todos os databases disponíveis no cluster PROD"""
-    try:
-        prod_conn = MongoConnection()
-        prod_client = prod_conn.client
-
-        all_databases = prod_client.list_database_names()
-        system_dbs = ["admin", "local", "config"]
-
-        databases_info = []
-        for db_name in all_databases:
-            if db_name not in system_dbs:
-                db = prod_client[db_name]
-                collections = db.list_collection_names()
+    """
+    Lista todos os databases disponíveis no cluster PROD
 
-                collection_details = {}
-                for coll_name in collections:
-                    count = db[coll_name].count_documents({})
-                    collection_details[coll_name] = count
+    Contagens e tamanhos vêm dos metadados de armazenamento (sem varrer as
+    coleções) e ficam em cache por alguns segundos.
 
-                databases_info.append({
-                    "name": db_name,
-                    "collections": collections,
-                    "document_counts": collection_details
-                })
+    Query params:
+        refresh: true ignora o cache
+    """
+    try:
+        refresh = request.args.get("refresh", "false").lower() == "true"
+        inventory = get_database_inventory(MongoConnection().client).list(refresh=refresh)
 
         return jsonify({
             "success": True,
-            "databases": databases_info
+            **inventory
         }), 200
 
     except Exception as e:
@@ -8,6 +8,7 @@ from src.application.use_cases import (
     DeletePaymentModality,
     TogglePaymentModality,
 )
+from src.application.services.modality_propagation import ModalityPropagation, bump_on_finish
 from src.application.middleware.auth_bypass import require_auth, require_feature, require_role, require_super_admin
 
 payment_modality_bp = Blueprint("payment_modalities", __name__)
@@ -20,6 +21,11 @@ def get_repository(company_id: str):
     return MongoPaymentModalityRepository(collection)
 
 
+def get_propagation(company_id: str) -> ModalityPropagation:
+    """Retorna o job de propagação de nome/cor da modalidade da empresa"""
+    return ModalityPropagation(get_tenant_db(company_id), on_finished=bump_on_finish(company_id))
+
+
 @payment_modality_bp.route("/payment-modalities", methods=["POST"])
 @require_auth
 @require_feature("payment_modalities.create")
@@ -95,6 +101,7 @@ def update_modality(modality_id):
 
         # Usa o DB da empresa do usuário autenticado
         repository = get_repository(g.company_id)
+        previous = repository.find_by_id(modality_id)
         use_case = UpdatePaymentModality(repository)
         modality = use_case.execute(
             modality_id,
@@ -109,6 +116,10 @@ def update_modality(modality_id):
             allows_credit_payment
         )
 
+        # Lançamentos guardam nome e cor da modalidade: propaga em segundo plano
+        if previous and (previous.name, previous.color) != (modality.name, modality.color):
+            get_propagation(g.company_id).start(modality)
+
         return jsonify(modality.to_dict()), 200
 
     except ValueError as e:
@@ -159,3 +170,52 @@ def toggle_modality(modality_id):
         print(f"Erro no toggle: {str(e)}")
         print(traceback.format_exc())
         return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@payment_modality_bp.route("/payment-modalities/<modality_id>/propagation", methods=["GET"])
+@require_auth
+@require_feature("payment_modalities.read")
+def get_modality_propagation(modality_id):
+    """
+    Andamento da propagação de nome/cor da modalidade para os lançamentos
+
+    Returns:
+        200: Job (status, updated, last_id, started_at, finished_at)
+        404: Nenhuma propagação registrada para a modalidade
+    """
+    try:
+        propagation = get_propagation(g.company_id)
+        # Job parado (processo caiu) ou com nova tentativa vencida volta a rodar
+        propagation.resume_stale()
+        job = propagation.find_job(modality_id)
+        if not job:
+            return jsonify({"error": "Nenhuma propagação encontrada para a modalidade"}), 404
+
+        return jsonify(job), 200
+
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
+
+
+@payment_modality_bp.route("/payment-modalities/<modality_id>/propagation/restart", methods=["POST"])
+@require_auth
+@require_feature("payment_modalities.update")
+def restart_modality_propagation(modality_id):
+    """
+    Reinicia a propagação de nome/cor da modalidade (ex: job que esgotou as tentativas)
+
+    Returns:
+        202: Job reiniciado (continua em segundo plano)
+        400: Propagação já em andamento
+        404: Nenhuma propagação registrada para a modalidade
+    """
+    try:
+        propagation = get_propagation(g.company_id)
+        propagation.restart(modality_id)
+
+        return jsonify(propagation.find_job(modality_id)), 202
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 404 if "Nenhuma propagação" in str(e) else 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
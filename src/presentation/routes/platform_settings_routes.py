@@ -1,7 +1,11 @@
-from flask import Blueprint, jsonify, g, request
+import json
+from itertools import chain
+from flask import Blueprint, Response, jsonify, g, request, stream_with_context
 from src.database import get_tenant_db
-from src.infra.repositories import MongoPlatformSettingsRepository
-from src.application.use_cases import GetPlatformSettings
+from src.infra.cache import get_tenant_cache
+from src.infra.repositories import MongoPaymentModalityRepository, MongoPlatformSettingsRepository
+from src.application.use_cases import CalculatePrices, GetPlatformSettings
+from src.application.use_cases.calculate_prices import read_costs_csv
 from src.application.middleware.auth_bypass import require_auth, require_feature, require_role, require_super_admin
 
 platform_settings_bp = Blueprint("platform_settings", __name__)
@@ -55,3 +59,60 @@ def update_markup_settings():
 
     except Exception as e:
         return jsonify({"error": f"Erro ao atualizar configurações: {str(e)}"}), 500
+
+
+def _read_costs():
+    """Custos do upload CSV (campo file) ou do JSON: lista de números, de {"sku", "cost"} ou {"costs": [...]}"""
+    file = request.files.get("file")
+    if file is not None:
+        return read_costs_csv(file.stream)
+
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("items", data.get("costs"))
+    if not isinstance(data, list):
+        raise ValueError("Envie um arquivo CSV (file) ou uma lista de custos")
+
+    if data and isinstance(data[0], dict):
+        return [item.get("sku") for item in data], [float(item.get("cost", "nan")) for item in data]
+    return None, [float(cost) for cost in data]
+
+
+@platform_settings_bp.route("/pricing/calculate", methods=["POST"])
+@require_auth
+@require_feature("platform_settings.read")
+def calculate_prices():
+    """
+    Calcula o preço de venda de cada custo, à vista e por modalidade com taxa
+
+    Body: CSV (multipart, campo file) ou JSON com a lista de custos
+    Query params:
+        stream: true para resposta NDJSON (um item por linha), útil em notas grandes
+
+    Returns:
+        200: {"settings", "methods", "items": [{"sku", "cost", "prices": {método: preço}}], "count"}
+        400: Custos inválidos ou markup não configurado
+    """
+    try:
+        skus, costs = _read_costs()
+        tenant_db = get_tenant_db(g.company_id)
+        use_case = CalculatePrices(
+            MongoPlatformSettingsRepository(tenant_db["platform_settings"]),
+            MongoPaymentModalityRepository(tenant_db["payment_modalities"]),
+            get_tenant_cache(),
+            g.company_id,
+        )
+
+        if request.args.get("stream", "false").lower() == "true":
+            events = use_case.stream(costs, skus)
+            # Primeiro evento fora do gerador: erros de validação ainda viram 400
+            first = next(events)
+            lines = (json.dumps(event, ensure_ascii=False) + "\n" for event in chain([first], events))
+            return Response(stream_with_context(lines), mimetype="application/x-ndjson"), 200
+
+        return jsonify(use_case.execute(costs, skus)), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
@@ -0,0 +1,43 @@
+from flask import Blueprint, request, jsonify, g
+from src.database import get_tenant_db
+from src.infra.repositories.mongo_search_repository import MongoSearchRepository
+from src.application.use_cases import SearchRecords
+from src.application.use_cases.search_records import KINDS
+from src.application.middleware.auth_bypass import require_auth, require_feature
+
+search_bp = Blueprint("search", __name__)
+
+
+@search_bp.route("/search", methods=["GET"])
+@require_auth
+@require_feature("accounts.read")
+def search():
+    """
+    Busca em contas, lançamentos, modalidades e bancos (índice de texto)
+
+    Query params:
+        q: Termo de busca (2 a 100 caracteres; sem acento e maiúsculas importarem)
+        page: Página (padrão 1)
+        page_size: Itens por página (1 a 50, padrão 20)
+        types: Tipos separados por vírgula (account, financial_entry,
+               payment_modality, bank_limit). Padrão: todos
+
+    Returns:
+        200: {"query", "page", "page_size", "has_more", "capped",
+              "results": [{"kind", "id", "title", "subtitle", "date", "value", "score"}]}
+        400: Parâmetros inválidos
+    """
+    try:
+        kinds = [k.strip() for k in request.args.get("types", "").split(",") if k.strip()]
+        page = int(request.args.get("page", 1))
+        page_size = int(request.args.get("page_size", 20))
+
+        use_case = SearchRecords(MongoSearchRepository(get_tenant_db(g.company_id)))
+        result = use_case.execute(request.args.get("q", ""), page, page_size, kinds or None)
+
+        return jsonify(result), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e), "types": list(KINDS)}), 400
+    except Exception:
+        return jsonify({"error": "Erro interno do servidor"}), 500
@@ -0,0 +1,121 @@
+"""
+Testes do cronograma de amortização de empréstimos
+
+Execute com: pytest tests/test_amortization_engine.py -v
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from src.application.services.amortization_engine import AmortizationEngine
+from src.application.use_cases import CreateLoan, RenegotiateLoan, UpdateLoan
+
+
+class InMemoryLoanRepository:
+    def __init__(self):
+        self.loans = {}
+        self.schedules = {}
+
+    def create(self, loan):
+        loan.id = f"loan-{len(self.loans) + 1}"
+        self.loans[loan.id] = loan
+        return loan
+
+    def find_by_id(self, loan_id):
+        return self.loans.get(loan_id)
+
+    def update(self, loan_id, loan):
+        self.loans[loan_id] = loan
+        return loan
+
+    def find_schedule(self, loan_id):
+        return list(self.schedules.get(loan_id, []))
+
+    def replace_schedule(self, loan, rows, from_date=None):
+        kept = [
+            row for row in self.schedules.get(loan.id, [])
+            if from_date is not None and row["due_date"] < from_date.isoformat()
+        ]
+        self.schedules[loan.id] = kept + [
+            dict(row, due_date=row["due_date"].isoformat()) for row in rows
+        ]
+
+
+class TestAmortizationEngine:
+
+    def test_price_has_fixed_payment_and_closes_balance(self):
+        rows = AmortizationEngine().schedule(10000, 2.0, 12, "price", date(2026, 1, 10))
+
+        payments = {row["payment"] for row in rows[:-1]}
+        assert payments == {945.60}
+        assert rows[0]["interest"] == 200.0
+        assert rows[-1]["balance"] == 0.0
+        assert sum(row["amortization"] for row in rows) == pytest.approx(10000, abs=0.001)
+
+    def test_sac_has_constant_amortization(self):
+        rows = AmortizationEngine().schedule(12000, 1.0, 12, "sac", date(2026, 1, 10))
+
+        assert {row["amortization"] for row in rows} == {1000.0}
+        assert rows[0]["payment"] == 1120.0
+        assert rows[-1]["payment"] == 1010.0
+
+    def test_due_dates_clip_to_month_end(self):
+        rows = AmortizationEngine().schedule(300, 0, 3, "price", date(2026, 1, 31))
+
+        assert [row["due_date"] for row in rows] == [
+            datetime(2026, 1, 31), datetime(2026, 2, 28), datetime(2026, 3, 31)
+        ]
+
+    def test_invalid_system_raises(self):
+        with pytest.raises(ValueError):
+            AmortizationEngine().schedule(1000, 1, 10, "alemao", date(2026, 1, 1))
+
+
+class TestRenegotiateLoan:
+
+    def test_keeps_past_installments_and_reschedules_balance(self):
+        repo = InMemoryLoanRepository()
+        loan = CreateLoan(repo).execute("Sicredi", 12000, 1.0, 12, datetime(2026, 1, 10), "sac")
+
+        result = RenegotiateLoan(repo).execute(
+            loan.id, monthly_rate=0.5, term_months=24, effective_date=datetime(2026, 4, 1)
+        )
+
+        schedule = repo.find_schedule(loan.id)
+        assert result["kept_installments"] == 3
+        assert result["renegotiated_balance"] == 9000.0
+        assert len(schedule) == 27
+        assert [row["number"] for row in schedule] == list(range(1, 28))
+        assert schedule[3]["due_date"] == "2026-04-10T00:00:00"
+        assert repo.find_by_id(loan.id).term_months == 27
+
+
+class TestUpdateLoan:
+
+    def test_purpose_only_keeps_schedule(self):
+        repo = InMemoryLoanRepository()
+        loan = CreateLoan(repo).execute("Sicredi", 12000, 1.0, 12, datetime(2026, 1, 10), "sac")
+        RenegotiateLoan(repo).execute(loan.id, monthly_rate=0.5, term_months=24, effective_date=datetime(2026, 4, 1))
+        before = repo.find_schedule(loan.id)
+
+        UpdateLoan(repo).execute(loan.id, purpose="Capital de giro", monthly_rate=0.5)
+
+        assert repo.find_schedule(loan.id) == before
+        assert repo.find_by_id(loan.id).purpose == "Capital de giro"
+
+    def test_rejects_schedule_changes_after_renegotiation(self):
+        repo = InMemoryLoanRepository()
+        loan = CreateLoan(repo).execute("Sicredi", 12000, 1.0, 12, datetime(2026, 1, 10), "sac")
+        RenegotiateLoan(repo).execute(loan.id, term_months=24, effective_date=datetime(2026, 4, 1))
+
+        with pytest.raises(ValueError):
+            UpdateLoan(repo).execute(loan.id, principal=15000)
+
+    def test_regenerates_schedule_when_terms_change(self):
+        repo = InMemoryLoanRepository()
+        loan = CreateLoan(repo).execute("Sicredi", 12000, 1.0, 12, datetime(2026, 1, 10), "sac")
+
+        UpdateLoan(repo).execute(loan.id, term_months=6)
+
+        assert len(repo.find_schedule(loan.id)) == 6
@@ -0,0 +1,68 @@
+"""
+Testes do cálculo de antecipação de recebíveis
+
+Execute com: pytest tests/test_anticipation_calculator.py -v
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from src.application.services.anticipation_calculator import AnticipationCalculator
+from src.domain.entities import Installment
+
+
+def installment(number, amount, due_date):
+    return Installment(
+        id=f"inst-{number}",
+        financial_entry_id="entry-1",
+        installment_number=number,
+        total_installments=3,
+        amount=amount,
+        due_date=due_date,
+    )
+
+
+class TestAnticipationCalculator:
+
+    def test_present_value_uses_monthly_compound_discount(self):
+        installments = [
+            installment(1, 100.0, datetime(2026, 1, 31)),
+            installment(2, 100.0, datetime(2026, 3, 2)),
+        ]
+
+        result = AnticipationCalculator().simulate(installments, 2.0, date(2026, 1, 1))
+
+        values = [item["present_value"] for item in result["installments"]]
+        assert values == [pytest.approx(100 / 1.02, abs=0.01), pytest.approx(100 / 1.02 ** 2, abs=0.01)]
+        assert result["totals"]["count"] == 2
+        assert result["totals"]["net_cash"] == pytest.approx(sum(values), abs=0.01)
+
+    def test_overdue_installments_are_not_discounted(self):
+        result = AnticipationCalculator().simulate(
+            [installment(1, 250.0, datetime(2025, 12, 10))], 3.0, date(2026, 1, 1)
+        )
+
+        assert result["installments"][0]["days"] == 0
+        assert result["totals"]["discount"] == 0.0
+
+    def test_groups_by_due_month(self):
+        installments = [
+            installment(1, 100.0, datetime(2026, 2, 5)),
+            installment(2, 50.0, datetime(2026, 2, 25)),
+            installment(3, 80.0, datetime(2026, 3, 10)),
+        ]
+
+        result = AnticipationCalculator().simulate(installments, 0.0, date(2026, 1, 1))
+
+        assert [(m["month"], m["count"], m["amount"]) for m in result["by_month"]] == [
+            ("2026-02", 2, 150.0),
+            ("2026-03", 1, 80.0),
+        ]
+
+    def test_empty_and_negative_rate(self):
+        calculator = AnticipationCalculator()
+
+        assert calculator.simulate([], 2.0)["totals"]["count"] == 0
+        with pytest.raises(ValueError):
+            calculator.simulate([], -1.0)
@@ -0,0 +1,97 @@
+"""
+Testes do executor limitado do bcrypt
+
+Execute com: pytest tests/test_bcrypt_pool.py -v
+"""
+
+import threading
+
+import pytest
+
+from src.application.use_cases.auth import Login
+from src.domain.entities import User
+from src.infra.security import BcryptPool, JWTHandler, PasswordHash, PasswordHasherBusy
+
+
+@pytest.fixture(autouse=True)
+def fast_bcrypt(monkeypatch):
+    monkeypatch.setenv("BCRYPT_ROUNDS", "4")
+
+
+class InMemoryUserRepository:
+    def __init__(self, user):
+        self.user = user
+        self.updates = 0
+
+    def find_by_email(self, email):
+        return self.user if email == self.user.email else None
+
+    def update(self, user_id, user):
+        self.updates += 1
+        return user
+
+
+class EmptyFeatureRegistry:
+    def codes_for_ids(self, feature_ids):
+        return []
+
+    def encode(self, codes):
+        return "", 0
+
+
+def make_login(user, pool):
+    return Login(
+        InMemoryUserRepository(user), None, None, JWTHandler(secret_key="test-secret"),
+        EmptyFeatureRegistry(), pool
+    )
+
+
+class TestBcryptPool:
+
+    def test_sheds_load_when_queue_is_full(self):
+        pool = BcryptPool(max_workers=1, max_queue=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return True
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(pool._run(slow))) for _ in range(2)]
+        for t in threads:
+            t.start()
+        started.wait(5)
+
+        with pytest.raises(PasswordHasherBusy) as busy:
+            pool._run(slow)
+        assert busy.value.retry_after >= 1
+
+        release.set()
+        for t in threads:
+            t.join()
+        assert results == [True, True]
+        assert pool.verify("123456", PasswordHash.hash("123456"))
+
+    def test_needs_rehash_compares_cost(self, monkeypatch):
+        hashed = PasswordHash.hash("123456")
+
+        assert not PasswordHash.needs_rehash(hashed)
+        monkeypatch.setenv("BCRYPT_ROUNDS", "5")
+        assert PasswordHash.needs_rehash(hashed)
+
+
+class TestLoginRehash:
+
+    def test_login_rehashes_when_cost_changes(self, monkeypatch):
+        user = User(email="a@b.com", password_hash=PasswordHash.hash("123456"), name="A", company_id="c1", role_ids=[], id="u1")
+        login = make_login(user, BcryptPool(max_workers=1, max_queue=1))
+
+        monkeypatch.setenv("BCRYPT_ROUNDS", "5")
+        login.execute("a@b.com", "123456")
+
+        assert user.password_hash.startswith("$2b$05$")
+        assert login._user_repository.updates == 1
+        login.execute("a@b.com", "123456")
+        assert login._user_repository.updates == 1
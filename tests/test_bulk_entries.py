@@ -0,0 +1,89 @@
+"""
+Testes da criação de lançamentos em lote (fechamento do dia)
+
+Execute com: pytest tests/test_bulk_entries.py -v
+"""
+
+import pytest
+
+from src.application.use_cases import CreateFinancialEntriesBulk
+from src.domain.entities import PaymentModality
+
+
+class InMemoryModalities:
+    def __init__(self, modalities):
+        self.modalities = {m.id: m for m in modalities}
+        self.lookups = 0
+
+    def find_by_ids(self, modality_ids):
+        self.lookups += 1
+        return [self.modalities[i] for i in modality_ids if i in self.modalities]
+
+
+class InMemoryStore:
+    def __init__(self):
+        self.items = []
+        self.calls = 0
+
+    def create_many(self, items):
+        self.calls += 1
+        for n, item in enumerate(items, start=len(self.items)):
+            item.id = f"id-{n}"
+        self.items.extend(items)
+        return items
+
+
+MODALITIES = [
+    PaymentModality(name="Pix", color="#00C853", id="pix"),
+    PaymentModality(name="Crediário", color="#9333EA", is_credit_plan=True, id="cred"),
+    PaymentModality(name="Antiga", color="#000000", is_active=False, id="old"),
+]
+
+
+def make_use_case():
+    entries, installments = InMemoryStore(), InMemoryStore()
+    modalities = InMemoryModalities(MODALITIES)
+    return CreateFinancialEntriesBulk(entries, modalities, installments), entries, installments, modalities
+
+
+class TestCreateFinancialEntriesBulk:
+
+    def test_day_closing_in_one_round_trip(self):
+        use_case, entries, installments, modalities = make_use_case()
+
+        result = use_case.execute([
+            {"value": 150.0, "date": "2026-01-10", "modality_id": "pix"},
+            {"value": 600.0, "date": "2026-01-10", "modality_id": "cred",
+             "installments_count": 3, "start_date": "2026-01-31"},
+            {"value": 90.0, "date": "2026-01-10", "modality_id": "pix"},
+        ])
+
+        assert result["created"] == 3 and result["failed"] == 0
+        assert modalities.lookups == 1
+        assert entries.calls == 1 and installments.calls == 1
+        assert [i["due_date"][:10] for i in result["results"][1]["installments"]] == [
+            "2026-01-31", "2026-02-28", "2026-03-31"
+        ]
+        assert {i.financial_entry_id for i in installments.items} == {result["results"][1]["entry"]["id"]}
+
+    def test_invalid_items_are_reported_per_index(self):
+        use_case, entries, _, _ = make_use_case()
+
+        result = use_case.execute([
+            {"value": 10.0, "date": "2026-01-10", "modality_id": "pix"},
+            {"value": 10.0, "date": "2026-01-10", "modality_id": "old"},
+            {"value": 10.0, "date": "2026-01-10", "modality_id": "cred"},
+            {"date": "2026-01-10", "modality_id": "pix"},
+            {"value": 10.0, "date": "2026-01-10", "modality_id": "missing"},
+        ])
+
+        assert [r["status"] for r in result["results"]] == ["created", "error", "error", "error", "error"]
+        assert result["results"][1]["error"] == "Modalidade de pagamento está inativa"
+        assert result["results"][4]["error"] == "Modalidade de pagamento não encontrada"
+        assert len(entries.items) == 1
+
+    def test_rejects_empty_list(self):
+        use_case, _, _, _ = make_use_case()
+
+        with pytest.raises(ValueError):
+            use_case.execute([])
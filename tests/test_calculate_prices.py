@@ -0,0 +1,114 @@
+"""
+Testes do cálculo de preços em lote (markup + taxas das modalidades)
+
+Execute com: pytest tests/test_calculate_prices.py -v
+"""
+
+import io
+
+import pytest
+
+from src.application.use_cases import CalculatePrices
+from src.application.use_cases.calculate_prices import read_costs_csv
+from src.domain.entities import PaymentModality, PlatformSettings
+
+
+class FakeSettingsRepository:
+    def __init__(self, settings):
+        self.settings = settings
+        self.calls = 0
+
+    def get_settings(self):
+        self.calls += 1
+        return self.settings
+
+
+class FakeModalityRepository:
+    def __init__(self, modalities):
+        self.modalities = modalities
+        self.calls = 0
+
+    def find_active(self):
+        self.calls += 1
+        return self.modalities
+
+
+class FakeCache:
+    def __init__(self):
+        self.values = {}
+
+    def get_or_load(self, company_id, key, loader):
+        if (company_id, key) not in self.values:
+            self.values[(company_id, key)] = loader()
+        return self.values[(company_id, key)]
+
+
+MODALITIES = [
+    PaymentModality(name="Pix", color="#000", id="pix"),
+    PaymentModality(name="Crédito 1x", color="#111", fee_percentage=2.0, id="credito"),
+    PaymentModality(name="Crediário", color="#222", is_credit_plan=True, id="crediario"),
+]
+
+
+def make_use_case(settings=None, cache=None):
+    settings = settings or PlatformSettings(markup_default=2.0, markup_cost=10.0, markup_percentage=0.05)
+    return CalculatePrices(
+        FakeSettingsRepository(settings), FakeModalityRepository(MODALITIES), cache, "c1"
+    )
+
+
+class TestCalculatePrices:
+
+    def test_prices_per_method(self):
+        result = make_use_case().execute([40.0, 90.0], ["A1", "B2"])
+
+        assert [m["key"] for m in result["methods"]] == ["cash", "credito", "crediario"]
+        first = result["items"][0]
+        assert first["sku"] == "A1"
+        assert first["prices"]["cash"] == 100.0
+        assert first["prices"]["credito"] == round(100.0 * 1.05 / 0.98, 2)
+        assert first["prices"]["crediario"] == 105.0
+        assert result["count"] == 2
+
+    def test_settings_loaded_once_from_cache(self):
+        cache = FakeCache()
+        use_case = make_use_case(cache=cache)
+
+        use_case.execute([10.0] * 500)
+        use_case.execute([20.0])
+
+        assert use_case._settings_repository.calls == 1
+        assert use_case._modality_repository.calls == 1
+
+    def test_stream_matches_execute(self):
+        use_case = make_use_case()
+        events = list(use_case.stream([40.0, 90.0]))
+
+        assert events[0]["type"] == "header"
+        assert [e["prices"] for e in events[1:]] == [i["prices"] for i in use_case.execute([40.0, 90.0])["items"]]
+
+    def test_requires_markup(self):
+        with pytest.raises(ValueError):
+            make_use_case(PlatformSettings()).execute([10.0])
+
+    def test_rejects_invalid_costs(self):
+        with pytest.raises(ValueError):
+            make_use_case().execute([10.0, -1.0])
+        with pytest.raises(ValueError):
+            make_use_case().execute([])
+
+
+class TestReadCostsCsv:
+
+    def test_with_header(self):
+        content = "Referência;Descrição;Custo\nT-01;Tênis;R$ 1.234,50\nS-02;Sandália;45,90\n"
+        skus, costs = read_costs_csv(io.BytesIO(content.encode("utf-8")))
+
+        assert skus == ["T-01", "S-02"]
+        assert costs.tolist() == [1234.5, 45.9]
+
+    def test_without_header(self):
+        skus, costs = read_costs_csv(io.StringIO("A,10\nB,20,5\n"))
+
+        assert skus == ["A", "B"]
+        assert costs.tolist() == [10.0, 20.0]
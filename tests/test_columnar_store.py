@@ -0,0 +1,122 @@
+"""
+Testes do cache colunar de análises
+
+Execute com: pytest tests/test_columnar_store.py -v
+"""
+
+from datetime import date
+
+import pytest
+
+from src.application.services.columnar_store import ColumnarStore, TenantColumns
+
+
+def entry(day, value, modality="pix", entry_type="normal", type_="received"):
+    return {"date": f"{day}T10:00:00", "value": value, "modality_id": modality,
+            "modality_name": modality.capitalize(), "type": type_, "entry_type": entry_type}
+
+
+ENTRIES = [
+    entry("2026-01-05", 100.0),                           # segunda
+    entry("2026-01-05", 50.0, "cash"),
+    entry("2026-01-06", 30.0),                            # terça
+    entry("2026-02-02", 200.0),                           # segunda
+    entry("2026-02-03", 80.0, entry_type="despesa"),
+]
+
+
+class FakeVersions:
+    def __init__(self):
+        self.value = 1
+
+    def current(self, company_id):
+        return self.value
+
+
+def make_columns():
+    columns = TenantColumns(version=1)
+    columns.append(ENTRIES)
+    return columns
+
+
+class TestTenantColumns:
+
+    def test_groupby_month_and_modality(self):
+        rows = make_columns().groupby(["month", "modality"])
+
+        assert rows == [
+            {"month": "2026-01", "modality": "Pix", "value": 130.0, "count": 2},
+            {"month": "2026-01", "modality": "Cash", "value": 50.0, "count": 1},
+            {"month": "2026-02", "modality": "Pix", "value": 280.0, "count": 2},
+        ]
+
+    def test_weekday_average_in_date_range(self):
+        rows = make_columns().groupby(
+            ["weekday"], "avg", start_day=date(2026, 1, 1).toordinal(), end_day=date(2026, 1, 31).toordinal()
+        )
+
+        assert rows == [
+            {"weekday": "segunda", "value": 75.0, "count": 2},
+            {"weekday": "terça", "value": 30.0, "count": 1},
+        ]
+
+    def test_total_without_dims_and_empty_range(self):
+        columns = make_columns()
+
+        assert columns.groupby([], "count") == [{"value": 5, "count": 5}]
+        assert columns.groupby(["entry_type"], start_day=date(2030, 1, 1).toordinal()) == []
+
+    def test_invalid_dimension_or_measure(self):
+        with pytest.raises(ValueError):
+            make_columns().groupby(["store"])
+        with pytest.raises(ValueError):
+            make_columns().groupby(["month"], "median")
+
+
+class TestColumnarStore:
+
+    def test_loads_once_and_appends_created_entries(self):
+        loads = []
+        versions = FakeVersions()
+        store = ColumnarStore(lambda cid: loads.append(cid) or ENTRIES, version_source=versions)
+
+        assert store.get("c1").size == 5
+        assert store.get("c1").size == 5
+
+        assert store.append("c1", [entry("2026-02-04", 10.0)], (1, 2))
+        versions.value = 2
+        assert store.get("c1").size == 6
+        assert loads == ["c1"]
+
+    def test_other_writes_trigger_reload(self):
+        loads = []
+        versions = FakeVersions()
+        store = ColumnarStore(lambda cid: loads.append(cid) or ENTRIES, version_source=versions)
+        store.get("c1")
+
+        versions.value = 3  # ex: lançamento excluído
+        assert not store.append("c1", [entry("2026-02-04", 10.0)], (2, 4))
+        store.get("c1")
+
+        assert loads == ["c1", "c1"]
+
+    def test_load_is_not_cached_when_version_moves_while_loading(self):
+        versions = FakeVersions()
+
+        def load(company_id):
+            versions.value = 2  # lançamento criado durante a leitura
+            return ENTRIES
+
+        store = ColumnarStore(load, version_source=versions)
+        store.get("c1")
+
+        assert not store.append("c1", ENTRIES[:1], (1, 3))
+        assert store.memory_usage() == {}
+
+    def test_evicts_least_recently_used_over_budget(self):
+        store = ColumnarStore(lambda cid: ENTRIES, version_source=FakeVersions(), max_bytes=1)
+
+        store.get("c1")
+        store.get("c2")
+
+        assert list(store.memory_usage()) == ["c2"]
@@ -0,0 +1,118 @@
+"""
+Testes da compressão das respostas
+
+Execute com: pytest tests/test_compression.py -v
+"""
+
+import gzip
+import json
+import zlib
+
+import brotli
+from flask import Flask, Response, jsonify
+
+from src.presentation.middlewares.compression import ResponseCompressor
+
+ROWS = [{"id": n, "modality_name": "Pix Sicredi", "value": 150.0} for n in range(200)]
+
+
+def make_app(**kwargs):
+    app = Flask(__name__)
+    compressor = ResponseCompressor(max_load=0, **kwargs)
+    compressor.init_app(app)
+
+    @app.route("/big")
+    def big():
+        return jsonify(ROWS)
+
+    @app.route("/small")
+    def small():
+        return jsonify({"status": "ok"})
+
+    @app.route("/stream")
+    def stream():
+        return Response((json.dumps(row) + "\n" for row in ROWS), mimetype="application/x-ndjson")
+
+    return app.test_client(), compressor
+
+
+class TestResponseCompressor:
+
+    def test_gzip_above_threshold(self):
+        client, compressor = make_app()
+
+        response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert json.loads(gzip.decompress(response.data)) == ROWS
+        stats = compressor.metrics.snapshot()["encodings"]["gzip"]
+        assert stats["responses"] == 1
+        assert stats["ratio"] < 0.2
+
+    def test_small_and_unaccepted_responses_are_not_compressed(self):
+        client, compressor = make_app()
+
+        assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert "Content-Encoding" not in client.get("/big", headers={"Accept-Encoding": "identity"}).headers
+        assert compressor.metrics.snapshot()["skipped"] == {"small": 1, "encoding": 1}
+
+    def test_streaming_response_is_compressed_per_chunk(self):
+        client, compressor = make_app()
+
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        lines = gzip.decompress(response.data).decode().splitlines()
+        assert [json.loads(line) for line in lines] == ROWS
+
+    def test_stream_chunks_decode_incrementally(self):
+        client, _ = make_app()
+
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"}, buffered=False)
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        first = decoder.decompress(next(iter(response.response)))
+        response.close()
+
+        assert json.loads(first) == ROWS[0]
+
+    def test_skips_when_cpu_saturated(self):
+        client, compressor = make_app()
+        compressor.max_load = 0.5
+        compressor._cpu_saturated = lambda: True
+
+        response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert compressor.metrics.snapshot()["skipped"] == {"load": 1}
+
+    def test_brotli_preferred_on_equal_quality(self):
+        client, compressor = make_app()
+
+        response = client.get("/big", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["Content-Encoding"] == "br"
+        assert json.loads(brotli.decompress(response.data)) == ROWS
+        assert compressor.metrics.snapshot()["encodings"]["br"]["responses"] == 1
+
+    def test_respects_client_quality_values(self):
+        client, _ = make_app()
+
+        assert client.get("/big", headers={"Accept-Encoding": "br;q=0.5, gzip"}).headers["Content-Encoding"] == "gzip"
+        assert client.get("/big", headers={"Accept-Encoding": "br, gzip;q=0.8"}).headers["Content-Encoding"] == "br"
+        assert client.get("/big", headers={"Accept-Encoding": "br;q=0, gzip"}).headers["Content-Encoding"] == "gzip"
+
+    def test_brotli_stream_decodes_incrementally(self):
+        client, compressor = make_app()
+
+        response = client.get("/stream", headers={"Accept-Encoding": "br"}, buffered=False)
+        chunks = iter(response.response)
+        decoder = brotli.Decompressor()
+        first = decoder.process(next(chunks))
+        rest = b"".join(decoder.process(chunk) for chunk in chunks)
+        response.close()
+
+        assert json.loads(first) == ROWS[0]
+        assert [json.loads(line) for line in (first + rest).decode().splitlines()] == ROWS
+        assert compressor.metrics.snapshot()["encodings"]["br"]["bytes_in"] > 0
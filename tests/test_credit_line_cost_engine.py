@@ -0,0 +1,78 @@
+"""
+Testes do motor de custo das linhas de crédito
+
+Execute com: pytest tests/test_credit_line_cost_engine.py -v
+"""
+
+import pytest
+
+from src.application.services.credit_line_cost_engine import CreditLineCostEngine
+from src.domain.entities.bank_limit import BankLimit
+
+
+def sicredi():
+    return BankLimit(
+        id="sicredi",
+        bank_name="Sicredi",
+        rotativo_available=80000.0,
+        rotativo_used=70000.0,
+        rotativo_rate=1.94,
+        cheque_available=5000.0,
+        cheque_used=0.0,
+        cheque_rate=7.99,
+        iof_rate=0.38,
+        iof_daily_rate=0.0082,
+    )
+
+
+def sicoob():
+    return BankLimit(
+        id="sicoob",
+        bank_name="Sicoob",
+        cheque_available=30000.0,
+        cheque_used=0.0,
+        cheque_rate=3.50,
+        iof_rate=0.38,
+        iof_daily_rate=0.0082,
+    )
+
+
+class TestCreditLineCostEngine:
+
+    def test_thirty_day_cost_matches_closed_formula(self):
+        """Em 30 dias os juros equivalem exatamente à taxa mensal"""
+        result = CreditLineCostEngine().project([sicredi()], days=30)
+        rotativo = next(line for line in result["lines"] if line["line"] == "rotativo")
+
+        assert rotativo["interest"] == pytest.approx(70000 * 0.0194, abs=0.01)
+        assert rotativo["iof"] == pytest.approx(70000 * (0.0038 + 0.000082 * 30), abs=0.01)
+        assert len(rotativo["daily_cost"]) == 30
+        assert rotativo["daily_cost"][-1] == rotativo["total_cost"]
+        assert rotativo["cet_month"] == pytest.approx(
+            (rotativo["total_cost"] / 70000) * 100, abs=1e-3
+        )
+
+    def test_ranking_puts_cheapest_fitting_line_first(self):
+        result = CreditLineCostEngine().project([sicredi(), sicoob()], days=30, amount=8000)
+        ranking = result["ranking"]
+
+        # Rotativo é o mais barato, mas só tem R$ 10.000 de folga - ainda cabe
+        assert [(r["bank_name"], r["line"]) for r in ranking[:3]] == [
+            ("Sicredi", "rotativo"),
+            ("Sicoob", "cheque_especial"),
+            ("Sicredi", "cheque_especial"),
+        ]
+        assert ranking[2]["fits"] is False
+
+    def test_iof_daily_is_capped_at_365_days(self):
+        engine = CreditLineCostEngine()
+        limit = BankLimit(bank_name="X", rotativo_available=1000, rotativo_used=1000, iof_daily_rate=0.01)
+
+        one_year = engine.project([limit], days=365)["lines"][0]["iof"]
+        two_years = engine.project([limit], days=730)["lines"][0]["iof"]
+
+        assert one_year == two_years == pytest.approx(36.5)
+
+    def test_invalid_horizon_raises(self):
+        with pytest.raises(ValueError):
+            CreditLineCostEngine().project([sicredi()], days=0)
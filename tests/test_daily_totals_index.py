@@ -0,0 +1,145 @@
+"""
+Testes do índice de somas acumuladas (totais por intervalo de datas)
+
+Execute com: pytest tests/test_daily_totals_index.py -v
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from src.application.services.daily_totals_index import DailyTotalsIndex, TenantDailyTotals
+from src.application.use_cases import GetEntryTotals
+
+ROLLUP = [
+    {"day": "2026-01-05", "type": "received", "entry_type": "normal", "total": 100.0},
+    {"day": "2026-01-06", "type": "received", "entry_type": "normal", "total": 50.0},
+    {"day": "2026-01-06", "type": "received", "entry_type": "despesa", "total": 20.0},
+    {"day": "2026-01-10", "type": "receivable", "entry_type": "normal", "total": 300.0},
+]
+
+
+class FakeVersions:
+    def __init__(self):
+        self.value = 1
+
+    def current(self, company_id):
+        return self.value
+
+
+class TestTenantDailyTotals:
+
+    def test_range_totals(self):
+        index = TenantDailyTotals.from_rollup(ROLLUP, version=1)
+
+        assert index.total(date(2026, 1, 1), date(2026, 1, 31)) == 470.0
+        assert index.total(date(2026, 1, 6), date(2026, 1, 6)) == 70.0
+        assert index.total(date(2026, 1, 1), date(2026, 1, 31), entry_type="normal") == 450.0
+        assert index.total(date(2026, 1, 1), date(2026, 1, 31), type="receivable") == 300.0
+        assert index.total(date(2026, 2, 1), date(2026, 2, 28)) == 0.0
+
+    def test_add_extends_range_both_ways(self):
+        index = TenantDailyTotals.from_rollup(ROLLUP, version=1)
+
+        index.add(date(2026, 2, 1), 10.0)
+        index.add(date(2025, 12, 31), 5.0, entry_type="emprestimo")
+
+        assert index.total(date(2025, 1, 1), date(2026, 12, 31)) == 485.0
+        assert index.total(date(2026, 1, 11), date(2026, 2, 1)) == 10.0
+        assert index.total(date(2025, 12, 31), date(2025, 12, 31), entry_type="emprestimo") == 5.0
+
+    def test_empty_index(self):
+        index = TenantDailyTotals.from_rollup([], version=1)
+        assert index.total(date(2026, 1, 1), date(2026, 1, 31)) == 0.0
+
+        index.add(date(2026, 1, 2), 7.5)
+        assert index.total(date(2026, 1, 1), date(2026, 1, 31)) == 7.5
+
+
+class TestDailyTotalsIndex:
+
+    def make_index(self):
+        versions = FakeVersions()
+        loads = []
+        index = DailyTotalsIndex(
+            lambda cid: loads.append(cid) or ROLLUP, version_source=versions,
+            executor=ThreadPoolExecutor(1),
+        )
+        return index, versions, loads
+
+    def test_miss_schedules_rebuild_then_hits(self):
+        index, _, loads = self.make_index()
+
+        assert index.lookup("c1") is None
+        index._executor.shutdown(wait=True)
+
+        assert index.lookup("c1") is not None
+        assert loads == ["c1"]
+
+    def test_patch_on_create_and_invalidate_on_other_writes(self):
+        index, versions, _ = self.make_index()
+        index.build("c1")
+
+        assert index.patch("c1", [{"date": "2026-01-05T09:00:00", "value": 25.0}], (1, 2))
+        versions.value = 2
+        assert index.lookup("c1").total(date(2026, 1, 5), date(2026, 1, 5)) == 125.0
+
+        # Outra escrita (ex: exclusão) levou a versão a 3: o próximo create não pode mais somar
+        assert not index.patch("c1", [{"date": "2026-01-05", "value": 1.0}], (3, 4))
+
+
+    def test_rebuild_is_dropped_when_version_moves_while_loading(self):
+        versions = FakeVersions()
+
+        def load(company_id):
+            # Lançamento gravado durante a leitura: a escrita já avançou a versão
+            versions.value = 2
+            return ROLLUP + [{"day": "2026-01-05", "type": "received", "entry_type": "normal", "total": 25.0}]
+
+        index = DailyTotalsIndex(load, version_source=versions, executor=ThreadPoolExecutor(1))
+        index.build("c1")
+
+        # Nada ficou carregado na versão 1: o patch da escrita (1 -> 3) não soma duas vezes
+        assert not index.patch("c1", [{"date": "2026-01-05", "value": 25.0}], (1, 3))
+        assert index.lookup("c1") is None
+
+
+class FakeRepository:
+    def __init__(self):
+        self.calls = []
+
+    def get_total_by_date_range(self, start, end, type=None, entry_type=None):
+        self.calls.append((start, end, type, entry_type))
+        return 42.0
+
+
+class TestGetEntryTotals:
+
+    def test_uses_index_when_available(self):
+        repository = FakeRepository()
+        index = TenantDailyTotals.from_rollup(ROLLUP, version=1)
+
+        result = GetEntryTotals(repository, index).execute({"jan": (date(2026, 1, 1), date(2026, 1, 31))})
+
+        assert result == {"totals": {"jan": 470.0}, "source": "index"}
+        assert repository.calls == []
+
+    def test_falls_back_to_aggregation(self):
+        repository = FakeRepository()
+
+        result = GetEntryTotals(repository).execute(
+            {"day": (date(2026, 1, 6), date(2026, 1, 6))}, entry_type="normal"
+        )
+
+        assert result == {"totals": {"day": 42.0}, "source": "aggregation"}
+        start, end, _, entry_type = repository.calls[0]
+        assert (start.isoformat(), end.isoformat()) == ("2026-01-06T00:00:00", "2026-01-06T23:59:59.999999")
+        assert entry_type == "normal"
+
+    def test_periods(self):
+        today = date(2026, 3, 12)  # quinta
+        assert GetEntryTotals.period_range("week", today) == (date(2026, 3, 9), today)
+        assert GetEntryTotals.period_range("year", today) == (date(2026, 1, 1), today)
+        with pytest.raises(ValueError):
+            GetEntryTotals.period_range("decade", today)
@@ -0,0 +1,74 @@
+"""
+Testes do snapshot do dashboard (seções em paralelo com timeout por seção)
+
+Execute com: pytest tests/test_dashboard_snapshot.py -v
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.application.use_cases import GetDashboardSnapshot
+
+
+class FakeSnapshot(GetDashboardSnapshot):
+    def __init__(self, sections, **kwargs):
+        super().__init__(None, None, None, None, None, None, **kwargs)
+        self._sections = sections
+
+    def _build_sections(self, start_date, end_date):
+        return self._sections
+
+
+def fail():
+    raise RuntimeError("senha=segredo")
+
+
+class TestGetDashboardSnapshot:
+
+    def test_partial_result_with_generic_error(self):
+        snapshot = FakeSnapshot(
+            {"accounts": lambda: [1, 2], "bank_limits": fail},
+            executor=ThreadPoolExecutor(2),
+        ).execute()
+
+        sections = snapshot["sections"]
+        assert sections["accounts"]["status"] == "ok"
+        assert sections["accounts"]["data"] == [1, 2]
+        assert sections["bank_limits"]["status"] == "error"
+        assert sections["bank_limits"]["error"] == GetDashboardSnapshot.ERROR_MESSAGE
+        assert "segredo" not in str(snapshot)
+
+    def test_hung_section_times_out_without_blocking_the_others(self):
+        gate = threading.Event()
+        snapshot = FakeSnapshot(
+            {"accounts": lambda: gate.wait(5), "payment_modalities": lambda: []},
+            executor=ThreadPoolExecutor(2), section_timeout=0.1,
+        ).execute()
+        gate.set()
+
+        assert snapshot["sections"]["accounts"]["status"] == "timeout"
+        assert snapshot["sections"]["payment_modalities"]["status"] == "ok"
+        assert list(snapshot["sections"]) == ["accounts", "payment_modalities"]
+
+    def test_timeout_counts_from_when_the_section_starts(self):
+        # Um único worker: a segunda seção espera a primeira na fila
+        snapshot = FakeSnapshot(
+            {"accounts": lambda: time.sleep(0.15), "bank_limits": lambda: time.sleep(0.1)},
+            executor=ThreadPoolExecutor(1), section_timeout=0.2,
+        ).execute()
+
+        assert snapshot["sections"]["accounts"]["status"] == "ok"
+        assert snapshot["sections"]["bank_limits"]["status"] == "ok"
+
+    def test_queued_section_is_cancelled_after_waiting_the_timeout(self):
+        gate = threading.Event()
+        ran = []
+        snapshot = FakeSnapshot(
+            {"accounts": lambda: gate.wait(5), "bank_limits": lambda: ran.append(True)},
+            executor=ThreadPoolExecutor(1), section_timeout=0.1,
+        ).execute()
+        gate.set()
+
+        assert snapshot["sections"]["bank_limits"]["status"] == "timeout"
+        assert ran == []
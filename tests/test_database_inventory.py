@@ -0,0 +1,101 @@
+"""
+Testes do inventário de databases (/api/migration/list-databases)
+
+Execute com: pytest tests/test_database_inventory.py -v
+"""
+
+from pymongo.errors import OperationFailure
+from pymongo.read_preferences import Primary
+
+from src.infra.database.database_inventory import DatabaseInventory
+
+
+class FakeCollection:
+    def __init__(self, storage=None, count=0):
+        self.storage, self.count = storage, count
+
+    def aggregate(self, pipeline):
+        if self.storage is None:
+            raise OperationFailure("$collStats não permitido")
+        return [{"storageStats": shard} for shard in self.storage]
+
+    def count_documents(self, query):
+        raise AssertionError("não deve varrer a coleção")
+
+    def estimated_document_count(self):
+        return self.count
+
+
+class FakeDatabase:
+    read_preference = Primary()
+
+    def __init__(self, collections):
+        self.collections = collections
+
+    def with_options(self, read_preference=None):
+        return self
+
+    def list_collection_names(self, filter=None):
+        return list(self.collections)
+
+    def __getitem__(self, name):
+        return self.collections[name]
+
+
+class FakeClient:
+    def __init__(self, databases):
+        self.databases = databases
+        self.listings = 0
+
+    def list_database_names(self):
+        self.listings += 1
+        return ["admin", "local", *self.databases]
+
+    def __getitem__(self, name):
+        return self.databases[name]
+
+
+def make_client():
+    return FakeClient({
+        "shared_db": FakeDatabase({
+            "users": FakeCollection([{"count": 4, "size": 800, "storageSize": 4096, "totalIndexSize": 8192}]),
+        }),
+        "cmp_loja": FakeDatabase({
+            # Sharded: um documento por shard
+            "financial_entries": FakeCollection([
+                {"count": 10, "size": 1000, "storageSize": 4096, "totalIndexSize": 2048},
+                {"count": 30, "size": 3000, "storageSize": 8192, "totalIndexSize": 2048},
+            ]),
+            "_meta": FakeCollection(None, count=1),
+        }),
+    })
+
+
+class TestDatabaseInventory:
+
+    def test_uses_storage_metadata(self):
+        result = DatabaseInventory(make_client(), ttl=0).list()
+
+        databases = {d["name"]: d for d in result["databases"]}
+        assert set(databases) == {"shared_db", "cmp_loja"}
+
+        loja = databases["cmp_loja"]
+        assert loja["collections"] == ["_meta", "financial_entries"]
+        assert loja["document_counts"] == {"_meta": 1, "financial_entries": 40}
+        assert loja["stats"]["financial_entries"] == {
+            "count": 40, "size": 4000, "avg_obj_size": 100.0, "storage_size": 12288, "index_size": 4096,
+        }
+        assert loja["stats"]["_meta"]["storage_size"] is None
+        assert loja["storage_size"] == 12288
+        assert loja["index_size"] == 4096
+
+    def test_result_is_cached_until_refresh(self):
+        client = make_client()
+        inventory = DatabaseInventory(client, ttl=60)
+
+        first = inventory.list()
+        assert inventory.list() is first
+        assert client.listings == 1
+
+        inventory.list(refresh=True)
+        assert client.listings == 2
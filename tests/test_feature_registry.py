@@ -0,0 +1,87 @@
+"""
+Testes do registro de features (bitset no token)
+
+Execute com: pytest tests/test_feature_registry.py -v
+"""
+
+import pytest
+
+from src.application.services.feature_registry import FeatureRegistry
+from src.domain.entities import Feature
+
+
+class InMemoryFeatureRepository:
+    def __init__(self, codes):
+        self.features = {}
+        self.find_all_calls = 0
+        for code in codes:
+            self.add(code)
+
+    def add(self, code):
+        feature = Feature(code=code, name=code, description="", module=code.split(".")[0], id=f"id-{code}")
+        self.features[feature.id] = feature
+        return feature
+
+    def find_all(self):
+        self.find_all_calls += 1
+        return [Feature(**vars(f)) for f in self.features.values()]
+
+    def assign_bit(self, feature_id):
+        feature = self.features[feature_id]
+        if feature.bit is None:
+            bits = [f.bit for f in self.features.values() if f.bit is not None]
+            feature.bit = max(bits) + 1 if bits else 0
+        return feature.bit
+
+
+CODES = [f"module_{i}.action" for i in range(40)]
+
+
+class TestFeatureRegistry:
+
+    def test_roundtrip(self):
+        registry = FeatureRegistry(InMemoryFeatureRepository(CODES))
+        granted = CODES[::3]
+
+        bits, version = registry.encode(granted)
+
+        assert version == 40
+        assert registry.decode(bits, version) == frozenset(granted)
+        assert len(bits) < len(",".join(granted)) / 10
+
+    def test_ids_are_resolved_to_codes(self):
+        registry = FeatureRegistry(InMemoryFeatureRepository(CODES))
+
+        assert registry.codes_for_ids(["id-module_1.action", "id-removida"]) == ["module_1.action"]
+
+    def test_old_token_stays_valid_after_new_feature(self):
+        repository = InMemoryFeatureRepository(CODES)
+        registry = FeatureRegistry(repository)
+        bits, version = registry.encode(["module_0.action", "module_39.action"])
+
+        repository.add("reports.export")
+        new_bits, new_version = registry.encode(["reports.export"])
+
+        assert new_version == version + 1
+        assert registry.decode(bits, version) == {"module_0.action", "module_39.action"}
+        # Outro processo, com o registro antigo, recarrega ao ver versão mais nova
+        stale = FeatureRegistry(repository)
+        stale._version, stale._bits, stale._codes = version, {}, {}
+        assert stale.decode(new_bits, new_version) == {"reports.export"}
+
+    def test_decode_is_cached_per_token(self):
+        repository = InMemoryFeatureRepository(CODES)
+        registry = FeatureRegistry(repository)
+        bits, version = registry.encode(CODES[:5])
+
+        first = registry.decode(bits, version)
+        calls = repository.find_all_calls
+
+        assert registry.decode(bits, version) is first
+        assert repository.find_all_calls == calls
+
+    def test_invalid_bitset(self):
+        registry = FeatureRegistry(InMemoryFeatureRepository(CODES))
+
+        with pytest.raises(ValueError):
+            registry.decode("a", registry.version)
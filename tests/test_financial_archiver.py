@@ -0,0 +1,286 @@
+"""
+Testes do arquivamento por ano de lançamentos e parcelas de períodos fechados
+
+Execute com: pytest tests/test_financial_archiver.py -v
+"""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.services.financial_archiver import FinancialArchiver
+from src.infra.repositories import MongoFinancialEntryRepository, MongoInstallmentRepository
+
+
+class FakeCursor(list):
+    def sort(self, field, direction=1):
+        return FakeCursor(sorted(self, key=lambda d: d.get(field) or "", reverse=direction < 0))
+
+    def limit(self, n):
+        return FakeCursor(self[:n])
+
+
+def matches(doc, query):
+    for field, cond in query.items():
+        value = doc.get(field)
+        if isinstance(cond, dict):
+            if "$in" in cond and value not in cond["$in"]:
+                return False
+            if "$gt" in cond and not value > cond["$gt"]:
+                return False
+            if "$gte" in cond and not value >= cond["$gte"]:
+                return False
+            if "$lt" in cond and not value < cond["$lt"]:
+                return False
+            if "$lte" in cond and not value <= cond["$lte"]:
+                return False
+            if "$ne" in cond and value == cond["$ne"]:
+                return False
+        elif value != cond:
+            return False
+    return True
+
+
+class FakeCollection:
+    """Subconjunto do pymongo.Collection usado pelo arquivamento e pelos repositórios"""
+
+    read_preference = None
+
+    def __init__(self, database, name):
+        self.database = database
+        self.name = name
+        self.docs = {}
+
+    def find(self, query=None, projection=None, session=None, batch_size=None):
+        return FakeCursor(dict(d) for d in self.docs.values() if matches(d, query or {}))
+
+    def find_one(self, query):
+        found = self.find(query)
+        return found[0] if found else None
+
+    def distinct(self, field, query):
+        return list({d[field] for d in self.find(query)})
+
+    def count_documents(self, query, limit=0):
+        return len(self.find(query))
+
+    def bulk_write(self, operations, ordered=True, session=None):
+        for op in operations:
+            self.docs[op._filter["_id"]] = dict(op._doc)
+
+    def delete_many(self, query, session=None):
+        found = self.find(query)
+        for doc in found:
+            del self.docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=len(found))
+
+    def delete_one(self, query, session=None):
+        found = self.find(query)[:1]
+        for doc in found:
+            del self.docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=len(found))
+
+    def replace_one(self, query, doc, upsert=False, session=None):
+        self.docs[query["_id"]] = dict(doc)
+
+    def update_one(self, query, update, upsert=False, session=None):
+        if query["_id"] not in self.docs and not upsert:
+            return SimpleNamespace(matched_count=0, modified_count=0)
+        doc = self.docs.setdefault(query["_id"], {"_id": query["_id"], "years": []})
+        doc.update(update.get("$set", {}))
+        for value in update.get("$addToSet", {}).get("years", {}).get("$each", []):
+            if value not in doc["years"]:
+                doc["years"].append(value)
+        if "$pull" in update:
+            doc["years"].remove(update["$pull"]["years"])
+        return SimpleNamespace(matched_count=1, modified_count=1)
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+    def drop(self):
+        self.database.collections.pop(self.name, None)
+
+
+class FakeDatabase:
+    name = "company_test"
+
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, name):
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(self, name)
+        return self.collections[name]
+
+    def get_collection(self, name, read_preference=None):
+        return self[name]
+
+
+def entry(entry_id, day, value=100.0):
+    return {"_id": entry_id, "date": f"{day}T00:00:00", "value": value, "modality_id": "m1",
+            "modality_name": "Pix", "modality_color": "#000", "created_at": f"{day}T10:00:00"}
+
+
+def installment(installment_id, entry_id, due, is_paid=True):
+    return {"_id": installment_id, "financial_entry_id": entry_id, "installment_number": 1,
+            "total_installments": 1, "amount": 100.0, "due_date": f"{due}T00:00:00", "is_paid": is_paid}
+
+
+@pytest.fixture
+def db():
+    database = FakeDatabase()
+    for doc in (entry("e1", "2023-03-10"), entry("e2", "2023-11-20"), entry("e3", "2024-01-05"),
+                entry("e4", "2026-09-01")):
+        database["financial_entries"].docs[doc["_id"]] = doc
+    for doc in (installment("i1", "e2", "2024-01-20"), installment("i2", "e3", "2024-02-05", is_paid=False)):
+        database["installments"].docs[doc["_id"]] = doc
+    return database
+
+
+class TestFinancialArchiver:
+
+    def test_archives_closed_entries_by_year(self, db):
+        stats = FinancialArchiver(db, batch_size=2).archive(12, today=date(2026, 10, 19))
+
+        assert stats["cutoff"] == "2025-10-01"
+        assert stats["entries_archived"] == 2
+        assert stats["entries_kept_open"] == 1
+        assert set(db["financial_entries"].docs) == {"e3", "e4"}
+        assert set(db["financial_entries_archive_2023"].docs) == {"e1", "e2"}
+        # Parcela vai para o ano do vencimento, junto com o lançamento
+        assert set(db["installments_archive_2024"].docs) == {"i1"}
+        assert set(db["installments"].docs) == {"i2"}
+        assert db["archive_catalog"].docs["financial_entries"]["years"] == [2023]
+
+    def test_unarchive_restores_entries_with_installments(self, db):
+        archiver = FinancialArchiver(db)
+        archiver.archive(12, today=date(2026, 10, 19))
+
+        stats = archiver.unarchive(2023)
+
+        assert stats == {"entries_restored": 2, "installments_restored": 1, "years": [2023]}
+        assert set(db["financial_entries"].docs) == {"e1", "e2", "e3", "e4"}
+        assert set(db["installments"].docs) == {"i1", "i2"}
+        assert "financial_entries_archive_2023" not in db.collections
+        assert db["archive_catalog"].docs["installments"]["years"] == []
+
+    def test_invalid_months(self, db):
+        with pytest.raises(ValueError):
+            FinancialArchiver(db).archive(0)
+
+    def test_refuses_to_move_without_transactions(self, db):
+        FinancialArchiver(db).archive(12, today=date(2026, 10, 19))
+        # Servidor standalone: um lote interrompido ficaria nas duas coleções
+        standalone = SimpleNamespace(supported=lambda: False, run=lambda fn: fn(None))
+        archiver = FinancialArchiver(db, standalone)
+
+        with pytest.raises(ValueError, match="transações"):
+            archiver.archive(12, today=date(2026, 10, 19))
+        with pytest.raises(ValueError, match="transações"):
+            archiver.unarchive(2023)
+        with pytest.raises(ValueError, match="transações"):
+            archiver.restore_installment("i1")
+        assert set(db["financial_entries_archive_2023"].docs) == {"e1", "e2"}
+
+
+class TestArchiveReads:
+
+    def test_range_reads_union_archive_only_when_needed(self, db):
+        FinancialArchiver(db).archive(12, today=date(2026, 10, 19))
+        repository = MongoFinancialEntryRepository(db["financial_entries"])
+
+        recent = repository.find_by_date_range(datetime(2026, 1, 1), datetime(2026, 12, 31))
+        old = repository.find_by_date_range(datetime(2023, 1, 1), datetime(2024, 12, 31))
+
+        assert [e.id for e in recent] == ["e4"]
+        assert [e.id for e in old] == ["e3", "e2", "e1"]
+        assert [e.id for e in repository.find_all()] == ["e4", "e3"]
+
+    def test_find_by_id_falls_back_to_archive(self, db):
+        FinancialArchiver(db).archive(12, today=date(2026, 10, 19))
+
+        assert MongoFinancialEntryRepository(db["financial_entries"]).find_by_id("e2").id == "e2"
+        installments = MongoInstallmentRepository(db["installments"]).find_by_financial_entry_id("e2")
+        assert [i.id for i in installments] == ["i1"]
+
+
+class TestArchivedWrites:
+
+    def test_delete_archived_entry_with_installments(self, db):
+        from src.application.use_cases import DeleteFinancialEntry
+
+        FinancialArchiver(db).archive(12, today=date(2026, 10, 19))
+        use_case = DeleteFinancialEntry(
+            MongoFinancialEntryRepository(db["financial_entries"]),
+            MongoInstallmentRepository(db["installments"]),
+        )
+
+        assert use_case.execute("e2") is True
+        assert "e2" not in db["financial_entries_archive_2023"].docs
+        assert db["installments_archive_2024"].docs == {}
+
+    def test_update_archived_entry_in_place(self, db):
+        FinancialArchiver(db).archive(12, today=date(2026, 10, 19))
+        repository = MongoFinancialEntryRepository(db["financial_entries"])
+        entry = repository.find_by_id("e1")
+        entry.value = 150.0
+
+        assert repository.update("e1", entry) is not None
+        assert db["financial_entries_archive_2023"].docs["e1"]["value"] == 150.0
+
+    def test_update_archived_entry_to_other_year_moves_to_hot(self, db):
+        FinancialArchiver(db).archive(12, today=date(2026, 10, 19))
+        repository = MongoFinancialEntryRepository(db["financial_entries"])
+        entry = repository.find_by_id("e1")
+        entry.date = datetime(2026, 10, 1)
+
+        repository.update("e1", entry)
+
+        assert "e1" not in db["financial_entries_archive_2023"].docs
+        assert [e.id for e in repository.find_by_date_range(datetime(2026, 10, 1), datetime(2026, 10, 31))] == ["e1"]
+
+    def test_bulk_delete_by_period_includes_archived_entries(self, db):
+        from src.application.use_cases import BulkDeleteFinancialEntries
+
+        FinancialArchiver(db).archive(12, today=date(2026, 10, 19))
+        use_case = BulkDeleteFinancialEntries(
+            MongoFinancialEntryRepository(db["financial_entries"]),
+            MongoInstallmentRepository(db["installments"]),
+        )
+
+        result = use_case.execute(start_date=datetime(2023, 1, 1), end_date=datetime(2024, 1, 31))
+
+        assert result == {"entries_deleted": 3, "installments_deleted": 2}
+        assert db["financial_entries_archive_2023"].docs == {}
+        assert set(db["financial_entries"].docs) == {"e4"}
+
+
+class TestDirectReaders:
+
+    def test_columnar_loader_reads_archived_years(self, db, monkeypatch):
+        from src.application.services import columnar_store
+
+        FinancialArchiver(db).archive(12, today=date(2026, 10, 19))
+        monkeypatch.setattr("src.database.get_tenant_db", lambda company_id: db)
+
+        assert sorted(doc["_id"] for doc in columnar_store._load_entries("c1")) == ["e1", "e2", "e3", "e4"]
+
+
+class TestArchivedInstallments:
+
+    def test_unpay_archived_installment_restores_its_entry(self, db):
+        from src.application.use_cases import UnpayInstallment
+
+        archiver = FinancialArchiver(db)
+        archiver.archive(12, today=date(2026, 10, 19))
+        repository = MongoInstallmentRepository(db["installments"])
+
+        installment = UnpayInstallment(repository, archiver).execute("i1")
+
+        assert installment.is_paid is False
+        assert "e2" in db["financial_entries"].docs
+        assert "e2" not in db["financial_entries_archive_2023"].docs
+        assert db["installments_archive_2024"].docs == {}
+        assert [i.id for i in repository.find_open_due_until(datetime(2024, 12, 31))] == ["i1", "i2"]
@@ -0,0 +1,120 @@
+"""
+Testes da exclusão em lote de lançamentos (com parcelas) e da limpeza de parcelas órfãs
+
+Execute com: pytest tests/test_financial_entry_cleanup.py -v
+"""
+
+from datetime import datetime
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from src.application.use_cases import BulkDeleteFinancialEntries, PurgeOrphanInstallments
+from src.infra.database.transaction_runner import MongoTransactionRunner
+
+
+class InMemoryEntries:
+    def __init__(self, dates):
+        self.dates = dict(dates)
+
+    def find_ids(self, start_date, end_date, modality_id=None):
+        return [i for i, d in self.dates.items() if start_date <= d <= end_date]
+
+    def find_existing_ids(self, entry_ids):
+        return {i for i in entry_ids if i in self.dates}
+
+    def delete_many(self, entry_ids, session=None):
+        return sum(self.dates.pop(i, None) is not None for i in entry_ids)
+
+
+class InMemoryInstallments:
+    def __init__(self, entry_ids):
+        self.entry_ids = list(entry_ids)
+
+    def delete_by_financial_entry_ids(self, financial_entry_ids, session=None):
+        before = len(self.entry_ids)
+        self.entry_ids = [i for i in self.entry_ids if i not in financial_entry_ids]
+        return before - len(self.entry_ids)
+
+    def iter_financial_entry_ids(self, batch_size=1000):
+        ids = sorted(set(self.entry_ids))
+        for start in range(0, len(ids), batch_size):
+            yield ids[start:start + batch_size]
+
+
+def make_data():
+    entries = InMemoryEntries({
+        "e1": datetime(2026, 1, 5),
+        "e2": datetime(2026, 1, 20),
+        "e3": datetime(2026, 2, 1),
+    })
+    installments = InMemoryInstallments(["e1", "e1", "e1", "e3", "gone", "gone"])
+    return entries, installments
+
+
+class TestBulkDelete:
+
+    def test_delete_by_ids_cascades_to_installments(self):
+        entries, installments = make_data()
+
+        result = BulkDeleteFinancialEntries(entries, installments).execute(entry_ids=["e1", "e1", "e2"])
+
+        assert result == {"entries_deleted": 2, "installments_deleted": 3}
+        assert set(entries.dates) == {"e3"}
+
+    def test_delete_by_period(self):
+        entries, installments = make_data()
+
+        result = BulkDeleteFinancialEntries(entries, installments).execute(
+            start_date=datetime(2026, 2, 1), end_date=datetime(2026, 2, 28)
+        )
+
+        assert result == {"entries_deleted": 1, "installments_deleted": 1}
+
+    def test_requires_criteria(self):
+        entries, installments = make_data()
+
+        with pytest.raises(ValueError):
+            BulkDeleteFinancialEntries(entries, installments).execute()
+
+
+class TestPurgeOrphanInstallments:
+
+    def test_dry_run_then_purge(self):
+        entries, installments = make_data()
+        use_case = PurgeOrphanInstallments(entries, installments)
+
+        assert use_case.execute(batch_size=2, dry_run=True) == {
+            "entries_checked": 3, "orphan_entries": 1, "installments_deleted": 0
+        }
+        assert use_case.execute(batch_size=2)["installments_deleted"] == 2
+        assert "gone" not in installments.entry_ids
+
+
+class StandaloneSession:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def with_transaction(self, callback):
+        raise OperationFailure(
+            "Transaction numbers are only allowed on a replica set member or mongos", code=20
+        )
+
+
+class StandaloneClient:
+    def start_session(self):
+        return StandaloneSession()
+
+
+class TestTransactionRunner:
+
+    def test_falls_back_to_ordered_steps_without_replica_set(self, monkeypatch):
+        monkeypatch.setattr(MongoTransactionRunner, "_supported", None)
+        sessions = []
+
+        assert MongoTransactionRunner(StandaloneClient()).run(lambda s: sessions.append(s) or "ok") == "ok"
+        assert sessions == [None]
+        assert MongoTransactionRunner._supported is False
@@ -0,0 +1,72 @@
+"""
+Testes do calendário de contas a pagar
+
+Execute com: pytest tests/test_list_upcoming_accounts.py -v
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from src.application.use_cases import ListUpcomingAccounts
+from src.domain.entities import Account
+
+
+class FakeAccountRepository:
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.ranges = []
+
+    def find_unpaid_due_between(self, start_date, end_date):
+        self.ranges.append((start_date, end_date))
+        return sorted(
+            (a for a in self.accounts if not a.paid and start_date <= a.date <= end_date),
+            key=lambda a: a.date
+        )
+
+    def get_unpaid_summary_before(self, date):
+        overdue = [a for a in self.accounts if not a.paid and a.date < date]
+        return {"count": len(overdue), "total": sum(a.value for a in overdue)}
+
+
+def account(id, day, value, paid=False):
+    return Account(id=id, value=value, date=datetime.fromisoformat(day), description=id, type="boleto", paid=paid)
+
+
+ACCOUNTS = [
+    account("vencida", "2026-10-10", 50.0),
+    account("folha", "2026-10-20", 1000.0),
+    account("luz", "2026-10-20T15:00:00", 200.5),
+    account("paga", "2026-10-21", 300.0, paid=True),
+    account("aluguel", "2026-11-05", 2500.0),
+    account("fora", "2026-12-01", 10.0),
+]
+
+
+class TestListUpcomingAccounts:
+
+    def test_groups_unpaid_by_day(self):
+        result = ListUpcomingAccounts(FakeAccountRepository(ACCOUNTS)).execute(30, today=date(2026, 10, 19))
+
+        assert result["from"] == "2026-10-19"
+        assert result["to"] == "2026-11-17"
+        assert [(d["date"], d["count"], d["total"]) for d in result["days"]] == [
+            ("2026-10-20", 2, 1200.5),
+            ("2026-11-05", 1, 2500.0),
+        ]
+        assert result["total"] == 3700.5
+        assert result["overdue"] == {"count": 1, "total": 50.0}
+
+    def test_window_covers_whole_last_day(self):
+        repository = FakeAccountRepository(ACCOUNTS)
+
+        ListUpcomingAccounts(repository).execute(1, today=date(2026, 10, 20))
+
+        start, end = repository.ranges[0]
+        assert start == datetime(2026, 10, 20)
+        assert end.date() == date(2026, 10, 20) and end.hour == 23
+
+    @pytest.mark.parametrize("days", [0, 366])
+    def test_invalid_days(self, days):
+        with pytest.raises(ValueError):
+            ListUpcomingAccounts(FakeAccountRepository([])).execute(days)
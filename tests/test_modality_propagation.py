@@ -0,0 +1,277 @@
+"""
+Testes da propagação de nome/cor da modalidade para os lançamentos
+
+Execute com: pytest tests/test_modality_propagation.py -v
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.application.services.modality_propagation import ModalityPropagation
+from src.application.use_cases import ListFinancialEntries
+from src.domain.entities import FinancialEntry, PaymentModality
+
+
+class FakeCursor(list):
+    def sort(self, field, direction):
+        return FakeCursor(sorted(self, key=lambda d: d[field], reverse=direction < 0))
+
+    def limit(self, n):
+        return FakeCursor(self[:n])
+
+
+def matches(doc, query):
+    for field, cond in query.items():
+        if field == "$or":
+            if not any(matches(doc, q) for q in cond):
+                return False
+        elif isinstance(cond, dict):
+            value = doc.get(field)
+            if "$in" in cond and value not in cond["$in"]:
+                return False
+            if "$gt" in cond and not value > cond["$gt"]:
+                return False
+            if "$lt" in cond and (value is None or not value < cond["$lt"]):
+                return False
+            if "$lte" in cond and (value is None or not value <= cond["$lte"]):
+                return False
+            if "$ne" in cond and value == cond["$ne"]:
+                return False
+        elif doc.get(field) != cond:
+            return False
+    return True
+
+
+class FakeCollection:
+    """Subconjunto do pymongo.Collection usado pelo job"""
+
+    read_preference = None
+
+    def __init__(self, docs=(), name=None, database=None):
+        self.docs = {d["_id"]: dict(d) for d in docs}
+        self.update_many_calls = 0
+        self.name, self.database = name, database
+
+    def find(self, query=None, projection=None):
+        return FakeCursor(dict(d) for d in self.docs.values() if matches(d, query or {}))
+
+    def find_one(self, query):
+        found = self.find(query)
+        return found[0] if found else None
+
+    def update_many(self, query, update):
+        self.update_many_calls += 1
+        modified = 0
+        for doc in self.docs.values():
+            if matches(doc, query):
+                doc.update(update["$set"])
+                modified += 1
+        return SimpleNamespace(modified_count=modified)
+
+    def update_one(self, query, update):
+        doc = self.find_one(query)
+        if doc is None:
+            return SimpleNamespace(matched_count=0)
+        stored = self.docs[doc["_id"]]
+        stored.update(update.get("$set", {}))
+        for field, inc in update.get("$inc", {}).items():
+            stored[field] = stored.get(field, 0) + inc
+        return SimpleNamespace(matched_count=1)
+
+    def find_one_and_update(self, query, update, upsert=False, return_document=None):
+        doc = self.find_one(query)
+        if doc is None:
+            if not upsert:
+                return None
+            self.docs[query["_id"]] = {"_id": query["_id"]}
+        key = doc["_id"] if doc else query["_id"]
+        self.docs[key].update(update["$set"])
+        return dict(self.docs[key])
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        self[name] = FakeCollection(name=name, database=self)
+        return self[name]
+
+    def get_collection(self, name, read_preference=None):
+        return self[name]
+
+
+def make_db(entry_count=7):
+    db = FakeDatabase()
+    db["financial_entries"].docs = {
+        f"e{n:02d}": {"_id": f"e{n:02d}", "modality_id": "pix" if n % 2 == 0 else "cash",
+                      "modality_name": "Pix", "modality_color": "#00C853"}
+        for n in range(entry_count)
+    }
+    return db
+
+
+RENAMED = PaymentModality(name="Pix Sicredi", color="#123456", id="pix")
+
+
+class TestModalityPropagation:
+
+    def test_updates_only_entries_of_the_modality_in_batches(self):
+        db = make_db()
+        finished = []
+        job = ModalityPropagation(db, on_finished=lambda: finished.append(True), batch_size=2)
+
+        job.start(RENAMED, background=False)
+
+        entries = db["financial_entries"].docs.values()
+        assert all(e["modality_name"] == "Pix Sicredi" for e in entries if e["modality_id"] == "pix")
+        assert all(e["modality_name"] == "Pix" for e in entries if e["modality_id"] == "cash")
+        assert db["financial_entries"].update_many_calls == 2
+        assert finished == [True]
+
+        status = job.find_job("pix")
+        assert status["status"] == "completed"
+        assert status["updated"] == 4
+        assert status["last_id"] == "e06"
+
+    def test_resumes_stale_job_from_last_id(self):
+        db = make_db()
+        db[ModalityPropagation.COLLECTION].docs["pix"] = {
+            "_id": "pix", "status": "running", "name": "Pix Sicredi", "color": "#123456",
+            "run_id": "old-run", "last_id": "e02", "updated": 2,
+            "heartbeat_at": "2000-01-01T00:00:00",
+        }
+        job = ModalityPropagation(db)
+        job._launch = lambda claimed, background: job.run(claimed)
+
+        assert job.resume_stale() == 1
+
+        entries = db["financial_entries"].docs
+        assert entries["e00"]["modality_name"] == "Pix"  # antes de last_id: já processado
+        assert entries["e04"]["modality_name"] == "Pix Sicredi"
+        assert job.find_job("pix")["updated"] == 4
+
+    def test_pending_lists_unfinished_jobs(self):
+        db = make_db()
+        job = ModalityPropagation(db)
+        job._launch = lambda claimed, background: None
+        job.start(RENAMED)
+
+        assert job.pending() == {"pix": {"name": "Pix Sicredi", "color": "#123456"}}
+
+
+    def test_updates_archived_entries_and_resumes_per_collection(self):
+        db = make_db()
+        db["archive_catalog"].docs["financial_entries"] = {"_id": "financial_entries", "years": [2023]}
+        db["financial_entries_archive_2023"].docs = {
+            "a1": {"_id": "a1", "modality_id": "pix", "modality_name": "Pix", "modality_color": "#00C853"},
+            "a2": {"_id": "a2", "modality_id": "pix", "modality_name": "Pix", "modality_color": "#00C853"},
+        }
+        # Job que caiu no meio do arquivo: a1 já foi processado
+        db[ModalityPropagation.COLLECTION].docs["pix"] = {
+            "_id": "pix", "status": "running", "name": "Pix Sicredi", "color": "#123456",
+            "run_id": "old-run", "collection": "financial_entries_archive_2023", "last_id": "a1",
+            "updated": 5, "heartbeat_at": "2000-01-01T00:00:00",
+        }
+        job = ModalityPropagation(db)
+        job._launch = lambda claimed, background: job.run(claimed)
+
+        assert job.resume_stale() == 1
+
+        archived = db["financial_entries_archive_2023"].docs
+        assert archived["a1"]["modality_name"] == "Pix"
+        assert archived["a2"]["modality_name"] == "Pix Sicredi"
+        assert db["financial_entries"].docs["e00"]["modality_name"] == "Pix"  # coleção principal já feita
+        assert job.find_job("pix")["status"] == "completed"
+
+        job.start(RENAMED, background=False)
+        assert archived["a1"]["modality_name"] == "Pix Sicredi"
+        assert job.find_job("pix")["updated"] == 5
+
+    def test_failed_job_is_retried_with_backoff(self):
+        db = make_db()
+        job = ModalityPropagation(db, batch_size=2)
+        job._launch = lambda claimed, background: job.run(claimed)
+        update_many = db["financial_entries"].update_many
+        db["financial_entries"].update_many = lambda query, update: (_ for _ in ()).throw(RuntimeError("rede"))
+
+        job.start(RENAMED)
+
+        failed = db[ModalityPropagation.COLLECTION].docs["pix"]
+        assert failed["status"] == "failed"
+        assert failed["attempts"] == 1
+        assert failed["retry_at"] > datetime.now().isoformat()
+        assert job.resume_stale() == 0  # ainda dentro da espera
+
+        db["financial_entries"].update_many = update_many
+        failed["retry_at"] = "2000-01-01T00:00:00"
+        assert job.resume_stale() == 1
+        assert job.find_job("pix")["status"] == "completed"
+        assert job.pending() == {}
+
+    def test_gives_up_after_max_attempts_until_restart(self):
+        db = make_db()
+        db[ModalityPropagation.COLLECTION].docs["pix"] = {
+            "_id": "pix", "status": "running", "name": "Pix Sicredi", "color": "#123456",
+            "run_id": "run", "last_id": "e02", "updated": 2, "heartbeat_at": datetime.now().isoformat(),
+            "attempts": ModalityPropagation.MAX_ATTEMPTS - 1,
+        }
+        job = ModalityPropagation(db)
+        db["financial_entries"].find = lambda *args: (_ for _ in ()).throw(RuntimeError("rede"))
+        job.run(dict(db[ModalityPropagation.COLLECTION].docs["pix"]))
+
+        assert db[ModalityPropagation.COLLECTION].docs["pix"]["retry_at"] is None
+        assert job.resume_stale() == 0
+
+        del db["financial_entries"].find
+        job.restart("pix", background=False)
+
+        status = job.find_job("pix")
+        assert status["status"] == "completed"
+        assert status["attempts"] == 0
+        assert status["updated"] == 4  # continuou de last_id
+
+    def test_restart_rejects_running_or_unknown_job(self):
+        db = make_db()
+        job = ModalityPropagation(db)
+        job._launch = lambda claimed, background: None
+        job.start(RENAMED)
+
+        with pytest.raises(ValueError):
+            job.restart("pix")
+        with pytest.raises(ValueError):
+            job.restart("cash")
+
+
+class TestListFinancialEntriesOverlay:
+
+    def test_overlays_current_modality_name(self):
+        entries = [
+            FinancialEntry(value=10.0, date=datetime(2026, 1, 1), modality_id=modality_id,
+                           modality_name="Pix", modality_color="#00C853", id=modality_id)
+            for modality_id in ("pix", "cash")
+        ]
+        repository = SimpleNamespace(find_all=lambda: entries)
+        overlay = lambda: {"pix": {"name": "Pix Sicredi", "color": "#123456"}}
+
+        result = ListFinancialEntries(repository, overlay).execute()
+
+        assert [(e.modality_name, e.modality_color) for e in result] == [
+            ("Pix Sicredi", "#123456"), ("Pix", "#00C853")
+        ]
+
+
+class TestResumeStaleThrottled:
+
+    def test_runs_at_most_once_per_interval_outside_the_cache(self, monkeypatch):
+        from src.application.services import modality_propagation
+
+        calls = []
+        monkeypatch.setattr(modality_propagation, "_resumed_at", {})
+        monkeypatch.setattr("src.database.get_tenant_db", lambda company_id: make_db())
+        monkeypatch.setattr(ModalityPropagation, "resume_stale", lambda self: calls.append(True) or 0)
+
+        modality_propagation.resume_stale_throttled("c1")
+        modality_propagation.resume_stale_throttled("c1")
+        modality_propagation.resume_stale_throttled("c2")
+
+        assert len(calls) == 2
@@ -0,0 +1,152 @@
+"""
+Testes do relatório de faturamento da plataforma (todas as empresas)
+
+Execute com: pytest tests/test_platform_revenue_report.py -v
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from src.application.use_cases.admin import PlatformRevenueReport
+from src.domain.entities import Company
+
+
+def company(company_id):
+    return Company(name=f"Loja {company_id}", cnpj=company_id, phone="", id=company_id, db_name=f"db_{company_id}")
+
+
+class FakeCompanies:
+    def __init__(self, companies):
+        self.companies = companies
+
+    def find_all(self, only_active=True):
+        return self.companies
+
+
+class FakeEntries:
+    name = "financial_entries"
+    read_preference = None
+
+    def __init__(self, rows, gate=None, error=None, archived=None):
+        self.rows, self.gate, self.error = rows, gate, error
+        self.max_time_ms = None
+        self.database = FakeTenantDb(self, archived or {})
+
+    def aggregate(self, pipeline, maxTimeMS=None):
+        self.max_time_ms = maxTimeMS
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.error:
+            raise self.error
+        return [
+            {"_id": {"month": month, "modality": modality}, "total": total, "count": count}
+            for month, modality, total, count in self.rows
+        ]
+
+
+class FakeCatalog:
+    def __init__(self, years):
+        self.years = years
+
+    def find_one(self, query):
+        return {"_id": query["_id"], "years": self.years} if self.years else None
+
+
+class FakeTenantDb:
+    """Banco da empresa: coleção quente, catálogo e arquivos por ano ({ano: FakeEntries})"""
+
+    def __init__(self, entries, archived):
+        self.entries, self.archived = entries, archived
+
+    def __getitem__(self, name):
+        if name == "archive_catalog":
+            return FakeCatalog(sorted(self.archived))
+        return self.entries
+
+    def get_collection(self, name, read_preference=None):
+        return self.archived[int(name.rsplit("_", 1)[1])]
+
+
+def make_report(entries_by_db, **kwargs):
+    companies = [company(db[3:]) for db in entries_by_db]
+    resolver = lambda c: {"financial_entries": entries_by_db[c.db_name]}
+    return PlatformRevenueReport(FakeCompanies(companies), resolver, executor=ThreadPoolExecutor(4), **kwargs)
+
+
+START, END = datetime(2026, 1, 1), datetime(2026, 3, 31, 23, 59, 59)
+
+
+class TestPlatformRevenueReport:
+
+    def test_merges_tenants_into_platform_totals(self):
+        report = make_report({
+            "db_a": FakeEntries([("2026-01", "Pix", 100.0, 2), ("2026-02", "Dinheiro", 50.0, 1)]),
+            "db_b": FakeEntries([("2026-01", "Pix", 25.5, 1), ("2026-01", None, 10.0, 1)]),
+        })
+
+        events = list(report.stream(START, END))
+
+        tenants = {e["company_id"]: e for e in events if e["type"] == "tenant"}
+        assert tenants["a"]["total"] == 150.0
+        assert tenants["b"]["by_modality"] == {"Pix": 25.5, "Sem modalidade": 10.0}
+
+        summary = events[-1]
+        assert summary["type"] == "summary"
+        assert summary["platform"]["total"] == 185.5
+        assert summary["platform"]["count"] == 5
+        assert summary["platform"]["by_month"] == {"2026-01": 135.5, "2026-02": 50.0}
+        assert summary["platform"]["by_modality"] == {"Pix": 125.5, "Dinheiro": 50.0, "Sem modalidade": 10.0}
+        assert summary["tenants"] == {"ok": 2}
+
+    def test_slow_tenant_does_not_block_the_others(self):
+        gate = threading.Event()
+        report = make_report({
+            "db_slow": FakeEntries([("2026-01", "Pix", 1.0, 1)], gate=gate),
+            "db_fast": FakeEntries([("2026-01", "Pix", 2.0, 1)]),
+        })
+
+        events = report.stream(START, END)
+        first = next(events)
+        gate.set()
+        rest = list(events)
+
+        assert first["company_id"] == "fast"
+        assert rest[0]["company_id"] == "slow"
+        assert rest[-1]["platform"]["total"] == 3.0
+
+    def test_timeouts_and_errors_are_reported_per_tenant(self):
+        gate = threading.Event()
+        report = make_report({
+            "db_ok": FakeEntries([("2026-01", "Pix", 5.0, 1)]),
+            "db_err": FakeEntries([], error=RuntimeError("falhou")),
+            "db_hung": FakeEntries([], gate=gate),
+        }, tenant_timeout=2, total_timeout=0.2)
+
+        events = list(report.stream(START, END))
+        gate.set()
+
+        status = {e["company_id"]: e["status"] for e in events if e["type"] == "tenant"}
+        assert status == {"ok": "ok", "err": "error", "hung": "timeout"}
+        assert events[-1]["platform"]["total"] == 5.0
+        assert events[-1]["tenants"] == {"ok": 1, "error": 1, "timeout": 1}
+
+    def test_includes_archived_years_in_range(self):
+        archived_2025 = FakeEntries([("2025-12", "Pix", 40.0, 2)])
+        archived_2024 = FakeEntries([("2024-06", "Pix", 999.0, 9)])
+        report = make_report({
+            "db_a": FakeEntries([("2026-01", "Pix", 10.0, 1)], archived={2024: archived_2024, 2025: archived_2025}),
+        })
+
+        events = list(report.stream(datetime(2025, 12, 1), END))
+
+        # 2024 fica fora do período: o arquivo dele nem é consultado
+        assert events[-1]["platform"]["total"] == 50.0
+        assert events[-1]["platform"]["by_month"] == {"2025-12": 40.0, "2026-01": 10.0}
+        assert archived_2024.max_time_ms is None
+
+    def test_invalid_range(self):
+        with pytest.raises(ValueError):
+            next(make_report({}).stream(END, START))
@@ -0,0 +1,48 @@
+"""
+Testes da política de leitura por endpoint
+
+Execute com: pytest tests/test_read_policy.py -v
+"""
+
+import pytest
+from pymongo import MongoClient
+from pymongo.read_preferences import Primary, SecondaryPreferred
+
+from src.database import ANALYTICS, PRIMARY, ReadPolicy
+
+# Cliente sem conexão: with_options não acessa o servidor
+client = MongoClient("mongodb://localhost:27017", connect=False)
+
+
+class TestReadPolicy:
+
+    def test_analytics_reads_from_secondary_with_bounded_staleness(self):
+        db = ReadPolicy(max_staleness=120).apply(client["tenant"], "dashboard.snapshot", ANALYTICS)
+
+        assert db.read_preference == SecondaryPreferred(max_staleness=120)
+        # Coleções herdam a preferência do banco
+        assert db["financial_entries"].read_preference == SecondaryPreferred(max_staleness=120)
+
+    def test_primary_keeps_original_target(self):
+        db = client["tenant"]
+
+        assert ReadPolicy().apply(db, "financial_entries.list", PRIMARY) is db
+
+    def test_override_per_endpoint(self):
+        policy = ReadPolicy(overrides={"dashboard.snapshot": "primary", "admin.dashboard": "nearest"})
+
+        assert policy.read_preference("dashboard.snapshot", ANALYTICS) == Primary()
+        assert policy.read_preference("admin.dashboard", ANALYTICS).mongos_mode == "nearest"
+        assert policy.read_preference("installments.daily_summary", ANALYTICS).mongos_mode == "secondaryPreferred"
+
+    def test_disabled_forces_primary(self):
+        policy = ReadPolicy(enabled=False)
+
+        assert policy.read_preference("dashboard.snapshot", ANALYTICS) == Primary()
+
+    def test_staleness_below_server_minimum_is_raised(self):
+        assert ReadPolicy(max_staleness=10).read_preference("x", ANALYTICS).max_staleness == 90
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            ReadPolicy(overrides={"x": "fastest"}).read_preference("x")
@@ -0,0 +1,146 @@
+"""
+Testes da previsão de vendas por modalidade (tendência + sazonalidade semanal)
+
+Execute com: pytest tests/test_sales_forecast.py -v
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.application.services.sales_forecast import ForecastCache, SalesForecaster, SeasonalTrendModel
+
+TODAY = date(2026, 3, 2)  # segunda-feira
+
+
+def weekday_sales(day: date) -> float:
+    # Sábado vende o dobro; crescimento de 1 por dia
+    return (200.0 if day.weekday() == 5 else 100.0) + (day - date(2026, 1, 1)).days
+
+
+class FakeRepository:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def get_daily_sales_by_modality(self, start_date, end_date):
+        self.calls.append((start_date.date(), end_date.date()))
+        return [
+            row for row in self.rows
+            if start_date.date().isoformat() <= row["day"] <= end_date.date().isoformat()
+        ]
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = {}
+
+    def find_one(self, query):
+        return self.docs.get(query["_id"])
+
+    def replace_one(self, query, doc, upsert=False):
+        self.docs[query["_id"]] = doc
+
+
+def history(start: date, end: date):
+    rows = []
+    day = start
+    while day <= end:
+        if day.weekday() != 6:
+            rows.append({"day": day.isoformat(), "modality_id": "m1", "modality_name": "Pix", "total": weekday_sales(day)})
+        day += timedelta(days=1)
+    return rows
+
+
+class TestSeasonalTrendModel:
+
+    def test_incremental_fit_matches_batch(self):
+        days = [date(2026, 1, 1) + timedelta(days=i) for i in range(60)]
+        days = [d for d in days if d.weekday() != 6]
+        ordinals = [d.toordinal() for d in days]
+        values = np.random.default_rng(1).normal(100, 10, len(days)).tolist()
+
+        batch = SeasonalTrendModel(range(6), ordinals[0])
+        batch.add(ordinals, values)
+        incremental = SeasonalTrendModel(range(6), ordinals[0])
+        incremental.add(ordinals[:20], values[:20])
+        incremental = SeasonalTrendModel.from_dict(incremental.to_dict())
+        incremental.add(ordinals[20:], values[20:])
+
+        assert incremental.predict(ordinals[-3:]) == batch.predict(ordinals[-3:])
+
+    def test_recovers_weekday_and_trend(self):
+        days = [d for d in (date(2026, 1, 1) + timedelta(days=i) for i in range(90)) if d.weekday() != 6]
+        model = SeasonalTrendModel(range(6), days[0].toordinal())
+        model.add([d.toordinal() for d in days], [weekday_sales(d) for d in days])
+
+        saturday = date(2026, 4, 4)
+        point, lower, upper = model.predict([saturday.toordinal()])[0]
+        assert point == pytest.approx(weekday_sales(saturday), abs=0.01)
+        assert lower <= point <= upper
+
+    def test_insufficient_history(self):
+        model = SeasonalTrendModel(range(6), date(2026, 1, 1).toordinal())
+        model.add([date(2026, 1, 1).toordinal()], [10.0])
+
+        with pytest.raises(ValueError):
+            model.predict([date(2026, 1, 2).toordinal()])
+
+
+class TestSalesForecaster:
+
+    def test_forecast_skips_closed_days(self):
+        repository = FakeRepository(history(date(2025, 12, 1), TODAY - timedelta(days=1)))
+        forecaster = SalesForecaster(repository, FakeCollection(), history_days=90)
+
+        result = forecaster.forecast(TODAY, horizon=14)
+
+        modality = result["modalities"][0]
+        assert modality["status"] == "ok"
+        assert len(modality["days"]) == 12
+        assert all(date.fromisoformat(d["date"]).weekday() != 6 for d in modality["days"])
+        assert result["fitted_until"] == "2026-03-01"
+
+    def test_incremental_update_reads_only_new_days(self):
+        repository = FakeRepository(history(date(2025, 12, 1), TODAY + timedelta(days=1)))
+        collection = FakeCollection()
+        forecaster = SalesForecaster(repository, collection, history_days=90, full_refit_days=7)
+
+        forecaster.fit(TODAY)
+        forecaster.fit(TODAY)
+        forecaster.fit(TODAY + timedelta(days=2))
+
+        assert repository.calls[-1] == (TODAY, TODAY + timedelta(days=1))
+        assert len(repository.calls) == 2
+        assert collection.docs["sales"]["last_day"] == (TODAY + timedelta(days=1)).isoformat()
+
+    def test_full_refit_after_interval(self):
+        repository = FakeRepository(history(date(2025, 12, 1), TODAY))
+        forecaster = SalesForecaster(repository, FakeCollection(), history_days=90, full_refit_days=7)
+
+        forecaster.fit(TODAY)
+        forecaster.fit(TODAY + timedelta(days=7))
+
+        assert repository.calls[-1][0] == TODAY + timedelta(days=7) - timedelta(days=90)
+
+    def test_invalid_horizon(self):
+        forecaster = SalesForecaster(FakeRepository([]), FakeCollection())
+
+        with pytest.raises(ValueError):
+            forecaster.forecast(TODAY, horizon=0)
+
+
+def test_cache_computes_once_per_day():
+    cache = ForecastCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"ok": True}
+
+    cache.get_or_compute("c1", TODAY, 30, compute)
+    cache.get_or_compute("c1", TODAY, 30, compute)
+    cache.get_or_compute("c1", TODAY + timedelta(days=1), 30, compute)
+
+    assert len(calls) == 2
@@ -0,0 +1,93 @@
+"""
+Testes da busca textual (ranking, paginação e limites)
+
+Execute com: pytest tests/test_search_records.py -v
+"""
+
+import pytest
+
+from src.application.use_cases import SearchRecords
+from src.infra.repositories.mongo_search_repository import SOURCES, ensure_text_indexes
+
+
+class FakeSearchRepository:
+    def __init__(self, results_by_kind):
+        self.results_by_kind = results_by_kind
+        self.calls = []
+
+    def search(self, query, kinds, limit):
+        self.calls.append((query, kinds, limit))
+        results = []
+        for kind in kinds:
+            ranked = sorted(self.results_by_kind.get(kind, []), key=lambda r: -r["score"])
+            results.extend(dict(r, kind=kind) for r in ranked[:limit])
+        return results
+
+
+def result(id, score, date=None):
+    return {"id": id, "title": id, "subtitle": None, "date": date, "value": None, "score": score}
+
+
+class TestSearchRecords:
+
+    def test_merges_kinds_by_relevance(self):
+        repository = FakeSearchRepository({
+            "account": [result("folha", 2.0, "2026-01-05"), result("boleto", 0.5)],
+            "payment_modality": [result("sicredi", 1.0)],
+        })
+
+        page = SearchRecords(repository).execute("  folha   pagamento ", page_size=2)
+
+        assert page["query"] == "folha pagamento"
+        assert [r["id"] for r in page["results"]] == ["folha", "sicredi"]
+        assert page["has_more"] is True
+        assert repository.calls[0][2] == 3
+
+    def test_ties_show_recent_first(self):
+        repository = FakeSearchRepository({
+            "financial_entry": [result("old", 1.0, "2025-01-01"), result("new", 1.0, "2026-01-01")],
+        })
+
+        page = SearchRecords(repository).execute("pix")
+
+        assert [r["id"] for r in page["results"]] == ["new", "old"]
+
+    def test_second_page(self):
+        repository = FakeSearchRepository({"account": [result(f"a{i}", 10 - i) for i in range(5)]})
+
+        page = SearchRecords(repository).execute("conta", page=2, page_size=2)
+
+        assert [r["id"] for r in page["results"]] == ["a2", "a3"]
+        assert page["has_more"] is True
+
+    @pytest.mark.parametrize("kwargs", [
+        {"query": "a"},
+        {"query": "folha", "page": 0},
+        {"query": "folha", "page_size": 51},
+        {"query": "folha", "kinds": ["users"]},
+        {"query": "folha", "page": 11, "page_size": 20},
+    ])
+    def test_invalid_parameters(self, kwargs):
+        with pytest.raises(ValueError):
+            SearchRecords(FakeSearchRepository({})).execute(**kwargs)
+
+
+def test_text_indexes_use_portuguese():
+    created = []
+
+    class Collection:
+        def __init__(self, name):
+            self.name = name
+
+        def create_index(self, keys, **options):
+            created.append((self.name, keys, options))
+
+    class Database(dict):
+        def __missing__(self, name):
+            return Collection(name)
+
+    ensure_text_indexes(Database())
+
+    assert {name for name, _, _ in created} == {s.collection for s in SOURCES.values()}
+    assert all(options["default_language"] == "portuguese" for _, _, options in created)
+    assert ("accounts", [("description", "text")]) in [(n, k) for n, k, _ in created]
@@ -0,0 +1,203 @@
+"""
+Testes do single-flight de leituras caras por empresa
+
+Execute com: pytest tests/test_single_flight.py -v
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from flask import Flask, g
+
+from src.application.use_cases.get_daily_credit_summary import GetDailyCreditSummary
+from src.domain.entities import Installment
+from src.infra.cache import SingleFlight
+from src.infra.cache import single_flight as single_flight_module
+from src.presentation.middlewares import request_coalescing
+from src.presentation.middlewares.request_coalescing import coalesced_tenant_read
+
+
+class CountingInstallmentRepository:
+    """Repositório falso que conta quantas vezes a varredura completa roda"""
+
+    def __init__(self, delay: float = 0.2):
+        self.calls = 0
+        self._delay = delay
+        self._lock = threading.Lock()
+
+    def find_all(self):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self._delay)
+        return [
+            Installment(
+                financial_entry_id="entry-1",
+                installment_number=1,
+                total_installments=1,
+                amount=100.0,
+                due_date=datetime(2026, 1, 10),
+            )
+        ]
+
+
+class EmptyEntryRepository:
+    def find_all(self):
+        return []
+
+    def find_by_date_range(self, start_date, end_date):
+        return []
+
+
+def run_concurrently(n, target):
+    barrier = threading.Barrier(n)
+    results = [None] * n
+    errors = []
+
+    def worker(i):
+        try:
+            barrier.wait()
+            results[i] = target(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+class FakeWriteVersion:
+    """Versão de escrita em memória (sem banco)"""
+
+    def __init__(self):
+        self.versions = {}
+
+    def current(self, company_id):
+        return self.versions.get(company_id, 0)
+
+    def bump(self, company_id):
+        previous = self.current(company_id)
+        self.versions[company_id] = previous + 1
+        return previous, previous + 1
+
+
+@pytest.fixture
+def write_version(monkeypatch):
+    fake = FakeWriteVersion()
+    monkeypatch.setattr(request_coalescing, "get_tenant_write_version", lambda: fake)
+    return fake
+
+
+class TestSingleFlight:
+
+    def test_concurrent_identical_calls_run_one_aggregation(self):
+        """N chamadas concorrentes idênticas executam uma única varredura"""
+        installment_repo = CountingInstallmentRepository()
+        use_case = GetDailyCreditSummary(installment_repo, EmptyEntryRepository())
+        single_flight = SingleFlight()
+
+        key = ("company-1", "installments.daily_summary", ())
+        results, errors = run_concurrently(
+            16, lambda i: single_flight.do(key, lambda: use_case.execute())
+        )
+
+        assert not errors
+        assert installment_repo.calls == 1
+        assert all(r == results[0] for r in results)
+        assert results[0][0]["total_receivable"] == 100.0
+
+    def test_different_keys_are_not_coalesced(self):
+        installment_repo = CountingInstallmentRepository(delay=0.05)
+        use_case = GetDailyCreditSummary(installment_repo, EmptyEntryRepository())
+        single_flight = SingleFlight()
+
+        run_concurrently(
+            4, lambda i: single_flight.do(("company-%d" % i, "summary", ()), use_case.execute)
+        )
+
+        assert installment_repo.calls == 4
+
+    def test_error_is_shared_and_not_cached(self):
+        single_flight = SingleFlight(cache_ttl=60)
+        calls = []
+
+        def failing():
+            calls.append(1)
+            time.sleep(0.1)
+            raise RuntimeError("falha no banco")
+
+        results, errors = run_concurrently(8, lambda i: single_flight.do("key", failing))
+
+        assert len(calls) == 1
+        assert len(errors) == 8
+        assert single_flight.do("key", lambda: "ok") == "ok"
+
+    def test_micro_cache_is_invalidated_by_write_version(self):
+        single_flight = SingleFlight(cache_ttl=60)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        assert single_flight.do("key", compute, version=1) == 1
+        assert single_flight.do("key", compute, version=1) == 1
+        assert single_flight.do("key", compute, version=2) == 2
+        assert len(calls) == 2
+
+    def test_request_helper_normalizes_query_args(self, monkeypatch, write_version):
+        """A ordem dos query params não cria chaves diferentes"""
+        monkeypatch.setattr(single_flight_module, "_single_flight", SingleFlight())
+        installment_repo = CountingInstallmentRepository()
+        use_case = GetDailyCreditSummary(installment_repo, EmptyEntryRepository())
+        app = Flask(__name__)
+        urls = [
+            "/api/installments/daily-summary?start_date=2026-01-01&end_date=2026-01-31",
+            "/api/installments/daily-summary?end_date=2026-01-31&start_date=2026-01-01",
+        ]
+
+        def call(i):
+            with app.test_request_context(urls[i % 2]):
+                g.company_id = "company-1"
+                return coalesced_tenant_read("installments.daily_summary", use_case.execute)
+
+        results, errors = run_concurrently(10, call)
+
+        assert not errors
+        assert installment_repo.calls == 1
+
+    def test_read_after_own_write_does_not_join_older_computation(self, monkeypatch, write_version):
+        """Sem micro-cache, a versão de escrita ainda separa as computações"""
+        monkeypatch.setattr(single_flight_module, "_single_flight", SingleFlight())
+        app = Flask(__name__)
+        started, release = threading.Event(), threading.Event()
+        seen = []
+
+        def slow_compute():
+            started.set()
+            release.wait(5)
+            return "antes da escrita"
+
+        def read(compute):
+            with app.test_request_context("/api/installments/daily-summary"):
+                g.company_id = "company-1"
+                seen.append(coalesced_tenant_read("installments.daily_summary", compute))
+
+        before = threading.Thread(target=read, args=(slow_compute,))
+        before.start()
+        started.wait(5)
+
+        write_version.bump("company-1")
+        read(lambda: "depois da escrita")
+        release.set()
+        before.join(5)
+
+        assert seen == ["depois da escrita", "antes da escrita"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
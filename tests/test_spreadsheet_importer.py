@@ -0,0 +1,205 @@
+"""
+Testes do parse das planilhas financeiras (CSV)
+
+Execute com: pytest tests/test_spreadsheet_importer.py -v
+"""
+
+import csv
+import io
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.application.importers import SHEET_PARSERS, ImportPipeline, SheetContext, detect_sheet_type, parse_sheet
+from src.application.importers.bulk_writer import BulkImportWriter
+from src.application.importers.parsing import parse_brl, parse_percent, year_from_filename
+
+
+MODALITIES = {
+    "pix sicredi": {"id": "pix", "name": "Pix Sicredi", "color": "#00C853", "is_credit_plan": False},
+    "debito sicoob": {"id": "deb", "name": "Débito Sicoob", "color": "#03A9F4", "is_credit_plan": False},
+}
+
+VENDAS_CSV = """Vendas* do mês ,"R$ 400,00",,,
+01/12/2025,Modalidade,02/12/2025,Modalidade,Dia,Modalidade
+,,,,,
+"R$ 100,00",,"R$ 300,00",,"R$ 0,00",
+"R$ 50,00",Pix Sicredi,"R$ 300,00",Debito Sicoob,,
+"R$ 50,00",Pix Sicredi,,,,
+"""
+
+DESPESAS_CSV = """Janeiro,,,,fevereiro,,,
+"R$ 980,00",,,,"R$ 0,00",,,
+2,Diarista,"R$ 480,00",Pago,,,,
+,Aluguel,"R$ 500,00",Em aberto,,,,
+,,,Em aberto,,,,
+"""
+
+
+def parse(sheet_type, content, year=None):
+    ctx = SheetContext(sheet_type=sheet_type, year=year, modalities=MODALITIES)
+    records = [r for chunk in SHEET_PARSERS[sheet_type](csv.reader(io.StringIO(content)), ctx) for r in chunk]
+    return records, ctx
+
+
+class TestParsing:
+
+    def test_parse_brl_handles_quoted_thousands_and_negatives(self):
+        values = parse_brl(["R$ 1.234,56", "-R$ 4.037,61", "72,72", "", "-"])
+
+        assert values[:3].tolist() == [1234.56, -4037.61, 72.72]
+        assert np.isnan(values[3:]).all()
+
+    def test_parse_percent(self):
+        assert parse_percent(["1,94%", "-", "0,0082%"]).tolist() == [1.94, 0.0, 0.0082]
+
+    def test_sheet_type_and_year_from_filename(self):
+        assert detect_sheet_type("Cópia de Financeiro - Crediário 2025.csv") == "crediario"
+        assert year_from_filename("Vendas Dezembro_25.csv") == 2025
+        with pytest.raises(ValueError):
+            detect_sheet_type("planilha.csv")
+
+
+class TestSheets:
+
+    def test_vendas_keys_are_deterministic_and_distinguish_repeated_sales(self):
+        records, ctx = parse("vendas", VENDAS_CSV)
+        again, _ = parse("vendas", VENDAS_CSV)
+
+        assert ctx.scope == "vendas:2025-12"
+        assert [r.value for r in records] == [50.0, 300.0, 50.0]
+        assert len({r.key for r in records}) == 3
+        assert [r.key for r in records] == [r.key for r in again]
+        assert records[1].fields["modality_name"] == "Débito Sicoob"
+
+    def test_unknown_modality_is_reported(self):
+        records, ctx = parse("vendas", VENDAS_CSV.replace("Debito Sicoob", "Cheque"))
+
+        assert len(records) == 2
+        assert ctx.errors == ["Modalidade não encontrada: Cheque"]
+
+    def test_despesas_carry_day_and_status(self):
+        records, ctx = parse("despesas", DESPESAS_CSV, year=2026)
+
+        assert ctx.scope == "despesas:2026"
+        assert [(r.fields["description"], r.fields["date"][:10], r.fields["paid"]) for r in records] == [
+            ("Diarista", "2026-01-02", True),
+            ("Aluguel", "2026-01-02", False),
+        ]
+
+    def test_grid_sheet_requires_year(self):
+        with pytest.raises(ValueError):
+            parse("despesas", DESPESAS_CSV)
+
+
+class RecordingTracker:
+    def __init__(self):
+        self.files = {}
+        self.status = None
+
+    def create(self, job_id, filenames):
+        self.files = {i: "queued" for i in range(len(filenames))}
+
+    def update_file(self, job_id, index, status, stats=None, error=None):
+        self.files[index] = status
+
+    def finish(self, job_id, status):
+        self.status = status
+
+
+class FakeImporter:
+    def modalities(self):
+        return MODALITIES
+
+    def write(self, parsed):
+        return {"file": parsed.filename, "inserted": parsed.record_count}
+
+
+class TestImportPipeline:
+
+    def test_parse_sheet_accepts_bytes_and_result_is_picklable(self):
+        parsed = parse_sheet(VENDAS_CSV.encode("utf-8"), "Vendas Dezembro_25.csv", modalities=MODALITIES)
+
+        assert parsed.scope == "vendas:2025-12"
+        assert parsed.record_count == 3
+        assert pickle.loads(pickle.dumps(parsed)).record_count == 3
+
+    def test_files_are_parsed_in_parallel_and_errors_reported_per_file(self):
+        tracker = RecordingTracker()
+        written = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pipeline = ImportPipeline(
+                tenant_db=None, executor=executor, tracker=tracker, on_written=lambda: written.append(True)
+            )
+            pipeline._importer = FakeImporter()
+            results = pipeline.run([
+                (VENDAS_CSV.encode("utf-8"), "Vendas Dezembro_25.csv"),
+                (b"a,b\n", "Vendas Janeiro_26.csv"),
+                (DESPESAS_CSV.encode("utf-8"), "Despesas 2026.csv"),
+            ])
+
+        assert [r["file"] for r in results] == ["Vendas Dezembro_25.csv", "Vendas Janeiro_26.csv", "Despesas 2026.csv"]
+        assert results[0]["inserted"] == 3
+        assert "error" in results[1]
+        assert tracker.files == {0: "done", 1: "error", 2: "done"}
+        assert tracker.status == "completed_with_errors"
+        assert written == [True]
+
+
+EMPRESTIMOS_CSV = """Banco,Valor contratado,Saldo devedor,Modalidade,Prazo,CET,Objetivo
+Sicredi,"R$ 12.000,00","R$ 9.000,00",Capital de giro,12,"1,50%",Estoque
+"""
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection=None):
+        return [d for d in self.docs if self._matches(d, query)]
+
+    def delete_many(self, query):
+        removed = self.find(query)
+        self.docs[:] = [d for d in self.docs if d not in removed]
+        return SimpleNamespace(deleted_count=len(removed))
+
+    @staticmethod
+    def _matches(doc, query):
+        for field, cond in query.items():
+            value = doc.get(field)
+            if isinstance(cond, dict):
+                if "$in" in cond and value not in cond["$in"]:
+                    return False
+                if "$nin" in cond and value in cond["$nin"]:
+                    return False
+            elif value != cond:
+                return False
+        return True
+
+
+class TestLoanImport:
+
+    def test_loan_terms_are_only_set_on_insert(self):
+        records, _ = parse("emprestimos", EMPRESTIMOS_CSV)
+
+        loan = records[0]
+        assert loan.collection == "loans"
+        assert set(loan.fields) == {"bank_name", "purpose"}
+        assert loan.insert_fields["principal"] == 12000.0
+        assert loan.insert_fields["term_months"] == 12
+
+    def test_prune_removes_schedules_of_pruned_loans(self):
+        db = {
+            "loans": FakeCollection([{"_id": "kept", "import_scope": "emprestimos"},
+                                     {"_id": "gone", "import_scope": "emprestimos"}]),
+            "loan_schedules": FakeCollection([{"loan_id": "kept", "number": 1}, {"loan_id": "gone", "number": 1}]),
+        }
+        writer = BulkImportWriter(db)
+        writer._seen["loans"].add("kept")
+
+        assert writer.prune("emprestimos") == 1
+        assert [d["_id"] for d in db["loans"].docs] == ["kept"]
+        assert [d["loan_id"] for d in db["loan_schedules"].docs] == ["kept"]
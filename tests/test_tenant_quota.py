@@ -0,0 +1,132 @@
+"""
+Testes do limite de requisições por empresa
+
+Execute com: pytest tests/test_tenant_quota.py -v
+"""
+
+import pytest
+from flask import Flask, Response, g
+
+from src.application.middleware import tenant_quota as quota_middleware
+from src.infra.rate_limit import InMemoryQuotaStore, QuotaExceeded, TenantLimits, TenantQuota, load_limits
+
+
+class TestInMemoryQuotaStore:
+
+    def test_burst_then_rate_limited(self):
+        store = InMemoryQuotaStore()
+        limits = TenantLimits(rate=1, burst=3, concurrency=10)
+
+        leases = [store.acquire("c1", limits) for _ in range(3)]
+        for lease in leases:
+            store.release("c1", lease)
+
+        with pytest.raises(QuotaExceeded) as exc:
+            store.acquire("c1", limits)
+        assert exc.value.reason == "rate"
+        assert exc.value.retry_after >= 1
+
+        # Outra empresa não é afetada
+        store.acquire("c2", limits)
+
+    def test_concurrency_cap_and_release(self):
+        store = InMemoryQuotaStore()
+        limits = TenantLimits(rate=100, burst=100, concurrency=2)
+
+        first = store.acquire("c1", limits)
+        store.acquire("c1", limits)
+        with pytest.raises(QuotaExceeded) as exc:
+            store.acquire("c1", limits)
+        assert exc.value.reason == "concurrency"
+
+        store.release("c1", first)
+        store.acquire("c1", limits)
+
+
+class TestTenantQuota:
+
+    def test_limits_follow_company_plan(self):
+        plans = {"c1": "enterprise", "c2": None}
+        calls = []
+
+        def resolver(company_id):
+            calls.append(company_id)
+            return plans[company_id]
+
+        quota = TenantQuota(InMemoryQuotaStore(), resolver, limits=load_limits(""))
+
+        assert quota.limits_for("c1").concurrency == 16
+        assert quota.limits_for("c1").concurrency == 16
+        assert quota.limits_for("c2") == load_limits("")["basic"]
+        assert calls == ["c1", "c2"]
+
+    def test_limits_override_from_json(self):
+        limits = load_limits('{"basic": {"concurrency": 1}, "trial": {"rate": 1}}')
+
+        assert limits["basic"].concurrency == 1
+        assert limits["basic"].rate == 10
+        assert limits["trial"].rate == 1
+
+    def test_backend_failure_lets_request_through(self):
+        class BrokenStore:
+            def acquire(self, key, limits):
+                raise ConnectionError("mongo fora")
+
+            def release(self, key, lease):
+                raise AssertionError("não deve liberar vaga que não foi reservada")
+
+        quota = TenantQuota(BrokenStore(), lambda _: "basic")
+
+        with quota.guard("c1"):
+            pass
+
+
+class TestQuotaDecorator:
+
+    def test_returns_429_with_retry_after(self, monkeypatch):
+        quota = TenantQuota(
+            InMemoryQuotaStore(), lambda _: "basic",
+            limits={"basic": TenantLimits(rate=0.5, burst=1, concurrency=5)},
+        )
+        monkeypatch.setattr(quota_middleware, "get_tenant_quota", lambda: quota)
+
+        app = Flask(__name__)
+
+        @app.route("/ping")
+        def ping():
+            g.company_id = "c1"
+            return quota_middleware.call_with_tenant_quota(lambda: ("ok", 200))
+
+        client = app.test_client()
+        assert client.get("/ping").status_code == 200
+
+        response = client.get("/ping")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+        assert response.get_json()["reason"] == "rate"
+
+    def test_streamed_response_holds_slot_until_closed(self, monkeypatch):
+        quota = TenantQuota(
+            InMemoryQuotaStore(), lambda _: "basic",
+            limits={"basic": TenantLimits(rate=100, burst=100, concurrency=1)},
+        )
+        monkeypatch.setattr(quota_middleware, "get_tenant_quota", lambda: quota)
+
+        app = Flask(__name__)
+
+        @app.route("/stream")
+        def stream():
+            g.company_id = "c1"
+            return quota_middleware.call_with_tenant_quota(
+                lambda: Response((line for line in ["a\n", "b\n"]), mimetype="application/x-ndjson")
+            )
+
+        client = app.test_client()
+        response = client.get("/stream", buffered=False)
+        assert next(iter(response.response)) == b"a\n"
+
+        # A primeira resposta ainda está sendo enviada: a vaga segue ocupada
+        assert client.get("/stream").status_code == 429
+
+        response.close()
+        assert client.get("/stream").status_code == 200
@@ -0,0 +1,76 @@
+"""
+Testes do cache de tokens JWT verificados
+
+Execute com: pytest tests/test_token_cache.py -v
+"""
+
+import time
+
+import jwt
+import pytest
+
+from src.infra.security import JWTHandler, VerifiedTokenCache
+
+
+class CountingJWTHandler(JWTHandler):
+    def __init__(self, **kwargs):
+        super().__init__(secret_key="test-secret", **kwargs)
+        self.decodes = 0
+
+    def verify_token(self, token):
+        self.decodes += 1
+        return super().verify_token(token)
+
+
+class TestVerifiedTokenCache:
+
+    def test_repeated_requests_decode_once(self):
+        handler = CountingJWTHandler(token_cache=VerifiedTokenCache())
+        token = handler.generate_token({"user_id": "u1"})
+
+        for _ in range(10):
+            assert handler.verify_access_token(token)["user_id"] == "u1"
+
+        assert handler.decodes == 1
+
+    def test_entry_expires_with_token(self):
+        cache = VerifiedTokenCache()
+        cache.put("token", {"user_id": "u1", "exp": time.time() + 0.05})
+
+        assert cache.get("token") is not None
+        time.sleep(0.06)
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_revoke_user_forces_full_verification(self):
+        handler = CountingJWTHandler(token_cache=VerifiedTokenCache())
+        token = handler.generate_token({"user_id": "u1"})
+        other = handler.generate_token({"user_id": "u2"})
+        handler.verify_access_token(token)
+        handler.verify_access_token(other)
+
+        handler.revoke_user_tokens("u1")
+        handler.verify_access_token(token)
+        handler.verify_access_token(other)
+
+        assert handler.decodes == 3
+
+    def test_lru_is_bounded(self):
+        cache = VerifiedTokenCache(max_entries=2)
+        exp = time.time() + 60
+        for i in range(3):
+            cache.put(f"t{i}", {"user_id": "u1", "exp": exp})
+
+        assert len(cache) == 2
+        assert cache.get("t0") is None
+        assert cache.revoke_user("u1") == 2
+
+    def test_invalid_token_is_not_cached(self):
+        handler = CountingJWTHandler(token_cache=VerifiedTokenCache())
+        forged = jwt.encode({"user_id": "u1", "exp": time.time() + 60}, "other-secret", algorithm="HS256")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                handler.verify_access_token(forged)
+
+        assert handler.decodes == 2